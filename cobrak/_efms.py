@@ -1,98 +1,176 @@
+"""Enumeration of elementary flux modes (EFMs) of COBRA-k models.
+
+Two enumeration backends are provided, both of which stream their EFMs to the caller
+as tuples of the active reaction IDs:
+
+* iterate_efms_double_description for pure stoichiometric EFMs. It runs the
+  nullspace variant of the double description method, in which the supports of all
+  intermediate rays are stored as compact bitsets (Python integers).
+* iterate_efms_milp for EFMs under enzyme and/or thermodynamic constraints as well
+  as under enforced minimal fluxes. It enumerates minimal supports with integer cuts
+  on one persistent MILP per parallel worker.
+
+calculate_efms collects the EFMs of the fitting backend in a set.
+"""
+
+# IMPORT SECTION #
+from collections.abc import Generator
 from copy import deepcopy
-from random import choice
+from fractions import Fraction
+from itertools import product
+from math import ceil, log2
 
 from joblib import Parallel, cpu_count, delayed
+from numpy import abs as np_abs
+from numpy import max as np_max
+from numpy import ndarray, zeros
+from pydantic import ConfigDict, validate_call
+from pyomo.common.errors import ApplicationError
 from pyomo.environ import (
     Binary,
     ConcreteModel,
     Constraint,
-    Objective,
+    ConstraintList,
     Reals,
-    SolverFactoryClass,
     Var,
-    maximize,
 )
 
-from .constants import BIG_M, STANDARD_MIN_MDF
+from .constants import ALL_OK_KEY, BIG_M, STANDARD_MIN_MDF
 from .dataclasses import Model, Solver
-from .lps import (
-    get_lp_from_cobrak_model,
-    get_objective,
-)
-from .pyomo_functionality import get_solver
+from .lps import get_lp_from_cobrak_model
+from .pyomo_functionality import get_objective, get_solver
 from .standard_solvers import SCIP
 from .utilities import (
+    add_statuses_to_optimziation_dict,
     delete_orphaned_metabolites_and_enzymes,
     delete_unused_reactions_in_variability_dict,
+    get_base_id,
+    get_pyomo_solution_as_dict,
     get_stoichiometrically_coupled_reactions,
 )
 
 STANDARD_EFM_OBJ_NAME = "EFM_STANDARD_OBJECTIVE"
+"""Name of the MILP objective which minimizes the number of active stoichiometric couples"""
+EFM_ZERO_TOLERANCE = 1e-9
+"""Absolute tolerance below which a (normalized) double description ray value counts as zero"""
 
 
-def _efm_batch_routine(
-    pyomo_model: ConcreteModel,
-    pyomo_solver: SolverFactoryClass,
-    objective_name: str,
-    cobrak_solver: Solver,
-    objective_sense: int,
-) -> None:
-    getattr(pyomo_model, objective_name).activate()
-
-    # OBJ ACTIVATE
-    pyomo_solver.solve(
-        pyomo_model, tee=True, warmstart=True, **cobrak_solver.solve_extra_options
-    )
+# "PRIVATE" FUNCTIONS SECTION #
+@validate_call(validate_return=True)
+def _enumerate_efm_milp_partition(
+    reduced_model: Model,
+    eligible_couples: list[list[str]],
+    enforced_reacs: list[str],
+    with_enzyme_constraints: bool,
+    with_thermodynamic_constraints: bool,
+    solver: Solver,
+    max_num_efms: int,
+    min_mdf: float,
+    min_efm_flux_bound: float,
+    off_couple_idxs: list[int],
+    on_couple_idxs: list[int],
+) -> list[tuple[str, ...]]:
+    """Enumerates the EFMs of one partition of the EFM MILP. Used in (parallelized) MILP EFM enumeration.
 
-    if results.solver.termination_condition == TerminationCondition.maxTimeLimit:
-        result = None
-    else:
-        result = value(getattr(model, target_id))
+    A partition is defined by stoichiometric couples which are fixed to be inactive (off) or active (on).
+    The partition's MILP is built once. Then, it is solved repeatedly, and after each solution, an integer
+    cut excludes the found support and all its supersets. As the MILP minimizes the number of active couples,
+    each found support is minimal within the partition. If couples are fixed to be active, a smaller support
+    may lie in another partition, which is why such supports are checked with _has_smaller_efm_support.
 
-    getattr(pyomo_model, objective_name).deactivate()
+    Args:
+        reduced_model (Model): The COBRA-k model without blocked reactions.
+        eligible_couples (list[list[str]]): The stoichiometric couples that can be switched on and off.
+        enforced_reacs (list[str]): Reactions with an enforced minimal flux, which are part of all EFMs.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        with_thermodynamic_constraints (bool): Whether to include thermodynamic constraints.
+        solver (Solver): The MILP solver.
+        max_num_efms (int): Maximal number of returned EFMs.
+        min_mdf (float): Minimal max-min driving force (MDF) if thermodynamic constraints are included.
+        min_efm_flux_bound (float): Minimal flux of an active couple's first reaction.
+        off_couple_idxs (list[int]): Indices of eligible couples which are fixed to be inactive.
+        on_couple_idxs (list[int]): Indices of eligible couples which are fixed to be active.
 
+    Returns:
+        list[tuple[str, ...]]: The partition's EFMs as tuples of active reaction IDs.
+    """
+    pyomo_model, zc_var_ids = _get_efm_milp(
+        reduced_model,
+        eligible_couples,
+        with_enzyme_constraints,
+        with_thermodynamic_constraints,
+        min_mdf,
+        min_efm_flux_bound,
+    )
+    for couple_idx in off_couple_idxs:
+        getattr(pyomo_model, zc_var_ids[couple_idx]).fix(0)
+    for couple_idx in on_couple_idxs:
+        getattr(pyomo_model, zc_var_ids[couple_idx]).fix(1)
+    pyomo_solver = get_solver(solver.name, solver.solver_options, solver.solver_attrs)
 
-def calculate_efms(
-    cobrak_model: Model,
-    with_inhomogenous_constraints: bool = False,
-    with_enzyme_constraints: bool = False,
-    with_thermodynamic_constraints: bool = False,
-    solver: Solver = SCIP,
-    variability_dict: dict[str, tuple[float, float]] = {},
-    max_num_efms: int = 1_000_000_000,
-    min_mdf: float = STANDARD_MIN_MDF,
-    min_efm_flux_bound: float = 1e-5,
-) -> set[tuple[str, ...]]:
-    enforced_reacs = [
-        reac_id
-        for reac_id in variability_dict
-        if variability_dict[reac_id][0] > 0.0 and reac_id in cobrak_model.reactions
-    ]
-    if not with_inhomogenous_constraints:
-        for enforced_reac in enforced_reacs:
-            cobrak_model.reactions[enforced_reac].min_flux = 0.0
-            variability_dict[enforced_reac] = (0.0, variability_dict[enforced_reac][1])
+    efms: list[tuple[str, ...]] = []
+    while len(efms) < max_num_efms:
+        solution_dict = _solve_efm_milp(pyomo_model, pyomo_solver, solver)
+        if not solution_dict[ALL_OK_KEY]:
+            break
+        active_couple_idxs = [
+            couple_idx
+            for couple_idx, zc_var_id in enumerate(zc_var_ids)
+            if solution_dict[zc_var_id] > 0.5
+        ]
+        pyomo_model.efm_cuts.add(
+            sum(
+                getattr(pyomo_model, zc_var_ids[couple_idx])
+                for couple_idx in active_couple_idxs
+            )
+            <= len(active_couple_idxs) - 1
+        )
+        if on_couple_idxs and _has_smaller_efm_support(
+            pyomo_model, pyomo_solver, solver, zc_var_ids, active_couple_idxs
+        ):
+            continue
 
-    reduced_model = deepcopy(cobrak_model)
-    if variability_dict != {}:
-        reduced_model = delete_unused_reactions_in_variability_dict(
-            reduced_model, variability_dict
+        active_reacs = set(enforced_reacs)
+        for couple_idx in active_couple_idxs:
+            active_reacs |= set(eligible_couples[couple_idx])
+        efms.append(
+            tuple(
+                reac_id
+                for reac_id in reduced_model.reactions
+                if reac_id in active_reacs
+            )
         )
-    reduced_model = delete_orphaned_metabolites_and_enzymes(reduced_model)
 
-    all_couples = get_stoichiometrically_coupled_reactions(
-        reduced_model,
-    )
-    eligible_couples: list[list[str]] = []
-    for couple in all_couples:
-        eligible = True
-        for enforced_reac in enforced_reacs:
-            if enforced_reac in couple:
-                eligible = False
-                break
-        if eligible:
-            eligible_couples.append(couple)
+    return efms
+
 
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_efm_milp(
+    reduced_model: Model,
+    eligible_couples: list[list[str]],
+    with_enzyme_constraints: bool,
+    with_thermodynamic_constraints: bool,
+    min_mdf: float,
+    min_efm_flux_bound: float,
+) -> tuple[ConcreteModel, list[str]]:
+    """Returns the MILP which minimizes the number of active stoichiometric couples.
+
+    For each eligible couple, a binary variable zC_var_... is added which is 1 if and only if
+    the couple's first reaction has a flux of at least min_efm_flux_bound. The first reaction's
+    maximal flux serves as big M (as far as it is below BIG_M). At least one couple
+    has to be active. The returned MILP also contains an empty ConstraintList 'efm_cuts'.
+
+    Args:
+        reduced_model (Model): The COBRA-k model without blocked reactions.
+        eligible_couples (list[list[str]]): The stoichiometric couples that can be switched on and off.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        with_thermodynamic_constraints (bool): Whether to include thermodynamic constraints.
+        min_mdf (float): Minimal max-min driving force (MDF) if thermodynamic constraints are included.
+        min_efm_flux_bound (float): Minimal flux of an active couple's first reaction.
+
+    Returns:
+        tuple[ConcreteModel, list[str]]: The MILP and the IDs of its couple binary variables.
+    """
     pyomo_model = get_lp_from_cobrak_model(
         cobrak_model=reduced_model,
         with_enzyme_constraints=with_enzyme_constraints,
@@ -102,7 +180,6 @@ def calculate_efms(
     )
     zc_var_sum = 0.0
     zc_var_ids: list[str] = []
-    objective_names: list[str] = []
     for eligible_couple in eligible_couples:
         zc_var_id = "zC_var_" + "_".join(eligible_couple)
         zc_var_ids.append(zc_var_id)
@@ -113,7 +190,8 @@ def calculate_efms(
             zc_var_id + "_constraint",
             Constraint(
                 rule=getattr(pyomo_model, eligible_couple[0])
-                <= BIG_M * getattr(pyomo_model, zc_var_id)
+                <= min(BIG_M, reduced_model.reactions[eligible_couple[0]].max_flux)
+                * getattr(pyomo_model, zc_var_id)
             ),
         )
         setattr(
@@ -126,64 +204,537 @@ def calculate_efms(
         )
         zc_var_sum += getattr(pyomo_model, zc_var_id)
 
-        objective_names.append(f"objective_{eligible_couple[0]}")
-        setattr(
-            pyomo_model,
-            objective_names[-1],
-            Objective(expr=getattr(pyomo_model, eligible_couple[0]), sense=maximize),
-        )
-        getattr(pyomo_model, objective_names[-1]).deactivate()
-
-    objective_names.append(f"objective_{eligible_couple[0]}")
+    pyomo_model.zc_var_sum = Var(within=Reals, bounds=(1.0, len(zc_var_ids)))
+    pyomo_model.zc_var_sum_constraint_1 = Constraint(
+        rule=pyomo_model.zc_var_sum == zc_var_sum
+    )
     setattr(
         pyomo_model,
         STANDARD_EFM_OBJ_NAME,
-        Objective(expr=0.0, sense=maximize),
+        get_objective(pyomo_model, "zc_var_sum", -1),
     )
-    getattr(pyomo_model, STANDARD_EFM_OBJ_NAME).deactivate()
+    pyomo_model.efm_cuts = ConstraintList()
 
-    setattr(pyomo_model, "zc_var_sum", Var(within=Reals, bounds=(1.0, 10_000.0)))
-    setattr(
-        pyomo_model,
-        "zc_var_sum_constraint_1",
-        Constraint(rule=getattr(pyomo_model, "zc_var_sum") == zc_var_sum),
+    return pyomo_model, zc_var_ids
+
+
+@validate_call(validate_return=True)
+def _get_efm_reduced_model(
+    cobrak_model: Model,
+    variability_dict: dict[str, tuple[float, float]],
+    with_inhomogenous_constraints: bool,
+) -> tuple[Model, list[str]]:
+    """Returns the model for the EFM enumeration and its reactions with an enforced flux.
+
+    Without inhomogenous constraints, all enforced minimal fluxes (from the model's reactions as
+    well as from the variability dict) are set to 0. Reactions which cannot carry flux according
+    to the variability dict are deleted, as well as all then orphaned metabolites and enzymes.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        variability_dict (dict[str, tuple[float, float]]): Optional variability data. If not empty, it must contain all reactions.
+        with_inhomogenous_constraints (bool): Whether or not enforced minimal fluxes are kept.
+
+    Returns:
+        tuple[Model, list[str]]: The reduced model and its reactions with an enforced minimal flux.
+    """
+    cobrak_model = deepcopy(cobrak_model)
+    variability_dict = deepcopy(variability_dict)
+
+    enforced_reacs = [
+        reac_id
+        for reac_id, reaction in cobrak_model.reactions.items()
+        if (reaction.min_flux > 0.0)
+        or ((reac_id in variability_dict) and (variability_dict[reac_id][0] > 0.0))
+    ]
+    if not with_inhomogenous_constraints:
+        for enforced_reac in enforced_reacs:
+            cobrak_model.reactions[enforced_reac].min_flux = 0.0
+            if enforced_reac in variability_dict:
+                variability_dict[enforced_reac] = (
+                    0.0,
+                    variability_dict[enforced_reac][1],
+                )
+        enforced_reacs = []
+
+    if variability_dict != {}:
+        cobrak_model = delete_unused_reactions_in_variability_dict(
+            cobrak_model, variability_dict
+        )
+    cobrak_model = delete_orphaned_metabolites_and_enzymes(cobrak_model)
+
+    return cobrak_model, [
+        reac_id for reac_id in enforced_reacs if reac_id in cobrak_model.reactions
+    ]
+
+
+@validate_call(validate_return=True)
+def _get_exact_nullspace(
+    stoichiometric_matrix: list[list[Fraction]], num_reactions: int
+) -> tuple[list[int], list[int], list[list[float]]]:
+    """Returns the nullspace of a stoichiometric matrix in the kernel form of the double description method.
+
+    The matrix is brought into its exact (rational) reduced row echelon form. For each free column f,
+    the returned nullspace contains one vector with a 1 at f, 0 at all other free columns and the
+    negative reduced row entries at the pivot columns. Hence, all nullspace vectors are already
+    nonnegative at the free columns.
+
+    Args:
+        stoichiometric_matrix (list[list[Fraction]]): The metabolite x reaction stoichiometric matrix.
+        num_reactions (int): The number of reactions (columns), also needed if there are no metabolites.
+
+    Returns:
+        tuple[list[int], list[int], list[list[float]]]: The pivot column indices, the free column indices
+        and the nullspace vectors (one list of length num_reactions for each free column).
+    """
+    rows = [row.copy() for row in stoichiometric_matrix]
+    pivot_cols: list[int] = []
+    current_row = 0
+    for col in range(num_reactions):
+        if current_row >= len(rows):
+            break
+        pivot_row = next(
+            (
+                row_idx
+                for row_idx in range(current_row, len(rows))
+                if rows[row_idx][col] != 0
+            ),
+            None,
+        )
+        if pivot_row is None:
+            continue
+        rows[current_row], rows[pivot_row] = rows[pivot_row], rows[current_row]
+        pivot_value = rows[current_row][col]
+        rows[current_row] = [entry / pivot_value for entry in rows[current_row]]
+        for row_idx, row in enumerate(rows):
+            if (row_idx == current_row) or (row[col] == 0):
+                continue
+            factor = row[col]
+            rows[row_idx] = [
+                entry - factor * pivot_entry
+                for entry, pivot_entry in zip(row, rows[current_row])
+            ]
+        pivot_cols.append(col)
+        current_row += 1
+
+    free_cols = [col for col in range(num_reactions) if col not in set(pivot_cols)]
+    nullspace_vectors: list[list[float]] = []
+    for free_col in free_cols:
+        nullspace_vector = [0.0 for _ in range(num_reactions)]
+        nullspace_vector[free_col] = 1.0
+        for row_idx, pivot_col in enumerate(pivot_cols):
+            nullspace_vector[pivot_col] = -float(rows[row_idx][free_col])
+        nullspace_vectors.append(nullspace_vector)
+
+    return pivot_cols, free_cols, nullspace_vectors
+
+
+def _get_ray_support(ray: ndarray, mask: int) -> int:
+    """Returns the support of a double description ray as bitset, restricted to the given bitset mask.
+
+    Args:
+        ray (ndarray): The ray.
+        mask (int): Bitset of the regarded coordinates.
+
+    Returns:
+        int: Bitset with bit i set if coordinate i is in the mask and ray[i] is nonzero.
+    """
+    support = 0
+    for coordinate in ray.nonzero()[0]:
+        support |= 1 << int(coordinate)
+    return support & mask
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _has_smaller_efm_support(
+    pyomo_model: ConcreteModel,
+    pyomo_solver: object,
+    solver: Solver,
+    zc_var_ids: list[str],
+    active_couple_idxs: list[int],
+) -> bool:
+    """Checks whether a feasible proper subset of the given active couples exists in the EFM MILP.
+
+    For this check, all partition fixings are temporarily lifted, all couples outside the given
+    support are fixed to be inactive and at least one couple of the support has to be inactive.
+    Afterwards, the MILP is restored.
+
+    Args:
+        pyomo_model (ConcreteModel): The EFM MILP.
+        pyomo_solver (object): The pyomo solver instance.
+        solver (Solver): The MILP solver (for its extra solve options).
+        zc_var_ids (list[str]): The IDs of the couple binary variables.
+        active_couple_idxs (list[int]): The indices of the support's active couples.
+
+    Returns:
+        bool: True if a smaller support is feasible, i.e. if the given support is no EFM.
+    """
+    original_fixings = [
+        (getattr(pyomo_model, zc_var_id).fixed, getattr(pyomo_model, zc_var_id).value)
+        for zc_var_id in zc_var_ids
+    ]
+    for couple_idx, zc_var_id in enumerate(zc_var_ids):
+        if couple_idx in active_couple_idxs:
+            getattr(pyomo_model, zc_var_id).unfix()
+        else:
+            getattr(pyomo_model, zc_var_id).fix(0)
+    pyomo_model.efm_subset_constraint = Constraint(
+        rule=sum(
+            getattr(pyomo_model, zc_var_ids[couple_idx])
+            for couple_idx in active_couple_idxs
+        )
+        <= len(active_couple_idxs) - 1
     )
-    pyomo_model.obj = get_objective(pyomo_model, "zc_var_sum", -1)
 
-    integer_cut_i = 0
-    pyomo_solver = get_solver(solver.name, solver.solver_options, solver.solver_attrs)
-    efms: set[tuple[str, ...]] = set()
-    for i in range(max_num_efms):
-        opt_targets = [STANDARD_EFM_OBJ_NAME] + [
-            choice(objective_names) for _ in range(cpu_count() - 1)
-        ]
-        min_z_results = Parallel(n_jobs=-1, verbose=10)(
-            delayed(_efm_batch_routine)(
-                pyomo_model,
-                pyomo_solver,
-                opt_target,
-                +1,
+    has_smaller_support = _solve_efm_milp(pyomo_model, pyomo_solver, solver)[ALL_OK_KEY]
+
+    pyomo_model.del_component(pyomo_model.efm_subset_constraint)
+    for zc_var_id, (was_fixed, original_value) in zip(zc_var_ids, original_fixings):
+        if was_fixed:
+            getattr(pyomo_model, zc_var_id).fix(original_value)
+        else:
+            getattr(pyomo_model, zc_var_id).unfix()
+
+    return has_smaller_support
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _solve_efm_milp(
+    pyomo_model: ConcreteModel,
+    pyomo_solver: object,
+    solver: Solver,
+) -> dict[str, float]:
+    """Solves the EFM MILP and returns its solution with statuses.
+
+    Args:
+        pyomo_model (ConcreteModel): The EFM MILP.
+        pyomo_solver (object): The pyomo solver instance.
+        solver (Solver): The MILP solver (for its extra solve options).
+
+    Returns:
+        dict[str, float]: The solution dict, whose ALL_OK_KEY value is False if the MILP is infeasible.
+    """
+    try:
+        results = pyomo_solver.solve(
+            pyomo_model, tee=False, **solver.solve_extra_options
+        )
+        return add_statuses_to_optimziation_dict(
+            get_pyomo_solution_as_dict(pyomo_model), results
+        )
+    except (ApplicationError, AttributeError, RuntimeError, ValueError):
+        return {ALL_OK_KEY: False}
+
+
+# "PUBLIC" FUNCTIONS SECTION #
+@validate_call
+def calculate_efms(
+    cobrak_model: Model,
+    with_inhomogenous_constraints: bool = False,
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    solver: Solver = SCIP,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    max_num_efms: int = 1_000_000_000,
+    min_mdf: float = STANDARD_MIN_MDF,
+    min_efm_flux_bound: float = 0.1,
+    num_workers: int = cpu_count(),
+) -> set[tuple[str, ...]]:
+    """Calculates the elementary flux modes (EFMs) of a COBRA-k model.
+
+    Pure stoichiometric EFMs (i.e., without inhomogenous, enzyme and thermodynamic constraints and without
+    extra linear constraints in the model) are enumerated with the double description method (see
+    iterate_efms_double_description). Otherwise, the EFMs are enumerated with parallel MILPs (see iterate_efms_milp).
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        with_inhomogenous_constraints (bool, optional): Whether or not enforced minimal fluxes are kept. Defaults to False.
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        solver (Solver, optional): The MILP solver. Defaults to SCIP.
+        variability_dict (dict[str, tuple[float, float]], optional): Optional variability data. Defaults to {}.
+        max_num_efms (int, optional): Maximal number of EFMs. Defaults to 1_000_000_000.
+        min_mdf (float, optional): Minimal max-min driving force (MDF). Defaults to STANDARD_MIN_MDF.
+        min_efm_flux_bound (float, optional): Minimal flux of an active MILP couple. Defaults to 0.1.
+        num_workers (int, optional): Number of parallel MILP workers. Defaults to cpu_count().
+
+    Returns:
+        set[tuple[str, ...]]: The EFMs as tuples of active reaction IDs.
+    """
+    if not (
+        with_inhomogenous_constraints
+        or with_enzyme_constraints
+        or with_thermodynamic_constraints
+        or cobrak_model.extra_linear_constraints
+    ):
+        return set(
+            iterate_efms_double_description(
+                cobrak_model,
+                variability_dict=variability_dict,
+                max_num_efms=max_num_efms,
             )
-            for opt_target in opt_targets
         )
+    return set(
+        iterate_efms_milp(
+            cobrak_model,
+            with_inhomogenous_constraints=with_inhomogenous_constraints,
+            with_enzyme_constraints=with_enzyme_constraints,
+            with_thermodynamic_constraints=with_thermodynamic_constraints,
+            solver=solver,
+            variability_dict=variability_dict,
+            max_num_efms=max_num_efms,
+            min_mdf=min_mdf,
+            min_efm_flux_bound=min_efm_flux_bound,
+            num_workers=num_workers,
+        )
+    )
 
-        new_efms = min_z_results.difference(efms)
-        if len(new_efms) == 0:
-            break
-        for new_efm in new_efms:
-            new_integer_cut = 0.0
-            new_integer_cut_sum = 0.0
-            for zc_var_id in zc_var_ids:
-                if getattr(pyomo_model, zc_var_id).value <= 0.1:
+
+@validate_call
+def iterate_efms_double_description(
+    cobrak_model: Model,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    max_num_efms: int = 1_000_000_000,
+) -> Generator[tuple[str, ...], None, None]:
+    """Streams the pure stoichiometric elementary flux modes (EFMs) of a COBRA-k model.
+
+    The EFMs are calculated with the nullspace variant of the double description method: Starting
+    from the stoichiometric matrix's nullspace, the nonnegativity of one reaction after the other is
+    enforced by combining all adjacent rays with positive and negative values. Adjacency is tested
+    combinatorially on the rays' supports, which are stored as bitsets. The EFMs of the last step are
+    yielded as soon as they are found. Enforced minimal fluxes are ignored (set to 0), and futile
+    cycles of a reaction's forward and reverse direction are skipped. The model's extra linear constraints
+    are not regarded (use iterate_efms_milp for them).
+
+    Args:
+        cobrak_model (Model): The COBRA-k model. All its reactions have to be irreversible (min_flux >= 0).
+        variability_dict (dict[str, tuple[float, float]], optional): Optional variability data. If given,
+            reactions which cannot carry flux are deleted beforehand. Defaults to {}.
+        max_num_efms (int, optional): Maximal number of yielded EFMs. Defaults to 1_000_000_000.
+
+    Raises:
+        ValueError: A reaction is reversible.
+
+    Yields:
+        tuple[str, ...]: One EFM as tuple of its active reaction IDs (in the model's reaction order).
+    """
+    reversible_reacs = [
+        reac_id
+        for reac_id, reaction in cobrak_model.reactions.items()
+        if reaction.min_flux < 0.0
+    ]
+    if reversible_reacs:
+        print(
+            f"ERROR: The double description EFM enumeration needs irreversible reactions, but {reversible_reacs} are reversible."
+        )
+        raise ValueError
+    reduced_model, _ = _get_efm_reduced_model(cobrak_model, variability_dict, False)
+    reac_ids = list(reduced_model.reactions.keys())
+    stoichiometric_matrix = [
+        [
+            Fraction(reduced_model.reactions[reac_id].stoichiometries.get(met_id, 0.0))
+            for reac_id in reac_ids
+        ]
+        for met_id in reduced_model.metabolites
+    ]
+    pivot_cols, free_cols, nullspace_vectors = _get_exact_nullspace(
+        stoichiometric_matrix, len(reac_ids)
+    )
+    if not free_cols:
+        return
+
+    def _to_efm(ray: ndarray) -> tuple[str, ...] | None:
+        efm = tuple(reac_ids[i] for i in ray.nonzero()[0])
+        if (len(efm) == 2) and (
+            get_base_id(efm[0], reduced_model.fwd_suffix, reduced_model.rev_suffix)
+            == get_base_id(efm[1], reduced_model.fwd_suffix, reduced_model.rev_suffix)
+        ):
+            return None
+        return efm
+
+    rays: list[ndarray] = []
+    for nullspace_vector in nullspace_vectors:
+        ray = zeros(len(reac_ids))
+        ray[:] = nullspace_vector
+        rays.append(ray)
+    processed_mask = 0
+    for free_col in free_cols:
+        processed_mask |= 1 << free_col
+    num_processed = len(free_cols)
+    min_num_common_zeros = len(free_cols) - 2
+
+    num_yielded_efms = 0
+    remaining_cols = list(pivot_cols)
+    while True:
+        if not remaining_cols:
+            # Only possible if the stoichiometric matrix has no pivot columns
+            for ray in rays:
+                efm = _to_efm(ray)
+                if efm is None:
                     continue
-                new_integer_cut += getattr(pyomo_model, zc_var_id)
-                new_integer_cut_sum += 1
-            setattr(
-                pyomo_model,
-                f"integer_cut_{integer_cut_i}",
-                Constraint(expr=new_integer_cut <= new_integer_cut_sum - 1),
-            )
-            integer_cut_i += 1
-        efms = efms.union(new_efms)
+                yield efm
+                num_yielded_efms += 1
+                if num_yielded_efms >= max_num_efms:
+                    return
+            return
 
-    return efms
+        # Process the coordinate with the fewest ray combinations first
+        current_col = min(
+            remaining_cols,
+            key=lambda col: (
+                sum(ray[col] > EFM_ZERO_TOLERANCE for ray in rays)
+                * sum(ray[col] < -EFM_ZERO_TOLERANCE for ray in rays)
+            ),
+        )
+        remaining_cols.remove(current_col)
+        is_last_step = not remaining_cols
+
+        supports = [_get_ray_support(ray, processed_mask) for ray in rays]
+        positive_idxs: list[int] = []
+        negative_idxs: list[int] = []
+        new_rays: list[ndarray] = []
+        for ray_idx, ray in enumerate(rays):
+            if ray[current_col] > EFM_ZERO_TOLERANCE:
+                positive_idxs.append(ray_idx)
+            elif ray[current_col] < -EFM_ZERO_TOLERANCE:
+                negative_idxs.append(ray_idx)
+            else:
+                ray[current_col] = 0.0
+            if ray[current_col] >= 0.0:
+                new_rays.append(ray)
+
+        if is_last_step:
+            for ray in new_rays:
+                efm = _to_efm(ray)
+                if efm is None:
+                    continue
+                yield efm
+                num_yielded_efms += 1
+                if num_yielded_efms >= max_num_efms:
+                    return
+
+        for positive_idx in positive_idxs:
+            for negative_idx in negative_idxs:
+                combined_support = supports[positive_idx] | supports[negative_idx]
+                # Necessary condition: Adjacent rays share enough zero constraints
+                if num_processed - combined_support.bit_count() < min_num_common_zeros:
+                    continue
+                # Combinatorial test: No other ray's support lies within the combined support
+                if any(
+                    (support | combined_support) == combined_support
+                    for other_idx, support in enumerate(supports)
+                    if other_idx not in (positive_idx, negative_idx)
+                ):
+                    continue
+                new_ray = (
+                    rays[positive_idx][current_col] * rays[negative_idx]
+                    - rays[negative_idx][current_col] * rays[positive_idx]
+                )
+                new_ray /= np_max(np_abs(new_ray))
+                new_ray[np_abs(new_ray) <= EFM_ZERO_TOLERANCE] = 0.0
+                new_ray[current_col] = 0.0
+                if is_last_step:
+                    efm = _to_efm(new_ray)
+                    if efm is None:
+                        continue
+                    yield efm
+                    num_yielded_efms += 1
+                    if num_yielded_efms >= max_num_efms:
+                        return
+                else:
+                    new_rays.append(new_ray)
+
+        if is_last_step:
+            return
+        rays = new_rays
+        processed_mask |= 1 << current_col
+        num_processed += 1
+
+
+@validate_call
+def iterate_efms_milp(
+    cobrak_model: Model,
+    with_inhomogenous_constraints: bool = False,
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    solver: Solver = SCIP,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    max_num_efms: int = 1_000_000_000,
+    min_mdf: float = STANDARD_MIN_MDF,
+    min_efm_flux_bound: float = 0.1,
+    num_workers: int = cpu_count(),
+) -> Generator[tuple[str, ...], None, None]:
+    """Streams the (enzyme- and/or thermodynamically constrained) elementary flux modes (EFMs) of a COBRA-k model.
+
+    The EFMs are the minimal supports of feasible flux distributions, where the support is measured in
+    stoichiometric couples (see get_stoichiometrically_coupled_reactions). To run in parallel, the
+    space of supports is partitioned by fixing the first couples to be active or inactive. Each
+    parallel worker enumerates one partition with integer cuts on one persistent MILP (see
+    _enumerate_efm_milp_partition). The EFMs of each partition are yielded as soon as the partition is done.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        with_inhomogenous_constraints (bool, optional): Whether or not enforced minimal fluxes are kept. Reactions
+            with an enforced flux are then part of every EFM. Defaults to False.
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        solver (Solver, optional): The MILP solver. Defaults to SCIP.
+        variability_dict (dict[str, tuple[float, float]], optional): Optional variability data. If given,
+            reactions which cannot carry flux are deleted beforehand. Defaults to {}.
+        max_num_efms (int, optional): Maximal number of yielded EFMs. Defaults to 1_000_000_000.
+        min_mdf (float, optional): Minimal max-min driving force (MDF). Defaults to STANDARD_MIN_MDF.
+        min_efm_flux_bound (float, optional): Minimal flux of an active couple's first reaction. It should be
+            well above the maximal fluxes times the solver's integrality tolerance as, otherwise, a nearly
+            inactive couple can carry a small flux. Defaults to 0.1.
+        num_workers (int, optional): Number of parallel workers. The number of partitions is the smallest power of two
+            that is at least as large. Defaults to cpu_count().
+
+    Yields:
+        tuple[str, ...]: One EFM as tuple of its active reaction IDs (in the model's reaction order).
+    """
+    reduced_model, enforced_reacs = _get_efm_reduced_model(
+        cobrak_model, variability_dict, with_inhomogenous_constraints
+    )
+    eligible_couples = [
+        couple
+        for couple in get_stoichiometrically_coupled_reactions(reduced_model)
+        if not any(enforced_reac in couple for enforced_reac in enforced_reacs)
+    ]
+    if not eligible_couples:
+        return
+
+    num_split_couples = (
+        min(len(eligible_couples), ceil(log2(num_workers))) if num_workers > 1 else 0
+    )
+    partitions = [
+        (
+            [idx for idx, is_on in enumerate(pattern) if not is_on],
+            [idx for idx, is_on in enumerate(pattern) if is_on],
+        )
+        for pattern in product((False, True), repeat=num_split_couples)
+    ]
+    partition_results = Parallel(
+        n_jobs=min(num_workers, len(partitions)), return_as="generator_unordered"
+    )(
+        delayed(_enumerate_efm_milp_partition)(
+            reduced_model,
+            eligible_couples,
+            enforced_reacs,
+            with_enzyme_constraints,
+            with_thermodynamic_constraints,
+            solver,
+            max_num_efms,
+            min_mdf,
+            min_efm_flux_bound,
+            off_couple_idxs,
+            on_couple_idxs,
+        )
+        for off_couple_idxs, on_couple_idxs in partitions
+    )
+
+    num_yielded_efms = 0
+    for partition_efms in partition_results:
+        for efm in partition_efms:
+            yield efm
+            num_yielded_efms += 1
+            if num_yielded_efms >= max_num_efms:
+                return
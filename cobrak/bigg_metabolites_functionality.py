@@ -43,37 +43,34 @@ def bigg_parse_metabolites_file(
     </pre>
     The BIGG ID <-> BIGG ID mapping is done for models which already use the BIGG IDs.
     """
-    # Open the BIGG metabolites file as string list, and remove all newlines
-    with open(bigg_metabolites_txt_path, encoding="utf-8") as f:
-        lines = f.readlines()
-    lines = [x.replace("\n", "") for x in lines if len(x) > 0]
-
     # Mapping variable which will store the BIGG ID<->
     bigg_id_name_mapping = {}
-    # Go through each BIGG metabolites file line (which is a tab-separated file)
-    # and retrieve the BIGG ID and the name (if there is a name for the given BIGG
-    # ID)
-    for line in lines:
-        bigg_id = line.split("\t")[1]
-        bigg_id_name_mapping[bigg_id] = bigg_id
+    # Go line by line through the BIGG metabolites file (which is a tab-separated
+    # file), without reading it completely into memory, and retrieve the BIGG ID
+    # and the name (if there is a name for the given BIGG ID)
+    with open(bigg_metabolites_txt_path, encoding="utf-8") as f:
+        for line in f:
+            line_parts = line.rstrip("\n").split("\t")
+            if len(line_parts) < 2:
+                continue
+            bigg_id = line_parts[1]
+            bigg_id_name_mapping[bigg_id] = bigg_id
 
-        # Exception to check if there is no name :O
-        try:
-            name = line.split("\t")[2].lower()
-        except Exception:
-            continue
-        bigg_id_name_mapping[name] = bigg_id
+            # Check if there is no name :O
+            if len(line_parts) < 3:
+                continue
+            name = line_parts[2].lower()
+            bigg_id_name_mapping[name] = bigg_id
 
-        try:
-            database_links = line.split("\t")[4]
-        except Exception:
-            continue
-        for database_link_part in database_links.split(": "):
-            if "CHEBI:" not in database_link_part:
+            if len(line_parts) < 5:
                 continue
-            subpart = database_link_part.split("CHEBI:")[1].strip()
-            chebi_id = subpart.split("; ")[0] if "; " in subpart else subpart
-            bigg_id_name_mapping[chebi_id] = bigg_id
+            database_links = line_parts[4]
+            for database_link_part in database_links.split(": "):
+                if "CHEBI:" not in database_link_part:
+                    continue
+                subpart = database_link_part.split("CHEBI:")[1].strip()
+                chebi_id = subpart.split("; ")[0] if "; " in subpart else subpart
+                bigg_id_name_mapping[chebi_id] = bigg_id
 
     # Write the JSON in the given folder :D
     json_write(bigg_metabolites_json_path, bigg_id_name_mapping)
@@ -0,0 +1,302 @@
+"""Exact branch-and-bound search over the activities of COBRA-k's stoichiometrically coupled reaction groups.
+
+As a complement to the evolutionary algorithm (see module 'evolution'), this search proves the optimality of its
+result. Each node of the search tree fixes some reaction couples as inactive (deactivated) and some as active
+(thermodynamically constrained, i.e. with z variables fixed to 1), while all other couples are free. A node is bounded
+by its ecTFBA (MILP) optimum, which is a relaxation of the NLP of any set of active reactions in the node's subtree.
+The NLP with the active reactions of the node's ecTFBA solution gives a feasible solution, the best of which is the
+incumbent. Subtrees whose bound cannot beat the incumbent are pruned; all others are branched on a free couple which
+is used in the node's ecTFBA solution. The nodes with the best bounds are evaluated in parallel.
+"""
+
+import heapq
+from copy import deepcopy
+from time import time
+
+from joblib import cpu_count
+from pyomo.common.errors import ApplicationError
+
+from .constants import (
+    ALL_OK_KEY,
+    OBJECTIVE_BOUND_KEY,
+    OBJECTIVE_VAR_NAME,
+    TIME_BUDGET_EXCEEDED_KEY,
+    Z_VAR_PREFIX,
+)
+from .dataclasses import CorrectionConfig, ExtraLinearConstraint, Model, Solver
+from .evolution import COBRAKProblem
+from .lps import perform_lp_optimization, perform_lp_variability_analysis
+from .standard_solvers import IPOPT, SCIP
+from .utilities import is_objsense_maximization, parallel_map_until_deadline
+
+
+def _evaluate_branch_and_bound_node(
+    problem: COBRAKProblem,
+    off_couple_idxs: tuple[int, ...],
+    on_couple_idxs: tuple[int, ...],
+) -> tuple[float | None, dict[str, float] | None, list[int]]:
+    """Calculates a branch-and-bound node's ecTFBA bound and the NLP with the ecTFBA's active reactions.
+
+    Args:
+        problem (COBRAKProblem): The problem with the model, reaction couples and solver settings.
+        off_couple_idxs (tuple[int, ...]): Indices of the couples fixed as inactive.
+        on_couple_idxs (tuple[int, ...]): Indices of the couples fixed as active.
+
+    Returns:
+        tuple[float | None, dict[str, float] | None, list[int]]: The ecTFBA objective value (None if the ecTFBA is infeasible),
+        the NLP result (None if the NLP failed) and the indices of the couples used in the ecTFBA solution.
+    """
+    deactivated_reactions = [
+        reac_id
+        for couple_idx in off_couple_idxs
+        for reac_id in problem.idx_to_reac_ids[couple_idx]
+    ]
+    node_model = deepcopy(problem.original_cobrak_model)
+    node_model.extra_linear_constraints += [
+        ExtraLinearConstraint(
+            stoichiometries={f"{Z_VAR_PREFIX}{reac_id}": 1.0},
+            lower_value=1.0,
+        )
+        for couple_idx in on_couple_idxs
+        for reac_id in problem.idx_to_reac_ids[couple_idx]
+        if node_model.reactions[reac_id].dG0 is not None
+    ]
+    try:
+        ectfba_dict = perform_lp_optimization(
+            cobrak_model=node_model,
+            objective_target=problem.objective_target,
+            objective_sense=problem.objective_sense,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            with_loop_constraints=True,
+            variability_dict=deepcopy(problem.variability_data),
+            ignored_reacs=deactivated_reactions,
+            solver=problem.lp_solver,
+            correction_config=problem.correction_config,
+            ignore_nonlinear_terms=problem.ignore_nonlinear_extra_terms_in_ectfbas,
+        )
+    except (ApplicationError, AttributeError, RuntimeError, ValueError):
+        ectfba_dict = {ALL_OK_KEY: False}
+    if not ectfba_dict[ALL_OK_KEY]:
+        return None, None, []
+
+    used_couple_idxs = [
+        couple_idx
+        for couple_idx, reac_ids in problem.idx_to_reac_ids.items()
+        if ectfba_dict.get(reac_ids[0], 0.0) > 1e-11
+    ]
+    nlp_result = problem.perform_nlp_with_ectfba_active_reactions(
+        ectfba_dict, deactivated_reactions
+    )
+    return ectfba_dict[OBJECTIVE_VAR_NAME], nlp_result, used_couple_idxs
+
+
+def perform_nlp_branch_and_bound(
+    cobrak_model: Model,
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    with_kappa: bool = True,
+    with_gamma: bool = True,
+    with_iota: bool = False,
+    with_alpha: bool = False,
+    lp_solver: Solver = SCIP,
+    nlp_solver: Solver = IPOPT,
+    nlp_strict_mode: bool = False,
+    nlp_single_strict_reacs: list[str] = [],
+    correction_config: CorrectionConfig = CorrectionConfig(),
+    min_abs_objvalue: float = 1e-13,
+    ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+    rel_gap_tolerance: float = 1e-6,
+    max_nodes: float = float("inf"),
+    num_parallel_nodes: int | None = None,
+    time_budget: float = float("inf"),
+    verbose: bool = False,
+) -> dict[float, list[dict[str, float]]]:
+    """Performs an exact branch-and-bound NLP optimization over the activities of the model's reaction couples.
+
+    The search space is the same as for perform_nlp_evolutionary_optimization, i.e. the stoichiometrically coupled reaction
+    groups which are not blocked or essential according to the variability data. For the search tree, see this module's
+    docstring. The search stops when no open node can beat the best found NLP result by more than rel_gap_tolerance
+    (then, the result is proven optimal, as far as the NLP solver finds the optimum of each NLP), or when max_nodes nodes were
+    evaluated or the time budget is used up. For small and medium models, this is often faster than running the evolutionary
+    algorithm until its objective value stagnates.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model to optimize.
+        objective_target (str | dict[str, float]): The objective target (reaction ID or dictionary of variable IDs and coefficients).
+        objective_sense (int): The objective sense (positive for maximization, negative for minimization).
+        variability_dict (dict[str, tuple[float, float]], optional): Variability data of the model's reactions. If empty, an
+            ecTFVA is performed. Defaults to {}.
+        with_kappa (bool, optional): Whether to use saturation term constraints in the NLPs. Defaults to True.
+        with_gamma (bool, optional): Whether to use thermodynamic term constraints in the NLPs. Defaults to True.
+        with_iota (bool, optional): Whether to use inhibition term constraints in the NLPs. Defaults to False.
+        with_alpha (bool, optional): Whether to use activation term constraints in the NLPs. Defaults to False.
+        lp_solver (Solver, optional): The MILP solver of the ecTFBA bounds. Defaults to SCIP.
+        nlp_solver (Solver, optional): The NLP solver. Defaults to IPOPT.
+        nlp_strict_mode (bool, optional): Whether or not the <= heuristic (True) or not (False; i.e. setting all equations to ==)
+            shall be used in the NLPs. Defaults to False.
+        nlp_single_strict_reacs (list[str], optional): Single reactions that shall be in strict mode. Defaults to [].
+        correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
+        min_abs_objvalue (float, optional): Minimal absolute NLP objective value to count as a result. Defaults to 1e-13.
+        ignore_nonlinear_extra_terms_in_ectfbas (bool, optional): Whether or not non-linear watches/constraints shall be ignored
+            in the ecTFBAs. Defaults to True.
+        rel_gap_tolerance (float, optional): Relative gap between a node's bound and the best NLP objective value below which the
+            node is pruned. Defaults to 1e-6.
+        max_nodes (float, optional): Maximal number of evaluated nodes. Defaults to float("inf").
+        num_parallel_nodes (int | None, optional): Number of nodes evaluated in parallel. Defaults to None, i.e. the number of CPUs.
+        time_budget (float, optional): Maximal wall-clock seconds of the search. Defaults to float("inf").
+        verbose (bool, optional): Whether or not the progress shall be printed. Defaults to False.
+
+    Returns:
+        dict[float, list[dict[str, float]]]: The found NLP results, sorted by their objective values. In each result,
+        OBJECTIVE_BOUND_KEY is the best objective value bound of all not fully searched nodes at the end of the search (i.e.
+        the best result's objective value if it is proven optimal), and TIME_BUDGET_EXCEEDED_KEY shows whether the time
+        budget was used up.
+    """
+    deadline = time() + time_budget
+    if isinstance(objective_target, str):
+        objective_target = {objective_target: 1.0}
+    if variability_dict == {}:
+        variability_dict = perform_lp_variability_analysis(
+            cobrak_model=cobrak_model,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            active_reactions=[],
+            solver=lp_solver,
+            ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
+        )
+    problem = COBRAKProblem(
+        cobrak_model=cobrak_model,
+        objective_target=objective_target,
+        objective_sense=objective_sense,
+        variability_dict=variability_dict,
+        nlp_dict_list=[],
+        best_value=0.0,
+        with_kappa=with_kappa,
+        with_gamma=with_gamma,
+        with_iota=with_iota,
+        with_alpha=with_alpha,
+        lp_solver=lp_solver,
+        nlp_solver=nlp_solver,
+        nlp_strict_mode=nlp_strict_mode,
+        nlp_single_strict_reacs=nlp_single_strict_reacs,
+        correction_config=correction_config,
+        min_abs_objvalue=min_abs_objvalue,
+        ignore_nonlinear_extra_terms_in_ectfbas=ignore_nonlinear_extra_terms_in_ectfbas,
+    )
+    if num_parallel_nodes is None:
+        num_parallel_nodes = cpu_count()
+
+    # Internally, objective values are converted such that lower is better
+    sense_factor = -1.0 if is_objsense_maximization(objective_sense) else 1.0
+
+    def can_beat_incumbent(bound: float) -> bool:
+        if incumbent == float("inf"):
+            return True
+        return bound < incumbent - rel_gap_tolerance * abs(incumbent)
+
+    incumbent = float("inf")
+    nlp_results: list[dict[str, float]] = []
+    # Open nodes as (parent bound, node number, off couple indices, on couple indices)
+    open_nodes: list[tuple[float, int, tuple[int, ...], tuple[int, ...]]] = [
+        (-float("inf"), 0, (), ())
+    ]
+    num_created_nodes = 1
+    num_evaluated_nodes = 0
+    cut_short = False
+    while open_nodes and (num_evaluated_nodes < max_nodes):
+        batch: list[tuple[float, int, tuple[int, ...], tuple[int, ...]]] = []
+        while (
+            open_nodes
+            and (len(batch) < num_parallel_nodes)
+            and (num_evaluated_nodes + len(batch) < max_nodes)
+        ):
+            node = heapq.heappop(open_nodes)
+            if can_beat_incumbent(node[0]):
+                batch.append(node)
+        if not batch:
+            break
+        if time() >= deadline:
+            for node in batch:
+                heapq.heappush(open_nodes, node)
+            cut_short = True
+            break
+
+        node_results, cut_short = parallel_map_until_deadline(
+            _evaluate_branch_and_bound_node,
+            [(problem, node[2], node[3]) for node in batch],
+            deadline,
+        )
+        for node, node_result in zip(batch, node_results):
+            if node_result is None:
+                # Not evaluated in time, so that the node stays open
+                heapq.heappush(open_nodes, node)
+                continue
+            num_evaluated_nodes += 1
+            bound, nlp_result, used_couple_idxs = node_result
+            if bound is None:
+                continue
+            bound *= sense_factor
+            if nlp_result is not None:
+                nlp_results.append(nlp_result)
+                incumbent = min(
+                    incumbent, sense_factor * nlp_result[OBJECTIVE_VAR_NAME]
+                )
+            if not can_beat_incumbent(bound):
+                continue
+
+            fixed_couple_idxs = set(node[2]) | set(node[3])
+            free_couple_idxs = [
+                couple_idx
+                for couple_idx in range(problem.dim)
+                if couple_idx not in fixed_couple_idxs
+            ]
+            if not free_couple_idxs:
+                continue
+            used_free_couple_idxs = [
+                couple_idx
+                for couple_idx in used_couple_idxs
+                if couple_idx not in fixed_couple_idxs
+            ]
+            branch_couple_idx = (
+                used_free_couple_idxs[0]
+                if used_free_couple_idxs
+                else free_couple_idxs[0]
+            )
+            for off_couple_idxs, on_couple_idxs in (
+                ((*node[2], branch_couple_idx), node[3]),
+                (node[2], (*node[3], branch_couple_idx)),
+            ):
+                heapq.heappush(
+                    open_nodes,
+                    (bound, num_created_nodes, off_couple_idxs, on_couple_idxs),
+                )
+                num_created_nodes += 1
+
+        if verbose:
+            print(
+                f"Branch-and-bound: {num_evaluated_nodes} evaluated nodes, {len(open_nodes)} open nodes, "
+                f"best objective value {sense_factor * incumbent}"
+            )
+        if cut_short:
+            break
+
+    open_bounds = [node[0] for node in open_nodes if can_beat_incumbent(node[0])]
+    global_bound = min([incumbent, *open_bounds]) if open_bounds else incumbent
+    if cut_short:
+        print(
+            f"INFO: Time budget of {time_budget} s used up, returning the best result found so far."
+        )
+
+    result_dict: dict[float, list[dict[str, float]]] = {}
+    for nlp_result in nlp_results:
+        nlp_result[OBJECTIVE_BOUND_KEY] = sense_factor * global_bound
+        nlp_result[TIME_BUDGET_EXCEEDED_KEY] = cut_short
+        objective_value = nlp_result[OBJECTIVE_VAR_NAME]
+        if objective_value not in result_dict:
+            result_dict[objective_value] = []
+        if nlp_result not in result_dict[objective_value]:
+            result_dict[objective_value].append(nlp_result)
+
+    return {key: result_dict[key] for key in sorted(result_dict.keys(), reverse=True)}
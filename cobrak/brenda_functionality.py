@@ -2,9 +2,11 @@
 
 # IMPORTS SECTION #
 import contextlib
-import copy
 import json
+import os
+import sqlite3
 import tarfile
+from collections.abc import Generator
 from math import isnan
 from statistics import median
 from typing import Any
@@ -13,12 +15,16 @@ import cobra
 from pydantic import ConfigDict, NonNegativeInt, validate_call
 
 from .dataclasses import EnzymeReactionData, ParameterReference
-from .io import json_load, json_zip_load
-from .ncbi_taxonomy_functionality import (
-    get_taxonomy_dict_from_nbci_taxonomy,
-    most_taxonomic_similar,
+from .expasy_functionality import EcNumberTrie
+from .io import json_load
+from .ncbi_taxonomy_functionality import load_ncbi_taxonomy_index
+from .sabio_rk_functionality import (
+    _get_normalized_name_to_bigg_id_dict,
+    _search_metname_in_bigg_ids,
 )
-from .sabio_rk_functionality import _search_metname_in_bigg_ids
+
+BRENDA_STORE_QUERY_CHUNK_SIZE = 500
+"""Maximal number of EC numbers per query of a BRENDA store (keeps the number of SQL parameters low)"""
 
 
 # "PRIVATE" FUNCTIONS SECTION #
@@ -35,9 +41,14 @@ def _brenda_get_all_enzyme_kinetic_data_for_model(
     max_temperature: float = float("inf"),
     accept_nan_temperature: bool = True,
     transfered_ec_codes: dict[str, str] = {},
+    brenda_store_path: str = "",
 ) -> dict[str, Any]:
     """Reads out a BRENDA JSON file created with parse_brenda_textfile and creates a model-specific JSON.
 
+    If a BRENDA store path (see brenda_create_kinetics_store) is given, only the needed EC numbers
+    are read out from this store (with the pH and temperature filters applied in its query) instead
+    of parsing the full BRENDA JSON.
+
     Arguments
     ----------
     * sbml_path: str ~ The path of the SBML model of which a specific BRENDA JSON kcat database
@@ -61,18 +72,6 @@ def _brenda_get_all_enzyme_kinetic_data_for_model(
     }
     </pre>
     """
-    brenda_kinetics_database_original = _brenda_parse_full_json(
-        brenda_json_targz_file_path=brenda_json_targz_file_path,
-        bigg_metabolites_json_path=bigg_metabolites_json_path,
-        brenda_version=brenda_version,
-        min_ph=min_ph,
-        max_ph=max_ph,
-        accept_nan_ph=accept_nan_ph,
-        min_temperature=min_temperature,
-        max_temperature=max_temperature,
-        accept_nan_temperature=accept_nan_temperature,
-    )
-
     # Get EC numbers of the model's reactions
     ec_numbers_of_model: list[str] = []
     for reaction in model.reactions:
@@ -93,42 +92,92 @@ def _brenda_get_all_enzyme_kinetic_data_for_model(
 
     ec_numbers_of_model = list(set(ec_numbers_of_model))
 
-    # Get EC number entries for each EC number of the model
+    if brenda_store_path:
+        # Only the EC numbers of the model (or, if they are missing, their wildcard
+        # fitting EC numbers) are read out from the indexed store
+        with contextlib.closing(sqlite3.connect(brenda_store_path)) as connection:
+            store_ec_numbers = [
+                row[0] for row in connection.execute("SELECT ec_number FROM ec_numbers")
+            ]
+        store_ec_number_trie = EcNumberTrie(store_ec_numbers)
+        queried_ec_numbers: set[str] = set()
+        for ec_number in ec_numbers_of_model:
+            if store_ec_number_trie.contains(ec_number):
+                queried_ec_numbers.add(ec_number)
+                continue
+            for wildcard_level in range(1, 5):
+                fitting_ec_numbers = (
+                    store_ec_number_trie.get_wildcard_fitting_ec_numbers(
+                        ec_number, wildcard_level
+                    )
+                )
+                if len(fitting_ec_numbers) > 0:
+                    queried_ec_numbers.update(fitting_ec_numbers)
+                    break
+        brenda_kinetics_database_original = _brenda_query_kinetics_store(
+            brenda_store_path=brenda_store_path,
+            ec_numbers=sorted(queried_ec_numbers),
+            min_ph=min_ph,
+            max_ph=max_ph,
+            accept_nan_ph=accept_nan_ph,
+            min_temperature=min_temperature,
+            max_temperature=max_temperature,
+            accept_nan_temperature=accept_nan_temperature,
+        )
+    else:
+        brenda_kinetics_database_original = _brenda_parse_full_json(
+            brenda_json_targz_file_path=brenda_json_targz_file_path,
+            bigg_metabolites_json_path=bigg_metabolites_json_path,
+            brenda_version=brenda_version,
+            min_ph=min_ph,
+            max_ph=max_ph,
+            accept_nan_ph=accept_nan_ph,
+            min_temperature=min_temperature,
+            max_temperature=max_temperature,
+            accept_nan_temperature=accept_nan_temperature,
+        )
+
+    # Get EC number entries for each EC number of the model. The entries are only
+    # shallowly merged, i.e. the kinetic data lists are shared with the full database.
+    database_ec_number_trie = EcNumberTrie(list(brenda_kinetics_database_original))
+    database_ec_number_order = {
+        database_ec_number: i
+        for i, database_ec_number in enumerate(brenda_kinetics_database_original)
+    }
     brenda_database_for_model = {}
     for ec_number in ec_numbers_of_model:
         entry_error = False
         if ec_number in brenda_kinetics_database_original:
-            ec_number_entry = copy.deepcopy(
-                brenda_kinetics_database_original[ec_number]
-            )
-            if "ERROR" in ec_number_entry:
+            if "ERROR" in brenda_kinetics_database_original[ec_number]:
                 entry_error = True
             else:
-                ec_number_entry["WILDCARD"] = False
-                brenda_database_for_model[ec_number] = copy.deepcopy(ec_number_entry)
+                brenda_database_for_model[ec_number] = {
+                    **brenda_kinetics_database_original[ec_number],
+                    "WILDCARD": False,
+                }
 
         if (ec_number not in brenda_kinetics_database_original) or entry_error:
             eligible_ec_number_entries: list[dict[str, Any]] = []
             for wildcard_level in range(1, 5):
-                for database_ec_number in list(
-                    brenda_kinetics_database_original.keys()
-                ):
-                    if _is_fitting_ec_numbers(
-                        ec_number, database_ec_number, wildcard_level
-                    ):
-                        database_ec_number_entry = copy.deepcopy(
-                            brenda_kinetics_database_original[database_ec_number]
-                        )
-                        if "ERROR" not in database_ec_number_entry:
-                            eligible_ec_number_entries.append(database_ec_number_entry)
+                eligible_ec_number_entries = [
+                    brenda_kinetics_database_original[database_ec_number]
+                    for database_ec_number in sorted(
+                        database_ec_number_trie.get_wildcard_fitting_ec_numbers(
+                            ec_number, wildcard_level
+                        ),
+                        key=database_ec_number_order.__getitem__,
+                    )
+                    if "ERROR"
+                    not in brenda_kinetics_database_original[database_ec_number]
+                ]
                 if len(eligible_ec_number_entries) > 0:
                     break
             ec_number_entry = {}
             for eligible_ec_number_entry in eligible_ec_number_entries:
-                for metabolite_key in eligible_ec_number_entry:
-                    metabolite_entry = copy.deepcopy(
-                        eligible_ec_number_entry[metabolite_key]
-                    )
+                for (
+                    metabolite_key,
+                    metabolite_entry,
+                ) in eligible_ec_number_entry.items():
                     if metabolite_key not in ec_number_entry:
                         ec_number_entry[metabolite_key] = metabolite_entry
                     else:
@@ -142,61 +191,57 @@ def _brenda_get_all_enzyme_kinetic_data_for_model(
     return brenda_database_for_model
 
 
-@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-def _brenda_parse_full_json(
+@validate_call
+def _brenda_get_kinetics_store_version(brenda_store_path: str) -> str | None:
+    """Returns the BRENDA version of a BRENDA store created with brenda_create_kinetics_store.
+
+    Args:
+        brenda_store_path (str): Path to the BRENDA store's SQLite file.
+
+    Returns:
+        str | None: The BRENDA version or None if the file has no (readable) version metadata.
+    """
+    try:
+        with contextlib.closing(sqlite3.connect(brenda_store_path)) as connection:
+            row = connection.execute(
+                "SELECT value FROM metadata WHERE key = 'brenda_version'"
+            ).fetchone()
+    except sqlite3.DatabaseError:
+        return None
+    return None if row is None else row[0]
+
+
+@validate_call
+def _brenda_iterate_kinetic_entries(
     brenda_json_targz_file_path: str,
     bigg_metabolites_json_path: str,
     brenda_version: str,
-    min_ph: float = -float("inf"),
-    max_ph: float = float("inf"),
-    accept_nan_ph: bool = True,
-    min_temperature: float = -float("inf"),
-    max_temperature: float = float("inf"),
-    accept_nan_temperature: bool = True,
-) -> dict[str, dict[str, Any]]:
-    """Goes through a BRENDA database JSON and converts it into a machine-readable dictionary.
+) -> Generator[tuple[str, list[tuple[Any, ...]]], None, None]:
+    """Goes through a BRENDA database JSON and yields the readable kinetic entries of each EC number with k_cat data.
 
-    The JSON includes kcats for found organisms and substrates.
-    As of Sep 24 2024, the BRENDA database can be downloaded as JSON under
-    https://www.brenda-enzymes.org/download.php
+    The entries are not filtered by pH or temperature, so that they can be used both for
+    _brenda_parse_full_json and for the indexed store of brenda_create_kinetics_store.
 
-    The BRENDA database is not in a completely standardized format, that's why this function
-    contains many convoluted checks and circumventions of non-standardized data.
+    Args:
+        brenda_json_targz_file_path (str): Path to the BRENDA JSON .tar.gz.
+        bigg_metabolites_json_path (str): Path to the BiGG metabolite name -> BiGG ID JSON.
+        brenda_version (str): The BRENDA version (e.g. "2024_1").
 
-    k_cat values from mutated enzymes are excluded (if this information can be successfully
-    read out by this function).
+    Raises:
+        FileNotFoundError: The BRENDA JSON is not in the .tar.gz.
 
-    Output
-    ----------
-    * A dictionary containing the BRENDA JSON kinetic data in the following machine-readable format:
-    <pre>
-        {
-            "$EC_NUMBER": {
-                "$SUBSTRATE_WITH_BIGG_ID_1": {
-                    "$ORGANISM_1": [
-                        $kcat_1,
-                        (...)
-                        $kcat_n,
-                    ]
-                },
-                (...),
-                "REST": {
-                    "$ORGANISM_1": [
-                        $kcat_1,
-                        (...)
-                        $kcat_n,
-                    ]
-                }
-            }
-            (...),
-        }
-    </pre>
-    'REST' stands for a substrate without found BIGG ID.
+    Yields:
+        tuple[str, list[tuple[Any, ...]]]: The EC number and its kinetic entries, each one of the form
+        (substrate BiGG ID or "" if not found, organisms, parameter type, value, references, comment,
+        BRENDA value string, BiGG-identified substrates, pH or NaN, temperature or NaN).
     """
     # Load BIGG ID <-> metabolite name mapping :D
     name_to_bigg_id_dict: dict[str, str] = json_load(
         bigg_metabolites_json_path, dict[str, str]
     )
+    normalized_name_to_bigg_id_dict = _get_normalized_name_to_bigg_id_dict(
+        name_to_bigg_id_dict
+    )
 
     with tarfile.open(brenda_json_targz_file_path, "r:gz") as tar:
         json_filename = f"brenda_{brenda_version}.json"
@@ -206,12 +251,11 @@ def _brenda_parse_full_json(
             raise FileNotFoundError
         brenda_json = json.load(json_file)
 
-    result_json: dict[str, dict[str, dict[str, list[Any]]]] = {}
     for ec_number, ec_data in brenda_json["data"].items():
         if "turnover_number" not in ec_data:
             continue
 
-        result_json[ec_number] = {}
+        ec_entries: list[tuple[Any, ...]] = []
 
         protein_to_organism_dict: dict[str, str] = {}
         protein_to_references_dict: dict[str, list[str]] = {}
@@ -271,23 +315,6 @@ def _brenda_parse_full_json(
                         with contextlib.suppress(ValueError):
                             temperature = float(temperature_string.replace("°c", ""))
 
-                if isnan(temperature):
-                    if not accept_nan_temperature:
-                        continue
-                else:
-                    if temperature > max_temperature:
-                        continue
-                    if temperature < min_temperature:
-                        continue
-                if isnan(ph):
-                    if not accept_nan_ph:
-                        continue
-                else:
-                    if ph > max_ph:
-                        continue
-                    if ph < min_ph:
-                        continue
-
                 substrate_raw = (
                     kinetics_entry["value"]
                     .split(" ")[1]
@@ -377,11 +404,21 @@ def _brenda_parse_full_json(
                             substrate = "REST"
                         else:
                             continue
-                if substrate not in result_json[ec_number]:
-                    result_json[ec_number][substrate] = {}
-
                 if not substrate:
-                    print(f"INFO: No substrate found for {ec_number}")
+                    ec_entries.append(
+                        (
+                            substrate,
+                            [],
+                            target_entry,
+                            kinetic_value,
+                            [],
+                            "",
+                            "",
+                            set(),
+                            ph,
+                            temperature,
+                        )
+                    )
                     continue
 
                 ref_num_to_pub: dict[str, dict[str, Any]] = ec_data["reference"]
@@ -420,23 +457,220 @@ def _brenda_parse_full_json(
                                 bigg_id="",
                                 entry=None,
                                 name_to_bigg_id_dict=name_to_bigg_id_dict,
+                                normalized_name_to_bigg_id_dict=normalized_name_to_bigg_id_dict,
                             )
                             if bigg_id:
                                 substrates_list.append(substrate_id)
 
-                for organism in organisms:
-                    if organism not in result_json[ec_number][substrate]:
-                        result_json[ec_number][substrate][organism] = []
-                    result_json[ec_number][substrate][organism].append(
-                        [
-                            target_entry,
-                            kinetic_value,
-                            read_references,
-                            kinetics_entry.get("comment", ""),
-                            kinetics_entry.get("value", ""),
-                            set(substrates_list),
-                        ]
+                ec_entries.append(
+                    (
+                        substrate,
+                        organisms,
+                        target_entry,
+                        kinetic_value,
+                        read_references,
+                        kinetics_entry.get("comment", ""),
+                        kinetics_entry.get("value", ""),
+                        set(substrates_list),
+                        ph,
+                        temperature,
                     )
+                )
+        yield ec_number, ec_entries
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def _brenda_parse_full_json(
+    brenda_json_targz_file_path: str,
+    bigg_metabolites_json_path: str,
+    brenda_version: str,
+    min_ph: float = -float("inf"),
+    max_ph: float = float("inf"),
+    accept_nan_ph: bool = True,
+    min_temperature: float = -float("inf"),
+    max_temperature: float = float("inf"),
+    accept_nan_temperature: bool = True,
+) -> dict[str, dict[str, Any]]:
+    """Goes through a BRENDA database JSON and converts it into a machine-readable dictionary.
+
+    The JSON includes kcats for found organisms and substrates.
+    As of Sep 24 2024, the BRENDA database can be downloaded as JSON under
+    https://www.brenda-enzymes.org/download.php
+
+    The BRENDA database is not in a completely standardized format, that's why this function
+    contains many convoluted checks and circumventions of non-standardized data.
+
+    k_cat values from mutated enzymes are excluded (if this information can be successfully
+    read out by this function).
+
+    Output
+    ----------
+    * A dictionary containing the BRENDA JSON kinetic data in the following machine-readable format:
+    <pre>
+        {
+            "$EC_NUMBER": {
+                "$SUBSTRATE_WITH_BIGG_ID_1": {
+                    "$ORGANISM_1": [
+                        $kcat_1,
+                        (...)
+                        $kcat_n,
+                    ]
+                },
+                (...),
+                "REST": {
+                    "$ORGANISM_1": [
+                        $kcat_1,
+                        (...)
+                        $kcat_n,
+                    ]
+                }
+            }
+            (...),
+        }
+    </pre>
+    'REST' stands for a substrate without found BIGG ID.
+    """
+    result_json: dict[str, dict[str, dict[str, list[Any]]]] = {}
+    for ec_number, ec_entries in _brenda_iterate_kinetic_entries(
+        brenda_json_targz_file_path=brenda_json_targz_file_path,
+        bigg_metabolites_json_path=bigg_metabolites_json_path,
+        brenda_version=brenda_version,
+    ):
+        result_json[ec_number] = {}
+        for (
+            substrate,
+            organisms,
+            target_entry,
+            kinetic_value,
+            read_references,
+            comment,
+            value_string,
+            substrates,
+            ph,
+            temperature,
+        ) in ec_entries:
+            if isnan(temperature):
+                if not accept_nan_temperature:
+                    continue
+            else:
+                if temperature > max_temperature:
+                    continue
+                if temperature < min_temperature:
+                    continue
+            if isnan(ph):
+                if not accept_nan_ph:
+                    continue
+            else:
+                if ph > max_ph:
+                    continue
+                if ph < min_ph:
+                    continue
+
+            if substrate not in result_json[ec_number]:
+                result_json[ec_number][substrate] = {}
+
+            if not substrate:
+                print(f"INFO: No substrate found for {ec_number}")
+                continue
+
+            for organism in organisms:
+                if organism not in result_json[ec_number][substrate]:
+                    result_json[ec_number][substrate][organism] = []
+                result_json[ec_number][substrate][organism].append(
+                    [
+                        target_entry,
+                        kinetic_value,
+                        read_references,
+                        comment,
+                        value_string,
+                        substrates,
+                    ]
+                )
+    return result_json
+
+
+@validate_call
+def _brenda_query_kinetics_store(
+    brenda_store_path: str,
+    ec_numbers: list[str],
+    min_ph: float = -float("inf"),
+    max_ph: float = float("inf"),
+    accept_nan_ph: bool = True,
+    min_temperature: float = -float("inf"),
+    max_temperature: float = float("inf"),
+    accept_nan_temperature: bool = True,
+) -> dict[str, dict[str, Any]]:
+    """Reads out the given EC numbers from a BRENDA store created with brenda_create_kinetics_store.
+
+    The pH and temperature filters are part of the SQL query, so that only the fitting entries are read.
+
+    Args:
+        brenda_store_path (str): Path to the BRENDA store's SQLite file.
+        ec_numbers (list[str]): The read out EC numbers. EC numbers which are not in the store are ignored.
+        min_ph (float, optional): Minimal pH. Defaults to -inf.
+        max_ph (float, optional): Maximal pH. Defaults to inf.
+        accept_nan_ph (bool, optional): Whether entries without pH are accepted. Defaults to True.
+        min_temperature (float, optional): Minimal temperature. Defaults to -inf.
+        max_temperature (float, optional): Maximal temperature. Defaults to inf.
+        accept_nan_temperature (bool, optional): Whether entries without temperature are accepted. Defaults to True.
+
+    Returns:
+        dict[str, dict[str, Any]]: The EC numbers' data in the format of _brenda_parse_full_json.
+    """
+    result_json: dict[str, dict[str, dict[str, list[Any]]]] = {}
+    with contextlib.closing(sqlite3.connect(brenda_store_path)) as connection:
+        for ec_numbers_chunk in (
+            ec_numbers[i : i + BRENDA_STORE_QUERY_CHUNK_SIZE]
+            for i in range(0, len(ec_numbers), BRENDA_STORE_QUERY_CHUNK_SIZE)
+        ):
+            placeholders = ",".join("?" for _ in ec_numbers_chunk)
+            for (ec_number,) in connection.execute(
+                f"SELECT ec_number FROM ec_numbers WHERE ec_number IN ({placeholders})",  # noqa: S608
+                ec_numbers_chunk,
+            ):
+                result_json[ec_number] = {}
+            rows = connection.execute(
+                "SELECT ec_number, bigg_id, organism, parameter_type, value, "
+                "references_json, comment, value_string, substrates_json "
+                f"FROM kinetic_entries WHERE ec_number IN ({placeholders}) "  # noqa: S608
+                "AND ((ph IS NULL AND ?) OR (ph >= ? AND ph <= ?)) "
+                "AND ((temperature IS NULL AND ?) OR (temperature >= ? AND temperature <= ?)) "
+                "ORDER BY rowid",
+                [
+                    *ec_numbers_chunk,
+                    accept_nan_ph,
+                    min_ph,
+                    max_ph,
+                    accept_nan_temperature,
+                    min_temperature,
+                    max_temperature,
+                ],
+            )
+            for (
+                ec_number,
+                bigg_id,
+                organism,
+                parameter_type,
+                value,
+                references_json,
+                comment,
+                value_string,
+                substrates_json,
+            ) in rows:
+                if bigg_id not in result_json[ec_number]:
+                    result_json[ec_number][bigg_id] = {}
+                if organism not in result_json[ec_number][bigg_id]:
+                    result_json[ec_number][bigg_id][organism] = []
+                result_json[ec_number][bigg_id][organism].append(
+                    [
+                        parameter_type,
+                        value,
+                        json.loads(references_json),
+                        comment,
+                        value_string,
+                        set(json.loads(substrates_json)),
+                    ]
+                )
     return result_json
 
 
@@ -463,6 +697,94 @@ def _is_fitting_ec_numbers(
 
 
 # "PUBLIC" FUNCTIONS SECTION #
+@validate_call
+def brenda_create_kinetics_store(
+    brenda_json_targz_file_path: str,
+    bigg_metabolites_json_path: str,
+    brenda_version: str,
+    brenda_store_path: str,
+) -> None:
+    """Converts a BRENDA database JSON once into an indexed SQLite store of its kinetic data.
+
+    With such a store, brenda_select_enzyme_kinetic_data_for_model does not have to parse the full
+    BRENDA JSON for each model, but only reads out the EC numbers of the given model. The pH and
+    temperature are stored unfiltered (NULL if unknown), so that one store can be used with any
+    pH and temperature filter. The store has indexes on the EC number, BiGG metabolite ID,
+    organism and parameter type ("turnover_number", "km_value" or "ki_value").
+
+    The store is first written into a temporary file which then replaces any existing file at the
+    given path, i.e., an interrupted conversion leaves no half-written store.
+
+    Args:
+        brenda_json_targz_file_path (str): Path to the BRENDA JSON .tar.gz.
+        bigg_metabolites_json_path (str): Path to the BiGG metabolite name -> BiGG ID JSON.
+        brenda_version (str): The BRENDA version (e.g. "2024_1").
+        brenda_store_path (str): Path of the created SQLite file.
+    """
+    temp_store_path = f"{brenda_store_path}.tmp"
+    if os.path.exists(temp_store_path):
+        os.remove(temp_store_path)
+    with contextlib.closing(sqlite3.connect(temp_store_path)) as connection:
+        connection.execute("CREATE TABLE ec_numbers (ec_number TEXT PRIMARY KEY)")
+        connection.execute(
+            "CREATE TABLE kinetic_entries ("
+            "ec_number TEXT NOT NULL, bigg_id TEXT NOT NULL, organism TEXT NOT NULL, "
+            "parameter_type TEXT NOT NULL, value REAL NOT NULL, references_json TEXT NOT NULL, "
+            "comment TEXT NOT NULL, value_string TEXT NOT NULL, substrates_json TEXT NOT NULL, "
+            "ph REAL, temperature REAL)"
+        )
+        connection.execute(
+            "CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO metadata VALUES ('brenda_version', ?)", (brenda_version,)
+        )
+        for ec_number, ec_entries in _brenda_iterate_kinetic_entries(
+            brenda_json_targz_file_path=brenda_json_targz_file_path,
+            bigg_metabolites_json_path=bigg_metabolites_json_path,
+            brenda_version=brenda_version,
+        ):
+            connection.execute("INSERT INTO ec_numbers VALUES (?)", (ec_number,))
+            connection.executemany(
+                "INSERT INTO kinetic_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        ec_number,
+                        substrate,
+                        organism,
+                        target_entry,
+                        kinetic_value,
+                        json.dumps(read_references),
+                        comment,
+                        value_string,
+                        json.dumps(sorted(substrates)),
+                        None if isnan(ph) else ph,
+                        None if isnan(temperature) else temperature,
+                    )
+                    for (
+                        substrate,
+                        organisms,
+                        target_entry,
+                        kinetic_value,
+                        read_references,
+                        comment,
+                        value_string,
+                        substrates,
+                        ph,
+                        temperature,
+                    ) in ec_entries
+                    if substrate
+                    for organism in organisms
+                ],
+            )
+        for column in ("ec_number", "bigg_id", "organism", "parameter_type"):
+            connection.execute(
+                f"CREATE INDEX idx_kinetic_entries_{column} ON kinetic_entries ({column})"
+            )
+        connection.commit()
+    os.replace(temp_store_path, brenda_store_path)
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
 def brenda_select_enzyme_kinetic_data_for_model(
     cobra_model: cobra.Model,
@@ -483,6 +805,7 @@ def brenda_select_enzyme_kinetic_data_for_model(
     kcat_overwrite: dict[str, float] = {},
     transfered_ec_number_json: str = "",
     max_taxonomy_level: NonNegativeInt = 1e9,
+    brenda_store_path: str = "",
 ) -> dict[str, EnzymeReactionData | None]:
     """Select and assign enzyme kinetic data for each reaction in a COBRApy model based on BRENDA
     database entries and taxonomic similarity.
@@ -510,7 +833,8 @@ def brenda_select_enzyme_kinetic_data_for_model(
             BiGG identifiers.
         brenda_version (str): String identifier for the BRENDA database version.
         base_species (str): Species identifier used as the reference for taxonomic similarity.
-        ncbi_parsed_json_path (str): Path to the parsed JSON file containing NCBI taxonomy data.
+        ncbi_parsed_json_path (str): Path to the parsed JSON file containing NCBI taxonomy data, or to
+            a (faster loading) binary taxonomy folder (see ncbi_taxonomy_functionality.write_ncbi_taxonomy_binary).
         kinetic_ignored_metabolites (list[str], optional): List of metabolite IDs to exclude
             from kinetic parameter selection. Defaults to an empty list.
         kinetic_ignored_enzyme_ids (list[str], optional): List of enzyme identifiers to ignore
@@ -533,6 +857,10 @@ def brenda_select_enzyme_kinetic_data_for_model(
             are accepted. Defaults to True.
         kcat_overwrite (dict[str, float], optional): Dictionary mapping reaction IDs to k_cat values
             that should override computed values. Defaults to an empty dictionary.
+        brenda_store_path (str, optional): If given, the BRENDA data is read out from this indexed store
+            (see brenda_create_kinetics_store) instead of parsing the full BRENDA JSON. If the store
+            does not exist yet or was created from another BRENDA version than brenda_version, it is
+            (re-)created first from the BRENDA JSON. Defaults to "".
 
     Returns:
         dict[str, EnzymeReactionData | None]:
@@ -553,6 +881,20 @@ def brenda_select_enzyme_kinetic_data_for_model(
         if transfered_ec_number_json
         else {}
     )
+    if brenda_store_path and (
+        (not os.path.exists(brenda_store_path))
+        or (_brenda_get_kinetics_store_version(brenda_store_path) != brenda_version)
+    ):
+        if os.path.exists(brenda_store_path):
+            print(
+                f"INFO: BRENDA store {brenda_store_path} is not of BRENDA version {brenda_version} and is rebuilt."
+            )
+        brenda_create_kinetics_store(
+            brenda_json_targz_file_path=brenda_json_targz_file_path,
+            bigg_metabolites_json_path=bigg_metabolites_json_path,
+            brenda_version=brenda_version,
+            brenda_store_path=brenda_store_path,
+        )
     brenda_database_for_model = _brenda_get_all_enzyme_kinetic_data_for_model(
         cobra_model,
         brenda_json_targz_file_path,
@@ -565,13 +907,17 @@ def brenda_select_enzyme_kinetic_data_for_model(
         max_temperature,
         accept_nan_temperature,
         transfered_ec_codes=transfered_ec_codes,
+        brenda_store_path=brenda_store_path,
     )
-    ncbi_parsed_json_data = json_zip_load(ncbi_parsed_json_path)
+    ncbi_taxonomy_index = load_ncbi_taxonomy_index(ncbi_parsed_json_path)
 
     bigg_metabolites_data: dict[str, str] = json_load(
         bigg_metabolites_json_path,
         dict[str, str],
     )
+    normalized_bigg_metabolites_data = _get_normalized_name_to_bigg_id_dict(
+        bigg_metabolites_data
+    )
 
     # Get reaction<->enzyme reaction data mapping
     enzyme_reaction_data: dict[str, EnzymeReactionData | None] = {}
@@ -589,6 +935,7 @@ def brenda_select_enzyme_kinetic_data_for_model(
                         bigg_id="",
                         entry=None,
                         name_to_bigg_id_dict=bigg_metabolites_data,
+                        normalized_name_to_bigg_id_dict=normalized_bigg_metabolites_data,
                     )
                     if bigg_id:
                         substrate_names_and_ids.append(bigg_id)
@@ -650,10 +997,9 @@ def brenda_select_enzyme_kinetic_data_for_model(
             organisms = list(metabolite_entries[met_id].keys())
             if base_species not in organisms:
                 organisms.append(base_species)
-            taxonomy_dict = get_taxonomy_dict_from_nbci_taxonomy(
-                organisms, ncbi_parsed_json_data
+            taxonomy_similarities = ncbi_taxonomy_index.get_taxonomic_distances(
+                base_species, organisms
             )
-            taxonomy_similarities = most_taxonomic_similar(base_species, taxonomy_dict)
             highest_taxonomy_level = max(taxonomy_similarities.values())
             for taxonomy_level in range(highest_taxonomy_level + 1):
                 if taxonomy_level > max_taxonomy_level:
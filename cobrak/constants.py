@@ -102,6 +102,9 @@ LNCONC_VAR_PREFIX = "x_"
 MDF_VAR_ID = "var_B"
 """Name for minimally occuring driving force variable"""
 
+OBJECTIVE_BOUND_KEY = "OBJECTIVE_BOUND"
+"""Best objective value bound proven by an exact optimization in optimization dict (equal to the objective value if proven optimal)"""
+
 OBJECTIVE_CONSTRAINT_NAME = "objective_constraint"
 """Name for constraint that defines the objective function's term"""
 
@@ -141,6 +144,9 @@ STANDARD_T = 298.15
 TERMINATION_CONDITION_KEY = "TERMINATION_CONDITION"
 """Solver termination condition key in optimization dict"""
 
+TIME_BUDGET_EXCEEDED_KEY = "TIME_BUDGET_EXCEEDED"
+"""Shows that the run which found the result was cut short because its time budget was used up"""
+
 USED_IDENTIFIERS_FOR_EQUILIBRATOR = [
     "inchi",
     "inchi_key",
@@ -377,6 +377,40 @@ class Model:
         """Method called when leaving a 'with' block"""
         return  # Return None to propagate any exceptions
 
+    def get_enzyme_reaction_index(self, rebuild: bool = False) -> dict[str, list[str]]:
+        """Returns the IDs of all reactions in which each enzyme occurs.
+
+        In a model created with get_fullsplit_cobra_model, each enzyme variant of a reaction is its own reaction
+        (with the reac_enz_separator in its ID), so that an enzyme maps to all its reaction variants. As each
+        variant's enzyme_reaction_data identifiers are the genes of one of the original gene-protein rule's
+        "and" blocks, a knocked out enzyme (or gene) knocks out all its indexed reactions.
+
+        The index is built once and then cached. It is rebuilt automatically if the model's reaction IDs
+        changed. After in-place changes of a reaction's enzyme_reaction_data, use rebuild=True.
+
+        Args:
+            rebuild (bool, optional): Whether to rebuild the cached index. Defaults to False.
+
+        Returns:
+            dict[str, list[str]]: Enzyme ID -> IDs of the reactions with this enzyme.
+        """
+        reac_ids = tuple(self.reactions.keys())
+        cached_index = self.__dict__.get("_enzyme_reaction_index")
+        if (not rebuild) and (cached_index is not None) and cached_index[0] == reac_ids:
+            return cached_index[1]
+
+        enzyme_reaction_index: dict[str, list[str]] = {}
+        for reac_id, reaction in self.reactions.items():
+            if reaction.enzyme_reaction_data is None:
+                continue
+            for enzyme_id in reaction.enzyme_reaction_data.identifiers:
+                if enzyme_id not in enzyme_reaction_index:
+                    enzyme_reaction_index[enzyme_id] = []
+                if reac_id not in enzyme_reaction_index[enzyme_id]:
+                    enzyme_reaction_index[enzyme_id].append(reac_id)
+        self.__dict__["_enzyme_reaction_index"] = (reac_ids, enzyme_reaction_index)
+        return enzyme_reaction_index
+
 
 @dataclass
 class CorrectionConfig:
@@ -4,13 +4,161 @@ This wrapper intends to work with BiGG-styled cobrapy metabolic models.
 """
 
 # IMPORTS SECTION #
+import os
 from typing import Any
 
 import cobra
+import numpy as np
 from equilibrator_api import Q_, ComponentContribution, Reaction
+from joblib import Parallel, delayed
 from pydantic import ConfigDict, validate_call
 
 from .constants import USED_IDENTIFIERS_FOR_EQUILIBRATOR
+from .io import json_load, json_write
+
+
+# PRIVATE FUNCTIONS #
+def _equilibrator_get_compound_id(
+    cc: ComponentContribution,
+    used_identifier: str,
+    identifier: str,
+) -> int | None:
+    """Searches a compound in the eQuilibrator database and returns its internal ID.
+
+    Args:
+        cc (ComponentContribution): The eQuilibrator ComponentContribution instance.
+        used_identifier (str): The identifier type (one of USED_IDENTIFIERS_FOR_EQUILIBRATOR).
+        identifier (str): The identifier value.
+
+    Returns:
+        int | None: The compound's internal eQuilibrator database ID, or None if it was not found.
+    """
+    if used_identifier == "inchi":
+        compound = cc.get_compound_by_inchi(identifier)
+    elif used_identifier == "inchi_key":
+        compound_list = cc.search_compound_by_inchi_key(identifier)
+        compound = compound_list[0] if len(compound_list) > 0 else None
+    else:
+        compound = cc.get_compound(used_identifier + ":" + identifier)
+    return None if compound is None else compound.id
+
+
+def _equilibrator_run_dG0_tasks(
+    tasks: list[tuple[Any, ...]],
+    max_uncertainty: float,
+    cc: ComponentContribution | None = None,
+) -> dict[str, tuple[float, float]]:
+    """Calculates the ΔG'° values of the given single-compartment reaction groups and multi-compartment reactions.
+
+    The tasks are of the forms
+    ("group", (pH, pMg, ionic strength in mM), [(reaction ID, {compound ID: stoichiometry, ...}), ...])
+    for reactions in compartments with the same conditions, whose ΔG'° values are calculated together, and
+    ("multi", reaction ID, inner compound ID stoichiometries, outer compound ID stoichiometries,
+    inner conditions, outer conditions, potential difference in V) for two-compartment reactions.
+    The compounds are given with their internal eQuilibrator database IDs, so that tasks can be
+    run in other processes.
+
+    Args:
+        tasks (list[tuple[Any, ...]]): The tasks.
+        max_uncertainty (float): The maximal accepted uncertainty value in kJ⋅mol⁻¹.
+        cc (ComponentContribution | None, optional): The ComponentContribution instance. If None, a new one
+            is created (as needed in other processes). Defaults to None.
+
+    Returns:
+        dict[str, tuple[float, float]]: Reaction ID -> (ΔG'°, uncertainty) in kJ⋅mol⁻¹ for all reactions
+        with a low enough uncertainty.
+    """
+    if cc is None:
+        cc = ComponentContribution()
+    compounds: dict[int, Any] = {}
+
+    def get_cc_reaction(compound_stoichiometries: dict[int, float]) -> Reaction:
+        for compound_id in compound_stoichiometries:
+            if compound_id not in compounds:
+                compounds[compound_id] = cc.ccache.get_compound_by_internal_id(
+                    compound_id
+                )
+        return Reaction(
+            {
+                compounds[compound_id]: stoichiometry
+                for compound_id, stoichiometry in compound_stoichiometries.items()
+            }
+        )
+
+    dG0_results: dict[str, tuple[float, float]] = {}
+    for task in tasks:
+        if task[0] == "group":
+            _, (ph, pmg, ionic_strength), group_reactions = task
+            # Set compartment conditions
+            cc.p_h = Q_(ph)
+            cc.p_mg = Q_(pmg)
+            cc.ionic_strength = Q_(str(ionic_strength) + "mM")
+
+            balanced_reaction_ids: list[str] = []
+            cc_reactions: list[Reaction] = []
+            for reaction_id, compound_stoichiometries in group_reactions:
+                cc_reaction = get_cc_reaction(compound_stoichiometries)
+                # Check whether or not the reaction is balanced and...
+                if not cc_reaction.is_balanced():
+                    print(f"INFO: Reaction {reaction_id} is not balanced")
+                    continue
+                balanced_reaction_ids.append(reaction_id)
+                cc_reactions.append(cc_reaction)
+            if not cc_reactions:
+                continue
+
+            # ...calculate all ΔG'° at once, with the uncertainties as row norms of the covariance's square root
+            standard_dg_primes, dg_uncertainty_sqrt = cc.standard_dg_prime_multi(
+                cc_reactions, uncertainty_representation="sqrt"
+            )
+            dG0s = standard_dg_primes.m_as("kJ⋅mol⁻¹")
+            uncertainties = np.linalg.norm(
+                np.atleast_2d(dg_uncertainty_sqrt.m_as("kJ⋅mol⁻¹")), axis=1
+            )
+            for reaction_id, dG0, uncertainty in zip(
+                balanced_reaction_ids, dG0s, uncertainties
+            ):
+                if uncertainty < max_uncertainty:
+                    dG0_results[reaction_id] = (float(dG0), float(uncertainty))
+                    print(
+                        f"No error with reaction {reaction_id}, ΔG'° succesfully calculated!"
+                    )
+                else:
+                    print(
+                        f"INFO: Reaction {reaction_id} uncertainty is too high with {uncertainty} kJ⋅mol⁻¹; ΔG'° not assigned for this reaction"
+                    )
+        else:
+            (
+                _,
+                reaction_id,
+                inner_compound_stoichiometries,
+                outer_compound_stoichiometries,
+                (ph_inner, pmg_inner, ionic_strength_inner),
+                (ph_outer, pmg_outer, ionic_strength_outer),
+                potential_difference,
+            ) = task
+            cc.p_h = Q_(ph_inner)
+            cc.ionic_strength = Q_(str(ionic_strength_inner) + " mM")
+            cc.p_mg = Q_(pmg_inner)
+            try:
+                standard_dg_prime = cc.multicompartmental_standard_dg_prime(
+                    get_cc_reaction(inner_compound_stoichiometries),
+                    get_cc_reaction(outer_compound_stoichiometries),
+                    e_potential_difference=Q_(str(potential_difference) + " V"),
+                    p_h_outer=Q_(ph_outer),
+                    p_mg_outer=Q_(pmg_outer),
+                    ionic_strength_outer=Q_(str(ionic_strength_outer) + " mM"),
+                )
+            except ValueError:
+                print("ERROR: Multi-compartmental reaction is not balanced")
+                continue
+            uncertainty = standard_dg_prime.error.m_as("kJ⋅mol⁻¹")
+            if uncertainty < max_uncertainty:
+                dG0_results[reaction_id] = (
+                    standard_dg_prime.value.m_as("kJ⋅mol⁻¹"),
+                    abs(uncertainty),
+                )
+    return dG0_results
 
 
 # PUBLIC FUNCTIONS #
@@ -26,12 +174,17 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
     exclusion_inner_parts: list[str] = [],
     ignore_uncertainty: bool = False,
     max_uncertainty: float = 1_000.0,
+    compound_cache_json_path: str = "",
+    num_workers: int = 1,
 ) -> tuple[dict[str, float], dict[str, float]]:
     """Cobrapy model wrapper for the ΔG'° determination of reactions using the eQuilibrator-API.
 
     Reactions are identified according to all annotation (in the cobrapy reaction's annotation member variable)
     given in this modules global USED_IDENTIFIERS list.
 
+    Each metabolite's compound is searched only once. Single-compartment reactions are grouped by their
+    compartment conditions, and the ΔG'° values of each group are calculated together in one eQuilibrator call.
+
     Args:
         sbml_path (str): The path to the SBML-encoded constraint-based metabolic model for which ΔG'° values are determined.
         inner_to_outer_compartments (List[str]): A list with compartment IDs going from inner (e.g., in E. coli,
@@ -44,6 +197,12 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
             the ID of an innter and outer compartment, and the potential difference between them.
         max_uncertainty (float): The maximal accepted uncertainty value (defaults to 1000 kJ⋅mol⁻¹). If a calculated uncertainty
             is higher than this value, the associated ΔG'° is *not* used (i.e., the specific reaction gets no ΔG'°).
+        compound_cache_json_path (str, optional): If given, the found (or not found) eQuilibrator compounds of all
+            searched identifiers are stored in (and, in later runs, read from) this JSON. As it contains internal
+            eQuilibrator database IDs, delete it if the eQuilibrator database changes. Defaults to "" (no cache).
+        num_workers (int, optional): Number of processes for the ΔG'° calculations. As each process has to load its
+            own eQuilibrator data (which takes time and memory), the default is a single calculation in this process.
+            Defaults to 1.
 
     Returns:
         Dict[str, Dict[str, float]]: A dictionary with the reaction IDs as keys, and dictionaries as values which,
@@ -51,9 +210,16 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
     """
     cobra_model = cobra.io.read_sbml_model(sbml_path)
 
-    reaction_dG0s: dict[str, float] = {}
-    reaction_dG0_uncertainties: dict[str, float] = {}
-    cc = ComponentContribution()
+    compound_id_cache: dict[str, int | None] = (
+        json_load(compound_cache_json_path, dict[str, int | None])
+        if compound_cache_json_path and os.path.exists(compound_cache_json_path)
+        else {}
+    )
+    cc: ComponentContribution | None = None
+    # Metabolite ID -> internal eQuilibrator compound ID (None if not found)
+    metabolite_compound_ids: dict[str, int | None] = {}
+    group_reactions: dict[tuple[float, float, float], list[Any]] = {}
+    multi_compartment_tasks: list[tuple[Any, ...]] = []
     for reaction_x in cobra_model.reactions:
         reaction: cobra.Reaction = reaction_x
 
@@ -64,45 +230,43 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
         for exclusion_inner_part in exclusion_inner_parts:
             if exclusion_inner_part in reaction.id:
                 stop = True
-        if stop:
+        if stop or not reaction.metabolites:
             continue
 
         stoichiometries: list[float] = []
         compartments: list[str] = []
-        identifiers: list[str] = []
-        identifier_keys: list[str] = []
+        compound_ids: list[int] = []
         for metabolite_x in reaction.metabolites:
             metabolite: cobra.Metabolite = metabolite_x
+            if metabolite.id not in metabolite_compound_ids:
+                compound_id: int | None = None
+                for used_identifier in USED_IDENTIFIERS_FOR_EQUILIBRATOR:
+                    if used_identifier not in metabolite.annotation:
+                        continue
+                    metabolite_identifiers = metabolite.annotation[used_identifier]
+                    identifier_temp = ""
+                    if isinstance(metabolite_identifiers, list):
+                        identifier_temp = metabolite_identifiers[0]
+                    elif isinstance(metabolite_identifiers, str):
+                        identifier_temp = metabolite_identifiers
+                    cache_key = f"{used_identifier}:{identifier_temp}"
+                    if cache_key not in compound_id_cache:
+                        if cc is None:
+                            cc = ComponentContribution()
+                        compound_id_cache[cache_key] = _equilibrator_get_compound_id(
+                            cc, used_identifier, identifier_temp
+                        )
+                    compound_id = compound_id_cache[cache_key]
+                    if compound_id is not None:
+                        break
+                metabolite_compound_ids[metabolite.id] = compound_id
+            if metabolite_compound_ids[metabolite.id] is None:
+                break
             stoichiometries.append(reaction.metabolites[metabolite])
             compartments.append(metabolite.compartment)
-            identifier = ""
-            for used_identifier in USED_IDENTIFIERS_FOR_EQUILIBRATOR:
-                if used_identifier not in metabolite.annotation:
-                    continue
-                metabolite_identifiers = metabolite.annotation[used_identifier]
-                identifier_temp = ""
-                if isinstance(metabolite_identifiers, list):
-                    identifier_temp = metabolite_identifiers[0]
-                elif isinstance(metabolite_identifiers, str):
-                    identifier_temp = metabolite_identifiers
-                if used_identifier == "inchi":
-                    compound = cc.get_compound_by_inchi(identifier_temp)
-                elif used_identifier == "inchi_key":
-                    compound_list = cc.search_compound_by_inchi_key(identifier_temp)
-                    compound = compound_list[0] if len(compound_list) > 0 else None
-                else:
-                    identifier_temp = used_identifier + ":" + identifier_temp
-                    compound = cc.get_compound(identifier_temp)
-                if compound is not None:
-                    identifier_key = used_identifier
-                    identifier = identifier_temp
-                    break
-            if not identifier:
-                break
-            identifier_keys.append(identifier_key)
-            identifiers.append(identifier)
+            compound_ids.append(metabolite_compound_ids[metabolite.id])
 
-        if not identifier:
+        if metabolite_compound_ids[metabolite_x.id] is None:
             print(
                 f"ERROR: Metabolite {metabolite_x.id} has no identifier of the given types!"
             )
@@ -116,49 +280,17 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
         unique_reaction_compartments = list(set(compartments))
         num_compartments = len(unique_reaction_compartments)
         if num_compartments == 1:
-            # Set compartment conditions
             compartment = unique_reaction_compartments[0]
-            cc.p_h = Q_(phs[compartment])
-            cc.p_mg = Q_(pmgs[compartment])
-            cc.ionic_strength = Q_(str(ionic_strengths[compartment]) + "mM")
-
-            # Build together reaction
-            reaction_dict: dict[Any, float] = {}
-            for i in range(len(stoichiometries)):
-                identifier_string = identifiers[i]
-                identifier_key = identifier_keys[i]
-                stoichiometry = stoichiometries[i]
-                if identifier_key == "inchi":
-                    compound = cc.get_compound_by_inchi(identifier_string)
-                elif identifier_key == "inchi_key":
-                    compound = cc.search_compound_by_inchi_key(identifier_string)[0]
-                else:
-                    compound = cc.get_compound(identifier_string)
-                reaction_dict[compound] = stoichiometry
-            cc_reaction = Reaction(reaction_dict)
-
-            # Check whether or not the reaction is balanced and...
-            if not cc_reaction.is_balanced():
-                print(f"INFO: Reaction {reaction.id} is not balanced")
-                continue
-
-            standard_dg_prime = cc.standard_dg_prime(cc_reaction)
-            uncertainty = standard_dg_prime.error.m_as("kJ⋅mol⁻¹")
-            if uncertainty < max_uncertainty:
-                dG0 = standard_dg_prime.value.m_as("kJ⋅mol⁻¹")
-                reaction_dG0s[reaction.id] = dG0
-                if ignore_uncertainty:
-                    reaction_dG0_uncertainties[reaction.id] = 0.0
-                else:
-                    reaction_dG0_uncertainties[reaction.id] = abs(uncertainty)
-
-                print(
-                    f"No error with reaction {reaction.id}, ΔG'° succesfully calculated!"
-                )
-            else:
-                print(
-                    f"INFO: Reaction {reaction.id} uncertainty is too high with {uncertainty} kJ⋅mol⁻¹; ΔG'° not assigned for this reaction"
-                )
+            conditions = (
+                phs[compartment],
+                pmgs[compartment],
+                ionic_strengths[compartment],
+            )
+            if conditions not in group_reactions:
+                group_reactions[conditions] = []
+            group_reactions[conditions].append(
+                (reaction.id, dict(zip(compound_ids, stoichiometries)))
+            )
         elif num_compartments == 2:
             index_zero = inner_to_outer_compartments.index(
                 unique_reaction_compartments[0]
@@ -174,75 +306,80 @@ def equilibrator_get_model_dG0_and_uncertainty_values(
                 outer_compartment = unique_reaction_compartments[0]
                 inner_compartment = unique_reaction_compartments[1]
 
-            ph_inner = Q_(phs[inner_compartment])
-            ph_outer = Q_(phs[outer_compartment])
-            ionic_strength_inner = Q_(str(ionic_strengths[inner_compartment]) + " mM")
-            ionic_strength_outer = Q_(str(ionic_strengths[outer_compartment]) + " mM")
-            pmg_inner = Q_(pmgs[inner_compartment])
-            pmg_outer = Q_(pmgs[outer_compartment])
-
             if (inner_compartment, outer_compartment) in potential_differences:
-                potential_difference = Q_(
-                    str(potential_differences[(inner_compartment, outer_compartment)])
-                    + " V"
-                )
+                potential_difference = potential_differences[
+                    (inner_compartment, outer_compartment)
+                ]
             elif (outer_compartment, inner_compartment) in potential_differences:
-                potential_difference = Q_(
-                    str(potential_differences[(outer_compartment, inner_compartment)])
-                    + " V"
-                )
+                potential_difference = potential_differences[
+                    (outer_compartment, inner_compartment)
+                ]
             else:
                 print("ERROR")
                 continue
 
-            inner_reaction_dict: dict[str, float] = {}
-            outer_reaction_dict: dict[str, float] = {}
-            for i in range(len(stoichiometries)):
-                key = identifiers[i]
-                stoichiometry = stoichiometries[i]
-                try:
-                    compound_key = cc.get_compound(key)
-                except Exception:  # sqlalchemy.orm.exc.MultipleResultsFound
-                    print("ERROR")
-                    continue
-
-                if compound_key is None:
-                    print("NONE in compound")
-                    continue
-
-                if compartments[i] == inner_compartment:
-                    inner_reaction_dict[compound_key] = stoichiometry
+            inner_compound_stoichiometries: dict[int, float] = {}
+            outer_compound_stoichiometries: dict[int, float] = {}
+            for compound_id, stoichiometry, compartment in zip(
+                compound_ids, stoichiometries, compartments
+            ):
+                if compartment == inner_compartment:
+                    inner_compound_stoichiometries[compound_id] = stoichiometry
                 else:
-                    outer_reaction_dict[compound_key] = stoichiometry
+                    outer_compound_stoichiometries[compound_id] = stoichiometry
 
-            cc_inner_reaction = Reaction(inner_reaction_dict)
-            cc_outer_reaction = Reaction(outer_reaction_dict)
-
-            cc.p_h = ph_inner
-            cc.ionic_strength = ionic_strength_inner
-            cc.p_mg = pmg_inner
-            try:
-                standard_dg_prime = cc.multicompartmental_standard_dg_prime(
-                    cc_inner_reaction,
-                    cc_outer_reaction,
-                    e_potential_difference=potential_difference,
-                    p_h_outer=ph_outer,
-                    p_mg_outer=pmg_outer,
-                    ionic_strength_outer=ionic_strength_outer,
+            multi_compartment_tasks.append(
+                (
+                    "multi",
+                    reaction.id,
+                    inner_compound_stoichiometries,
+                    outer_compound_stoichiometries,
+                    (
+                        phs[inner_compartment],
+                        pmgs[inner_compartment],
+                        ionic_strengths[inner_compartment],
+                    ),
+                    (
+                        phs[outer_compartment],
+                        pmgs[outer_compartment],
+                        ionic_strengths[outer_compartment],
+                    ),
+                    potential_difference,
                 )
-                uncertainty = standard_dg_prime.error.m_as("kJ⋅mol⁻¹")
-                if uncertainty < max_uncertainty:
-                    dG0 = standard_dg_prime.value.m_as("kJ⋅mol⁻¹")
-                    reaction_dG0s[reaction.id] = dG0
-                    if ignore_uncertainty:
-                        reaction_dG0_uncertainties[reaction.id] = 0.0
-                    else:
-                        reaction_dG0_uncertainties[reaction.id] = abs(uncertainty)
-            except ValueError:
-                print("ERROR: Multi-compartmental reaction is not balanced")
-                continue
+            )
         else:
             print("ERROR: More than two compartments are not possible")
             continue
 
+    if compound_cache_json_path:
+        json_write(compound_cache_json_path, compound_id_cache)
+
+    tasks: list[tuple[Any, ...]] = [
+        ("group", conditions, reactions)
+        for conditions, reactions in group_reactions.items()
+    ] + multi_compartment_tasks
+    if num_workers > 1:
+        dG0_results: dict[str, tuple[float, float]] = {}
+        for worker_results in Parallel(n_jobs=num_workers, verbose=10)(
+            delayed(_equilibrator_run_dG0_tasks)(
+                tasks[worker_index::num_workers], max_uncertainty
+            )
+            for worker_index in range(min(num_workers, len(tasks)))
+        ):
+            dG0_results.update(worker_results)
+    else:
+        dG0_results = (
+            _equilibrator_run_dG0_tasks(tasks, max_uncertainty, cc) if tasks else {}
+        )
+
+    reaction_dG0s: dict[str, float] = {}
+    reaction_dG0_uncertainties: dict[str, float] = {}
+    for reaction_x in cobra_model.reactions:
+        if reaction_x.id not in dG0_results:
+            continue
+        dG0, uncertainty = dG0_results[reaction_x.id]
+        reaction_dG0s[reaction_x.id] = dG0
+        reaction_dG0_uncertainties[reaction_x.id] = (
+            0.0 if ignore_uncertainty else abs(uncertainty)
+        )
     return reaction_dG0s, reaction_dG0_uncertainties
@@ -3,27 +3,43 @@
 The actual genetic algorithm can be found in the module 'genetic'.
 """
 
+import os
 from copy import deepcopy
-from random import sample
+from os.path import exists
+from random import Random
 from tempfile import TemporaryDirectory
 from time import time
-from typing import Any, Literal
+from typing import Any
 
 from joblib import Parallel, cpu_count, delayed
 from numpy.random import randint
 from pyomo.common.errors import ApplicationError
-from pyomo.environ import Binary, Constraint, Reals, Var
-
-from .constants import ALL_OK_KEY, BIG_M, OBJECTIVE_VAR_NAME, Z_VAR_PREFIX
+from pyomo.environ import Binary, ConcreteModel, Constraint, Reals, Var
+
+from .constants import (
+    ALL_OK_KEY,
+    BIG_M,
+    OBJECTIVE_VAR_NAME,
+    TIME_BUDGET_EXCEEDED_KEY,
+    Z_VAR_PREFIX,
+)
 from .dataclasses import CorrectionConfig, ExtraLinearConstraint, Model, Solver
 from .genetic import COBRAKGENETIC
-from .io import json_load, json_write
+from .io import (
+    ensure_folder_existence,
+    json_load,
+    json_write,
+    pickle_load,
+    pickle_write,
+)
 from .lps import (
+    _get_optimization_lp,
     add_statuses_to_optimziation_dict,
     get_lp_from_cobrak_model,
     perform_lp_optimization,
     perform_lp_variability_analysis,
 )
+from .metaheuristics import BINARY_OPTIMIZERS
 from .nlps import perform_nlp_irreversible_optimization_with_active_reacs_only
 from .pyomo_functionality import (
     add_objective_to_model,
@@ -38,8 +54,9 @@ from .utilities import (
     get_files,
     get_pyomo_solution_as_dict,
     get_stoichiometrically_coupled_reactions,
+    is_infeasible_optimization_dict,
     is_objsense_maximization,
-    split_list,
+    parallel_map_until_deadline,
     standardize_folder,
 )
 
@@ -59,15 +76,23 @@ class COBRAKProblem:
         with_iota (bool, optional): Whether to use iota parameter. Defaults to True.
         with_alpha (bool, optional): Whether to use alpha parameter. Defaults to True.
         num_gens (int, optional): The number of generations in the evolutionary algorithm. Defaults to 5.
-        algorithm (Literal["genetic"], optional): The type of optimization algorithm to use. Defaults to "genetic", the only available algorithm right now.
+        algorithm (str | type, optional): The optimization algorithm to use, either a key of cobrak.metaheuristics.BINARY_OPTIMIZERS
+            ("genetic", "annealing" or "tabu") or an optimizer class with the same interface. Defaults to "genetic".
         lp_solver (Solver, optional): The linear programming solver to use. Defaults to SCIP.
         nlp_solver (Solver, optional): The nonlinear programming solver to use. Defaults to IPOPT.
-        objvalue_json_path (str, optional): The path to the JSON file for storing objective values. Defaults to "".
+        objvalue_json_path (str, optional): The path to the JSON Lines file to which the objective values are appended (see COBRAKGENETIC). Defaults to "".
         max_rounds_same_objvalue (float, optional): The maximum number of rounds with the same objective value before stopping. Defaults to float("inf").
         correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
         min_abs_objvalue (float, optional): The minimum absolute value of the objective function to consider as valid. Defaults to 1e-6.
         pop_size (int | None, optional): The population size for the evolutionary algorithm. Defaults to None.
         ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs. Defaults to True.
+        surrogate_skip_share (float, optional): Share of each generation's mutated solutions that a surrogate model predicts to be least promising and
+            which are therefore not evaluated. Defaults to 0.0, i.e. no surrogate pre-screening.
+        seed (int | None, optional): Seed of the evolutionary algorithm's random number generator. Defaults to None.
+        checkpoint_folder (str, optional): If not empty, folder in which the evolutionary algorithm's checkpoint and the found NLP
+            results are stored so that an interrupted run can be resumed (checkpoints are only written by the genetic algorithm). Defaults to "".
+        time_budget (float, optional): Maximal wall-clock seconds of the evolutionary algorithm. Defaults to float("inf").
+        optimizer_options (dict[str, Any], optional): Extra keyword arguments of the optimizer class (e.g. tabu_tenure for "tabu"). Defaults to {}.
 
     Attributes:
         original_cobrak_model (Model): A deep copy of the original COBRA-k model.
@@ -81,7 +106,7 @@ class COBRAKProblem:
         nlp_solver (Solver): The nonlinear programming solver.
         temp_directory_name (str): Name of the temporary directory for storing results.
         best_value (float): The best value found so far.
-        objvalue_json_path (str): Path to the JSON file for objective values.
+        objvalue_json_path (str): Path to the JSON Lines file for objective values.
         max_rounds_same_objvalue (float): Maximum number of rounds with same objective value.
         correction_config (CorrectionConfig): Configuration for corrections.
         min_abs_objvalue (float): Minimum absolute value of objective function to consider valid.
@@ -100,7 +125,7 @@ class COBRAKProblem:
         with_iota: bool = True,
         with_alpha: bool = True,
         num_gens: int = 5,
-        algorithm: Literal["genetic"] = "genetic",
+        algorithm: str | type = "genetic",
         lp_solver: Solver = SCIP,
         nlp_solver: Solver = IPOPT,
         nlp_strict_mode: bool = False,
@@ -111,6 +136,11 @@ class COBRAKProblem:
         min_abs_objvalue: float = 1e-6,
         pop_size: int | None = None,
         ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+        surrogate_skip_share: float = 0.0,
+        seed: int | None = None,
+        checkpoint_folder: str = "",
+        time_budget: float = float("inf"),
+        optimizer_options: dict[str, Any] = {},
     ) -> None:
         """Initializes a COBRAKProblem object.
 
@@ -126,18 +156,28 @@ class COBRAKProblem:
             with_iota (bool, optional): Whether to use iota parameter. Defaults to True.
             with_alpha (bool, optional): Whether to use alpha parameter. Defaults to True.
             num_gens (int, optional): The number of generations in the evolutionary algorithm. Defaults to 5.
-            algorithm (Literal["genetic"], optional): The type of optimization algorithm to use. Defaults to "genetic", the only algorithm currently available.
+            algorithm (str | type, optional): The optimization algorithm to use, either a key of cobrak.metaheuristics.BINARY_OPTIMIZERS
+                ("genetic", "annealing" or "tabu") or an optimizer class with the same interface. Defaults to "genetic".
             lp_solver (Solver, optional): The linear programming solver to use. Defaults to SCIP.
             nlp_solver (Solver, optional): The nonlinear programming solver to use. Defaults to IPOPT.
             nlp_strict_mode (bool, optional): Whether or not the <= heuristic (True) or not (False; i.e. setting all equations to ==) shall be used. Defaults to False.
             nlp_single_strict_reacs (list[str], optional): List of single reactions that shall be in strict mode (see ```nlp_strict_mode```argument above).
                 If ```nlp_strict_mode=True```, this has no effect. Defaults to [].
-            objvalue_json_path (str, optional): The path to the JSON file for storing objective values. Defaults to "".
+            objvalue_json_path (str, optional): The path to the JSON Lines file to which the objective values are appended (see COBRAKGENETIC). Defaults to "".
             max_rounds_same_objvalue (float, optional): The maximum number of rounds with the same objective value before stopping. Defaults to float("inf").
             correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
             min_abs_objvalue (float, optional): The minimum absolute value of the objective function to consider as valid. Defaults to 1e-6.
             pop_size (int | None, optional): The population size for the evolutionary algorithm. Defaults to None.
             ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs. Defaults to True.
+            surrogate_skip_share (float, optional): Share of each generation's mutated solutions that a surrogate model predicts to be least promising and
+                which are therefore not evaluated. Defaults to 0.0, i.e. no surrogate pre-screening.
+            seed (int | None, optional): Seed of the evolutionary algorithm's random number generator. Defaults to None.
+            checkpoint_folder (str, optional): If not empty, folder in which the evolutionary algorithm's checkpoint and the found NLP
+                results are stored so that an interrupted run can be resumed (checkpoints are only written by the genetic algorithm). Defaults to "".
+            time_budget (float, optional): Maximal wall-clock seconds of the evolutionary algorithm. If it is used up,
+                the results found so far are returned with TIME_BUDGET_EXCEEDED_KEY set to True. Defaults to float("inf").
+            optimizer_options (dict[str, Any], optional): Extra keyword arguments of the optimizer class (e.g. tabu_tenure for "tabu").
+                Defaults to {}.
         """
         self.original_cobrak_model: Model = deepcopy(cobrak_model)
         self.objective_target = objective_target
@@ -189,13 +229,9 @@ class COBRAKProblem:
             for nlp_dict in nlp_dict_list:
                 first_reac_id = filtered_reac_couplex[0]
                 if (first_reac_id in nlp_dict) and (nlp_dict[first_reac_id] > 0.0):
-                    self.initial_xs_list[nlp_idx].append(
-                        1.0 if algorithm != "genetic" else 1
-                    )
+                    self.initial_xs_list[nlp_idx].append(1)
                 else:
-                    self.initial_xs_list[nlp_idx].append(
-                        0.0 if algorithm != "genetic" else 0
-                    )
+                    self.initial_xs_list[nlp_idx].append(0)
 
                 nlp_idx += 1  # noqa: SIM113
 
@@ -222,6 +258,138 @@ class COBRAKProblem:
         self.ignore_nonlinear_extra_terms_in_ectfbas = (
             ignore_nonlinear_extra_terms_in_ectfbas
         )
+        self.surrogate_skip_share = surrogate_skip_share
+        self.seed = seed
+        self.checkpoint_folder = (
+            standardize_folder(checkpoint_folder) if checkpoint_folder else ""
+        )
+        self.time_budget = time_budget
+        self.optimizer_options = optimizer_options
+
+    def _get_used_z_tfba_dict(
+        self,
+        z_ectfba_dict: dict[str, float],
+        deactivated_reactions: list[str],
+    ) -> dict[str, float]:
+        """Returns which reactions are used (1.0) or unused (0.0) in a max-z or min-z ecTFBA result.
+
+        Args:
+            z_ectfba_dict (dict[str, float]): The max-z or min-z ecTFBA result.
+            deactivated_reactions (list[str]): The reactions deactivated for the current solution.
+
+        Returns:
+            dict[str, float]: The usage dict, ready as optimization dict for an NLP with active reactions only.
+        """
+        used_z_tfba_dict: dict[str, float] = {}
+        for var_id in z_ectfba_dict:
+            if var_id not in self.original_cobrak_model.reactions:
+                continue
+            reaction = self.original_cobrak_model.reactions[var_id]
+            if ((reaction.dG0 is None) and (var_id not in deactivated_reactions)) or (
+                (reaction.dG0 is not None)
+                and (z_ectfba_dict[f"{Z_VAR_PREFIX}{var_id}"] > 0.0)
+            ):
+                used_z_tfba_dict[var_id] = 1.0
+            else:
+                used_z_tfba_dict[var_id] = 0.0
+        used_z_tfba_dict[ALL_OK_KEY] = True
+        return used_z_tfba_dict
+
+    def _perform_z_branch_nlp(
+        self,
+        used_z_tfba_dict: dict[str, float],
+    ) -> dict[str, float] | None:
+        """Runs the NLP of a max-z or min-z branch of the fitness function.
+
+        Args:
+            used_z_tfba_dict (dict[str, float]): The reaction usage dict of the branch's ecTFBA.
+
+        Returns:
+            dict[str, float] | None: The NLP result or None if it failed or its objective value is too small.
+        """
+        try:
+            nlp_dict = perform_nlp_irreversible_optimization_with_active_reacs_only(
+                cobrak_model=self.original_cobrak_model,
+                objective_target=self.objective_target,
+                objective_sense=self.objective_sense,
+                optimization_dict=deepcopy(used_z_tfba_dict),
+                variability_dict=deepcopy(self.variability_data),
+                with_kappa=self.with_kappa,
+                with_gamma=self.with_gamma,
+                with_iota=self.with_iota,
+                with_alpha=self.with_alpha,
+                solver=self.nlp_solver,
+                correction_config=self.correction_config,
+                strict_mode=self.nlp_strict_mode,
+                single_strict_reacs=self.nlp_single_strict_reacs,
+            )
+        except (ApplicationError, AttributeError, ValueError, OSError):
+            return None
+        if nlp_dict[ALL_OK_KEY] and (
+            abs(nlp_dict[OBJECTIVE_VAR_NAME]) > self.min_abs_objvalue
+        ):
+            return nlp_dict
+        return None
+
+    def _perform_z_branch(
+        self,
+        z_lp: ConcreteModel,
+        z_objective_sense: int,
+        deactivated_reactions: list[str],
+    ) -> dict[str, float] | None:
+        """Solves the max-z or min-z ecTFBA of the fitness function and the NLP with its active reactions.
+
+        This runs in its own process (see fitness), i.e., z_lp is this branch's own copy of the shared LP.
+
+        Args:
+            z_lp (ConcreteModel): The ecTFBA with both z sum objectives (deactivated).
+            z_objective_sense (int): +1 for the max-z and -1 for the min-z branch.
+            deactivated_reactions (list[str]): The reactions deactivated for the current solution.
+
+        Returns:
+            dict[str, float] | None: The NLP result or None if the ecTFBA or NLP failed or the objective value is too small.
+        """
+        getattr(z_lp, f"z_sum_obj_{z_objective_sense}").activate()
+        pyomo_lp_solver = get_solver(
+            self.lp_solver.name,
+            self.lp_solver.solver_options,
+            self.lp_solver.solver_attrs,
+        )
+        try:
+            results = pyomo_lp_solver.solve(
+                z_lp, tee=False, **self.lp_solver.solve_extra_options
+            )
+            z_ectfba_dict = add_statuses_to_optimziation_dict(
+                get_pyomo_solution_as_dict(z_lp), results
+            )
+        except (ApplicationError, AttributeError, ValueError, OSError):
+            return None
+        if not z_ectfba_dict[ALL_OK_KEY]:
+            return None
+        return self.perform_nlp_with_ectfba_active_reactions(
+            z_ectfba_dict, deactivated_reactions
+        )
+
+    def perform_nlp_with_ectfba_active_reactions(
+        self,
+        ectfba_dict: dict[str, float],
+        deactivated_reactions: list[str],
+    ) -> dict[str, float] | None:
+        """Runs the problem's NLP with the reactions that are active in the given ecTFBA result.
+
+        This is the NLP that fitness() runs for its max-z and min-z ecTFBAs and can be used for ecTFBAs of other origin
+        (e.g., the nodes of a branch-and-bound search).
+
+        Args:
+            ectfba_dict (dict[str, float]): The ecTFBA result (with thermodynamic constraints, i.e., with z variables).
+            deactivated_reactions (list[str]): The reactions deactivated in the ecTFBA.
+
+        Returns:
+            dict[str, float] | None: The NLP result or None if it failed or its objective value is too small.
+        """
+        return self._perform_z_branch_nlp(
+            self._get_used_z_tfba_dict(ectfba_dict, deactivated_reactions)
+        )
 
     def fitness(
         self,
@@ -260,8 +428,6 @@ class COBRAKProblem:
         if not first_ectfba_dict[ALL_OK_KEY]:
             return [(1_000_000.0, [])]
 
-        nlp_results: list[dict[str, float]] = []
-
         if is_objsense_maximization(self.objective_sense):
             lower_value = first_ectfba_dict[OBJECTIVE_VAR_NAME] - 1e-12
             upper_value = None
@@ -292,127 +458,42 @@ class COBRAKProblem:
             and (self.variability_data[reac_id][1] > 0.0)
             and (reac_id not in deactivated_reactions)
         }
-        try:
-            maxz_ectfba_dict = perform_lp_optimization(
-                cobrak_model=maxz_model,
-                objective_target=eligible_z_sum_objective,
-                objective_sense=+1,
-                with_enzyme_constraints=True,
-                with_thermodynamic_constraints=True,
-                with_loop_constraints=True,
-                variability_dict=deepcopy(self.variability_data),
-                ignored_reacs=deactivated_reactions,
-                solver=self.lp_solver,
-                correction_config=self.correction_config,
-                ignore_nonlinear_terms=self.ignore_nonlinear_extra_terms_in_ectfbas,
-            )
-        except (ApplicationError, AttributeError, ValueError):
-            maxz_ectfba_dict = {ALL_OK_KEY: False}
-        if maxz_ectfba_dict[ALL_OK_KEY]:
-            used_maxz_tfba_dict: dict[str, float] = {}
-            for var_id in maxz_ectfba_dict:
-                if var_id not in self.original_cobrak_model.reactions:
-                    continue
-                reaction = self.original_cobrak_model.reactions[var_id]
-                if (
-                    (reaction.dG0 is None) and (var_id not in deactivated_reactions)
-                ) or (
-                    (reaction.dG0 is not None)
-                    and (maxz_ectfba_dict[f"{Z_VAR_PREFIX}{var_id}"] > 0.0)
-                ):
-                    used_maxz_tfba_dict[var_id] = 1.0
-                else:
-                    used_maxz_tfba_dict[var_id] = 0.0
-
-            used_maxz_tfba_dict[ALL_OK_KEY] = True
-
-            if used_maxz_tfba_dict[ALL_OK_KEY]:
-                try:
-                    second_nlp_dict = (
-                        perform_nlp_irreversible_optimization_with_active_reacs_only(
-                            cobrak_model=self.original_cobrak_model,
-                            objective_target=self.objective_target,
-                            objective_sense=self.objective_sense,
-                            optimization_dict=deepcopy(used_maxz_tfba_dict),
-                            variability_dict=deepcopy(self.variability_data),
-                            with_kappa=self.with_kappa,
-                            with_gamma=self.with_gamma,
-                            with_iota=self.with_iota,
-                            with_alpha=self.with_alpha,
-                            solver=self.nlp_solver,
-                            correction_config=self.correction_config,
-                            strict_mode=self.nlp_strict_mode,
-                            single_strict_reacs=self.nlp_single_strict_reacs,
-                        )
-                    )
-                    if second_nlp_dict[ALL_OK_KEY] and (
-                        abs(second_nlp_dict[OBJECTIVE_VAR_NAME]) > self.min_abs_objvalue
-                    ):
-                        nlp_results.append(second_nlp_dict)
-                except (ApplicationError, AttributeError, ValueError):
-                    pass
 
-        ####
+        # One LP is built for both the max-z and the min-z objective, which are activated in the respective branch
         try:
-            minz_ectfba_dict = perform_lp_optimization(
+            z_lp = _get_optimization_lp(
                 cobrak_model=maxz_model,
-                objective_target=eligible_z_sum_objective,
-                objective_sense=-1,
                 with_enzyme_constraints=True,
                 with_thermodynamic_constraints=True,
                 with_loop_constraints=True,
                 variability_dict=deepcopy(self.variability_data),
                 ignored_reacs=deactivated_reactions,
-                solver=self.lp_solver,
                 correction_config=self.correction_config,
                 ignore_nonlinear_terms=self.ignore_nonlinear_extra_terms_in_ectfbas,
             )
+            for z_objective_sense in (+1, -1):
+                z_lp = add_objective_to_model(
+                    z_lp,
+                    eligible_z_sum_objective,
+                    z_objective_sense,
+                    f"z_sum_obj_{z_objective_sense}",
+                    f"z_sum_obj_var_{z_objective_sense}",
+                )
+                getattr(z_lp, f"z_sum_obj_{z_objective_sense}").deactivate()
         except (ApplicationError, AttributeError, ValueError):
-            minz_ectfba_dict = {ALL_OK_KEY: False}
-        if minz_ectfba_dict[ALL_OK_KEY]:
-            used_minz_tfba_dict: dict[str, float] = {}
-            for var_id in minz_ectfba_dict:
-                if var_id not in self.original_cobrak_model.reactions:
-                    continue
-                reaction = self.original_cobrak_model.reactions[var_id]
-                if (
-                    (reaction.dG0 is None) and (var_id not in deactivated_reactions)
-                ) or (
-                    (reaction.dG0 is not None)
-                    and (minz_ectfba_dict[f"{Z_VAR_PREFIX}{var_id}"] > 0.0)
-                ):
-                    used_minz_tfba_dict[var_id] = 1.0
-                else:
-                    used_minz_tfba_dict[var_id] = 0.0
-
-            used_minz_tfba_dict[ALL_OK_KEY] = True
-
-            if used_minz_tfba_dict[ALL_OK_KEY]:
-                try:
-                    third_nlp_dict = (
-                        perform_nlp_irreversible_optimization_with_active_reacs_only(
-                            cobrak_model=self.original_cobrak_model,
-                            objective_target=self.objective_target,
-                            objective_sense=self.objective_sense,
-                            optimization_dict=deepcopy(used_minz_tfba_dict),
-                            variability_dict=deepcopy(self.variability_data),
-                            with_kappa=self.with_kappa,
-                            with_gamma=self.with_gamma,
-                            with_iota=self.with_iota,
-                            with_alpha=self.with_alpha,
-                            solver=self.nlp_solver,
-                            correction_config=self.correction_config,
-                            strict_mode=self.nlp_strict_mode,
-                            single_strict_reacs=self.nlp_single_strict_reacs,
-                        )
-                    )
-                    if third_nlp_dict[ALL_OK_KEY] and (
-                        abs(third_nlp_dict[OBJECTIVE_VAR_NAME]) > self.min_abs_objvalue
-                    ):
-                        nlp_results.append(third_nlp_dict)
-                except (ApplicationError, AttributeError, ValueError):
-                    pass
-        ####
+            return [(1_000_000.0, [])]
+        # The max-z and min-z branches (each an ecTFBA and an NLP) run concurrently. Each branch runs in
+        # its own process with its own (pickled) copy of z_lp, as concurrent pyomo solves in threads would
+        # share pyomo's (not thread-safe) global temporary file manager.
+        branch_results = Parallel(n_jobs=2, backend="loky")(
+            delayed(self._perform_z_branch)(
+                z_lp, z_objective_sense, deactivated_reactions
+            )
+            for z_objective_sense in (+1, -1)
+        )
+        nlp_results: list[dict[str, float]] = [
+            nlp_result for nlp_result in branch_results if nlp_result is not None
+        ]
 
         output: list[tuple[float, list[float | int]]] = [(1_000_000, [])]
         for nlp_result in nlp_results:
@@ -427,7 +508,9 @@ class COBRAKProblem:
 
             if self.temp_directory_name:
                 filename = f"{self.temp_directory_name}{objective_value}{time()}{randint(0, 1_000_000_000)}.json"  # noqa: NPY002
-                json_write(filename, opt_nlp_dict)
+                # Written under a temporary name first so that optimize() never reads a partially written file
+                json_write(f"{filename}.tmp", opt_nlp_dict)
+                os.replace(f"{filename}.tmp", filename)
 
             if is_objsense_maximization(self.objective_sense):
                 objective_value *= -1
@@ -454,42 +537,212 @@ class COBRAKProblem:
         Returns:
             dict[float, list[dict[str, float]]]: A dictionary containing the optimization results.
         """
-        temp_directory = TemporaryDirectory()
-        self.temp_directory_name = standardize_folder(temp_directory.name)
-
-        match self.algorithm:
-            case "genetic":
-                evolution = COBRAKGENETIC(
-                    fitness_function=self.fitness,
-                    xs_dim=self.dim,
-                    extra_xs=self.initial_xs_list,
-                    gen=self.num_gens,
-                    objvalue_json_path=self.objvalue_json_path,
-                    max_rounds_same_objvalue=self.max_rounds_same_objvalue,
-                    pop_size=self.pop_size,
-                )
-            case _:
+        if self.checkpoint_folder:
+            # NLP results of earlier (interrupted) runs are kept so that a resumed run still returns them
+            temp_directory = None
+            self.temp_directory_name = f"{self.checkpoint_folder}nlp_results/"
+            ensure_folder_existence(self.temp_directory_name)
+            genetic_checkpoint_path = (
+                f"{self.checkpoint_folder}genetic_checkpoint.pickle"
+            )
+        else:
+            temp_directory = TemporaryDirectory()
+            self.temp_directory_name = standardize_folder(temp_directory.name)
+            genetic_checkpoint_path = ""
+
+        if isinstance(self.algorithm, str):
+            if self.algorithm not in BINARY_OPTIMIZERS:
                 print(
-                    f"ERROR: Evolution algorithm {self.algorithm} does not exist! Use 'genetic'."
+                    f"ERROR: Evolution algorithm {self.algorithm} does not exist! Use one of {list(BINARY_OPTIMIZERS.keys())}."
                 )
                 raise ValueError
+            optimizer_class = BINARY_OPTIMIZERS[self.algorithm]
+        else:
+            optimizer_class = self.algorithm
+        optimizer_kwargs: dict[str, Any] = {
+            "fitness_function": self.fitness,
+            "xs_dim": self.dim,
+            "extra_xs": self.initial_xs_list,
+            "gen": self.num_gens,
+            "objvalue_json_path": self.objvalue_json_path,
+            "max_rounds_same_objvalue": self.max_rounds_same_objvalue,
+            "pop_size": self.pop_size,
+            "seed": self.seed,
+            "time_budget": self.time_budget,
+        }
+        # Surrogate pre-screening and checkpoints are specific to the genetic algorithm
+        if issubclass(optimizer_class, COBRAKGENETIC):
+            optimizer_kwargs["surrogate_skip_share"] = self.surrogate_skip_share
+            optimizer_kwargs["checkpoint_path"] = genetic_checkpoint_path
+        evolution = optimizer_class(**optimizer_kwargs, **self.optimizer_options)
         evolution.run()
 
+        # parallel_map_until_deadline() terminates still running fitness calls before returning,
+        # i.e., no further NLP results are written into the (temporary) folder from here on
         result_dict: dict[float, list[dict[str, float]]] = {}
         for json_filename in get_files(self.temp_directory_name):
+            if not json_filename.endswith(".json"):
+                continue
             json_data = json_load(f"{self.temp_directory_name}{json_filename}", Any)
+            json_data[TIME_BUDGET_EXCEEDED_KEY] = evolution.cut_short
             objective_value = json_data[OBJECTIVE_VAR_NAME]
             if objective_value not in result_dict:
                 result_dict[objective_value] = []
             result_dict[objective_value].append(deepcopy(json_data))
 
-        temp_directory.cleanup()
+        if temp_directory is not None:
+            temp_directory.cleanup()
 
         return {
             key: result_dict[key] for key in sorted(result_dict.keys(), reverse=True)
         }
 
 
+def _get_lp_prechecked_targets(
+    cobrak_model: Model,
+    targets: list[tuple[str, list[str], int]],
+    objective_target: dict[str, float],
+    objective_sense: int,
+    variability_data: dict[str, tuple[float, float]],
+    pyomo_lp_solver,  # noqa: ANN001
+    lp_solver: Solver = SCIP,
+    correction_config: CorrectionConfig = CorrectionConfig(),
+    ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+    var_data_abs_epsilon: float = 1e-5,
+) -> list[tuple[str, list[str], int]]:
+    """Returns the postprocessing targets whose switch is feasible in an ecTFBA, sorted from most to least promising.
+
+    The ecTFBA is a relaxation of the NLP that _postprocess_batch solves for a target (the NLP's kinetic efficiency factors
+    can only reduce a reaction's capacity). Hence, if the ecTFBA with the switched reactions cannot reach the objective value
+    bound of the given model (see postprocess), neither can the NLP. All switches are checked with one persistent LP in which
+    only the bounds of the switched reactions are changed (and reset afterwards).
+
+    Args:
+        cobrak_model (Model): The COBRA-k model, including postprocess' objective value bound as extra linear constraint.
+        targets (list[tuple[str, list[str], int]]): The targets of the form (target type ("ac" or "deac"), reaction couple,
+            maximal number of allowed changes).
+        objective_target (dict[str, float]): Target value(s) for the objective function.
+        objective_sense (int): Sense of the objective function (1 for maximization, -1 for minimization).
+        variability_data (dict[str, tuple[float, float]]): Variability data for each reaction.
+        pyomo_lp_solver: The Pyomo solver to use.
+        lp_solver (Solver, optional): The linear programming solver to use. Defaults to SCIP.
+        correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
+        ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs.
+            Defaults to True.
+        var_data_abs_epsilon: (float, optional): Under this value, any data given by the variability dict is considered to be 0. Defaults to 1e-5.
+
+    Returns:
+        list[tuple[str, list[str], int]]: The targets that passed the check, sorted by their ecTFBA objective value (best first).
+    """
+    try:
+        precheck_lp = _get_optimization_lp(
+            cobrak_model=cobrak_model,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            with_loop_constraints=False,
+            variability_dict=deepcopy(variability_data),
+            correction_config=correction_config,
+            ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
+            var_data_abs_epsilon=var_data_abs_epsilon,
+        )
+        precheck_lp = add_objective_to_model(
+            precheck_lp,
+            objective_target,
+            objective_sense,
+            "PRECHECK_OBJ",
+            "PRECHECK_OBJ_VAR",
+        )
+    except (ApplicationError, AttributeError, ValueError):
+        return targets
+
+    precheck_values: dict[tuple[str, tuple[str, ...]], float | None] = {}
+    for target_type, target_couple, _ in targets:
+        precheck_key = (target_type, tuple(target_couple))
+        if precheck_key in precheck_values:
+            continue
+        switched_vars = [
+            getattr(precheck_lp, reac_id)
+            for reac_id in (
+                target_couple if target_type == "deac" else target_couple[:1]
+            )
+            if hasattr(precheck_lp, reac_id)
+        ]
+        original_bounds = [(var.lb, var.ub) for var in switched_vars]
+        for var in switched_vars:
+            if target_type == "deac":
+                var.setlb(0.0)
+                var.setub(0.0)
+            else:
+                var.setlb(max(var.lb or 0.0, 1e-5))
+        try:
+            results = pyomo_lp_solver.solve(
+                precheck_lp, tee=False, **lp_solver.solve_extra_options
+            )
+            precheck_dict = add_statuses_to_optimziation_dict(
+                get_pyomo_solution_as_dict(precheck_lp), results
+            )
+            precheck_values[precheck_key] = (
+                precheck_dict["PRECHECK_OBJ_VAR"] if precheck_dict[ALL_OK_KEY] else None
+            )
+        except RuntimeError:
+            # Raised by pyomo's appsi solver interfaces (e.g., HiGHS) if no feasible solution exists
+            precheck_values[precheck_key] = None
+        except (ApplicationError, AttributeError, ValueError):
+            # Without a definite answer, the switch is kept (and tested with the NLP)
+            precheck_values[precheck_key] = (
+                float("inf")
+                if is_objsense_maximization(objective_sense)
+                else -float("inf")
+            )
+        for var, (lb, ub) in zip(switched_vars, original_bounds):
+            var.setlb(lb)
+            var.setub(ub)
+
+    prechecked_targets = [
+        target
+        for target in targets
+        if precheck_values[(target[0], tuple(target[1]))] is not None
+    ]
+    return sorted(
+        prechecked_targets,
+        key=lambda target: precheck_values[(target[0], tuple(target[1]))],
+        reverse=is_objsense_maximization(objective_sense),
+    )
+
+
+def _get_neighbour_couples(
+    cobrak_model: Model,
+    reac_couples: list[list[str]],
+    changed_reacs: list[str],
+) -> list[list[str]]:
+    """Returns the reaction couples which share at least one metabolite with any of the changed reactions.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        reac_couples (list[list[str]]): The stoichiometrically coupled reactions.
+        changed_reacs (list[str]): IDs of the reactions whose activity changed.
+
+    Returns:
+        list[list[str]]: The neighbouring reaction couples (including the couples of the changed reactions).
+    """
+    changed_mets = {
+        met_id
+        for reac_id in changed_reacs
+        if reac_id in cobrak_model.reactions
+        for met_id in cobrak_model.reactions[reac_id].stoichiometries
+    }
+    return [
+        reac_couple
+        for reac_couple in reac_couples
+        if any(reac_id in changed_reacs for reac_id in reac_couple)
+        or any(
+            met_id in changed_mets
+            for reac_id in reac_couple
+            for met_id in cobrak_model.reactions[reac_id].stoichiometries
+        )
+    ]
+
+
 def _postprocess_batch(
     reac_couples: list[str],
     target_couples: list[tuple[str, list[str]]],
@@ -795,9 +1048,18 @@ def postprocess(
     correction_config: CorrectionConfig = CorrectionConfig(),
     onlytested: str = "",
     ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+    time_budget: float = float("inf"),
+    lp_precheck: bool = True,
+    max_rounds: int = 1,
 ) -> tuple[float, list[float | int]]:
     """Postprocesses the optimization results to find feasible switches.
 
+    A switch deactivates an active (or activates an inactive) couple of stoichiometrically coupled reactions, and it is feasible
+    if the NLP of the switched reaction set (allowing some further changes of reaction activities) beats the given result. Switches
+    that already fail an ecTFBA pre-check are not tested with an NLP, and the remaining ones are tested in parallel, most promising
+    ones first. With max_rounds > 1, the best feasible switch of a round becomes the starting point of the next round, in which only
+    the switches around the reactions whose activity changed are tested again.
+
     Args:
         cobrak_model (Model): The COBRA-k model to optimize.
         opt_dict (dict[str, float]): Optimization result dictionary.
@@ -817,10 +1079,17 @@ def postprocess(
         correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
         onlytested (str, optional): Specific reactions to test during postprocessing. Defaults to "".
         ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs.
+        time_budget (float, optional): Maximal wall-clock seconds of the postprocessing. Once the budget is used up, no further switches
+            are tested and the results of still running tests are discarded. The best result then has TIME_BUDGET_EXCEEDED_KEY set to True. Defaults to float("inf").
+        lp_precheck (bool, optional): Whether or not switches are first checked with an ecTFBA (which is a relaxation of the NLP) so that
+            switches which cannot beat the given result are skipped. Defaults to True.
+        max_rounds (int, optional): Maximal number of rounds of applying the best found switch and re-screening the switches around it.
+            Defaults to 1, i.e. only the switches of the given result are tested.
 
     Returns:
         tuple[float, list[float | int]]: Best result and a list of feasible switches.
     """
+    deadline = time() + time_budget
     if variability_data == {}:
         variability_data = perform_lp_variability_analysis(
             cobrak_model=cobrak_model,
@@ -839,90 +1108,209 @@ def postprocess(
         lp_solver.solver_attrs,
     )
 
-    cobrak_model = deepcopy(cobrak_model)
     if type(objective_target) is str:
         objective_target = {objective_target: 1.0}
-    obj_value = 0.0
-    for obj_target_id, obj_target_multiplier in objective_target.items():
-        obj_value += opt_dict[obj_target_id] * obj_target_multiplier
-    epsilon = 1e-6 if is_objsense_maximization(objective_sense) else -1e-6
-    cobrak_model = add_objective_value_as_extra_linear_constraint(
-        cobrak_model,
-        obj_value + epsilon,
-        objective_target,
-        objective_sense,
-    )
-
     reac_couples = get_stoichiometrically_coupled_reactions(cobrak_model)
-    active_reacs = [
-        active_reac
-        for active_reac in get_active_reacs_from_optimization_dict(
-            cobrak_model, opt_dict
-        )
-        if (active_reac in [reac_ids[0] for reac_ids in reac_couples])
-        and (active_reac not in objective_target)  # and opt_dict[active_reac] > 1e-8
-    ]
-    active_reac_couples: list[list[str]] = [
-        reac_couple
-        for reac_couple in reac_couples
-        if reac_couple[0] in active_reacs and variability_data[reac_couple[0]][0] == 0.0
-    ]
-    inactive_reac_couples: list[list[str]] = [
-        reac_couple
-        for reac_couple in reac_couples
-        if reac_couple[0] not in active_reacs
-        and variability_data[reac_couple[0]][1] > 0.0
-    ]
-    targets = []
-    for max_target_num in (0, 5):
-        targets += [("deac", x, max_target_num) for x in active_reac_couples]
-        targets += [("ac", x, max_target_num) for x in inactive_reac_couples]
-    all_feasible_switches_metalist = Parallel(n_jobs=-1, verbose=10)(
-        delayed(_postprocess_batch)(
-            reac_couples,
-            targets_batch,
-            active_reacs,
-            cobrak_model,
+
+    all_feasible_switches = []
+    best_result: dict[str, float] = {}
+    cut_short = False
+    rescreened_couples: list[list[str]] | None = None
+    for _ in range(max_rounds):
+        obj_value = 0.0
+        for obj_target_id, obj_target_multiplier in objective_target.items():
+            obj_value += opt_dict[obj_target_id] * obj_target_multiplier
+        epsilon = 1e-6 if is_objsense_maximization(objective_sense) else -1e-6
+        round_cobrak_model = add_objective_value_as_extra_linear_constraint(
+            deepcopy(cobrak_model),
+            obj_value + epsilon,
             objective_target,
             objective_sense,
-            variability_data,
-            pyomo_lp_solver,
-            with_kappa,
-            with_gamma,
-            with_iota,
-            with_alpha,
-            lp_solver,
-            nlp_solver,
-            nlp_strict_mode,
-            nlp_single_strict_reacs,
-            verbose,
-            correction_config,
-            onlytested,
-            ignore_nonlinear_extra_terms_in_ectfbas,
         )
-        for targets_batch in split_list(targets, cpu_count())
-    )
-    all_feasible_switches = []
-    for sublist in all_feasible_switches_metalist:
-        all_feasible_switches.extend(sublist)
 
-    if len(all_feasible_switches) > 0:
-        best_result = all_feasible_switches[0][2]
-        for result in [x[2] for x in all_feasible_switches[1:]]:
+        active_reacs = [
+            active_reac
+            for active_reac in get_active_reacs_from_optimization_dict(
+                round_cobrak_model, opt_dict
+            )
+            if (active_reac in [reac_ids[0] for reac_ids in reac_couples])
+            and (
+                active_reac not in objective_target
+            )  # and opt_dict[active_reac] > 1e-8
+        ]
+        screened_couples = (
+            reac_couples if rescreened_couples is None else rescreened_couples
+        )
+        active_reac_couples: list[list[str]] = [
+            reac_couple
+            for reac_couple in screened_couples
+            if reac_couple[0] in active_reacs
+            and variability_data[reac_couple[0]][0] == 0.0
+        ]
+        inactive_reac_couples: list[list[str]] = [
+            reac_couple
+            for reac_couple in screened_couples
+            if reac_couple[0] not in active_reacs
+            and variability_data[reac_couple[0]][1] > 0.0
+        ]
+        targets = []
+        for max_target_num in (0, 5):
+            targets += [("deac", x, max_target_num) for x in active_reac_couples]
+            targets += [("ac", x, max_target_num) for x in inactive_reac_couples]
+        if onlytested:
+            targets = [
+                target
+                for target in targets
+                if any(onlytested in reac_id for reac_id in target[1])
+            ]
+        if lp_precheck:
+            num_targets = len(targets)
+            targets = _get_lp_prechecked_targets(
+                round_cobrak_model,
+                targets,
+                objective_target,
+                objective_sense,
+                variability_data,
+                pyomo_lp_solver,
+                lp_solver,
+                correction_config,
+                ignore_nonlinear_extra_terms_in_ectfbas,
+            )
+            print(
+                f"INFO: {len(targets)} of {num_targets} postprocessing switches passed the LP pre-check."
+            )
+
+        # Each switch is a separate task so that the parallel workers are scheduled dynamically
+        # (i.e., a worker that finished a switch directly starts the next one)
+        round_feasible_switches_metalist, cut_short = parallel_map_until_deadline(
+            _postprocess_batch,
+            [
+                (
+                    reac_couples,
+                    [target],
+                    active_reacs,
+                    round_cobrak_model,
+                    objective_target,
+                    objective_sense,
+                    variability_data,
+                    pyomo_lp_solver,
+                    with_kappa,
+                    with_gamma,
+                    with_iota,
+                    with_alpha,
+                    lp_solver,
+                    nlp_solver,
+                    nlp_strict_mode,
+                    nlp_single_strict_reacs,
+                    verbose,
+                    correction_config,
+                    onlytested,
+                    ignore_nonlinear_extra_terms_in_ectfbas,
+                )
+                for target in targets
+            ],
+            deadline,
+            verbose=10,
+        )
+        round_feasible_switches = []
+        for sublist in round_feasible_switches_metalist:
+            if sublist is not None:
+                round_feasible_switches.extend(sublist)
+        all_feasible_switches.extend(round_feasible_switches)
+        if len(round_feasible_switches) == 0:
+            break
+
+        # All found switches reach the round's objective value bound, i.e., the best one is an improvement
+        round_best_result = round_feasible_switches[0][2]
+        for result in [x[2] for x in round_feasible_switches[1:]]:
             if is_objsense_maximization(objective_sense):
-                if result[OBJECTIVE_VAR_NAME] > best_result[OBJECTIVE_VAR_NAME]:
-                    best_result = result
+                if result[OBJECTIVE_VAR_NAME] > round_best_result[OBJECTIVE_VAR_NAME]:
+                    round_best_result = result
             else:
-                if result[OBJECTIVE_VAR_NAME] < best_result[OBJECTIVE_VAR_NAME]:
-                    best_result = result
-    else:
-        best_result = {}
+                if result[OBJECTIVE_VAR_NAME] < round_best_result[OBJECTIVE_VAR_NAME]:
+                    round_best_result = result
+        best_result = round_best_result
+        if cut_short:
+            break
+
+        # Apply the best switch and only re-screen the couples around reactions whose activity changed
+        old_active_reacs = set(
+            get_active_reacs_from_optimization_dict(cobrak_model, opt_dict)
+        )
+        new_active_reacs = set(
+            get_active_reacs_from_optimization_dict(cobrak_model, best_result)
+        )
+        rescreened_couples = _get_neighbour_couples(
+            cobrak_model,
+            reac_couples,
+            sorted(old_active_reacs ^ new_active_reacs),
+        )
+        opt_dict = best_result
+
+    if best_result:
+        best_result[TIME_BUDGET_EXCEEDED_KEY] = cut_short
 
     return all_feasible_switches, best_result
     ####
 
 
-def _sampling_routine(
+def _get_canonical_deactivation_set(
+    deactivated_reacs: list[str],
+    reac_to_couple_id: dict[str, str],
+) -> tuple[str, ...]:
+    """Returns a canonical form of a set of deactivated reactions.
+
+    Deactivating one reaction of a couple of stoichiometrically coupled reactions deactivates the whole couple. Hence,
+    each reaction is replaced by the first reaction of its couple (which represents the couple), and the result is sorted.
+
+    Args:
+        deactivated_reacs (list[str]): The deactivated reactions.
+        reac_to_couple_id (dict[str, str]): Reaction IDs as keys, the first reaction of their couple as values.
+
+    Returns:
+        tuple[str, ...]: The sorted and unique couple representatives of the deactivated reactions.
+    """
+    return tuple(
+        sorted(
+            {reac_to_couple_id.get(reac_id, reac_id) for reac_id in deactivated_reacs}
+        )
+    )
+
+
+def _is_deactivation_set_redundant(
+    canonical_deactivation_set: tuple[str, ...],
+    sampling_cache: dict[
+        tuple[str, ...], tuple[tuple[str, ...] | None, dict[str, float] | None]
+    ],
+) -> bool:
+    """Returns whether or not sampling a (canonical) deactivation set cannot lead to a new start solution.
+
+    This is the case if the set was already sampled, if it contains an already sampled set whose ecTFBA is proven infeasible
+    (deactivating more reactions cannot make it feasible), or if it contains an already sampled set whose ecTFBA solution
+    does not use any of the additionally deactivated couples (this solution stays optimal).
+
+    Args:
+        canonical_deactivation_set (tuple[str, ...]): The canonical deactivation set (see _get_canonical_deactivation_set).
+        sampling_cache (dict[tuple[str, ...], tuple[tuple[str, ...] | None, dict[str, float] | None]]): The already sampled
+            canonical deactivation sets as keys, the results of _sample_deactivation_set as values.
+
+    Returns:
+        bool: True if the deactivation set is redundant.
+    """
+    if canonical_deactivation_set in sampling_cache:
+        return True
+    candidate_set = set(canonical_deactivation_set)
+    for sampled_set, (ectfba_active_reacs, _) in sampling_cache.items():
+        if not candidate_set.issuperset(sampled_set):
+            continue
+        if ectfba_active_reacs is None:
+            return True
+        if not (candidate_set - set(sampled_set)).intersection(ectfba_active_reacs):
+            return True
+    return False
+
+
+def _sample_deactivation_set(
     cobrak_model: Model,
     objective_target: str,
     objective_sense: int,
@@ -931,7 +1319,7 @@ def _sampling_routine(
     with_gamma: bool,
     with_iota: bool,
     with_alpha: bool,
-    deactivated_reaction_lists: list[list[str]],
+    deactivated_reacs: list[str],
     lp_solver: Solver,
     nlp_solver: Solver,
     nlp_strict_mode: bool,
@@ -939,8 +1327,8 @@ def _sampling_routine(
     correction_config: CorrectionConfig,
     min_abs_objvalue: float,
     ignore_nonlinear_extra_terms_in_ectfbas: bool,
-) -> list[dict[str, float]]:
-    """Runs the sampling routine to find feasible initial solutions.
+) -> tuple[tuple[str, ...] | None, dict[str, float] | None] | None:
+    """Tries to find a feasible initial solution (through an ecTFBA and an NLP) with the given reactions being deactivated.
 
     Args:
         cobrak_model (Model): The COBRA-k model to optimize.
@@ -951,7 +1339,7 @@ def _sampling_routine(
         with_gamma (bool): Whether to use gamma parameter.
         with_iota (bool): Whether to use iota parameter.
         with_alpha (bool): Whether to use alpha parameter.
-        deactivated_reaction_lists (list[list[str]]): List of deactivated reaction lists.
+        deactivated_reacs (list[str]): The deactivated reactions.
         lp_solver (Solver): The linear programming solver to use.
         nlp_solver (Solver): The nonlinear programming solver to use.
         nlp_strict_mode (bool, optional): Whether or not the <= heuristic (True) or not (False; i.e. setting all equations to ==) shall be used. Defaults to False.
@@ -962,71 +1350,68 @@ def _sampling_routine(
         ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs.
 
     Returns:
-        list[dict[str, float]]: List of feasible solutions found.
+        tuple[tuple[str, ...] | None, dict[str, float] | None] | None: The active reactions of the ecTFBA solution (None if the
+        ecTFBA is proven infeasible) and the feasible NLP solution (None if none was found). None instead of the tuple if a
+        solver error or any other solver problem (e.g., a time limit) made the result inconclusive, i.e., if it must not be cached.
     """
-    working_dicts: list[dict[str, float]] = []
-    for deactivated_reaction_set in deactivated_reaction_lists:
-        try:
-            ectfba_dict = perform_lp_optimization(
-                cobrak_model=cobrak_model,
-                objective_target=objective_target,
-                objective_sense=objective_sense,
-                with_enzyme_constraints=True,
-                with_thermodynamic_constraints=True,
-                with_loop_constraints=False,
-                variability_dict=variability_dict,
-                ignored_reacs=deactivated_reaction_set,
-                solver=lp_solver,
-                correction_config=correction_config,
-                ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
-            )
-        except (ApplicationError, AttributeError, ValueError):
-            continue
+    try:
+        ectfba_dict = perform_lp_optimization(
+            cobrak_model=cobrak_model,
+            objective_target=objective_target,
+            objective_sense=objective_sense,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            with_loop_constraints=False,
+            variability_dict=variability_dict,
+            ignored_reacs=deactivated_reacs,
+            solver=lp_solver,
+            correction_config=correction_config,
+            ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
+        )
+    except (ApplicationError, AttributeError, ValueError, OSError):
+        return None
 
-        if not ectfba_dict[ALL_OK_KEY]:
-            continue
+    if not ectfba_dict[ALL_OK_KEY]:
+        if is_infeasible_optimization_dict(ectfba_dict):
+            return None, None
+        return None
 
-        active_ectfba_reacs = get_active_reacs_from_optimization_dict(
-            cobrak_model, ectfba_dict
-        )
-        missing_errortarget = False
-        for errortarget in correction_config.error_scenario:
-            if errortarget not in cobrak_model.reactions:
-                continue
-            if errortarget not in active_ectfba_reacs:
-                missing_errortarget = True
-        if missing_errortarget:
+    active_ectfba_reacs = get_active_reacs_from_optimization_dict(
+        cobrak_model, ectfba_dict
+    )
+    for errortarget in correction_config.error_scenario:
+        if errortarget not in cobrak_model.reactions:
             continue
+        if errortarget not in active_ectfba_reacs:
+            return tuple(active_ectfba_reacs), None
 
-        ###################################################
-        # 3. NLP for initial set of rmax guesses
-        try:
-            nlp_result = perform_nlp_irreversible_optimization_with_active_reacs_only(
-                cobrak_model=cobrak_model,
-                objective_target=objective_target,
-                objective_sense=objective_sense,
-                optimization_dict=ectfba_dict,
-                variability_dict=variability_dict,
-                with_kappa=with_kappa,
-                with_gamma=with_gamma,
-                with_iota=with_iota,
-                with_alpha=with_alpha,
-                verbose=False,
-                solver=nlp_solver,
-                correction_config=correction_config,
-                strict_mode=nlp_strict_mode,
-                single_strict_reacs=nlp_single_strict_reacs,
-            )
-        except (ApplicationError, AttributeError, ValueError):
-            continue
-        if not nlp_result[ALL_OK_KEY]:
-            continue
-        if abs(nlp_result[OBJECTIVE_VAR_NAME]) < min_abs_objvalue:
-            continue
-        if nlp_result[ALL_OK_KEY]:
-            working_dicts.append(deepcopy(nlp_result))
-            print("Working sampling result:", nlp_result[OBJECTIVE_VAR_NAME])
-    return working_dicts
+    ###################################################
+    # 3. NLP for initial set of rmax guesses
+    try:
+        nlp_result = perform_nlp_irreversible_optimization_with_active_reacs_only(
+            cobrak_model=cobrak_model,
+            objective_target=objective_target,
+            objective_sense=objective_sense,
+            optimization_dict=ectfba_dict,
+            variability_dict=variability_dict,
+            with_kappa=with_kappa,
+            with_gamma=with_gamma,
+            with_iota=with_iota,
+            with_alpha=with_alpha,
+            verbose=False,
+            solver=nlp_solver,
+            correction_config=correction_config,
+            strict_mode=nlp_strict_mode,
+            single_strict_reacs=nlp_single_strict_reacs,
+        )
+    except (ApplicationError, AttributeError, ValueError, OSError):
+        return None
+    if not nlp_result[ALL_OK_KEY]:
+        return tuple(active_ectfba_reacs), None
+    if abs(nlp_result[OBJECTIVE_VAR_NAME]) < min_abs_objvalue:
+        return tuple(active_ectfba_reacs), None
+    print("Working sampling result:", nlp_result[OBJECTIVE_VAR_NAME])
+    return tuple(active_ectfba_reacs), deepcopy(nlp_result)
 
 
 def perform_nlp_evolutionary_optimization(
@@ -1044,7 +1429,7 @@ def perform_nlp_evolutionary_optimization(
     sampling_max_deactivated_reactions: int = 5,
     sampling_always_deactivated_reactions: list[str] = [],
     evolution_num_gens: int = 5,
-    algorithm: Literal["genetic"] = "genetic",
+    algorithm: str | type = "genetic",
     lp_solver: Solver = SCIP,
     nlp_solver: Solver = IPOPT,
     nlp_strict_mode: bool = False,
@@ -1056,9 +1441,21 @@ def perform_nlp_evolutionary_optimization(
     pop_size: int | None = None,
     working_results: list[dict[str, float]] = [],
     ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+    surrogate_skip_share: float = 0.0,
+    seed: int | None = None,
+    checkpoint_folder: str = "",
+    time_budget: float = float("inf"),
+    postprocess_best_result: bool = False,
+    optimizer_options: dict[str, Any] = {},
 ) -> dict[float, list[dict[str, float]]]:
     """Performs NLP evolutionary optimization on the given COBRA-k model.
 
+    The evolutionary algorithm starts with feasible solutions from an initial sampling, in which random sets of reactions are
+    deactivated. Each set is canonicalized (i.e., a reaction stands for its whole couple of stoichiometrically coupled reactions),
+    and sets that were already sampled or that cannot lead to a new solution (supersets of sets with infeasible ecTFBA or of sets whose
+    ecTFBA solution does not use the additionally deactivated reactions) are skipped. The sets are sampled in parallel, and the
+    sampling stops as soon as sampling_wished_num_feasible_starts distinct feasible solutions are found.
+
     Args:
         cobrak_model (Model): The COBRA-k model to optimize.
         objective_target (str | dict[str, float]): Target value(s) for the objective function.
@@ -1074,24 +1471,64 @@ def perform_nlp_evolutionary_optimization(
         sampling_max_deactivated_reactions (int, optional): Maximum number of deactivated reactions allowed. Defaults to 5.
         sampling_always_deactivated_reactions (list[str], optional): List of reactions that should always be deactivated. Defaults to [].
         evolution_num_gens (int, optional): Number of generations for the evolutionary algorithm. Defaults to 5.
-        algorithm (Literal["genetic"], optional): Type of optimization algorithm to use. Defaults to "genetic", which is also the only algorithm currently available.
+        algorithm (str | type, optional): Optimization algorithm to use, either a key of cobrak.metaheuristics.BINARY_OPTIMIZERS ("genetic",
+            "annealing" for parallel tempering simulated annealing or "tabu" for tabu search) or an optimizer class with the same interface.
+            Defaults to "genetic".
         lp_solver (Solver, optional): The linear programming solver to use. Defaults to SCIP.
         nlp_solver (Solver, optional): The nonlinear programming solver to use. Defaults to IPOPT.
         nlp_strict_mode (bool, optional): Whether or not the <= heuristic (True) or not (False; i.e. setting all equations to ==) shall be used. Defaults to False.
         nlp_single_strict_reacs (list[str], optional): List of single reactions that shall be in strict mode (see ```nlp_strict_mode```argument above).
             If ```nlp_strict_mode=True```, this has no effect. Defaults to [].
-        objvalue_json_path (str, optional): Path to the JSON file for objective values. Defaults to "".
+        objvalue_json_path (str, optional): Path to the JSON Lines file to which the objective values are appended (see COBRAKGENETIC). Defaults to "".
         max_rounds_same_objvalue (float, optional): Maximum number of rounds with same objective value before stopping. Defaults to float("inf").
         correction_config (CorrectionConfig, optional): Configuration for corrections during optimization. Defaults to CorrectionConfig().
         min_abs_objvalue (float, optional): Minimum absolute value of objective function to consider valid. Defaults to 1e-13.
         pop_size (int | None, optional): Population size for the evolutionary algorithm. Defaults to None.
         working_results (list[dict[str, float]], optional): List of initial feasible results. Defaults to [].
         ignore_nonlinear_extra_terms_in_ectfbas: (bool, optional): Whether or not non-linear watches/constraints shall be ignored in ecTFBAs. Defaults to True.
+        surrogate_skip_share (float, optional): Share of each generation's mutated solutions that a surrogate model (k nearest neighbours by Hamming
+            distance, trained on all evaluated solutions) predicts to be least promising and which are therefore not evaluated. Defaults to 0.0, i.e.
+            no surrogate pre-screening.
+        seed (int | None, optional): Seed for the random choices of the sampling and the evolutionary algorithm. With a seed, the
+            sequence of tested solutions is reproducible. Defaults to None.
+        checkpoint_folder (str, optional): If not empty, the results of all sampled deactivation sets, the evolutionary algorithm's state and all found NLP
+            results are stored in this folder. Calling this function again with the same folder resumes an interrupted run instead
+            of starting from scratch. Defaults to "".
+        time_budget (float, optional): Maximal wall-clock seconds shared by the sampling, the evolutionary algorithm and (if
+            postprocess_best_result is True) the postprocessing. Once it is used up, no further LPs/NLPs are started, the results
+            of still running ones are discarded, and all results found so far are returned. In the returned solutions,
+            TIME_BUDGET_EXCEEDED_KEY is True if the budget was used up. Defaults to float("inf").
+        postprocess_best_result (bool, optional): Whether or not the best result of the evolutionary algorithm shall be improved
+            further with postprocess (within the remaining time budget). The best postprocessing result is added to the returned
+            dictionary. Defaults to False.
+        optimizer_options (dict[str, Any], optional): Extra keyword arguments of the optimizer class (e.g. tabu_tenure for "tabu"). Defaults to {}.
 
     Returns:
         dict[float, list[dict[str, float]]]: Dictionary of objective values and corresponding solutions.
     """
-    if variability_dict == {}:
+    deadline = time() + time_budget
+    sampling_cut_short = False
+    if isinstance(objective_target, str):
+        objective_target = {objective_target: 1.0}
+
+    if checkpoint_folder:
+        checkpoint_folder = standardize_folder(checkpoint_folder)
+        ensure_folder_existence(checkpoint_folder)
+        sampling_checkpoint_path = f"{checkpoint_folder}sampling_checkpoint.pickle"
+    else:
+        sampling_checkpoint_path = ""
+
+    sampling_cache: dict[
+        tuple[str, ...], tuple[tuple[str, ...] | None, dict[str, float] | None]
+    ] = {}
+    sampling_finished = False
+    if sampling_checkpoint_path and exists(sampling_checkpoint_path):
+        # Resume with the variability and sampling results of the interrupted run
+        variability_dict, sampling_cache, sampling_finished = pickle_load(
+            sampling_checkpoint_path
+        )
+        print(f"INFO: Resuming from sampling checkpoint {sampling_checkpoint_path}.")
+    elif variability_dict == {}:
         variability_dict = perform_lp_variability_analysis(
             cobrak_model=cobrak_model,
             with_enzyme_constraints=True,
@@ -1104,86 +1541,144 @@ def perform_nlp_evolutionary_optimization(
         variability_dict = deepcopy(variability_dict)
 
     # Initial sampling
-    if isinstance(objective_target, str):
-        objective_target = {objective_target: 1.0}
-    objective_target_ids = list(objective_target.keys())  # type: ignore
-
-    deactivatable_reactions = [
-        var_id
-        for var_id in variability_dict
-        if (var_id in cobrak_model.reactions)
-        and (variability_dict[var_id][0] == 0.0)
-        and (var_id not in objective_target_ids)
-        and (var_id not in sampling_always_deactivated_reactions)
-        and (var_id not in correction_config.error_scenario)
-    ]
     distinct_feasible_start_solutions: dict[tuple[str, ...], dict[str, float]] = {}
-    for current_round in range(sampling_max_metarounds):
-        # Get deactivated reaction lists
-        all_deactivated_reaction_lists = [
-            [
-                sample(
-                    deactivatable_reactions,
-                    randint(1, sampling_max_deactivated_reactions + 1),  # noqa: NPY002
-                )
-                + sampling_always_deactivated_reactions
-                for _ in range(sampling_rounds_per_metaround)
-            ]
-            for _ in range(cpu_count())
-        ]
-        if current_round == 0:
-            all_deactivated_reaction_lists[0][0] = deepcopy(
-                sampling_always_deactivated_reactions
-            )
 
-        # run sampling
-        results = Parallel(n_jobs=-1, verbose=10)(
-            delayed(_sampling_routine)(
-                cobrak_model,
-                objective_target,
-                objective_sense,
-                variability_dict,
-                with_kappa,
-                with_gamma,
-                with_iota,
-                with_alpha,
-                deactivated_reaction_lists,
-                lp_solver,
-                nlp_solver,
-                nlp_strict_mode,
-                nlp_single_strict_reacs,
-                correction_config,
-                min_abs_objvalue,
-                ignore_nonlinear_extra_terms_in_ectfbas,
+    def add_start_solution(
+        sampling_result: tuple[tuple[str, ...] | None, dict[str, float] | None] | None,
+    ) -> bool:
+        nlp_dict = None if sampling_result is None else sampling_result[1]
+        if nlp_dict is not None:
+            active_reacs_tuple = tuple(
+                sorted(get_active_reacs_from_optimization_dict(cobrak_model, nlp_dict))
             )
-            for deactivated_reaction_lists in all_deactivated_reaction_lists
-        )
-        if len(working_results) > 0:
-            results.append(working_results)
-        best_result = (
-            -float("inf") if is_objsense_maximization(objective_sense) else float("inf")
+            distinct_feasible_start_solutions[active_reacs_tuple] = nlp_dict
+        return (
+            len(distinct_feasible_start_solutions)
+            >= sampling_wished_num_feasible_starts
         )
-        for result in results:
-            for nlp_dict in result:
-                active_reacs_tuple = tuple(
-                    sorted(
-                        get_active_reacs_from_optimization_dict(cobrak_model, nlp_dict)
+
+    for nlp_dict in working_results:
+        add_start_solution((None, deepcopy(nlp_dict)))
+    for sampling_result in sampling_cache.values():
+        sampling_finished = add_start_solution(sampling_result) or sampling_finished
+
+    if not sampling_finished:
+        sampling_rng = Random(seed)
+        objective_target_ids = list(objective_target.keys())  # type: ignore
+        reac_to_couple_id = {
+            reac_id: reac_couple[0]
+            for reac_couple in get_stoichiometrically_coupled_reactions(cobrak_model)
+            for reac_id in reac_couple
+        }
+        deactivatable_reactions = [
+            var_id
+            for var_id in variability_dict
+            if (var_id in cobrak_model.reactions)
+            and (variability_dict[var_id][0] == 0.0)
+            and (var_id not in objective_target_ids)
+            and (var_id not in sampling_always_deactivated_reactions)
+            and (var_id not in correction_config.error_scenario)
+        ]
+        num_sets_per_metaround = cpu_count() * sampling_rounds_per_metaround
+        for current_round in range(sampling_max_metarounds):
+            if time() >= deadline:
+                sampling_cut_short = True
+                break
+
+            # Get new (i.e., not yet sampled and not redundant) canonical deactivation sets
+            deactivation_sets: list[tuple[str, ...]] = []
+            if current_round == 0:
+                deactivation_sets.append(
+                    _get_canonical_deactivation_set(
+                        sampling_always_deactivated_reactions, reac_to_couple_id
                     )
                 )
-                distinct_feasible_start_solutions[active_reacs_tuple] = deepcopy(
-                    nlp_dict
+            for _ in range(100 * num_sets_per_metaround):
+                if len(deactivation_sets) >= num_sets_per_metaround:
+                    break
+                deactivation_set = _get_canonical_deactivation_set(
+                    sampling_rng.sample(
+                        deactivatable_reactions,
+                        min(
+                            sampling_rng.randint(1, sampling_max_deactivated_reactions),
+                            len(deactivatable_reactions),
+                        ),
+                    )
+                    + sampling_always_deactivated_reactions,
+                    reac_to_couple_id,
                 )
-                if is_objsense_maximization(objective_sense):
-                    best_result = max(nlp_dict[OBJECTIVE_VAR_NAME], best_result)
-                else:
-                    best_result = min(nlp_dict[OBJECTIVE_VAR_NAME], best_result)
+                if (deactivation_set not in deactivation_sets) and (
+                    not _is_deactivation_set_redundant(deactivation_set, sampling_cache)
+                ):
+                    deactivation_sets.append(deactivation_set)
+            if not deactivation_sets:
+                break
+
+            # Run sampling with one deactivation set per task, stopping early once enough distinct starts exist
+            results, sampling_cut_short = parallel_map_until_deadline(
+                _sample_deactivation_set,
+                [
+                    (
+                        cobrak_model,
+                        objective_target,
+                        objective_sense,
+                        variability_dict,
+                        with_kappa,
+                        with_gamma,
+                        with_iota,
+                        with_alpha,
+                        list(deactivation_set),
+                        lp_solver,
+                        nlp_solver,
+                        nlp_strict_mode,
+                        nlp_single_strict_reacs,
+                        correction_config,
+                        min_abs_objvalue,
+                        ignore_nonlinear_extra_terms_in_ectfbas,
+                    )
+                    for deactivation_set in deactivation_sets
+                ],
+                deadline,
+                stop_condition=add_start_solution,
+            )
+            # Unfinished calls and calls with solver errors (both None) are not cached, so that they can be sampled again
+            for deactivation_set, result in zip(deactivation_sets, results):
+                if result is not None:
+                    sampling_cache[deactivation_set] = result
+                    sampling_finished = add_start_solution(result) or sampling_finished
+
+            if sampling_finished or sampling_cut_short:
+                break
+
+        if sampling_checkpoint_path:
+            pickle_write(
+                sampling_checkpoint_path,
+                (variability_dict, sampling_cache, not sampling_cut_short),
+            )
 
-        if (
-            len(distinct_feasible_start_solutions.keys())
-            >= sampling_wished_num_feasible_starts
-        ):
-            break
+    best_result = (
+        -float("inf") if is_objsense_maximization(objective_sense) else float("inf")
+    )
+    for nlp_dict in distinct_feasible_start_solutions.values():
+        if is_objsense_maximization(objective_sense):
+            best_result = max(nlp_dict[OBJECTIVE_VAR_NAME], best_result)
+        else:
+            best_result = min(nlp_dict[OBJECTIVE_VAR_NAME], best_result)
 
+    if sampling_cut_short:
+        print(
+            f"INFO: Time budget of {time_budget} s used up during the initial sampling, returning the sampling results."
+        )
+        sampling_result_dict: dict[float, list[dict[str, float]]] = {}
+        for nlp_dict in distinct_feasible_start_solutions.values():
+            nlp_dict[TIME_BUDGET_EXCEEDED_KEY] = True
+            if nlp_dict[OBJECTIVE_VAR_NAME] not in sampling_result_dict:
+                sampling_result_dict[nlp_dict[OBJECTIVE_VAR_NAME]] = []
+            sampling_result_dict[nlp_dict[OBJECTIVE_VAR_NAME]].append(nlp_dict)
+        return {
+            key: sampling_result_dict[key]
+            for key in sorted(sampling_result_dict.keys(), reverse=True)
+        }
     if len(distinct_feasible_start_solutions.keys()) == 0:
         print(
             "ERROR in initial sampling: No feasible sampling solution found! Check feasibility of problem and/or adjust sampling settings."
@@ -1219,6 +1714,46 @@ def perform_nlp_evolutionary_optimization(
         ignore_nonlinear_extra_terms_in_ectfbas=ignore_nonlinear_extra_terms_in_ectfbas,
         nlp_strict_mode=nlp_strict_mode,
         nlp_single_strict_reacs=nlp_single_strict_reacs,
+        surrogate_skip_share=surrogate_skip_share,
+        seed=seed,
+        checkpoint_folder=checkpoint_folder,
+        time_budget=max(0.0, deadline - time()),
+        optimizer_options=optimizer_options,
     )
+    evolution_result = problem.optimize()
+
+    if (not postprocess_best_result) or (not evolution_result):
+        return evolution_result
 
-    return problem.optimize()
+    best_objective_value = (
+        max(evolution_result.keys())
+        if is_objsense_maximization(objective_sense)
+        else min(evolution_result.keys())
+    )
+    _, best_postprocess_result = postprocess(
+        cobrak_model=cobrak_model,
+        opt_dict=evolution_result[best_objective_value][0],
+        objective_target=objective_target,
+        objective_sense=objective_sense,
+        variability_data=variability_dict,
+        with_kappa=with_kappa,
+        with_gamma=with_gamma,
+        with_iota=with_iota,
+        with_alpha=with_alpha,
+        lp_solver=lp_solver,
+        nlp_solver=nlp_solver,
+        nlp_strict_mode=nlp_strict_mode,
+        nlp_single_strict_reacs=nlp_single_strict_reacs,
+        correction_config=correction_config,
+        ignore_nonlinear_extra_terms_in_ectfbas=ignore_nonlinear_extra_terms_in_ectfbas,
+        time_budget=max(0.0, deadline - time()),
+    )
+    if best_postprocess_result:
+        postprocess_objective_value = best_postprocess_result[OBJECTIVE_VAR_NAME]
+        if postprocess_objective_value not in evolution_result:
+            evolution_result[postprocess_objective_value] = []
+        evolution_result[postprocess_objective_value].append(best_postprocess_result)
+    return {
+        key: evolution_result[key]
+        for key in sorted(evolution_result.keys(), reverse=True)
+    }
@@ -1,10 +1,153 @@
-"""This module provides functionality to parse Expasy enzyme RDF files and extract EC number transfers."""
+"""This module provides functionality to parse Expasy enzyme RDF files and extract EC number transfers.
+
+It also provides EcNumberTrie, an index of EC numbers along their hierarchy (class, subclass, ...).
+"""
 
 import xml.etree.ElementTree as ET
+from typing import Any
 
 from pydantic import validate_call
 
 
+class EcNumberTrie:
+    """An index of EC numbers which follows the EC hierarchy, e.g. 1 → 1.1 → 1.1.1 → 1.1.1.1.
+
+    Each EC number is stored (once) as path of its dot-separated parts. Thereby, all EC numbers under a
+    given prefix (e.g. all under 1.1.1.-) are found by following this prefix once, instead of comparing
+    the prefix with every stored EC number.
+
+    Attributes:
+        root (dict[str, Any]): The trie's root node. Each node is a dictionary of its child nodes (keys are
+            the EC number parts) and, under the key None, the EC number that ends at this node (if any).
+    """
+
+    def __init__(self, ec_numbers: list[str] = []) -> None:
+        """Initializes the EcNumberTrie object.
+
+        Args:
+            ec_numbers (list[str], optional): EC numbers which are directly added. Defaults to [].
+        """
+        self.root: dict[str | None, Any] = {}
+        for ec_number in ec_numbers:
+            self.add(ec_number)
+
+    def add(self, ec_number: str) -> None:
+        """Adds an EC number to the trie.
+
+        Args:
+            ec_number (str): The EC number, e.g. "1.1.1.1".
+        """
+        node = self.root
+        for ec_number_part in ec_number.split("."):
+            if ec_number_part not in node:
+                node[ec_number_part] = {}
+            node = node[ec_number_part]
+        node[None] = ec_number
+
+    def contains(self, ec_number: str) -> bool:
+        """Returns whether the EC number is stored in the trie.
+
+        Args:
+            ec_number (str): The EC number.
+
+        Returns:
+            bool: Whether the EC number is stored.
+        """
+        node = self._get_node(ec_number.split("."))
+        return (node is not None) and (None in node)
+
+    def get_ec_numbers_under(self, ec_number_prefix: str) -> list[str]:
+        """Returns all stored EC numbers under the given prefix (including the prefix itself if it is stored).
+
+        Trailing "-" parts are ignored, i.e. "1.1.1.-" and "1.1.1" are the same prefix. An empty prefix
+        returns all stored EC numbers.
+
+        Args:
+            ec_number_prefix (str): The EC number prefix, e.g. "1.1.1.-".
+
+        Returns:
+            list[str]: The stored EC numbers under the prefix.
+        """
+        ec_number_parts = [part for part in ec_number_prefix.split(".") if part]
+        while ec_number_parts and ec_number_parts[-1] == "-":
+            ec_number_parts.pop()
+        node = self._get_node(ec_number_parts)
+        if node is None:
+            return []
+        return self._get_ec_numbers_of_subtree(node, 0, None)
+
+    def get_wildcard_fitting_ec_numbers(
+        self, ec_number: str, wildcard_level: int
+    ) -> list[str]:
+        """Returns all stored EC numbers that fit the given EC number under the wildcard level.
+
+        An EC number fits if both EC numbers are identical without their last wildcard_level parts,
+        i.e., the same EC numbers as with brenda_functionality's _is_fitting_ec_numbers are returned.
+        E.g., with wildcard level 1, "1.1.1.1" fits all stored EC numbers 1.1.1.x.
+
+        Args:
+            ec_number (str): The EC number, e.g. "1.1.1.1".
+            wildcard_level (int): The number of ignored last EC number parts.
+
+        Returns:
+            list[str]: The fitting stored EC numbers.
+        """
+        if wildcard_level == 0:
+            return [ec_number] if self.contains(ec_number) else []
+        prefix_parts = ec_number.split(".")[:-wildcard_level]
+        node = self._get_node(prefix_parts)
+        if node is None:
+            return []
+        if prefix_parts:
+            return self._get_ec_numbers_of_subtree(node, wildcard_level, wildcard_level)
+        # Without a remaining prefix, all EC numbers with at most wildcard_level parts fit
+        return self._get_ec_numbers_of_subtree(node, 1, wildcard_level)
+
+    def _get_ec_numbers_of_subtree(
+        self, node: dict[str | None, Any], min_depth: int, max_depth: int | None
+    ) -> list[str]:
+        """Returns all EC numbers in the node's subtree with a depth (relative to the node) in the given range.
+
+        Args:
+            node (dict[str | None, Any]): The subtree's root node.
+            min_depth (int): Minimal depth.
+            max_depth (int | None): Maximal depth (None: unlimited).
+
+        Returns:
+            list[str]: The subtree's EC numbers.
+        """
+        ec_numbers: list[str] = []
+        stack: list[tuple[dict[str | None, Any], int]] = [(node, 0)]
+        while stack:
+            current_node, depth = stack.pop()
+            if (None in current_node) and (depth >= min_depth):
+                ec_numbers.append(current_node[None])
+            if (max_depth is not None) and (depth >= max_depth):
+                continue
+            stack.extend(
+                (child_node, depth + 1)
+                for key, child_node in reversed(list(current_node.items()))
+                if key is not None
+            )
+        return ec_numbers
+
+    def _get_node(self, ec_number_parts: list[str]) -> dict[str | None, Any] | None:
+        """Returns the node of the given EC number parts (None if it is not in the trie).
+
+        Args:
+            ec_number_parts (list[str]): The EC number parts, e.g. ["1", "1", "1"].
+
+        Returns:
+            dict[str | None, Any] | None: The node or None.
+        """
+        node = self.root
+        for ec_number_part in ec_number_parts:
+            if ec_number_part not in node:
+                return None
+            node = node[ec_number_part]
+        return node
+
+
 @validate_call(validate_return=True)
 def get_ec_number_transfers(expasy_enzyme_rdf_path: str) -> dict[str, str]:
     """Parses an Expasy enzyme RDF file to extract enzyme EC number transfers.
@@ -1,17 +1,163 @@
 """Methods for COBRA-k's genetic algorithm used in the COBRA-k evolutionary algorithm"""
 
 import operator
+import os
 from collections.abc import Callable
 from copy import deepcopy
 from os import cpu_count
-from random import choice, randint, uniform
+from random import Random
 from time import time
+from typing import Any
 
 import numpy as np
-from joblib import Parallel, delayed
 
-from .io import json_write
-from .utilities import count_last_equal_elements, last_n_elements_equal
+from .io import jsonl_append, jsonl_follow, pickle_load, pickle_write
+from .utilities import (
+    count_last_equal_elements,
+    last_n_elements_equal,
+    parallel_map_until_deadline,
+)
+
+
+def _pack_xs_dict(xs_dict: dict[tuple[int, ...], float], xs_dim: int) -> dict[str, Any]:
+    """Packs a dictionary of bit vectors and their fitness values into a compact form for checkpoints.
+
+    Args:
+        xs_dict (dict[tuple[int, ...], float]): Bit vectors (all of length xs_dim or empty) as keys,
+            their fitness values as values.
+        xs_dim (int): The length of the (non-empty) bit vectors.
+
+    Returns:
+        dict[str, Any]: The bit vectors packed as bits of an uint8 array, their fitness values as float
+        array, and the fitness value of the empty vector (or None if it is not given).
+    """
+    xs_items = [(x, fitness) for x, fitness in xs_dict.items() if x]
+    return {
+        "bits": np.packbits(
+            np.array([x for x, _ in xs_items], dtype=np.uint8).reshape(-1, xs_dim),
+            axis=1,
+        ),
+        "fitnesses": np.array([fitness for _, fitness in xs_items], dtype=np.float64),
+        "empty_fitness": xs_dict.get(()),
+    }
+
+
+def _unpack_xs_dict(
+    packed_xs_dict: dict[str, Any], xs_dim: int
+) -> dict[tuple[int, ...], float]:
+    """Reverts _pack_xs_dict.
+
+    Args:
+        packed_xs_dict (dict[str, Any]): The result of _pack_xs_dict.
+        xs_dim (int): The length of the (non-empty) bit vectors.
+
+    Returns:
+        dict[tuple[int, ...], float]: Bit vectors as keys, their fitness values as values.
+    """
+    xs_array = np.unpackbits(packed_xs_dict["bits"], axis=1, count=xs_dim)
+    xs_dict: dict[tuple[int, ...], float] = {
+        tuple(int(bit) for bit in x): float(fitness)
+        for x, fitness in zip(xs_array, packed_xs_dict["fitnesses"])
+    }
+    if packed_xs_dict["empty_fitness"] is not None:
+        xs_dict[()] = packed_xs_dict["empty_fitness"]
+    return xs_dict
+
+
+class HammingKNNSurrogate:
+    """A lightweight k-nearest-neighbour surrogate of a fitness function over bit vectors.
+
+    Distances between bit vectors are Hamming distances. For a candidate, the surrogate
+    predicts (i) the probability that its fitness evaluation will be feasible (i.e., not
+    reach the infeasibility fitness value) and (ii) its expected fitness, both as
+    inverse-distance-weighted averages over its k nearest known bit vectors.
+
+    Attributes:
+        num_neighbors (int): The number k of considered nearest neighbours.
+        infeasible_fitness (float): Fitness values at or above this value count as infeasible.
+    """
+
+    def __init__(
+        self,
+        num_neighbors: int = 5,
+        infeasible_fitness: float = 1_000_000.0,
+    ) -> None:
+        """Initializes the HammingKNNSurrogate object.
+
+        Args:
+            num_neighbors (int, optional): The number k of considered nearest neighbours. Defaults to 5.
+            infeasible_fitness (float, optional): Fitness values at or above this value count as infeasible.
+                Defaults to 1_000_000.0.
+        """
+        self.num_neighbors = num_neighbors
+        self.infeasible_fitness = infeasible_fitness
+        self.known_xs = np.zeros((0, 0), dtype=np.int32)
+        self.known_fitnesses = np.zeros(0, dtype=np.float64)
+
+    def fit(self, xs_and_fitnesses: dict[tuple[int, ...], float]) -> None:
+        """(Re-)trains the surrogate with the given bit vectors and their fitness values.
+
+        Args:
+            xs_and_fitnesses (dict[tuple[int, ...], float]): Bit vectors as keys, their fitness values as values.
+        """
+        known_items = [(x, fitness) for x, fitness in xs_and_fitnesses.items() if x]
+        self.known_xs = np.array([x for x, _ in known_items], dtype=np.int32)
+        self.known_fitnesses = np.array(
+            [fitness for _, fitness in known_items], dtype=np.float64
+        )
+
+    def predict(self, xs: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+        """Predicts feasibility probabilities and fitness values of the given bit vectors.
+
+        Args:
+            xs (list[list[int]]): The bit vectors.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The feasibility probabilities and the expected fitness values
+            (inf if no feasible neighbour exists).
+        """
+        queried_xs = np.array(xs, dtype=np.int32)
+        # Hamming distances of all queried to all known vectors as two matrix products
+        distances = queried_xs @ (1 - self.known_xs).T + (1 - queried_xs) @ (
+            self.known_xs.T
+        )
+        num_neighbors = min(self.num_neighbors, self.known_xs.shape[0])
+        neighbor_idxs = np.argsort(distances, axis=1, kind="stable")[:, :num_neighbors]
+        weights = 1.0 / (1.0 + np.take_along_axis(distances, neighbor_idxs, axis=1))
+        neighbor_fitnesses = self.known_fitnesses[neighbor_idxs]
+        feasible_neighbors = neighbor_fitnesses < self.infeasible_fitness
+
+        feasibility_probabilities = (weights * feasible_neighbors).sum(
+            axis=1
+        ) / weights.sum(axis=1)
+        feasible_weights = weights * feasible_neighbors
+        feasible_weight_sums = feasible_weights.sum(axis=1)
+        expected_fitnesses = np.full(len(xs), float("inf"))
+        has_feasible_neighbor = feasible_weight_sums > 0.0
+        expected_fitnesses[has_feasible_neighbor] = (
+            feasible_weights * np.where(feasible_neighbors, neighbor_fitnesses, 0.0)
+        ).sum(axis=1)[has_feasible_neighbor] / feasible_weight_sums[
+            has_feasible_neighbor
+        ]
+        return feasibility_probabilities, expected_fitnesses
+
+    def rank(self, xs: list[list[int]]) -> list[int]:
+        """Ranks the given bit vectors from most to least promising.
+
+        Bit vectors are sorted by descending predicted feasibility probability and, for
+        equal probabilities, by ascending expected fitness.
+
+        Args:
+            xs (list[list[int]]): The bit vectors.
+
+        Returns:
+            list[int]: The indices of the bit vectors in xs, sorted from most to least promising.
+        """
+        feasibility_probabilities, expected_fitnesses = self.predict(xs)
+        return [
+            int(idx)
+            for idx in np.lexsort((expected_fitnesses, -feasibility_probabilities))
+        ]
 
 
 class COBRAKGENETIC:
@@ -23,11 +169,22 @@ class COBRAKGENETIC:
         xs_dim (int): The dimensionality of the search space.
         gen (int): The number of generations to run the algorithm for.
         seed (int | None): The seed for the random number generator.
-        objvalue_json_path (str): The path to a JSON file to store objective values.
+        rng (Random): The random number generator from which all random decisions
+            (including the seeds of the particles' mutations) are drawn.
+        objvalue_json_path (str): The path to a JSON Lines file to which the objective values are appended.
         max_rounds_same_objvalue (float): The maximum number of rounds with the same
             objective value before stopping the algorithm.
         pop_size (int | None): The size of the population. If None, defaults to the
             number of CPUs.
+        surrogate_skip_share (float): Share of each generation's mutated particles that is
+            not evaluated with the fitness function as a surrogate model predicts them to
+            be the least promising ones. If 0.0, no surrogate is used.
+        num_saved_evaluations (int): Number of fitness evaluations saved by the surrogate.
+        num_evaluations (int): Number of (finished) fitness evaluations of the run.
+        checkpoint_path (str): If not empty, path of the pickled checkpoint file of the run.
+        checkpoint_interval (int): Number of generations between two checkpoint writes.
+        time_budget (float): Maximal wall-clock seconds of a run() call.
+        cut_short (bool): Whether or not the last run() call was stopped because its time budget was used up.
     """
 
     def __init__(
@@ -42,6 +199,11 @@ class COBRAKGENETIC:
         objvalue_json_path: str = "",
         max_rounds_same_objvalue: float = float("inf"),
         pop_size: int | None = None,
+        surrogate_skip_share: float = 0.0,
+        surrogate_num_neighbors: int = 5,
+        checkpoint_path: str = "",
+        checkpoint_interval: int = 1,
+        time_budget: float = float("inf"),
     ) -> None:
         """Initializes the COBRAKGENETIC object.
 
@@ -52,11 +214,31 @@ class COBRAKGENETIC:
             extra_xs (list[list[int]], optional): Extra particles to initialize the population.
                 Defaults to [].
             seed (int | None, optional): Seed for the random number generator. Defaults to None.
-            objvalue_json_path (str, optional): Path to a JSON file to store objective values.
+            objvalue_json_path (str, optional): Path to a JSON Lines file to which one line is appended
+                after the initialization and after each generation, containing the elapsed time, the
+                generation, the best objective value, the number of fitness evaluations so far and the
+                objective values found in this generation.
+                A final line with "finished": true marks the end of the run. Such a log can be followed
+                live with tail_objvalue_log and plotted with cobrak.plotting.plot_objvalue_evolution.
                 Defaults to "".
             max_rounds_same_objvalue (float, optional): Maximum rounds with the same objective
                 value before stopping. Defaults to infinity.
             pop_size (int | None, optional): Population size. Defaults to None.
+            surrogate_skip_share (float, optional): Share (between 0 and 1) of each generation's
+                mutated particles that is predicted to be least promising by a HammingKNNSurrogate
+                (trained on all evaluated particles) and therefore not evaluated. Defaults to 0.0,
+                i.e. no surrogate pre-screening.
+            surrogate_num_neighbors (int, optional): Number of nearest neighbours of the surrogate.
+                Defaults to 5.
+            checkpoint_path (str, optional): If not empty, the run's state (tested particles, generation
+                counter, objective history and random number generator state) is written as pickle file
+                to this path after the initialization and every checkpoint_interval generations. If the
+                file already exists when run() is called, the run resumes from it. Defaults to "".
+            checkpoint_interval (int, optional): Number of generations between two checkpoint writes.
+                Defaults to 1.
+            time_budget (float, optional): Maximal wall-clock seconds of a run() call. Once it is used up, no
+                further fitness evaluations are started, the results of still running ones are discarded, and
+                the best particle found so far is returned (with cut_short set to True). Defaults to float("inf").
         """
         # Parameters
         self.fitness_function = fitness_function
@@ -65,6 +247,7 @@ class COBRAKGENETIC:
         self.seed = seed
         if seed is not None:
             np.random.seed(seed)  # noqa: NPY002
+        self.rng = Random(seed)
 
         # Initialization of random particles
         cpu_count_value = cpu_count() if pop_size is None else pop_size
@@ -73,7 +256,7 @@ class COBRAKGENETIC:
         else:
             self.cpu_count = cpu_count_value
         self.init_xs = [
-            [randint(0, 1) for _ in range(xs_dim)]
+            [self.rng.randint(0, 1) for _ in range(xs_dim)]
             for _ in range(self.cpu_count - len(extra_xs))
         ]
 
@@ -84,8 +267,65 @@ class COBRAKGENETIC:
         self.tested_xs: dict[tuple[int, ...], float] = {}
         self.all_xs: dict[tuple[int, ...], float] = {}
         self.objvalue_json_path = objvalue_json_path
-        self.objvalue_json_data: dict[float, list[float]] = {}
         self.max_rounds_same_objvalue = max_rounds_same_objvalue
+        self.surrogate_skip_share = surrogate_skip_share
+        self.surrogate = HammingKNNSurrogate(num_neighbors=surrogate_num_neighbors)
+        self.evaluated_mutated_xs: dict[tuple[int, ...], float] = {}
+        self.num_saved_evaluations = 0
+        self.num_evaluations = 0
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.generation = 0
+        self.max_objvalues: list[float] = []
+        self.elapsed_time = 0.0
+        self.time_budget = time_budget
+        self.cut_short = False
+
+    def _load_checkpoint(self) -> None:
+        """Restores the run's state from the checkpoint file at checkpoint_path."""
+        checkpoint = pickle_load(self.checkpoint_path)
+        if checkpoint["xs_dim"] != self.xs_dim:
+            print(
+                f"ERROR: Checkpoint {self.checkpoint_path} is for {checkpoint['xs_dim']} instead of {self.xs_dim} dimensions."
+            )
+            raise ValueError
+        self.generation = checkpoint["generation"]
+        self.max_objvalues = checkpoint["max_objvalues"]
+        self.elapsed_time = checkpoint["elapsed_time"]
+        self.rng.setstate(checkpoint["rng_state"])
+        self.tested_xs = _unpack_xs_dict(checkpoint["tested_xs"], self.xs_dim)
+        self.all_xs = _unpack_xs_dict(checkpoint["all_xs"], self.xs_dim)
+        self.evaluated_mutated_xs = _unpack_xs_dict(
+            checkpoint["evaluated_mutated_xs"], self.xs_dim
+        )
+        self.num_saved_evaluations = checkpoint["num_saved_evaluations"]
+        self.num_evaluations = checkpoint.get("num_evaluations", 0)
+
+    def _write_checkpoint(self) -> None:
+        """Writes the run's state to checkpoint_path.
+
+        The checkpoint is first written to a temporary file which then replaces the old checkpoint,
+        so that an interrupted write never leaves a corrupt checkpoint behind.
+        """
+        temp_checkpoint_path = f"{self.checkpoint_path}.tmp"
+        pickle_write(
+            temp_checkpoint_path,
+            {
+                "xs_dim": self.xs_dim,
+                "generation": self.generation,
+                "max_objvalues": self.max_objvalues,
+                "elapsed_time": self.elapsed_time,
+                "rng_state": self.rng.getstate(),
+                "tested_xs": _pack_xs_dict(self.tested_xs, self.xs_dim),
+                "all_xs": _pack_xs_dict(self.all_xs, self.xs_dim),
+                "evaluated_mutated_xs": _pack_xs_dict(
+                    self.evaluated_mutated_xs, self.xs_dim
+                ),
+                "num_saved_evaluations": self.num_saved_evaluations,
+                "num_evaluations": self.num_evaluations,
+            },
+        )
+        os.replace(temp_checkpoint_path, self.checkpoint_path)
 
     def _get_sorted_list_from_tested_xs(self) -> list[tuple[float, tuple[int, ...]]]:
         """Returns a sorted list of tuples containing fitness scores and solutions.
@@ -105,26 +345,41 @@ class COBRAKGENETIC:
             tuple[float, tuple[int, ...]]: A tuple containing the best fitness score and the
             corresponding solution.
         """
-        init_fitnesses = Parallel(n_jobs=-1)(
-            delayed(self.fitness_function)(x) for x in self.init_xs
-        )
-        if init_fitnesses is not None:
-            self.tested_xs = {}
+        deadline = time() + self.time_budget
+        self.cut_short = False
+        if self.checkpoint_path and os.path.isfile(self.checkpoint_path):
+            self._load_checkpoint()
+            print(
+                f"INFO: Resuming from checkpoint {self.checkpoint_path} at generation {self.generation}."
+            )
+        else:
+            init_fitnesses, self.cut_short = parallel_map_until_deadline(
+                self.fitness_function, [(x,) for x in self.init_xs], deadline
+            )
+            self.tested_xs = {(): 1_000_000.0}
             for init_fitness in init_fitnesses:
+                if init_fitness is None:
+                    continue
+                self.num_evaluations += 1
                 for fitness, xs in init_fitness:
                     self.tested_xs[tuple(xs)] = fitness
-        else:
-            print("ERROR: Something went wrong during initialization")
-            raise ValueError
 
-        if self.objvalue_json_path:
-            start_time = time()
-            self.objvalue_json_data[0.0] = sorted(self.tested_xs.values())
-            json_write(self.objvalue_json_path, self.objvalue_json_data)
+            if self.objvalue_json_path:
+                # A new run starts a new log (a resumed run continues the existing one)
+                if os.path.isfile(self.objvalue_json_path):
+                    os.remove(self.objvalue_json_path)
+                self._log_objvalues(0.0, list(self.tested_xs.values()))
+            # An incomplete initialization is not checkpointed so that a resumed run repeats it
+            if self.checkpoint_path and not self.cut_short:
+                self._write_checkpoint()
+        start_time = time() - self.elapsed_time
 
         # Actual algorithm
-        max_objvalues = []
-        for _ in range(self.gen):
+        max_objvalues = self.max_objvalues
+        while (self.generation < self.gen) and not self.cut_short:
+            if time() >= deadline:
+                self.cut_short = True
+                break
             max_objvalues.append(max(self.tested_xs.values()))
             if last_n_elements_equal(max_objvalues, self.max_rounds_same_objvalue):  # type: ignore
                 break
@@ -135,12 +390,16 @@ class COBRAKGENETIC:
             chosen_xs: list[tuple[int, ...]] = []
             # Choose some of the top 3
             for _ in range(self.cpu_count // 4):
-                chosen_xs.append(choice([x[1] for x in xs_list if len(x[1]) > 0][:3]))
+                chosen_xs.append(
+                    self.rng.choice([x[1] for x in xs_list if len(x[1]) > 0][:3])
+                )
 
             # Choose some of the 25% best
             for _ in range(self.cpu_count // 2):
                 chosen_xs.append(
-                    choice([x[1] for x in xs_list][: round(len(xs_list) * 0.25)])
+                    self.rng.choice(
+                        [x[1] for x in xs_list][: round(len(xs_list) * 0.25)]
+                    )
                 )
 
             # Choose some other 75% worst
@@ -148,88 +407,150 @@ class COBRAKGENETIC:
                 addlength = 0
                 while not addlength:
                     added_xs = deepcopy(
-                        choice([x[1] for x in xs_list][round(len(xs_list) * 0.25) :])
+                        self.rng.choice(
+                            [x[1] for x in xs_list][round(len(xs_list) * 0.25) :]
+                        )
                     )
                     addlength = len(added_xs)
                 chosen_xs.append(added_xs)
 
             # Random crossovers
             for _ in range(round(len(chosen_xs) * 0.2)):
-                target = randint(0, len(chosen_xs) - 1)
-                source = randint(0, len(chosen_xs) - 1)
-                cut = randint(0, self.xs_dim - 1)
+                target = self.rng.randint(0, len(chosen_xs) - 1)
+                source = self.rng.randint(0, len(chosen_xs) - 1)
+                cut = self.rng.randint(0, self.xs_dim - 1)
                 chosen_xs[target] = deepcopy(chosen_xs[target][:cut]) + deepcopy(
                     chosen_xs[source][cut:]
                 )
 
-            # Test Xs in parallel
-            results = Parallel(n_jobs=-1, verbose=10)(
-                delayed(self.update_particle)(
-                    chosen_x,
+            # Test Xs in parallel (with mutation seeds drawn here so that the run is reproducible)
+            mutation_seeds = [self.rng.getrandbits(64) for _ in chosen_xs]
+            if self.surrogate_skip_share > 0.0:
+                results, self.cut_short = self._update_particles_with_surrogate(
+                    chosen_xs,
                     count_last_equal_elements(max_objvalues),
+                    mutation_seeds,
+                    deadline,
+                )
+            else:
+                results, self.cut_short = parallel_map_until_deadline(
+                    self.update_particle,
+                    [
+                        (
+                            chosen_x,
+                            count_last_equal_elements(max_objvalues),
+                            mutation_seed,
+                        )
+                        for chosen_x, mutation_seed in zip(chosen_xs, mutation_seeds)
+                    ],
+                    deadline,
+                    verbose=10,
                 )
-                for chosen_x in chosen_xs
-            )
-
-            if results is None:
-                print("ERROR: Something went wrong during fitness calculations")
-                raise ValueError
 
-            # Unpack results
-            for fitnesses_and_active_xs, mutated_x in results:
+            # Unpack results (of the evaluations which finished in time)
+            new_fitnesses: list[float] = []
+            for result in results:
+                if result is None:
+                    continue
+                fitnesses_and_active_xs, mutated_x = result
+                if len(mutated_x):
+                    self.num_evaluations += 1
                 for fitness, active_x in fitnesses_and_active_xs:
                     if active_x is None or active_x == []:
                         continue
+                    new_fitnesses.append(fitness)
                     self.tested_xs[tuple(active_x)] = fitness
                     self.all_xs[tuple(active_x)] = fitness
                 self.all_xs[tuple(mutated_x)] = max(
                     fitness for (fitness, _) in fitnesses_and_active_xs
                 )
+                if self.surrogate_skip_share > 0.0:
+                    self.evaluated_mutated_xs[tuple(mutated_x)] = min(
+                        fitness for (fitness, _) in fitnesses_and_active_xs
+                    )
 
+            self.generation += 1
+            self.elapsed_time = time() - start_time
             if self.objvalue_json_path:
-                self.objvalue_json_data[time() - start_time] = sorted(
-                    self.tested_xs.values()
-                )
-                json_write(self.objvalue_json_path, self.objvalue_json_data)
+                self._log_objvalues(self.elapsed_time, new_fitnesses)
+            if self.checkpoint_path and (
+                self.generation % self.checkpoint_interval == 0
+            ):
+                self._write_checkpoint()
+
+        if self.objvalue_json_path:
+            self._log_objvalues(time() - start_time, [], finished=True)
+        if self.cut_short:
+            print(
+                f"INFO: Time budget of {self.time_budget} s used up, returning the best result found so far."
+            )
+        if self.surrogate_skip_share > 0.0:
+            print(
+                f"INFO: Surrogate pre-screening saved {self.num_saved_evaluations} fitness evaluations."
+            )
 
         best_f_and_x = self._get_sorted_list_from_tested_xs()[0]
         return best_f_and_x[0], best_f_and_x[1]
 
-    def update_particle(
+    def _log_objvalues(
+        self, elapsed_time: float, new_fitnesses: list[float], finished: bool = False
+    ) -> None:
+        """Appends a line to the objective value log at objvalue_json_path.
+
+        Args:
+            elapsed_time (float): Seconds since the start of the run.
+            new_fitnesses (list[float]): The fitness values found since the last line.
+            finished (bool, optional): Whether or not this is the run's final line. Defaults to False.
+        """
+        entry: dict[str, Any] = {
+            "time": elapsed_time,
+            "generation": self.generation,
+            "best": min(self.tested_xs.values()),
+            "evaluations": self.num_evaluations,
+            "objvalues": sorted(new_fitnesses),
+        }
+        if finished:
+            entry["finished"] = True
+        jsonl_append(self.objvalue_json_path, entry)
+
+    def _mutate_particle(
         self,
         chosen_x: list[int],
         num_rounds_without_best_change: int,
-    ) -> tuple[float, list[int], list[int]]:
-        """Updates a single particle by introducing mutations.
+        mutation_seed: int | None = None,
+    ) -> list[int]:
+        """Returns a new (i.e., not yet tested) mutated version of a particle.
 
         Args:
             chosen_x (list[int]): The current solution represented as a list of integers.
             num_rounds_without_best_change (int): The number of rounds without a change in the
                 best fitness score.
+            mutation_seed (int | None, optional): Seed of the mutation's random number generator.
+                Defaults to None.
 
         Returns:
-            tuple[list[list[float]], list[int]]: A tuple containing a list of fitness scores
-            and the mutated solution.
+            list[int]: The mutated solution or an empty list if no new mutation could be found.
         """
         if not len(chosen_x):
-            return [[1_000_000, []]], []
+            return []
 
+        rng = Random(mutation_seed)
         min_change_p = 0.1 * 0.95**num_rounds_without_best_change
         max_change_p = 0.1 * 1.05**num_rounds_without_best_change
-        change_p = uniform(min_change_p, max_change_p)
+        change_p = rng.uniform(min_change_p, max_change_p)
         change_p = max(0.001, change_p)
         change_p = min(0.999, change_p)
 
         mutation_tries = 0
         while True:
             mutated_x: list[float] = []
-            match randint(0, 2):
+            match rng.randint(0, 2):
                 case 0:  # Extend
                     for x in chosen_x:
                         if x == 1:
                             mutated_x.append(1)
                             continue
-                        if uniform(0.0, 1.0) < change_p:
+                        if rng.uniform(0.0, 1.0) < change_p:
                             mutated_x.append(1)
                         else:
                             mutated_x.append(x)
@@ -238,19 +559,19 @@ class COBRAKGENETIC:
                         if x == 0:
                             mutated_x.append(0)
                             continue
-                        if uniform(0.0, 1.0) < change_p:
+                        if rng.uniform(0.0, 1.0) < change_p:
                             mutated_x.append(0)
                         else:
                             mutated_x.append(x)
                 case 2:  # Extend and decrease
                     for x in chosen_x:
                         if x == 1:
-                            if uniform(0.0, 1.0) < change_p:
+                            if rng.uniform(0.0, 1.0) < change_p:
                                 mutated_x.append(0)
                             else:
                                 mutated_x.append(x)
                         else:
-                            if uniform(0.0, 1.0) < change_p:
+                            if rng.uniform(0.0, 1.0) < change_p:
                                 mutated_x.append(1)
                             else:
                                 mutated_x.append(x)
@@ -258,13 +579,126 @@ class COBRAKGENETIC:
                 #    mutated_x = [randint(0, 1) for _ in range(len(chosen_x))]
 
             if mutation_tries > 250:
-                return [[1_000_000, []]], []
+                return []
             if tuple(mutated_x) in self.all_xs:
                 mutation_tries += 1
             else:
                 break
 
+        return mutated_x
+
+    def _update_particles_with_surrogate(
+        self,
+        chosen_xs: list[list[int]],
+        num_rounds_without_best_change: int,
+        mutation_seeds: list[int],
+        deadline: float = float("inf"),
+    ) -> tuple[list[tuple[list[tuple[float, list[int]]], list[int]] | None], bool]:
+        """Mutates the chosen particles and evaluates only the ones the surrogate deems most promising.
+
+        The surrogate is trained on all particles with known fitness, i.e. the tested (active)
+        particles and the evaluated mutated particles (with their best resulting fitness).
+
+        Args:
+            chosen_xs (list[list[int]]): The particles chosen for mutation.
+            num_rounds_without_best_change (int): The number of rounds without a change in the
+                best fitness score.
+            mutation_seeds (list[int]): Seeds of the particles' mutations.
+            deadline (float, optional): time() timestamp after which no further evaluations are started.
+                Defaults to float("inf").
+
+        Returns:
+            tuple[list[tuple[list[tuple[float, list[int]]], list[int]] | None], bool]: As for update_particle,
+            the fitness scores and mutated solution of each evaluated particle (None if its evaluation did not
+            finish before the deadline), and whether or not any evaluation did not finish before the deadline.
+        """
+        mutated_xs: list[list[int]] = []
+        for chosen_x, mutation_seed in zip(chosen_xs, mutation_seeds):
+            mutated_x = self._mutate_particle(
+                chosen_x, num_rounds_without_best_change, mutation_seed
+            )
+            if len(mutated_x) and (mutated_x not in mutated_xs):
+                mutated_xs.append(mutated_x)
+
+        known_xs = {**self.tested_xs, **self.evaluated_mutated_xs}
+        if len(mutated_xs) > 1 and len(known_xs) >= self.surrogate.num_neighbors:
+            self.surrogate.fit(known_xs)
+            num_evaluated = max(
+                1, round(len(mutated_xs) * (1.0 - self.surrogate_skip_share))
+            )
+            self.num_saved_evaluations += len(mutated_xs) - num_evaluated
+            mutated_xs = [mutated_xs[idx] for idx in self.surrogate.rank(mutated_xs)][
+                :num_evaluated
+            ]
+
+        fitnesses_and_active_xs_list, cut_short = parallel_map_until_deadline(
+            self.fitness_function,
+            [(mutated_x,) for mutated_x in mutated_xs],
+            deadline,
+            verbose=10,
+        )
+        return [
+            None
+            if fitnesses_and_active_xs is None
+            else (fitnesses_and_active_xs, mutated_x)
+            for fitnesses_and_active_xs, mutated_x in zip(
+                fitnesses_and_active_xs_list, mutated_xs
+            )
+        ], cut_short
+
+    def update_particle(
+        self,
+        chosen_x: list[int],
+        num_rounds_without_best_change: int,
+        mutation_seed: int | None = None,
+    ) -> tuple[float, list[int], list[int]]:
+        """Updates a single particle by introducing mutations.
+
+        Args:
+            chosen_x (list[int]): The current solution represented as a list of integers.
+            num_rounds_without_best_change (int): The number of rounds without a change in the
+                best fitness score.
+            mutation_seed (int | None, optional): Seed of the mutation's random number generator.
+                Defaults to None.
+
+        Returns:
+            tuple[list[list[float]], list[int]]: A tuple containing a list of fitness scores
+            and the mutated solution.
+        """
+        mutated_x = self._mutate_particle(
+            chosen_x, num_rounds_without_best_change, mutation_seed
+        )
+        if not len(mutated_x):
+            return [[1_000_000, []]], []
+
         # Evaluate new position
         fitnesses_and_active_xs = self.fitness_function(mutated_x)
 
         return fitnesses_and_active_xs, mutated_x
+
+
+def tail_objvalue_log(
+    objvalue_json_path: str,
+    poll_interval: float = 1.0,
+    idle_timeout: float = float("inf"),
+) -> None:
+    """Prints the lines of a (possibly still running) COBRAKGENETIC objective value log as they are written.
+
+    Stops when the run's final line was read or when no new line appeared for idle_timeout seconds.
+
+    Args:
+        objvalue_json_path (str): Path to the JSON Lines log (see COBRAKGENETIC's objvalue_json_path).
+        poll_interval (float, optional): Seconds between two checks for new lines. Defaults to 1.0.
+        idle_timeout (float, optional): Seconds without new lines after which the tailing stops.
+            Defaults to float("inf").
+    """
+    for entry in jsonl_follow(objvalue_json_path, poll_interval, idle_timeout):
+        if entry.get("finished", False):
+            print(
+                f"Finished after generation {entry['generation']} ({entry['time']:.1f} s); best objective value: {entry['best']}"
+            )
+            return
+        print(
+            f"Generation {entry['generation']} ({entry['time']:.1f} s): best objective value {entry['best']}, "
+            f"{len(entry['objvalues'])} new objective value(s)"
+        )
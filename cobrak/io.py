@@ -2,12 +2,15 @@
 
 # IMPORTS SECTION #
 import contextlib
+import io
 import json
 import os
 import pickle
 import tempfile
+import time
 import zipfile
 from ast import literal_eval
+from collections.abc import Generator
 from dataclasses import asdict, is_dataclass
 from typing import Any, TypeVar
 from zipfile import ZipFile
@@ -627,9 +630,8 @@ def json_write(path: str, json_data: Any) -> None:  # noqa: ANN401
                 json_dict[key] = data
         json_write(path, json_dict)
     else:
-        json_output = json.dumps(json_data, indent=4)
         with open(path, "w+", encoding="utf-8") as f:
-            f.write(json_output)
+            json.dump(json_data, f, indent=4)
 
 
 @validate_call
@@ -678,9 +680,92 @@ def json_zip_write(
     * json_data: Any ~ The dictionary or list which shalll be the content of
       the created JSON file
     """
-    json_output = json.dumps(json_data, indent=4).encode("utf-8")
-    with ZipFile(path + ".zip", "w", compression=zip_method) as zip_file:
-        zip_file.writestr(os.path.basename(path), json_output)
+    # The JSON is encoded chunk-wise directly into the zip member, so that
+    # the full JSON string never has to be held in memory.
+    with (
+        ZipFile(path + ".zip", "w", compression=zip_method) as zip_file,
+        zip_file.open(os.path.basename(path), "w", force_zip64=True) as zip_member,
+        io.TextIOWrapper(zip_member, encoding="utf-8") as text_member,
+    ):
+        json.dump(json_data, text_member, indent=4)
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+def jsonl_append(path: str, json_data: Any) -> None:  # noqa: ANN401
+    """Appends the given data as a single line to a JSON Lines file (which is created if it does not exist).
+
+    In contrast to json_write, the already written content is not rewritten, i.e. the cost of a call
+    does not grow with the size of the file.
+
+    Args:
+        path (str): The path of the JSON Lines file.
+        json_data (Any): The JSON-compatible data which becomes the new line.
+    """
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(json_data) + "\n")
+
+
+@validate_call
+def jsonl_follow(
+    path: str,
+    poll_interval: float = 1.0,
+    idle_timeout: float = float("inf"),
+) -> Generator[Any, None, None]:
+    """Yields the lines of a JSON Lines file which is still being written, similar to "tail -f".
+
+    All already written lines are yielded first. Afterwards, the file is polled for new lines
+    until no new line appeared for idle_timeout seconds. If the file does not exist yet, it is
+    waited for in the same way. A line which is only partially written is yielded as soon as
+    it is completed.
+
+    Args:
+        path (str): The path of the JSON Lines file.
+        poll_interval (float, optional): Seconds between two checks for new lines. Defaults to 1.0.
+        idle_timeout (float, optional): Seconds without new lines after which the generator stops.
+            Defaults to float("inf"), i.e. the generator only stops if the caller stops iterating.
+
+    Yields:
+        Any: The parsed content of each line.
+    """
+    last_change_time = time.time()
+    while not os.path.isfile(path):
+        if time.time() - last_change_time >= idle_timeout:
+            return
+        time.sleep(poll_interval)
+
+    with open(path, encoding="utf-8") as f:
+        unfinished_line = ""
+        last_change_time = time.time()
+        while True:
+            line = f.readline()
+            if line:
+                unfinished_line += line
+                if unfinished_line.endswith("\n"):
+                    yield json.loads(unfinished_line)
+                    unfinished_line = ""
+                last_change_time = time.time()
+                continue
+            if time.time() - last_change_time >= idle_timeout:
+                return
+            time.sleep(poll_interval)
+
+
+@validate_call
+def jsonl_stream(path: str) -> Generator[Any, None, None]:
+    """Yields the parsed lines of a JSON Lines file one by one, without loading the whole file.
+
+    A last line without a final newline (i.e., a line which is just being written) is skipped.
+
+    Args:
+        path (str): The path of the JSON Lines file.
+
+    Yields:
+        Any: The parsed content of each line.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.endswith("\n") and line.strip():
+                yield json.loads(line)
 
 
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
@@ -0,0 +1,441 @@
+"""High-throughput knockout (KO) screening of COBRA-k models.
+
+A KO screen optimizes the same objective for many single, double or triple KOs of reactions
+or enzymes. Instead of building one optimization model per KO, each parallel worker builds
+its (MI)LP once and, for each KO, only fixes the knocked out reactions to zero flux and
+frees them afterwards.
+"""
+
+# IMPORT SECTION #
+from collections.abc import Generator
+from copy import deepcopy
+from itertools import combinations
+
+from joblib import Parallel, cpu_count, delayed
+from pydantic import validate_call
+from pyomo.common.errors import ApplicationError
+
+from .constants import ALL_OK_KEY, OBJECTIVE_VAR_NAME, STANDARD_MIN_MDF
+from .dataclasses import Model, Solver
+from .io import jsonl_append
+from .lps import _get_optimization_lp
+from .mcs import _get_knockout_items
+from .pyomo_functionality import get_objective, get_solver
+from .standard_solvers import SCIP
+from .utilities import (
+    add_statuses_to_optimziation_dict,
+    get_pyomo_solution_as_dict,
+    get_stoichiometrically_coupled_reactions,
+    split_list,
+)
+
+KNOCKOUT_FLUX_TOLERANCE = 1e-9
+"""Absolute flux below which a variability bound counts as zero in KO screens"""
+
+
+# "PRIVATE" FUNCTIONS SECTION #
+@validate_call(validate_return=True)
+def _evaluate_knockout_batch(
+    cobrak_model: Model,
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    with_enzyme_constraints: bool,
+    with_thermodynamic_constraints: bool,
+    with_loop_constraints: bool,
+    variability_dict: dict[str, tuple[float, float]],
+    min_mdf: float,
+    solver: Solver,
+    batch: list[tuple[int, list[str]]],
+) -> list[tuple[int, float | None]]:
+    """Evaluates a batch of KOs on one persistent (MI)LP. Used in (parallelized) KO screening.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        objective_target (str | dict[str, float]): The objective target.
+        objective_sense (int): The objective sense (+1: maximization, -1: minimization).
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        with_thermodynamic_constraints (bool): Whether to include thermodynamic constraints.
+        with_loop_constraints (bool): Whether to include loop constraints.
+        variability_dict (dict[str, tuple[float, float]]): Variability data that is applied as variable bounds.
+        min_mdf (float): Minimal max-min driving force (MDF) if thermodynamic constraints are included.
+        solver (Solver): The (MI)LP solver.
+        batch (list[tuple[int, list[str]]]): For each KO, its index and its knocked out reaction IDs.
+
+    Returns:
+        list[tuple[int, float | None]]: For each KO, its index and its objective value (None if infeasible).
+    """
+    model = _get_optimization_lp(
+        cobrak_model,
+        with_enzyme_constraints=with_enzyme_constraints,
+        with_thermodynamic_constraints=with_thermodynamic_constraints,
+        with_loop_constraints=with_loop_constraints,
+        variability_dict=variability_dict,
+        min_mdf=min_mdf,
+    )
+    model.obj = get_objective(model, objective_target, objective_sense)
+    pyomo_solver = get_solver(solver.name, solver.solver_options, solver.solver_attrs)
+    try:
+        warmstart_capable = bool(pyomo_solver.warm_start_capable())
+    except AttributeError:
+        warmstart_capable = False
+    solve_extra_options = deepcopy(solver.solve_extra_options)
+    if warmstart_capable:
+        solve_extra_options["warmstart"] = True
+
+    batch_results: list[tuple[int, float | None]] = []
+    for knockout_idx, knocked_out_reac_ids in batch:
+        for reac_id in knocked_out_reac_ids:
+            getattr(model, reac_id).fix(0.0)
+        try:
+            results = pyomo_solver.solve(model, tee=False, **solve_extra_options)
+            result_dict = add_statuses_to_optimziation_dict(
+                get_pyomo_solution_as_dict(model), results
+            )
+        except (ApplicationError, AttributeError, RuntimeError, ValueError):
+            result_dict = {ALL_OK_KEY: False}
+        for reac_id in knocked_out_reac_ids:
+            getattr(model, reac_id).unfix()
+        batch_results.append(
+            (
+                knockout_idx,
+                result_dict[OBJECTIVE_VAR_NAME] if result_dict[ALL_OK_KEY] else None,
+            )
+        )
+    return batch_results
+
+
+# "PUBLIC" FUNCTIONS SECTION #
+@validate_call
+def iterate_knockout_screen(
+    cobrak_model: Model,
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    max_num_knockouts: int = 2,
+    knockout_level: str = "reaction",
+    knockout_candidates: list[str] = [],
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    with_loop_constraints: bool = False,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    min_mdf: float = STANDARD_MIN_MDF,
+    solver: Solver = SCIP,
+    num_workers: int = cpu_count(),
+    batches_per_worker: int = 4,
+) -> Generator[tuple[tuple[str, ...], float | None], None, None]:
+    """Streams the results of a single, double and (optionally) triple knockout (KO) screen.
+
+    See perform_knockout_screen for a description of the screen. Here, each KO result is yielded as soon
+    as the batch in which it was evaluated is finished. The wild type (i.e., the empty KO) comes first.
+
+    Args:
+        See perform_knockout_screen.
+
+    Yields:
+        tuple[tuple[str, ...], float | None]: The sorted knocked out KO item IDs and the objective value (None if infeasible).
+    """
+    if not 1 <= max_num_knockouts <= 3:
+        print(
+            f"ERROR: The maximal number of knockouts must be 1, 2 or 3, but is {max_num_knockouts}."
+        )
+        raise ValueError
+
+    knockout_items = _get_knockout_items(
+        cobrak_model, knockout_level, knockout_candidates
+    )
+    # Pruning through prior variability data
+    essential_item_ids: list[str] = []
+    blocked_item_ids: list[str] = []
+    for item_id, reac_ids in knockout_items.items():
+        variabilities = [
+            variability_dict[reac_id]
+            for reac_id in reac_ids
+            if reac_id in variability_dict
+        ]
+        if any(min_flux > KNOCKOUT_FLUX_TOLERANCE for min_flux, _ in variabilities):
+            essential_item_ids.append(item_id)
+        elif (len(variabilities) == len(reac_ids)) and all(
+            max_flux <= KNOCKOUT_FLUX_TOLERANCE for _, max_flux in variabilities
+        ):
+            blocked_item_ids.append(item_id)
+    screened_item_ids = sorted(
+        item_id
+        for item_id in knockout_items
+        if item_id not in essential_item_ids + blocked_item_ids
+    )
+
+    # Deduplication: KOs which knock out the same stoichiometric couples are identical
+    couple_idx_of_reac: dict[str, int] = {}
+    for couple_idx, couple in enumerate(
+        get_stoichiometrically_coupled_reactions(cobrak_model)
+    ):
+        for reac_id in couple:
+            couple_idx_of_reac[reac_id] = couple_idx
+    knockouts_of_signature: dict[frozenset[int], list[tuple[str, ...]]] = {
+        frozenset(): [()]
+    }
+    for num_knockouts in range(1, max_num_knockouts + 1):
+        for knockout in combinations(screened_item_ids, num_knockouts):
+            signature = frozenset(
+                couple_idx_of_reac[reac_id]
+                for item_id in knockout
+                for reac_id in knockout_items[item_id]
+            )
+            if signature not in knockouts_of_signature:
+                knockouts_of_signature[signature] = []
+            knockouts_of_signature[signature].append(knockout)
+
+    signatures = list(knockouts_of_signature.keys())
+    knocked_out_reacs_of_signature = [
+        sorted(
+            {
+                reac_id
+                for item_id in knockouts_of_signature[signature][0]
+                for reac_id in knockout_items[item_id]
+            }
+        )
+        for signature in signatures
+    ]
+    # The wild type is evaluated first, all other KOs in parallel batches
+    yield from (
+        ((), objective_value)
+        for _, objective_value in _evaluate_knockout_batch(
+            cobrak_model,
+            objective_target,
+            objective_sense,
+            with_enzyme_constraints,
+            with_thermodynamic_constraints,
+            with_loop_constraints,
+            variability_dict,
+            min_mdf,
+            solver,
+            [(0, [])],
+        )
+    )
+    for essential_item_id in sorted(essential_item_ids):
+        yield (essential_item_id,), None
+    knockout_batches = [
+        batch
+        for batch in split_list(
+            list(enumerate(knocked_out_reacs_of_signature))[1:],
+            max(1, num_workers * batches_per_worker),
+        )
+        if batch
+    ]
+    batch_results = Parallel(
+        n_jobs=max(1, min(num_workers, len(knockout_batches))),
+        return_as="generator_unordered",
+    )(
+        delayed(_evaluate_knockout_batch)(
+            cobrak_model,
+            objective_target,
+            objective_sense,
+            with_enzyme_constraints,
+            with_thermodynamic_constraints,
+            with_loop_constraints,
+            variability_dict,
+            min_mdf,
+            solver,
+            batch,
+        )
+        for batch in knockout_batches
+    )
+    for batch_result in batch_results:
+        for signature_idx, objective_value in batch_result:
+            for knockout in knockouts_of_signature[signatures[signature_idx]]:
+                yield knockout, objective_value
+
+
+@validate_call
+def perform_knockout_batch(
+    cobrak_model: Model,
+    knockouts: list[list[str]],
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    knockout_level: str = "enzyme",
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    with_loop_constraints: bool = False,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    min_mdf: float = STANDARD_MIN_MDF,
+    solver: Solver = SCIP,
+    num_workers: int = cpu_count(),
+    batches_per_worker: int = 4,
+) -> list[float | None]:
+    """Evaluates the given list of knockouts (KOs) with one persistent (MI)LP per worker.
+
+    In contrast to perform_knockout_screen, the KOs are not combined automatically, so that e.g. a list of
+    thousands of gene KO sets can be evaluated. At the enzyme level, each KO set is translated into its
+    knocked out reactions through the model's cached enzyme→reaction index (see Model.get_enzyme_reaction_index),
+    i.e., the model's reactions are only scanned once. As the enzyme identifiers of a fullsplit model
+    (see get_fullsplit_cobra_model) are the genes of the original gene-protein rules, an enzyme KO is a gene KO
+    which knocks out all reaction variants with this gene. KO sets with the same knocked out reactions are
+    optimized only once.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        knockouts (list[list[str]]): The KO sets, each one a list of simultaneously knocked out enzyme (or
+            reaction) IDs.
+        objective_target (str | dict[str, float]): The objective target.
+        objective_sense (int): The objective sense (+1: maximization, -1: minimization).
+        knockout_level (str, optional): "enzyme" (where an enzyme knocks out all reactions with it) or "reaction"
+            (where a reaction's base ID knocks out its forward and reverse direction). Defaults to "enzyme".
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        with_loop_constraints (bool, optional): Whether to include loop constraints. Defaults to False.
+        variability_dict (dict[str, tuple[float, float]], optional): Variability data that is applied as variable
+            bounds. Defaults to {}.
+        min_mdf (float, optional): Minimal max-min driving force (MDF). Defaults to STANDARD_MIN_MDF.
+        solver (Solver, optional): The (MI)LP solver. Defaults to SCIP.
+        num_workers (int, optional): Number of parallel workers. Defaults to cpu_count().
+        batches_per_worker (int, optional): Number of KO batches per worker. Defaults to 4.
+
+    Raises:
+        ValueError: A KO set contains an ID which is not a KO item of the given level.
+
+    Returns:
+        list[float | None]: For each KO set (in the given order), the objective value (None if infeasible).
+    """
+    knockout_items = _get_knockout_items(cobrak_model, knockout_level, [])
+    if knockout_level == "reaction":
+        for reac_id in cobrak_model.reactions:
+            knockout_items[reac_id] = [reac_id]
+
+    knocked_out_reac_sets: list[tuple[str, ...]] = []
+    knockout_set_idxs: list[int] = []
+    idx_of_knocked_out_reac_set: dict[tuple[str, ...], int] = {}
+    for knockout in knockouts:
+        for item_id in knockout:
+            if item_id not in knockout_items:
+                print(
+                    f"ERROR: '{item_id}' is no knockout item at the '{knockout_level}' level."
+                )
+                raise ValueError
+        knocked_out_reac_set = tuple(
+            sorted(
+                {reac_id for item_id in knockout for reac_id in knockout_items[item_id]}
+            )
+        )
+        if knocked_out_reac_set not in idx_of_knocked_out_reac_set:
+            idx_of_knocked_out_reac_set[knocked_out_reac_set] = len(
+                knocked_out_reac_sets
+            )
+            knocked_out_reac_sets.append(knocked_out_reac_set)
+        knockout_set_idxs.append(idx_of_knocked_out_reac_set[knocked_out_reac_set])
+
+    knockout_batches = [
+        batch
+        for batch in split_list(
+            [
+                (set_idx, list(knocked_out_reac_set))
+                for set_idx, knocked_out_reac_set in enumerate(knocked_out_reac_sets)
+            ],
+            max(1, num_workers * batches_per_worker),
+        )
+        if batch
+    ]
+    objective_values: list[float | None] = [None for _ in knocked_out_reac_sets]
+    for batch_result in Parallel(
+        n_jobs=max(1, min(num_workers, len(knockout_batches))),
+        return_as="generator_unordered",
+    )(
+        delayed(_evaluate_knockout_batch)(
+            cobrak_model,
+            objective_target,
+            objective_sense,
+            with_enzyme_constraints,
+            with_thermodynamic_constraints,
+            with_loop_constraints,
+            variability_dict,
+            min_mdf,
+            solver,
+            batch,
+        )
+        for batch in knockout_batches
+    ):
+        for set_idx, objective_value in batch_result:
+            objective_values[set_idx] = objective_value
+    return [objective_values[set_idx] for set_idx in knockout_set_idxs]
+
+
+@validate_call
+def perform_knockout_screen(
+    cobrak_model: Model,
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    max_num_knockouts: int = 2,
+    knockout_level: str = "reaction",
+    knockout_candidates: list[str] = [],
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    with_loop_constraints: bool = False,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    min_mdf: float = STANDARD_MIN_MDF,
+    solver: Solver = SCIP,
+    num_workers: int = cpu_count(),
+    batches_per_worker: int = 4,
+    result_jsonl_path: str = "",
+) -> dict[tuple[str, ...], float | None]:
+    """Performs a single, double and (optionally) triple knockout (KO) screen with one persistent (MI)LP per worker.
+
+    For each KO, the given objective is optimized under the chosen constraints. The KOs are distributed in
+    batches over parallel workers, where each worker builds its (MI)LP only once and then just fixes and
+    frees the knocked out reactions. To save optimizations:
+
+    * KO items which are essential according to the variability dict (i.e., with a positive minimal flux) are
+      reported as infeasible single KOs without optimization and are not combined further.
+    * KO items which are blocked according to the variability dict (i.e., with a maximal flux of 0) are skipped.
+    * Symmetric KOs (e.g., A+B and B+A) are only screened once, and KOs which knock out the same stoichiometric
+      couples (see get_stoichiometrically_coupled_reactions) are optimized only once.
+
+    If a result JSON Lines path is given, each KO result is appended to it as soon as its batch is finished.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        objective_target (str | dict[str, float]): The objective target.
+        objective_sense (int): The objective sense (+1: maximization, -1: minimization).
+        max_num_knockouts (int, optional): Maximal number of simultaneous KOs (1, 2 or 3). Defaults to 2.
+        knockout_level (str, optional): "reaction" (where a reaction's forward and reverse direction are one KO) or
+            "enzyme" (where an enzyme knocks out all reactions with it). Defaults to "reaction".
+        knockout_candidates (list[str], optional): If not empty, only these reactions or enzymes are knocked out.
+            Defaults to [].
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        with_loop_constraints (bool, optional): Whether to include loop constraints. Defaults to False.
+        variability_dict (dict[str, tuple[float, float]], optional): Variability data from a prior variability analysis
+            under the same constraints. Used for pruning and as variable bounds. Defaults to {}.
+        min_mdf (float, optional): Minimal max-min driving force (MDF). Defaults to STANDARD_MIN_MDF.
+        solver (Solver, optional): The (MI)LP solver. Defaults to SCIP.
+        num_workers (int, optional): Number of parallel workers. Defaults to cpu_count().
+        batches_per_worker (int, optional): Number of KO batches per worker. More batches let results arrive
+            earlier at the expense of more built (MI)LPs. Defaults to 4.
+        result_jsonl_path (str, optional): If not empty, each result is appended as line
+            {"knockouts": [...], "objective_value": ...} to this JSON Lines file. Defaults to "".
+
+    Returns:
+        dict[tuple[str, ...], float | None]: The sorted knocked out KO item IDs (where () is the wild type) -> the
+        objective value (None if infeasible).
+    """
+    screen_results: dict[tuple[str, ...], float | None] = {}
+    for knockout, objective_value in iterate_knockout_screen(
+        cobrak_model=cobrak_model,
+        objective_target=objective_target,
+        objective_sense=objective_sense,
+        max_num_knockouts=max_num_knockouts,
+        knockout_level=knockout_level,
+        knockout_candidates=knockout_candidates,
+        with_enzyme_constraints=with_enzyme_constraints,
+        with_thermodynamic_constraints=with_thermodynamic_constraints,
+        with_loop_constraints=with_loop_constraints,
+        variability_dict=variability_dict,
+        min_mdf=min_mdf,
+        solver=solver,
+        num_workers=num_workers,
+        batches_per_worker=batches_per_worker,
+    ):
+        screen_results[knockout] = objective_value
+        if result_jsonl_path:
+            jsonl_append(
+                result_jsonl_path,
+                {"knockouts": list(knockout), "objective_value": objective_value},
+            )
+    return screen_results
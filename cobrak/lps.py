@@ -15,11 +15,14 @@ from typing import Any
 
 from joblib import Parallel, cpu_count, delayed
 from numpy import percentile
+from numpy.random import default_rng
 from pydantic import ConfigDict, validate_call
+from pyomo.common.errors import ApplicationError
 from pyomo.environ import (
     Binary,
     ConcreteModel,
     Constraint,
+    ConstraintList,
     Expression,
     Objective,
     Reals,
@@ -35,6 +38,7 @@ from pyomo.environ import (
 from cobrak.pyomo_functionality import add_linear_approximation_to_pyomo_model
 
 from .constants import (
+    ALL_OK_KEY,
     BIG_M,
     DF_VAR_PREFIX,
     DG0_VAR_PREFIX,
@@ -1187,6 +1191,108 @@ def _batch_variability_optimization(
     return resultslist
 
 
+@validate_call(validate_return=True)
+def _enumerate_thermodynamic_bottleneck_sets(
+    cobrak_model: Model,
+    with_enzyme_constraints: bool,
+    min_mdf: float,
+    max_num_sets: int,
+    solver: Solver,
+    ignore_nonlinear_terms: bool,
+    seed: int,
+) -> list[list[str]]:
+    """Enumerates minimal thermodynamic bottleneck sets on one persistent MILP. Used in (parallelized) bottleneck enumeration.
+
+    The MILP of perform_lp_thermodynamic_bottleneck_analysis is built once. Then, it is solved
+    repeatedly, and after each solution, an integer cut excludes the found bottleneck set and all
+    its supersets. As the objective minimizes the number of bottlenecks, every found set is minimal
+    with respect to inclusion. The objective's weights are slightly perturbed with the given seed
+    (with a total perturbation < 1, i.e. without changing the minimal number of bottlenecks) so that
+    different seeds break ties between equally large sets differently.
+    If the solver is CPLEX or Gurobi, all further pool solutions with the same number of bottlenecks
+    are harvested after each solve (see _get_solution_pool_bottleneck_sets).
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        min_mdf (float): Minimal enforced max-min driving force (MDF).
+        max_num_sets (int): Maximal number of returned bottleneck sets.
+        solver (Solver): The MILP solver.
+        ignore_nonlinear_terms (bool): Whether or not non-linear extra watches and constraints shall *not* be included.
+        seed (int): Seed for the objective's tie-breaking perturbation.
+
+    Returns:
+        list[list[str]]: The found minimal bottleneck sets, in the order of their finding.
+    """
+    thermo_constraint_lp = get_lp_from_cobrak_model(
+        cobrak_model,
+        with_enzyme_constraints=with_enzyme_constraints,
+        with_thermodynamic_constraints=True,
+        with_loop_constraints=False,
+        add_thermobottleneck_analysis_vars=True,
+        min_mdf=min_mdf,
+        ignore_nonlinear_terms=ignore_nonlinear_terms,
+    )
+    zb_var_ids = [
+        var_id
+        for var_id in get_model_var_names(thermo_constraint_lp)
+        if var_id.startswith("zb_var_")
+    ]
+    if not zb_var_ids:
+        return []
+
+    perturbations = default_rng(seed).random(len(zb_var_ids)) / (len(zb_var_ids) + 1)
+    thermo_constraint_lp.obj = Objective(
+        expr=sum(
+            (1.0 + perturbation) * getattr(thermo_constraint_lp, zb_var_id)
+            for zb_var_id, perturbation in zip(zb_var_ids, perturbations)
+        ),
+        sense=minimize,
+    )
+    thermo_constraint_lp.bottleneck_cuts = ConstraintList()
+    pyomo_solver = get_solver(solver.name, solver.solver_options, solver.solver_attrs)
+
+    bottleneck_sets: list[list[str]] = []
+    while len(bottleneck_sets) < max_num_sets:
+        try:
+            results = pyomo_solver.solve(
+                thermo_constraint_lp, tee=False, **solver.solve_extra_options
+            )
+            solution_dict = add_statuses_to_optimziation_dict(
+                get_pyomo_solution_as_dict(thermo_constraint_lp), results
+            )
+        except (ApplicationError, AttributeError, RuntimeError, ValueError):
+            break
+        if not solution_dict[ALL_OK_KEY]:
+            break
+
+        new_zb_sets = [
+            [zb_var_id for zb_var_id in zb_var_ids if solution_dict[zb_var_id] > 0.01]
+        ]
+        new_zb_sets.extend(
+            zb_set
+            for zb_set in _get_solution_pool_bottleneck_sets(
+                pyomo_solver, thermo_constraint_lp, zb_var_ids, max_num_sets
+            )
+            if (len(zb_set) == len(new_zb_sets[0])) and (zb_set not in new_zb_sets)
+        )
+        for zb_set in new_zb_sets:
+            if len(bottleneck_sets) >= max_num_sets:
+                break
+            bottleneck_sets.append(
+                [zb_var_id.replace("zb_var_", "") for zb_var_id in zb_set]
+            )
+            if not zb_set:
+                # No bottleneck at all, i.e. no further minimal set exists
+                return bottleneck_sets
+            thermo_constraint_lp.bottleneck_cuts.add(
+                sum(getattr(thermo_constraint_lp, zb_var_id) for zb_var_id in zb_set)
+                <= len(zb_set) - 1
+            )
+
+    return bottleneck_sets
+
+
 @validate_call(validate_return=True)
 def _get_dG0_highbound(cobrak_model: Model, dG0_error_cutoff: float) -> float:
     """Calculate the high bound for dG0 values based on a specified error cutoff.
@@ -1233,6 +1339,136 @@ def _get_km_bounds(cobrak_model: Model, km_error_cutoff: float) -> tuple[float,
     return kms_lowbound, kms_highbound
 
 
+@validate_call
+def _get_optimization_lp(
+    cobrak_model: Model,
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    with_loop_constraints: bool = False,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    ignored_reacs: list[str] = [],
+    min_mdf: float = STANDARD_MIN_MDF,
+    with_flux_sum_var: bool = False,
+    ignore_nonlinear_terms: bool = False,
+    correction_config: CorrectionConfig = CorrectionConfig(),
+    var_data_abs_epsilon: float = 1e-5,
+) -> ConcreteModel:
+    """Construct the (objective-less) pyomo model that is solved in perform_lp_optimization.
+
+    Besides the constraints of get_lp_from_cobrak_model, the ignored reactions are fixed to zero
+    flux and the variability dict is applied as variable bounds. As no objective is set, one can
+    add multiple (de-)activatable objectives to the returned model and solve it repeatedly.
+
+    Args:
+        cobrak_model (Model): The COBRAk model.
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        with_loop_constraints (bool, optional): Whether to include loop closure constraints. Defaults to False.
+        variability_dict (dict[str, tuple[float, float]], optional): Variable bounds. Defaults to {}.
+        ignored_reacs (list[str], optional): Reaction IDs that are set to zero flux. Defaults to [].
+        min_mdf (float, optional): Minimal MDF for thermodynamic constraints. Defaults to STANDARD_MIN_MDF.
+        with_flux_sum_var (bool, optional): Whether to include the flux sum variable. Defaults to False.
+        ignore_nonlinear_terms (bool, optional): Whether non-linear watches/constraints shall be ignored. Defaults to False.
+        correction_config (CorrectionConfig, optional): Parameter correction configuration. Defaults to CorrectionConfig().
+        var_data_abs_epsilon: (float, optional): Under this value, any data given by the variability dict is considered to be 0. Defaults to 1e-5.
+
+    Returns:
+        ConcreteModel: The pyomo model without objective.
+    """
+    optimization_cobrak_model = deepcopy(cobrak_model)
+    if variability_dict != {}:
+        optimization_cobrak_model = delete_unused_reactions_in_variability_dict(
+            cobrak_model,
+            variability_dict,
+        )
+    optimization_model = get_lp_from_cobrak_model(
+        cobrak_model=optimization_cobrak_model,
+        with_enzyme_constraints=with_enzyme_constraints,
+        with_thermodynamic_constraints=with_thermodynamic_constraints,
+        with_loop_constraints=with_loop_constraints,
+        with_flux_sum_var=with_flux_sum_var,
+        min_mdf=min_mdf,
+        ignore_nonlinear_terms=ignore_nonlinear_terms,
+        correction_config=correction_config,
+    )
+
+    for deactivated_reaction in set(ignored_reacs):
+        try:
+            setattr(
+                optimization_model,
+                f"DEACTIVATE_{deactivated_reaction}",
+                Constraint(
+                    expr=getattr(optimization_model, deactivated_reaction) == 0.0
+                ),
+            )
+        except AttributeError:
+            continue
+
+    return apply_variability_dict(
+        optimization_model,
+        cobrak_model,
+        variability_dict,
+        correction_config.error_scenario,
+        abs_epsilon=var_data_abs_epsilon,
+    )
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_solution_pool_bottleneck_sets(
+    pyomo_solver: Any,  # noqa: ANN401
+    model: ConcreteModel,
+    zb_var_ids: list[str],
+    max_num_sets: int,
+) -> list[list[str]]:
+    """Returns the bottleneck sets of a solver's solution pool after a bottleneck MILP solve.
+
+    Solution pools are only reachable through the direct pyomo interfaces of CPLEX
+    ("cplex_direct", using CPLEX's populate) and Gurobi ("gurobi_direct", using
+    Gurobi's PoolSearchMode). For any other solver, an empty list is returned.
+
+    Args:
+        pyomo_solver (Any): The pyomo solver instance which just solved the model.
+        model (ConcreteModel): The solved bottleneck analysis MILP.
+        zb_var_ids (list[str]): The IDs of the bottleneck binary variables.
+        max_num_sets (int): Maximal number of pool solutions.
+
+    Returns:
+        list[list[str]]: For each pool solution, the list of active bottleneck binary variable IDs.
+    """
+    if getattr(pyomo_solver, "name", "") not in ("cplex_direct", "gurobi_direct"):
+        return []
+    solver_model = pyomo_solver._solver_model  # noqa: SLF001
+    var_map = pyomo_solver._pyomo_var_to_solver_var_map  # noqa: SLF001
+    solver_vars = [var_map[getattr(model, zb_var_id)] for zb_var_id in zb_var_ids]
+
+    pool_values: list[list[float]] = []
+    match pyomo_solver.name:
+        case "cplex_direct":
+            solver_model.parameters.mip.pool.capacity.set(max_num_sets)
+            solver_model.parameters.mip.limits.populate.set(max_num_sets)
+            solver_model.populate_solution_pool()
+            pool_values.extend(
+                solver_model.solution.pool.get_values(solution_idx, solver_vars)
+                for solution_idx in range(solver_model.solution.pool.get_num())
+            )
+        case "gurobi_direct":
+            solver_model.setParam("PoolSearchMode", 2)
+            solver_model.setParam("PoolSolutions", max_num_sets)
+            solver_model.optimize()
+            for solution_idx in range(solver_model.SolCount):
+                solver_model.setParam("SolutionNumber", solution_idx)
+                pool_values.append(solver_model.getAttr("Xn", solver_vars))
+
+    return [
+        [
+            zb_var_id
+            for zb_var_id, zb_value in zip(zb_var_ids, solution_values)
+            if zb_value > 0.01
+        ]
+        for solution_values in pool_values
+    ]
+
+
 @validate_call
 def _get_steady_state_lp_from_cobrak_model(
     cobrak_model: Model,
@@ -1688,41 +1924,18 @@ def perform_lp_optimization(
     Returns:
         dict[str, float]: A dictionary containing the flux distribution results for each reaction in the model.
     """
-    optimization_cobrak_model = deepcopy(cobrak_model)
-    if variability_dict != {}:
-        optimization_cobrak_model = delete_unused_reactions_in_variability_dict(
-            cobrak_model,
-            variability_dict,
-        )
-    optimization_model = get_lp_from_cobrak_model(
-        cobrak_model=optimization_cobrak_model,
+    optimization_model = _get_optimization_lp(
+        cobrak_model=cobrak_model,
         with_enzyme_constraints=with_enzyme_constraints,
         with_thermodynamic_constraints=with_thermodynamic_constraints,
         with_loop_constraints=with_loop_constraints,
-        with_flux_sum_var=with_flux_sum_var,
+        variability_dict=variability_dict,
+        ignored_reacs=ignored_reacs,
         min_mdf=min_mdf,
+        with_flux_sum_var=with_flux_sum_var,
         ignore_nonlinear_terms=ignore_nonlinear_terms,
         correction_config=correction_config,
-    )
-
-    for deactivated_reaction in set(ignored_reacs):
-        try:
-            setattr(
-                optimization_model,
-                f"DEACTIVATE_{deactivated_reaction}",
-                Constraint(
-                    expr=getattr(optimization_model, deactivated_reaction) == 0.0
-                ),
-            )
-        except AttributeError:
-            continue
-
-    optimization_model = apply_variability_dict(
-        optimization_model,
-        cobrak_model,
-        variability_dict,
-        correction_config.error_scenario,
-        abs_epsilon=var_data_abs_epsilon,
+        var_data_abs_epsilon=var_data_abs_epsilon,
     )
     optimization_model.obj = get_objective(
         optimization_model, objective_target, objective_sense
@@ -1815,6 +2028,69 @@ def perform_lp_thermodynamic_bottleneck_analysis(
     return bottleneck_reactions
 
 
+@validate_call(validate_return=True)
+def perform_lp_thermodynamic_bottleneck_enumeration(
+    cobrak_model: Model,
+    with_enzyme_constraints: bool = False,
+    min_mdf: float = STANDARD_MIN_MDF,
+    max_num_sets: int = 10,
+    solver: Solver = SCIP,
+    ignore_nonlinear_terms: bool = False,
+    seeds: list[int] = [0],
+    parallel_verbosity_level: int = 0,
+) -> list[list[str]]:
+    """Enumerates alternative minimal sets of thermodynamic bottlenecks in a COBRAk model.
+
+    perform_lp_thermodynamic_bottleneck_analysis returns only one minimal bottleneck set. Here,
+    for each given seed, a worker solves the same bottleneck MILP on one persistent pyomo model
+    again and again, each time with an added integer cut that excludes the last found set and all
+    its supersets. Thereby, all found sets are minimal with respect to inclusion and are found in
+    the order of their size. The seeds perturb the ties between equally large sets so that parallel
+    workers find different sets. With CPLEX ("cplex_direct") or Gurobi ("gurobi_direct") as solver,
+    the solver's solution pool is additionally used to harvest all equally large sets at once.
+
+    Args:
+        cobrak_model (Model): The COBRAk model to analyze for thermodynamic bottlenecks.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints in the analysis.
+        min_mdf (float, optional): Minimum max-min driving force (MDF) to be enforced. Defaults to STANDARD_MIN_MDF.
+        max_num_sets (int, optional): Maximal number of returned bottleneck sets (also per worker). Defaults to 10.
+        solver (Solver, optional): The MILP solver. Defaults to SCIP.
+        ignore_nonlinear_terms (bool, optional): Whether or not non-linear extra watches and constraints shall *not*
+            be included. Defaults to False.
+        seeds (list[int], optional): One parallel worker is run for each seed. Defaults to [0].
+        parallel_verbosity_level (int, optional): Sets the verbosity level for the joblib parallelization. Defaults to 0.
+
+    Returns:
+        list[list[str]]: All distinct found minimal bottleneck sets (each as sorted list of reaction IDs),
+        sorted by their size and reaction IDs.
+    """
+    cobrak_model = deepcopy(cobrak_model)
+    worker_results = Parallel(
+        n_jobs=min(len(seeds), cpu_count()), verbose=parallel_verbosity_level
+    )(
+        delayed(_enumerate_thermodynamic_bottleneck_sets)(
+            cobrak_model,
+            with_enzyme_constraints,
+            min_mdf,
+            max_num_sets,
+            solver,
+            ignore_nonlinear_terms,
+            seed,
+        )
+        for seed in seeds
+    )
+
+    bottleneck_sets: set[tuple[str, ...]] = {
+        tuple(sorted(bottleneck_set))
+        for worker_result in worker_results
+        for bottleneck_set in worker_result
+    }
+    return [
+        list(bottleneck_set)
+        for bottleneck_set in sorted(bottleneck_sets, key=lambda x: (len(x), x))
+    ][:max_num_sets]
+
+
 @validate_call
 def perform_lp_variability_analysis(
     cobrak_model: Model,
@@ -0,0 +1,611 @@
+"""Minimal cut sets (MCS) of COBRA-k models.
+
+An MCS is a minimal set of knockouts (of reactions or of enzymes) which makes a target
+region infeasible, e.g. which blocks any production of a metabolite. MCS are enumerated
+by size with any MILP solver (e.g. HiGHS or SCIP):
+
+* For linear (enzyme-constrained) models, candidates come from the dual (Farkas) MILP of
+  the target region, whose solutions are exactly the knockout sets blocking the target region.
+* With thermodynamic constraints, the target region is a MILP without a dual. Then,
+  candidates come from a hitting set MILP and are tested with the target region itself. Each
+  feasible flux distribution that survives a candidate becomes a new hitting set cut.
+
+In both cases, integer cuts exclude all supersets of found MCS.
+"""
+
+# IMPORT SECTION #
+from joblib import Parallel, delayed
+from pydantic import ConfigDict, validate_call
+from pyomo.common.errors import ApplicationError
+from pyomo.environ import (
+    Binary,
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Objective,
+    Reals,
+    Var,
+    minimize,
+    value,
+)
+from pyomo.repn import generate_standard_repn
+
+from .constants import ALL_OK_KEY, BIG_M, FLUX_SUM_VAR_ID, STANDARD_MIN_MDF
+from .dataclasses import Model, Solver
+from .lps import get_lp_from_cobrak_model
+from .pyomo_functionality import get_objective, get_solver
+from .standard_solvers import SCIP
+from .utilities import (
+    add_statuses_to_optimziation_dict,
+    get_base_id,
+    is_infeasible_optimization_dict,
+)
+
+MCS_FLUX_TOLERANCE = 1e-6
+"""Flux above which a knockout item counts as active in a surviving flux distribution"""
+
+
+# "PRIVATE" FUNCTIONS SECTION #
+@validate_call(validate_return=True)
+def _enumerate_mcs_of_size(
+    cobrak_model: Model,
+    target: dict[str, float],
+    min_target_value: float,
+    with_enzyme_constraints: bool,
+    with_thermodynamic_constraints: bool,
+    min_mdf: float,
+    knockout_items: dict[str, list[str]],
+    mcs_size: int,
+    known_mcs: list[list[str]],
+    check_minimality: bool,
+    method: str,
+    solver: Solver,
+    max_num_mcs: int,
+) -> list[list[str]]:
+    """Enumerates the MCS of one size. Used in (parallelized) MCS enumeration.
+
+    The candidate MILP (dual MILP or hitting set MILP) gets the constraint that exactly mcs_size
+    knockout items are chosen. After each candidate, an integer cut excludes the candidate and
+    all its supersets. If the MCS of all smaller sizes are given as known_mcs, every found cut set
+    is minimal. Otherwise (e.g. in parallel runs), check_minimality has to be True so that each
+    cut set is checked by re-testing it without each of its knockouts.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        target (dict[str, float]): Linear target term which has to reach min_target_value in the target region.
+        min_target_value (float): Minimal value of the target term in the target region.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        with_thermodynamic_constraints (bool): Whether to include thermodynamic constraints.
+        min_mdf (float): Minimal max-min driving force (MDF) if thermodynamic constraints are included.
+        knockout_items (dict[str, list[str]]): Knockout item ID -> IDs of the reactions it knocks out.
+        mcs_size (int): The size of the enumerated MCS.
+        known_mcs (list[list[str]]): Already known (smaller) MCS.
+        check_minimality (bool): Whether or not each found cut set is checked for minimality.
+        method (str): Either "dual" or "hitting_set".
+        solver (Solver): The MILP solver.
+        max_num_mcs (int): Maximal number of returned MCS.
+
+    Returns:
+        list[list[str]]: The found MCS of the given size (each as sorted list of knockout item IDs).
+    """
+    target_model = _get_mcs_target_model(
+        cobrak_model,
+        target,
+        min_target_value,
+        with_enzyme_constraints,
+        with_thermodynamic_constraints,
+        min_mdf,
+    )
+    item_ids = list(knockout_items.keys())
+    if method == "dual":
+        candidate_model = _get_mcs_dual_milp(target_model, knockout_items)
+    else:
+        candidate_model = _get_mcs_hitting_set_milp(len(item_ids))
+    candidate_model.mcs_size_constraint = Constraint(
+        expr=sum(candidate_model.z[item_idx] for item_idx in range(len(item_ids)))
+        == mcs_size
+    )
+    for known_cut_set in known_mcs:
+        candidate_model.mcs_cuts.add(
+            sum(candidate_model.z[item_ids.index(item_id)] for item_id in known_cut_set)
+            <= len(known_cut_set) - 1
+        )
+    pyomo_solver = get_solver(solver.name, solver.solver_options, solver.solver_attrs)
+
+    mcs_list: list[list[str]] = []
+    while len(mcs_list) < max_num_mcs:
+        if not _solve_mcs_model(candidate_model, pyomo_solver, solver)[ALL_OK_KEY]:
+            break
+        candidate_idxs = [
+            item_idx
+            for item_idx in range(len(item_ids))
+            if value(candidate_model.z[item_idx]) > 0.5
+        ]
+        candidate = [item_ids[item_idx] for item_idx in candidate_idxs]
+
+        if method == "hitting_set":
+            surviving_solution = _get_surviving_target_solution(
+                target_model, pyomo_solver, solver, knockout_items, candidate
+            )
+            if surviving_solution is not None:
+                surviving_idxs = [
+                    item_idx
+                    for item_idx, item_id in enumerate(item_ids)
+                    if any(
+                        surviving_solution[reac_id] > MCS_FLUX_TOLERANCE
+                        for reac_id in knockout_items[item_id]
+                    )
+                ]
+                if not surviving_idxs:
+                    # The target region survives without any knockout item
+                    break
+                candidate_model.hitting_set_cuts.add(
+                    sum(candidate_model.z[item_idx] for item_idx in surviving_idxs) >= 1
+                )
+                continue
+
+        candidate_model.mcs_cuts.add(
+            sum(candidate_model.z[item_idx] for item_idx in candidate_idxs)
+            <= mcs_size - 1
+        )
+        if check_minimality and any(
+            _get_surviving_target_solution(
+                target_model,
+                pyomo_solver,
+                solver,
+                knockout_items,
+                [item_id for item_id in candidate if item_id != left_out_item_id],
+            )
+            is None
+            for left_out_item_id in candidate
+        ):
+            continue
+        mcs_list.append(sorted(candidate))
+
+    return mcs_list
+
+
+@validate_call(validate_return=True)
+def _get_knockout_items(
+    cobrak_model: Model,
+    knockout_level: str,
+    knockout_candidates: list[str],
+) -> dict[str, list[str]]:
+    """Returns the knockout items and the reactions which each of them knocks out.
+
+    At the reaction level, a reaction's forward and reverse direction form one knockout item (with
+    the reaction's base ID), as a knockout of a gene or enzyme blocks both directions. At the enzyme level,
+    each enzyme knocks out all reactions (e.g. all _ENZ_ variants of a fullsplit model) which have it
+    in their enzyme_reaction_data's identifiers, i.e. a complex is knocked out by any of its enzymes.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        knockout_level (str): Either "reaction" or "enzyme".
+        knockout_candidates (list[str]): If not empty, only these knockout items (or, at the reaction level, the
+            knockout items of these reaction IDs) can be knocked out.
+
+    Raises:
+        ValueError: Unknown knockout level.
+
+    Returns:
+        dict[str, list[str]]: Knockout item ID -> IDs of the reactions it knocks out.
+    """
+    knockout_items: dict[str, list[str]] = {}
+    match knockout_level:
+        case "reaction":
+            for reac_id in cobrak_model.reactions:
+                base_id = get_base_id(
+                    reac_id, cobrak_model.fwd_suffix, cobrak_model.rev_suffix
+                )
+                if base_id not in knockout_items:
+                    knockout_items[base_id] = []
+                knockout_items[base_id].append(reac_id)
+        case "enzyme":
+            for (
+                enzyme_id,
+                reac_ids,
+            ) in cobrak_model.get_enzyme_reaction_index().items():
+                knockout_items[enzyme_id] = list(reac_ids)
+        case _:
+            print(
+                f"ERROR: Knockout level must be 'reaction' or 'enzyme', but is '{knockout_level}'."
+            )
+            raise ValueError
+
+    if knockout_candidates:
+        knockout_items = {
+            item_id: reac_ids
+            for item_id, reac_ids in knockout_items.items()
+            if (item_id in knockout_candidates)
+            or any(reac_id in knockout_candidates for reac_id in reac_ids)
+        }
+    return knockout_items
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_mcs_dual_milp(
+    target_model: ConcreteModel,
+    knockout_items: dict[str, list[str]],
+) -> ConcreteModel:
+    """Returns the dual (Farkas) MILP of a linear target region.
+
+    The target region's constraints and variable bounds are read as rows A_i x <= b_i (or A_i x = b_i).
+    By Farkas' lemma, the target region without the knocked out columns is infeasible if and only if
+    there is a u (with u_i >= 0 for inequalities) with b^T u <= -1 and (A^T u)_j = 0 for all remaining
+    columns j. A knocked out column's (A^T u)_j may become nonzero, which is modeled with the big M
+    BIG_M and the knockout items' binary variables z.
+
+    Args:
+        target_model (ConcreteModel): The (linear) target region.
+        knockout_items (dict[str, list[str]]): Knockout item ID -> IDs of the reactions it knocks out.
+
+    Raises:
+        ValueError: The target region is not linear.
+
+    Returns:
+        ConcreteModel: The dual MILP with the indexed binary variable z, the objective to minimize the
+        sum of z and the empty ConstraintLists 'mcs_cuts' and 'hitting_set_cuts'.
+    """
+    rows: list[tuple[dict[str, float], float, bool]] = []
+    for constraint in target_model.component_data_objects(Constraint, active=True):
+        repn = generate_standard_repn(constraint.body)
+        if not repn.is_linear():
+            print(
+                f"ERROR: The dual MCS MILP needs a linear target region, but {constraint.name} is nonlinear."
+            )
+            raise ValueError
+        coefficients: dict[str, float] = {}
+        for var, coefficient in zip(repn.linear_vars, repn.linear_coefs):
+            coefficients[var.name] = coefficients.get(var.name, 0.0) + coefficient
+        if constraint.equality:
+            rows.append((coefficients, value(constraint.upper) - repn.constant, True))
+            continue
+        if constraint.has_ub():
+            rows.append((coefficients, value(constraint.upper) - repn.constant, False))
+        if constraint.has_lb():
+            rows.append(
+                (
+                    {var_id: -coeff for var_id, coeff in coefficients.items()},
+                    -(value(constraint.lower) - repn.constant),
+                    False,
+                )
+            )
+    for var in target_model.component_data_objects(Var):
+        if not var.is_continuous():
+            print(
+                f"ERROR: The dual MCS MILP needs a linear target region, but {var.name} is not continuous."
+            )
+            raise ValueError
+        var_lb, var_ub = (var.value, var.value) if var.fixed else (var.lb, var.ub)
+        if var_ub is not None:
+            rows.append(({var.name: 1.0}, var_ub, False))
+        if var_lb is not None:
+            rows.append(({var.name: -1.0}, -var_lb, False))
+
+    column_terms: dict[str, list[tuple[int, float]]] = {}
+    for row_idx, (coefficients, _, _) in enumerate(rows):
+        for var_id, coefficient in coefficients.items():
+            if var_id not in column_terms:
+                column_terms[var_id] = []
+            column_terms[var_id].append((row_idx, coefficient))
+    item_idxs_of_reac: dict[str, list[int]] = {}
+    for item_idx, reac_ids in enumerate(knockout_items.values()):
+        for reac_id in reac_ids:
+            if reac_id not in item_idxs_of_reac:
+                item_idxs_of_reac[reac_id] = []
+            item_idxs_of_reac[reac_id].append(item_idx)
+
+    dual_milp = ConcreteModel()
+    dual_milp.u = Var(
+        range(len(rows)),
+        within=Reals,
+        bounds=lambda _, row_idx: (None, None) if rows[row_idx][2] else (0.0, None),
+    )
+    dual_milp.z = Var(range(len(knockout_items)), within=Binary)
+    dual_milp.column_constraints = ConstraintList()
+    for var_id, terms in column_terms.items():
+        column_expr = sum(
+            coefficient * dual_milp.u[row_idx] for row_idx, coefficient in terms
+        )
+        if var_id not in item_idxs_of_reac:
+            dual_milp.column_constraints.add(column_expr == 0.0)
+            continue
+        knockout_expr = BIG_M * sum(
+            dual_milp.z[item_idx] for item_idx in item_idxs_of_reac[var_id]
+        )
+        dual_milp.column_constraints.add(column_expr <= knockout_expr)
+        dual_milp.column_constraints.add(column_expr >= -knockout_expr)
+    dual_milp.farkas_constraint = Constraint(
+        expr=sum(rhs * dual_milp.u[row_idx] for row_idx, (_, rhs, _) in enumerate(rows))
+        <= -1.0
+    )
+    dual_milp.obj = Objective(
+        expr=sum(dual_milp.z[item_idx] for item_idx in range(len(knockout_items))),
+        sense=minimize,
+    )
+    dual_milp.mcs_cuts = ConstraintList()
+    dual_milp.hitting_set_cuts = ConstraintList()
+    return dual_milp
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_mcs_hitting_set_milp(num_items: int) -> ConcreteModel:
+    """Returns the (initially unconstrained) hitting set MILP for candidate knockout sets.
+
+    Args:
+        num_items (int): The number of knockout items.
+
+    Returns:
+        ConcreteModel: The MILP with the indexed binary variable z, the objective to minimize the
+        sum of z and the empty ConstraintLists 'mcs_cuts' and 'hitting_set_cuts'.
+    """
+    hitting_set_milp = ConcreteModel()
+    hitting_set_milp.z = Var(range(num_items), within=Binary)
+    hitting_set_milp.obj = Objective(
+        expr=sum(hitting_set_milp.z[item_idx] for item_idx in range(num_items)),
+        sense=minimize,
+    )
+    hitting_set_milp.mcs_cuts = ConstraintList()
+    hitting_set_milp.hitting_set_cuts = ConstraintList()
+    return hitting_set_milp
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_mcs_target_model(
+    cobrak_model: Model,
+    target: dict[str, float],
+    min_target_value: float,
+    with_enzyme_constraints: bool,
+    with_thermodynamic_constraints: bool,
+    min_mdf: float,
+) -> ConcreteModel:
+    """Returns the target region, i.e. the model's (MI)LP in which the target term reaches min_target_value.
+
+    Its objective minimizes the flux sum so that surviving flux distributions are sparse.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        target (dict[str, float]): Linear target term.
+        min_target_value (float): Minimal value of the target term.
+        with_enzyme_constraints (bool): Whether to include enzyme constraints.
+        with_thermodynamic_constraints (bool): Whether to include thermodynamic constraints.
+        min_mdf (float): Minimal max-min driving force (MDF) if thermodynamic constraints are included.
+
+    Returns:
+        ConcreteModel: The target region.
+    """
+    target_model = get_lp_from_cobrak_model(
+        cobrak_model,
+        with_enzyme_constraints=with_enzyme_constraints,
+        with_thermodynamic_constraints=with_thermodynamic_constraints,
+        with_loop_constraints=False,
+        with_flux_sum_var=True,
+        min_mdf=min_mdf,
+    )
+    target_model.mcs_target_constraint = Constraint(
+        expr=sum(
+            coefficient * getattr(target_model, var_id)
+            for var_id, coefficient in target.items()
+        )
+        >= min_target_value
+    )
+    target_model.obj = get_objective(target_model, FLUX_SUM_VAR_ID, -1)
+    return target_model
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _get_surviving_target_solution(
+    target_model: ConcreteModel,
+    pyomo_solver: object,
+    solver: Solver,
+    knockout_items: dict[str, list[str]],
+    knocked_out_item_ids: list[str],
+) -> dict[str, float] | None:
+    """Returns a flux distribution of the target region that survives the given knockouts.
+
+    The knocked out reactions are fixed to 0 and are unfixed afterwards, i.e. the target region is reused.
+
+    Args:
+        target_model (ConcreteModel): The target region.
+        pyomo_solver (object): The pyomo solver instance.
+        solver (Solver): The solver (for its extra solve options).
+        knockout_items (dict[str, list[str]]): Knockout item ID -> IDs of the reactions it knocks out.
+        knocked_out_item_ids (list[str]): The knocked out items.
+
+    Raises:
+        ValueError: The target region could not be solved, e.g. due to a solver error or time limit.
+
+    Returns:
+        dict[str, float] | None: The surviving solution or None if the knockouts block (i.e. make infeasible) the target region.
+    """
+    knocked_out_reac_ids = {
+        reac_id
+        for item_id in knocked_out_item_ids
+        for reac_id in knockout_items[item_id]
+    }
+    for reac_id in knocked_out_reac_ids:
+        getattr(target_model, reac_id).fix(0.0)
+    solution_dict = _solve_mcs_model(target_model, pyomo_solver, solver)
+    for reac_id in knocked_out_reac_ids:
+        getattr(target_model, reac_id).unfix()
+    if solution_dict[ALL_OK_KEY]:
+        return solution_dict
+    if not is_infeasible_optimization_dict(solution_dict):
+        print(
+            f"ERROR: The target region with the knockouts {knocked_out_item_ids} could not be solved (no proven infeasibility)."
+        )
+        raise ValueError
+    return None
+
+
+@validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
+def _solve_mcs_model(
+    pyomo_model: ConcreteModel,
+    pyomo_solver: object,
+    solver: Solver,
+) -> dict[str, float]:
+    """Solves a (candidate or target region) MCS model and returns its solution with statuses.
+
+    Args:
+        pyomo_model (ConcreteModel): The model.
+        pyomo_solver (object): The pyomo solver instance.
+        solver (Solver): The solver (for its extra solve options).
+
+    Returns:
+        dict[str, float]: The solution dict, whose ALL_OK_KEY value is False if the model is infeasible
+        or could not be solved (see is_infeasible_optimization_dict to distinguish both cases).
+    """
+    try:
+        # The solution is loaded only if there is one, as some solver interfaces raise an error
+        # for infeasible models otherwise, which would hide the termination condition
+        results = pyomo_solver.solve(
+            pyomo_model,
+            tee=False,
+            **{**solver.solve_extra_options, "load_solutions": False},
+        )
+        statuses = add_statuses_to_optimziation_dict({}, results)
+        if not statuses[ALL_OK_KEY]:
+            return statuses
+        pyomo_model.solutions.load_from(results)
+        return {
+            **{var.name: var.value for var in pyomo_model.component_data_objects(Var)},
+            **statuses,
+        }
+    except (ApplicationError, AttributeError, RuntimeError, ValueError):
+        return {ALL_OK_KEY: False}
+
+
+# "PUBLIC" FUNCTIONS SECTION #
+@validate_call
+def calculate_minimal_cut_sets(
+    cobrak_model: Model,
+    target: str | dict[str, float],
+    min_target_value: float = 1e-3,
+    max_mcs_size: int = 3,
+    max_num_mcs: int = 1_000,
+    knockout_level: str = "reaction",
+    knockout_candidates: list[str] = [],
+    with_enzyme_constraints: bool = False,
+    with_thermodynamic_constraints: bool = False,
+    min_mdf: float = STANDARD_MIN_MDF,
+    method: str = "auto",
+    solver: Solver = SCIP,
+    num_workers: int = 1,
+) -> list[list[str]]:
+    """Calculates the minimal cut sets (MCS) which block a target region of a COBRA-k model.
+
+    The target region consists of all flux distributions (under the chosen enzyme and/or thermodynamic
+    constraints) in which the target term reaches at least min_target_value. An MCS is a minimal set of
+    knockouts after which no such flux distribution exists anymore.
+
+    With num_workers=1, the MCS are enumerated by increasing size, where all MCS of smaller sizes exclude
+    their supersets. Otherwise, the sizes are enumerated in parallel and each found cut set is checked for
+    minimality.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model.
+        target (str | dict[str, float]): The target variable ID or a linear term of variable IDs.
+        min_target_value (float, optional): Minimal value of the target term in the target region. Defaults to 1e-3.
+        max_mcs_size (int, optional): Maximal size of the MCS. Defaults to 3.
+        max_num_mcs (int, optional): Maximal number of returned MCS. Defaults to 1_000.
+        knockout_level (str, optional): Either "reaction" (reaction knockouts, where both directions of a reaction with
+            forward and reverse suffix are knocked out together under the reaction's base ID) or "enzyme" (enzyme knockouts
+            which knock out all reactions with the enzyme, e.g. all _ENZ_ variants of a fullsplit model).
+            Defaults to "reaction".
+        knockout_candidates (list[str], optional): If not empty, only these reaction or enzyme IDs can be knocked out.
+            Defaults to [].
+        with_enzyme_constraints (bool, optional): Whether to include enzyme constraints. Defaults to False.
+        with_thermodynamic_constraints (bool, optional): Whether to include thermodynamic constraints. Defaults to False.
+        min_mdf (float, optional): Minimal max-min driving force (MDF). Defaults to STANDARD_MIN_MDF.
+        method (str, optional): "dual" (only without thermodynamic constraints), "hitting_set" or "auto" (i.e.,
+            "dual" if possible). Defaults to "auto".
+        solver (Solver, optional): The MILP solver. Defaults to SCIP.
+        num_workers (int, optional): Number of parallel workers. Defaults to 1.
+
+    Raises:
+        ValueError: Unknown or impossible method, or the target region is already infeasible without knockouts.
+
+    Returns:
+        list[list[str]]: The MCS (each as sorted list of knockout item IDs), sorted by their size and IDs.
+    """
+    if isinstance(target, str):
+        target = {target: 1.0}
+    if method == "auto":
+        method = "hitting_set" if with_thermodynamic_constraints else "dual"
+    if method not in ("dual", "hitting_set"):
+        print(
+            f"ERROR: MCS method must be 'auto', 'dual' or 'hitting_set', but is '{method}'."
+        )
+        raise ValueError
+    if (method == "dual") and with_thermodynamic_constraints:
+        print(
+            "ERROR: The dual MCS method cannot be used with thermodynamic constraints (use 'hitting_set')."
+        )
+        raise ValueError
+
+    knockout_items = _get_knockout_items(
+        cobrak_model, knockout_level, knockout_candidates
+    )
+    target_model = _get_mcs_target_model(
+        cobrak_model,
+        target,
+        min_target_value,
+        with_enzyme_constraints,
+        with_thermodynamic_constraints,
+        min_mdf,
+    )
+    if (
+        _get_surviving_target_solution(
+            target_model,
+            get_solver(solver.name, solver.solver_options, solver.solver_attrs),
+            solver,
+            knockout_items,
+            [],
+        )
+        is None
+    ):
+        print("ERROR: The target region is infeasible even without any knockout.")
+        raise ValueError
+
+    mcs_args = (
+        cobrak_model,
+        target,
+        min_target_value,
+        with_enzyme_constraints,
+        with_thermodynamic_constraints,
+        min_mdf,
+        knockout_items,
+    )
+    all_mcs: list[list[str]] = []
+    if num_workers == 1:
+        for mcs_size in range(1, max_mcs_size + 1):
+            all_mcs.extend(
+                _enumerate_mcs_of_size(
+                    *mcs_args,
+                    mcs_size,
+                    all_mcs,
+                    False,
+                    method,
+                    solver,
+                    max_num_mcs - len(all_mcs),
+                )
+            )
+            if len(all_mcs) >= max_num_mcs:
+                break
+    else:
+        sized_mcs_lists = Parallel(n_jobs=min(num_workers, max_mcs_size))(
+            delayed(_enumerate_mcs_of_size)(
+                *mcs_args,
+                mcs_size,
+                [],
+                True,
+                method,
+                solver,
+                max_num_mcs,
+            )
+            for mcs_size in range(1, max_mcs_size + 1)
+        )
+        for sized_mcs_list in sized_mcs_lists:
+            all_mcs.extend(sized_mcs_list)
+
+    return sorted(all_mcs, key=lambda mcs: (len(mcs), mcs))[:max_num_mcs]
@@ -0,0 +1,628 @@
+"""Binary metaheuristics which can be used instead of COBRA-k's genetic algorithm in its evolutionary optimization.
+
+All optimizers work on the same bit vectors (one bit per coupled reaction group) and the same fitness function
+as COBRAKGENETIC, i.e. a function which returns a list of (fitness, active bit vector) tuples for a given bit vector,
+where lower fitness values are better and a fitness of 1_000_000 marks an infeasible bit vector.
+
+An optimizer is a class with COBRAKGENETIC's constructor arguments fitness_function, xs_dim, gen, extra_xs, seed,
+objvalue_json_path, max_rounds_same_objvalue, pop_size and time_budget, a run() method that returns the best fitness
+and bit vector, and a cut_short attribute. The built-in optimizers are registered in BINARY_OPTIMIZERS, whose keys
+are the algorithm names accepted by COBRA-k's evolutionary optimization. Own optimizers can be used by passing their
+class as algorithm or by adding them to BINARY_OPTIMIZERS.
+"""
+
+import operator
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from math import exp, sqrt
+from os import cpu_count
+from random import Random
+from time import time
+from typing import Any
+
+from .genetic import COBRAKGENETIC
+from .io import jsonl_append, jsonl_stream
+from .utilities import last_n_elements_equal, parallel_map_until_deadline
+
+INFEASIBLE_FITNESS = 1_000_000.0
+
+
+class BinaryOptimizer(ABC):
+    """Base class of local search optimizers over bit vectors.
+
+    Each generation, the optimizer proposes up to pop_size new bit vectors, which are evaluated in parallel.
+    Bit vectors whose fitness is already known are not evaluated again. Subclasses implement _initialize
+    (called with the fitnesses of the initial bit vectors) and _step (which performs one generation).
+
+    Attributes:
+        fitness_function (Callable): The fitness function (see the module's docstring).
+        xs_dim (int): The dimensionality of the search space.
+        gen (int): The maximal number of generations.
+        rng (Random): The random number generator from which all random decisions are drawn.
+        pop_size (int): Maximal number of fitness evaluations per generation.
+        objvalue_json_path (str): The path to a JSON Lines file to which the objective values are appended.
+        max_rounds_same_objvalue (float): The maximum number of generations with the same best fitness before the
+            run stops.
+        time_budget (float): Maximal wall-clock seconds of a run() call.
+        tested_xs (dict[tuple[int, ...], float]): Fitness of each active bit vector returned by the fitness function.
+        evaluated_xs (dict[tuple[int, ...], float]): Best fitness of each bit vector that was passed to the fitness function.
+        num_evaluations (int): Number of (finished) fitness evaluations of the run.
+        generation (int): Number of finished generations.
+        cut_short (bool): Whether or not the last run() call was stopped because its time budget was used up.
+    """
+
+    def __init__(
+        self,
+        fitness_function: Callable[
+            [list[float | int]], list[tuple[float, list[float | int]]]
+        ],
+        xs_dim: int,
+        gen: int,
+        extra_xs: list[list[int]] = [],
+        seed: int | None = None,
+        objvalue_json_path: str = "",
+        max_rounds_same_objvalue: float = float("inf"),
+        pop_size: int | None = None,
+        time_budget: float = float("inf"),
+    ) -> None:
+        """Initializes the optimizer.
+
+        Args:
+            fitness_function (Callable): The fitness function to evaluate bit vectors.
+            xs_dim (int): The dimensionality of the search space.
+            gen (int): The maximal number of generations.
+            extra_xs (list[list[int]], optional): Bit vectors (e.g. known feasible solutions) that are evaluated
+                together with the random initial bit vectors. Defaults to [].
+            seed (int | None, optional): Seed for the random number generator. Defaults to None.
+            objvalue_json_path (str, optional): Path to a JSON Lines file with one line per generation, in the
+                same format as COBRAKGENETIC's log. Defaults to "".
+            max_rounds_same_objvalue (float, optional): Maximal number of generations with the same best fitness
+                before the run stops. Defaults to float("inf").
+            pop_size (int | None, optional): Maximal number of fitness evaluations per generation. Defaults to None,
+                i.e. the number of CPUs.
+            time_budget (float, optional): Maximal wall-clock seconds of a run() call. Once it is used up, no further
+                fitness evaluations are started and the best bit vector found so far is returned (with cut_short set
+                to True). Defaults to float("inf").
+        """
+        self.fitness_function = fitness_function
+        self.xs_dim = xs_dim
+        self.gen = gen
+        self.rng = Random(seed)
+        pop_size_value = cpu_count() if pop_size is None else pop_size
+        self.pop_size = 1 if pop_size_value is None else max(1, pop_size_value)
+        self.init_xs = [
+            [self.rng.randint(0, 1) for _ in range(xs_dim)]
+            for _ in range(self.pop_size - len(extra_xs))
+        ]
+        self.init_xs.extend([list(extra_x) for extra_x in extra_xs])
+        self.objvalue_json_path = objvalue_json_path
+        self.max_rounds_same_objvalue = max_rounds_same_objvalue
+        self.time_budget = time_budget
+
+        self.tested_xs: dict[tuple[int, ...], float] = {}
+        self.evaluated_xs: dict[tuple[int, ...], float] = {}
+        self.num_evaluations = 0
+        self.generation = 0
+        self.cut_short = False
+        self._new_fitnesses: list[float] = []
+
+    def _evaluate(self, xs: list[list[int]], deadline: float) -> list[float | None]:
+        """Returns the fitness of each bit vector, evaluating only the ones with a yet unknown fitness.
+
+        Args:
+            xs (list[list[int]]): The bit vectors.
+            deadline (float): time() timestamp after which no further evaluations are started.
+
+        Returns:
+            list[float | None]: The (best) fitness of each bit vector, or None if its evaluation did not finish
+            before the deadline.
+        """
+        new_xs: list[tuple[int, ...]] = []
+        for x in xs:
+            if (tuple(x) not in self.evaluated_xs) and (tuple(x) not in new_xs):
+                new_xs.append(tuple(x))
+
+        results, cut_short = parallel_map_until_deadline(
+            self.fitness_function,
+            [(list(new_x),) for new_x in new_xs],
+            deadline,
+        )
+        self.cut_short = self.cut_short or cut_short
+        for new_x, fitnesses_and_active_xs in zip(new_xs, results):
+            if fitnesses_and_active_xs is None:
+                continue
+            self.num_evaluations += 1
+            for fitness, active_x in fitnesses_and_active_xs:
+                if (active_x is None) or (len(active_x) == 0):
+                    continue
+                self.tested_xs[tuple(active_x)] = fitness
+                self._new_fitnesses.append(fitness)
+            self.evaluated_xs[new_x] = min(
+                fitness for (fitness, _) in fitnesses_and_active_xs
+            )
+
+        return [self.evaluated_xs.get(tuple(x)) for x in xs]
+
+    def _get_best_fitness(self) -> float:
+        """Returns the best fitness found so far.
+
+        Returns:
+            float: The best fitness found so far.
+        """
+        return min(self.tested_xs.values())
+
+    def _get_energy_scale(self) -> float:
+        """Returns the absolute value of the best feasible fitness found so far (or 1.0 without a feasible one).
+
+        Fitness differences are divided by this scale so that temperatures and acceptance criteria do not depend
+        on the objective's unit.
+
+        Returns:
+            float: The energy scale.
+        """
+        best_fitness = self._get_best_fitness()
+        if best_fitness >= INFEASIBLE_FITNESS:
+            return 1.0
+        return max(abs(best_fitness), 1e-9)
+
+    def _get_neighbour(self, x: list[int], num_flips: int) -> list[int]:
+        """Returns a copy of the bit vector with num_flips random bits flipped, preferring not yet evaluated ones.
+
+        Args:
+            x (list[int]): The bit vector.
+            num_flips (int): The number of flipped bits.
+
+        Returns:
+            list[int]: The neighbouring bit vector.
+        """
+        neighbour = list(x)
+        for _ in range(100):
+            neighbour = list(x)
+            for flip_idx in self.rng.sample(
+                range(self.xs_dim), min(num_flips, self.xs_dim)
+            ):
+                neighbour[flip_idx] = 1 - neighbour[flip_idx]
+            if tuple(neighbour) not in self.evaluated_xs:
+                break
+        return neighbour
+
+    def _log_objvalues(self, elapsed_time: float, finished: bool = False) -> None:
+        """Appends a line (in COBRAKGENETIC's format) to the objective value log at objvalue_json_path.
+
+        Args:
+            elapsed_time (float): Seconds since the start of the run.
+            finished (bool, optional): Whether or not this is the run's final line. Defaults to False.
+        """
+        entry: dict[str, Any] = {
+            "time": elapsed_time,
+            "generation": self.generation,
+            "best": self._get_best_fitness(),
+            "evaluations": self.num_evaluations,
+            "objvalues": sorted(self._new_fitnesses),
+        }
+        if finished:
+            entry["finished"] = True
+        jsonl_append(self.objvalue_json_path, entry)
+        self._new_fitnesses = []
+
+    @abstractmethod
+    def _initialize(self, init_fitnesses: list[float | None]) -> None:
+        """Sets the optimizer's start state.
+
+        Args:
+            init_fitnesses (list[float | None]): The fitness of each of init_xs (None if not evaluated in time).
+        """
+
+    @abstractmethod
+    def _step(self, deadline: float) -> None:
+        """Performs one generation.
+
+        Args:
+            deadline (float): time() timestamp after which no further evaluations are started.
+        """
+
+    def run(self) -> tuple[float, tuple[int, ...]]:
+        """Runs the optimization.
+
+        Returns:
+            tuple[float, tuple[int, ...]]: A tuple containing the best fitness score and the corresponding bit vector.
+        """
+        start_time = time()
+        deadline = start_time + self.time_budget
+        self.cut_short = False
+        self.generation = 0
+        self.tested_xs = {(): INFEASIBLE_FITNESS}
+        self._new_fitnesses = []
+
+        init_fitnesses = self._evaluate(self.init_xs, deadline)
+        if self.objvalue_json_path:
+            if os.path.isfile(self.objvalue_json_path):
+                os.remove(self.objvalue_json_path)
+            self._log_objvalues(0.0)
+        self._initialize(init_fitnesses)
+
+        best_fitnesses: list[float] = []
+        while (self.generation < self.gen) and not self.cut_short:
+            if time() >= deadline:
+                self.cut_short = True
+                break
+            best_fitnesses.append(self._get_best_fitness())
+            if last_n_elements_equal(best_fitnesses, self.max_rounds_same_objvalue):
+                break
+
+            self._step(deadline)
+
+            self.generation += 1
+            if self.objvalue_json_path:
+                self._log_objvalues(time() - start_time)
+
+        if self.objvalue_json_path:
+            self._log_objvalues(time() - start_time, finished=True)
+        if self.cut_short:
+            print(
+                f"INFO: Time budget of {self.time_budget} s used up, returning the best result found so far."
+            )
+
+        return min(
+            [(fitness, x) for (x, fitness) in self.tested_xs.items()],
+            key=operator.itemgetter(0),
+        )
+
+
+class COBRAKANNEALING(BinaryOptimizer):
+    """Parallel tempering simulated annealing over bit vectors.
+
+    pop_size replicas perform a simulated annealing walk at fixed, geometrically spaced temperatures. Each
+    generation, every replica proposes a neighbour (hotter replicas flip more bits), all proposals are evaluated
+    in parallel and accepted with the Metropolis criterion. Afterwards, neighbouring replicas exchange their states
+    with the parallel tempering criterion, so that good states move to the cold replicas while the hot ones keep
+    exploring. Temperatures are relative to the absolute value of the best feasible fitness found so far.
+    Infeasible proposals are never accepted by a replica with a feasible state.
+
+    Attributes:
+        temperatures (list[float]): The replicas' temperatures, from coldest to hottest.
+        max_num_flips (int): Number of flipped bits of the hottest replica's proposals (the coldest one flips one bit).
+        replica_xs (list[list[int]]): The replicas' current bit vectors.
+        replica_fitnesses (list[float]): The replicas' current fitnesses.
+        num_exchanges (int): Number of accepted replica exchanges.
+    """
+
+    def __init__(
+        self,
+        fitness_function: Callable[
+            [list[float | int]], list[tuple[float, list[float | int]]]
+        ],
+        xs_dim: int,
+        gen: int,
+        extra_xs: list[list[int]] = [],
+        seed: int | None = None,
+        objvalue_json_path: str = "",
+        max_rounds_same_objvalue: float = float("inf"),
+        pop_size: int | None = None,
+        time_budget: float = float("inf"),
+        min_temperature: float = 0.001,
+        max_temperature: float = 0.2,
+        max_num_flips: int = 2,
+    ) -> None:
+        """Initializes the COBRAKANNEALING object.
+
+        Args:
+            fitness_function (Callable): The fitness function to evaluate bit vectors.
+            xs_dim (int): The dimensionality of the search space.
+            gen (int): The maximal number of generations.
+            extra_xs (list[list[int]], optional): Extra initial bit vectors. Defaults to [].
+            seed (int | None, optional): Seed for the random number generator. Defaults to None.
+            objvalue_json_path (str, optional): Path to the JSON Lines objective value log. Defaults to "".
+            max_rounds_same_objvalue (float, optional): Maximal number of generations with the same best fitness.
+                Defaults to float("inf").
+            pop_size (int | None, optional): Number of replicas. Defaults to None, i.e. the number of CPUs.
+            time_budget (float, optional): Maximal wall-clock seconds of a run() call. Defaults to float("inf").
+            min_temperature (float, optional): Relative temperature of the coldest replica. Defaults to 0.001.
+            max_temperature (float, optional): Relative temperature of the hottest replica. Defaults to 0.2.
+            max_num_flips (int, optional): Number of flipped bits of the hottest replica's proposals. Defaults to 2.
+        """
+        super().__init__(
+            fitness_function=fitness_function,
+            xs_dim=xs_dim,
+            gen=gen,
+            extra_xs=extra_xs,
+            seed=seed,
+            objvalue_json_path=objvalue_json_path,
+            max_rounds_same_objvalue=max_rounds_same_objvalue,
+            pop_size=pop_size,
+            time_budget=time_budget,
+        )
+        if not (0.0 < min_temperature <= max_temperature):
+            print(
+                "ERROR: The temperatures must fulfill 0 < min_temperature <= max_temperature."
+            )
+            raise ValueError
+        if self.pop_size == 1:
+            self.temperatures = [min_temperature]
+        else:
+            self.temperatures = [
+                min_temperature
+                * (max_temperature / min_temperature) ** (idx / (self.pop_size - 1))
+                for idx in range(self.pop_size)
+            ]
+        self.max_num_flips = max(1, max_num_flips)
+        self.replica_xs: list[list[int]] = []
+        self.replica_fitnesses: list[float] = []
+        self.num_exchanges = 0
+
+    def _initialize(self, init_fitnesses: list[float | None]) -> None:
+        """Assigns the best initial bit vectors to the coldest replicas.
+
+        Args:
+            init_fitnesses (list[float | None]): The fitness of each of init_xs (None if not evaluated in time).
+        """
+        sorted_inits = sorted(
+            [
+                (INFEASIBLE_FITNESS if fitness is None else fitness, init_x)
+                for fitness, init_x in zip(init_fitnesses, self.init_xs)
+            ],
+            key=operator.itemgetter(0),
+        )
+        self.replica_xs = [
+            list(sorted_inits[idx % len(sorted_inits)][1])
+            for idx in range(self.pop_size)
+        ]
+        self.replica_fitnesses = [
+            sorted_inits[idx % len(sorted_inits)][0] for idx in range(self.pop_size)
+        ]
+
+    def _is_accepted(
+        self, current_fitness: float, new_fitness: float, temperature: float
+    ) -> bool:
+        """Returns whether or not a replica at the given temperature accepts the new fitness (Metropolis criterion).
+
+        Args:
+            current_fitness (float): The replica's current fitness.
+            new_fitness (float): The proposal's fitness.
+            temperature (float): The replica's relative temperature.
+
+        Returns:
+            bool: Whether or not the proposal is accepted.
+        """
+        if (new_fitness >= INFEASIBLE_FITNESS) and (
+            current_fitness < INFEASIBLE_FITNESS
+        ):
+            return False
+        delta = (new_fitness - current_fitness) / self._get_energy_scale()
+        if delta <= 0.0:
+            return True
+        return self.rng.random() < exp(-delta / temperature)
+
+    def _step(self, deadline: float) -> None:
+        """Performs one generation of Metropolis moves followed by replica exchanges.
+
+        Args:
+            deadline (float): time() timestamp after which no further evaluations are started.
+        """
+        proposals = [
+            self._get_neighbour(
+                replica_x,
+                1
+                + round(
+                    (self.max_num_flips - 1) * replica_idx / max(1, self.pop_size - 1)
+                ),
+            )
+            for replica_idx, replica_x in enumerate(self.replica_xs)
+        ]
+        proposal_fitnesses = self._evaluate(proposals, deadline)
+        for replica_idx, (proposal, proposal_fitness) in enumerate(
+            zip(proposals, proposal_fitnesses)
+        ):
+            if proposal_fitness is None:
+                continue
+            if self._is_accepted(
+                self.replica_fitnesses[replica_idx],
+                proposal_fitness,
+                self.temperatures[replica_idx],
+            ):
+                self.replica_xs[replica_idx] = proposal
+                self.replica_fitnesses[replica_idx] = proposal_fitness
+
+        # Exchanges between neighbouring temperatures (alternating between even and odd pairs)
+        energy_scale = self._get_energy_scale()
+        for replica_idx in range(self.generation % 2, self.pop_size - 1, 2):
+            log_acceptance = (
+                (
+                    1 / self.temperatures[replica_idx]
+                    - 1 / self.temperatures[replica_idx + 1]
+                )
+                * (
+                    self.replica_fitnesses[replica_idx]
+                    - self.replica_fitnesses[replica_idx + 1]
+                )
+                / energy_scale
+            )
+            if (log_acceptance >= 0.0) or (self.rng.random() < exp(log_acceptance)):
+                self.replica_xs[replica_idx], self.replica_xs[replica_idx + 1] = (
+                    self.replica_xs[replica_idx + 1],
+                    self.replica_xs[replica_idx],
+                )
+                (
+                    self.replica_fitnesses[replica_idx],
+                    self.replica_fitnesses[replica_idx + 1],
+                ) = (
+                    self.replica_fitnesses[replica_idx + 1],
+                    self.replica_fitnesses[replica_idx],
+                )
+                self.num_exchanges += 1
+
+
+class COBRAKTABU(BinaryOptimizer):
+    """Tabu search with an aspiration criterion over bit vectors.
+
+    Each generation, up to pop_size not yet evaluated single-bit flips of the current bit vector (plus all
+    flips with an already known fitness) are evaluated in parallel. The search moves to the best of them if it
+    improves the current fitness or, once the fitness of all flips is known, even if it is worse. Flipping a bit makes it tabu for tabu_tenure generations, unless
+    the flip leads to a better fitness than the best one found so far (aspiration criterion). Moves to infeasible
+    bit vectors are only made from infeasible ones. If no move is admissible, the search restarts from the best
+    bit vector found so far.
+
+    Attributes:
+        tabu_tenure (int): Number of generations for which a flipped bit stays tabu.
+        current_x (list[int]): The current bit vector.
+        current_fitness (float): The current fitness.
+        tabu_until (dict[int, int]): For each tabu bit, the generation until which it is tabu.
+    """
+
+    def __init__(
+        self,
+        fitness_function: Callable[
+            [list[float | int]], list[tuple[float, list[float | int]]]
+        ],
+        xs_dim: int,
+        gen: int,
+        extra_xs: list[list[int]] = [],
+        seed: int | None = None,
+        objvalue_json_path: str = "",
+        max_rounds_same_objvalue: float = float("inf"),
+        pop_size: int | None = None,
+        time_budget: float = float("inf"),
+        tabu_tenure: int | None = None,
+    ) -> None:
+        """Initializes the COBRAKTABU object.
+
+        Args:
+            fitness_function (Callable): The fitness function to evaluate bit vectors.
+            xs_dim (int): The dimensionality of the search space.
+            gen (int): The maximal number of generations.
+            extra_xs (list[list[int]], optional): Extra initial bit vectors. Defaults to [].
+            seed (int | None, optional): Seed for the random number generator. Defaults to None.
+            objvalue_json_path (str, optional): Path to the JSON Lines objective value log. Defaults to "".
+            max_rounds_same_objvalue (float, optional): Maximal number of generations with the same best fitness.
+                Defaults to float("inf").
+            pop_size (int | None, optional): Maximal number of fitness evaluations per generation. Defaults to None,
+                i.e. the number of CPUs.
+            time_budget (float, optional): Maximal wall-clock seconds of a run() call. Defaults to float("inf").
+            tabu_tenure (int | None, optional): Number of generations for which a flipped bit stays tabu. Defaults
+                to None, i.e. the rounded square root of xs_dim.
+        """
+        super().__init__(
+            fitness_function=fitness_function,
+            xs_dim=xs_dim,
+            gen=gen,
+            extra_xs=extra_xs,
+            seed=seed,
+            objvalue_json_path=objvalue_json_path,
+            max_rounds_same_objvalue=max_rounds_same_objvalue,
+            pop_size=pop_size,
+            time_budget=time_budget,
+        )
+        self.tabu_tenure = (
+            max(1, round(sqrt(xs_dim))) if tabu_tenure is None else tabu_tenure
+        )
+        self.current_x: list[int] = []
+        self.current_fitness = INFEASIBLE_FITNESS
+        self.tabu_until: dict[int, int] = {}
+
+    def _initialize(self, init_fitnesses: list[float | None]) -> None:
+        """Starts the search at the best initial bit vector.
+
+        Args:
+            init_fitnesses (list[float | None]): The fitness of each of init_xs (None if not evaluated in time).
+        """
+        self.current_fitness, self.current_x = min(
+            [
+                (INFEASIBLE_FITNESS if fitness is None else fitness, list(init_x))
+                for fitness, init_x in zip(init_fitnesses, self.init_xs)
+            ],
+            key=operator.itemgetter(0),
+        )
+        self.tabu_until = {}
+
+    def _step(self, deadline: float) -> None:
+        """Evaluates single-bit flips of the current bit vector and performs the best admissible move.
+
+        Args:
+            deadline (float): time() timestamp after which no further evaluations are started.
+        """
+        best_fitness_before = self._get_best_fitness()
+        flip_idxs = list(range(self.xs_dim))
+        self.rng.shuffle(flip_idxs)
+        neighbours: dict[int, list[int]] = {}
+        for flip_idx in flip_idxs:
+            neighbour = list(self.current_x)
+            neighbour[flip_idx] = 1 - neighbour[flip_idx]
+            neighbours[flip_idx] = neighbour
+        new_flip_idxs = [
+            flip_idx
+            for flip_idx in flip_idxs
+            if tuple(neighbours[flip_idx]) not in self.evaluated_xs
+        ][: self.pop_size]
+        known_flip_idxs = [
+            flip_idx
+            for flip_idx in flip_idxs
+            if tuple(neighbours[flip_idx]) in self.evaluated_xs
+        ]
+        move_idxs = new_flip_idxs + known_flip_idxs
+        move_fitnesses = self._evaluate(
+            [neighbours[move_idx] for move_idx in move_idxs], deadline
+        )
+
+        best_move: tuple[float, int] | None = None
+        for move_idx, move_fitness in zip(move_idxs, move_fitnesses):
+            if move_fitness is None:
+                continue
+            if (move_fitness >= INFEASIBLE_FITNESS) and (
+                self.current_fitness < INFEASIBLE_FITNESS
+            ):
+                continue
+            is_tabu = self.tabu_until.get(move_idx, -1) >= self.generation
+            if is_tabu and not (move_fitness < best_fitness_before):
+                continue
+            if (best_move is None) or (move_fitness < best_move[0]):
+                best_move = (move_fitness, move_idx)
+
+        # Non-improving moves are only made once all neighbours are known (the others are evaluated next generation)
+        is_improving = (best_move is not None) and (best_move[0] < self.current_fitness)
+        if (not is_improving) and any(
+            tuple(neighbour) not in self.evaluated_xs
+            for neighbour in neighbours.values()
+        ):
+            return
+
+        if best_move is None:
+            best_fitness, best_x = min(
+                [(fitness, x) for (x, fitness) in self.tested_xs.items() if len(x)]
+                or [(INFEASIBLE_FITNESS, tuple(self.current_x))],
+                key=operator.itemgetter(0),
+            )
+            self.current_x, self.current_fitness = list(best_x), best_fitness
+            self.tabu_until = {}
+            return
+
+        self.current_fitness, move_idx = best_move
+        self.current_x = neighbours[move_idx]
+        self.tabu_until[move_idx] = self.generation + self.tabu_tenure
+
+
+BINARY_OPTIMIZERS: dict[str, type] = {
+    "genetic": COBRAKGENETIC,
+    "annealing": COBRAKANNEALING,
+    "tabu": COBRAKTABU,
+}
+
+
+def get_evaluations_to_target(
+    objvalue_json_path: str, target_fitness: float, rel_tolerance: float = 1e-6
+) -> float:
+    """Returns the number of fitness evaluations after which a run's objective value log first reached the target.
+
+    Args:
+        objvalue_json_path (str): Path to the JSON Lines objective value log of a run of any of the BINARY_OPTIMIZERS.
+        target_fitness (float): The target fitness (lower is better).
+        rel_tolerance (float, optional): Relative tolerance with which the target counts as reached. Defaults to 1e-6.
+
+    Returns:
+        float: The number of fitness evaluations until the target was reached, or float("inf") if it was never reached.
+    """
+    threshold = target_fitness + rel_tolerance * abs(target_fitness)
+    for entry in jsonl_stream(objvalue_json_path):
+        if entry["best"] <= threshold:
+            return float(entry["evaluations"])
+    return float("inf")
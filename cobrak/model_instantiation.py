@@ -452,7 +452,7 @@ def get_cobrak_model_with_kinetic_data_from_sbml_model_alone(
             bigg_metabolites_json_path=f"{path_to_external_resources}bigg_models_metabolites.json",
             brenda_version=brenda_version,
             base_species=base_species,
-            ncbi_parsed_json_path=f"{path_to_external_resources}parsed_taxdmp.json",
+            ncbi_parsed_json_path=f"{path_to_external_resources}parsed_taxdmp",
             kinetic_ignored_metabolites=kinetic_ignored_metabolites,
             kinetic_ignored_enzyme_ids=kinetic_ignored_enzymes,
             custom_enzyme_kinetic_data=custom_kms_and_kcats,
@@ -462,7 +462,7 @@ def get_cobrak_model_with_kinetic_data_from_sbml_model_alone(
             cobra_model=fullsplit_model,
             sabio_target_folder=folder_of_sabio_database,
             base_species=base_species,
-            ncbi_parsed_json_path=f"{path_to_external_resources}parsed_taxdmp.json",
+            ncbi_parsed_json_path=f"{path_to_external_resources}parsed_taxdmp",
             bigg_metabolites_json_path=f"{path_to_external_resources}bigg_models_metabolites.json",
             kinetic_ignored_metabolites=kinetic_ignored_metabolites,
             kinetic_ignored_enzyme_ids=kinetic_ignored_enzymes,
@@ -530,6 +530,9 @@ def get_cobrak_model_with_kinetic_data_from_sbml_model_alone(
             dG0_exclusion_prefixes,
             dG0_exclusion_inner_parts,
             ignore_dG0_uncertainty,
+            compound_cache_json_path=f"{data_cache_folder}_cache_equilibrator_compounds.json"
+            if data_cache_folder
+            else "",
         )
         if data_cache_folder:
             json_write(f"{data_cache_folder}_cache_dG0.json", dG0s)
@@ -4,76 +4,467 @@ This module contains functions which can access NCBI TAXONOMY.
 """
 
 # IMPORTS #
+import io
 import os
+from collections.abc import Generator, Iterator, Mapping
 from typing import Any
 from zipfile import ZipFile
 
+import numpy as np
 from pydantic import NonNegativeInt, validate_call
 
-from .io import json_zip_write, standardize_folder
+from .io import json_zip_load, json_zip_write, standardize_folder
 
 
-# PUBLIC FUNCTIONS #
-@validate_call(validate_return=True)
-def parse_ncbi_taxonomy(
-    ncbi_taxdmp_zipfile_path: str,
-    ncbi_parsed_json_path: str,
-) -> None:
-    """Parses NCBI taxonomy data from a taxdump zip file and saves it as a JSON file.
+# CLASSES #
+class NcbiTaxonomyIndex:
+    """A precomputed index of the NCBI taxonomy tree for fast taxonomic distance queries.
+
+    The tree is given as parent array over integer node IDs. At initialization, each node's depth and its
+    pre-order DFS entry and exit positions (i.e., its Euler tour interval) are computed with vectorized
+    NumPy operations. A node a is an ancestor of node u if and only if entry[a] <= entry[u] < exit[a],
+    so that the lowest common ancestor of a base species and any organism is the deepest ancestor of the
+    base species whose interval contains the organism. Thereby, the distances of many organisms to a base
+    species are answered in one vectorized call.
 
-    This function extracts the necessary files from the NCBI taxdump zip archive, parses the taxonomy data,
-    and writes the parsed data to a JSON file. The parsed data includes mappings from taxonomy numbers to names
-    and vice versa, as well as the taxonomy tree structure.
+    The taxonomic distance of an organism is the position of its lowest common ancestor in the base species'
+    lineage, i.e., the same value as the one of most_taxonomic_similar and get_taxonomy_scores. Organisms
+    which are not in the taxonomy are treated as direct children of the root.
+
+    Attributes:
+        parents (np.ndarray): int32 parent node of each node (-1 for the root).
+        node_of_name (Mapping[str, int]): Organism name -> node.
+        depths (np.ndarray): int32 depth of each node (0 for the root).
+        entries (np.ndarray): int32 pre-order DFS entry position of each node.
+        exits (np.ndarray): int32 pre-order DFS exit position (exclusive) of each node.
+    """
+
+    def __init__(
+        self,
+        parents: np.ndarray,
+        node_of_name: Mapping[str, int],
+        precomputed_arrays: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+    ) -> None:
+        """Initializes the NcbiTaxonomyIndex object and precomputes depths and Euler tour intervals.
+
+        Args:
+            parents (np.ndarray): Parent node of each node (-1 or the node itself for a root).
+            node_of_name (Mapping[str, int]): Organism name -> node.
+            precomputed_arrays (tuple[np.ndarray, np.ndarray, np.ndarray] | None, optional): If given, the
+                already computed depths, entries and exits (e.g. memory-mapped from a binary taxonomy, see
+                write_ncbi_taxonomy_binary), which are then used without any computation. Defaults to None.
+        """
+        self._node_cache: dict[str, int] = {}
+        self._lineage_cache: dict[int, np.ndarray] = {}
+        if precomputed_arrays is not None:
+            self.parents = parents
+            self.node_of_name = node_of_name
+            self.depths, self.entries, self.exits = precomputed_arrays
+            return
+
+        num_nodes = parents.shape[0]
+        node_ids = np.arange(num_nodes, dtype=np.int32)
+        parents = np.asarray(parents, dtype=np.int32)
+        roots = (parents < 0) | (parents >= num_nodes) | (parents == node_ids)
+        self.parents = np.where(roots, -1, parents).astype(np.int32)
+        self.node_of_name = node_of_name
+
+        # Depths (level by level, starting from the roots)
+        depths = np.full(num_nodes, -1, dtype=np.int32)
+        depths[roots] = 0
+        nodes_of_depth: list[np.ndarray] = [node_ids[roots]]
+        unresolved = node_ids[~roots]
+        while unresolved.size > 0:
+            resolved = depths[self.parents[unresolved]] >= 0
+            if not resolved.any():
+                # Cycles without root are cut and become roots themselves
+                depths[unresolved] = 0
+                self.parents[unresolved] = -1
+                nodes_of_depth[0] = np.concatenate((nodes_of_depth[0], unresolved))
+                break
+            newly_resolved = unresolved[resolved]
+            depths[newly_resolved] = depths[self.parents[newly_resolved]] + 1
+            for depth in np.unique(depths[newly_resolved]):
+                while len(nodes_of_depth) <= depth:
+                    nodes_of_depth.append(np.zeros(0, dtype=np.int32))
+                nodes_of_depth[depth] = np.concatenate(
+                    (
+                        nodes_of_depth[depth],
+                        newly_resolved[depths[newly_resolved] == depth],
+                    )
+                )
+            unresolved = unresolved[~resolved]
+        self.depths = depths
+
+        # Subtree sizes (from the deepest level upwards)
+        sizes = np.ones(num_nodes, dtype=np.int64)
+        for level_nodes in reversed(nodes_of_depth[1:]):
+            np.add.at(sizes, self.parents[level_nodes], sizes[level_nodes])
+
+        # Pre-order entry positions (from the roots downwards): a child enters after its
+        # parent and after the subtrees of all its previous siblings
+        entries = np.zeros(num_nodes, dtype=np.int64)
+        root_nodes = nodes_of_depth[0]
+        entries[root_nodes] = np.cumsum(sizes[root_nodes]) - sizes[root_nodes]
+        for level_nodes in nodes_of_depth[1:]:
+            ordered_nodes = level_nodes[
+                np.argsort(self.parents[level_nodes], kind="stable")
+            ]
+            ordered_parents = self.parents[ordered_nodes]
+            preceding_sizes = np.cumsum(sizes[ordered_nodes]) - sizes[ordered_nodes]
+            _, group_starts, group_lengths = np.unique(
+                ordered_parents, return_index=True, return_counts=True
+            )
+            preceding_sibling_sizes = preceding_sizes - np.repeat(
+                preceding_sizes[group_starts], group_lengths
+            )
+            entries[ordered_nodes] = (
+                entries[ordered_parents] + 1 + preceding_sibling_sizes
+            )
+        self.entries = entries.astype(np.int32)
+        self.exits = (entries + sizes).astype(np.int32)
+
+    def get_lineage(self, node: int) -> np.ndarray:
+        """Returns the (cached) lineage of a node, i.e., the node itself and all its ancestors up to the root.
+
+        Args:
+            node (int): The node.
+
+        Returns:
+            np.ndarray: The lineage nodes, starting with the given node.
+        """
+        if node not in self._lineage_cache:
+            lineage = np.zeros(self.depths[node] + 1, dtype=np.int32)
+            ancestor = node
+            for position in range(lineage.shape[0]):
+                lineage[position] = ancestor
+                ancestor = self.parents[ancestor]
+            self._lineage_cache[node] = lineage
+        return self._lineage_cache[node]
+
+    def get_node(self, organism: str) -> int:
+        """Returns the (memoized) node of an organism name (-1 if it is not in the taxonomy).
+
+        Args:
+            organism (str): The organism's name.
+
+        Returns:
+            int: The organism's node or -1.
+        """
+        if organism not in self._node_cache:
+            node = self.node_of_name.get(organism)
+            self._node_cache[organism] = -1 if node is None else int(node)
+        return self._node_cache[organism]
+
+    def get_taxonomic_distances(
+        self, base_species: str, organisms: list[str]
+    ) -> dict[str, int]:
+        """Returns the taxonomic distance of each organism to the base species.
+
+        The distance is the number of steps from the base species up to the lowest common ancestor of the
+        base species and the organism (0 for the base species itself).
+
+        Args:
+            base_species (str): The species to which the distances are calculated.
+            organisms (list[str]): The organism names.
+
+        Returns:
+            dict[str, int]: Organism name -> taxonomic distance to the base species.
+        """
+        base_node = self.get_node(base_species)
+        if base_node < 0:
+            # As in get_taxonomy_dict_from_nbci_taxonomy, an unknown base species only shares the root
+            return {
+                organism: 0 if organism == base_species else 1 for organism in organisms
+            }
+        lineage = self.get_lineage(base_node)
+        nodes = np.array(
+            [self.get_node(organism) for organism in organisms], dtype=np.int32
+        )
+        known_nodes = np.where(nodes >= 0, nodes, lineage[-1])
+        organism_entries = self.entries[known_nodes][:, None]
+        in_subtree = (self.entries[lineage][None, :] <= organism_entries) & (
+            organism_entries < self.exits[lineage][None, :]
+        )
+        distances = np.where(
+            in_subtree.any(axis=1), in_subtree.argmax(axis=1), lineage.shape[0]
+        )
+        distances[nodes < 0] = lineage.shape[0] - 1
+        return {
+            organism: 0 if organism == base_species else int(distance)
+            for organism, distance in zip(organisms, distances)
+        }
+
+
+class NcbiTaxonomyNames(Mapping[str, int]):
+    """A compact, read-only organism name -> taxonomy node mapping for (memory-mapped) binary taxonomies.
+
+    All names are stored as one UTF-8 byte array in sorted order, together with their start offsets and
+    their nodes. A name is found through a binary search over these arrays, so that no Python dictionary
+    with millions of entries has to be created.
+
+    Attributes:
+        name_bytes (np.ndarray): uint8 array of all concatenated UTF-8 encoded names (sorted by their bytes).
+        name_offsets (np.ndarray): int64 start offset of each name in name_bytes (plus the total length at the end).
+        name_nodes (np.ndarray): int32 node of each name.
+    """
+
+    def __init__(
+        self, name_bytes: np.ndarray, name_offsets: np.ndarray, name_nodes: np.ndarray
+    ) -> None:
+        """Initializes the NcbiTaxonomyNames object.
+
+        Args:
+            name_bytes (np.ndarray): uint8 array of all concatenated UTF-8 encoded names (sorted by their bytes).
+            name_offsets (np.ndarray): int64 start offset of each name in name_bytes (plus the total length at the end).
+            name_nodes (np.ndarray): int32 node of each name.
+        """
+        self.name_bytes = name_bytes
+        self.name_offsets = name_offsets
+        self.name_nodes = name_nodes
+
+    def __getitem__(self, name: str) -> int:
+        """Returns the node of the name through a binary search.
+
+        Args:
+            name (str): The organism name.
+
+        Raises:
+            KeyError: The name is not in the taxonomy.
+
+        Returns:
+            int: The name's node.
+        """
+        searched_bytes = name.encode("utf-8")
+        low, high = 0, self.name_nodes.shape[0]
+        while low < high:
+            middle = (low + high) // 2
+            middle_bytes = self._get_name_bytes(middle)
+            if middle_bytes < searched_bytes:
+                low = middle + 1
+            elif middle_bytes > searched_bytes:
+                high = middle
+            else:
+                return int(self.name_nodes[middle])
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over all names in their sorted order.
+
+        Yields:
+            str: The next name.
+        """
+        for name_index in range(self.name_nodes.shape[0]):
+            yield self._get_name_bytes(name_index).decode("utf-8")
+
+    def __len__(self) -> int:
+        """Returns the number of names.
+
+        Returns:
+            int: The number of names.
+        """
+        return self.name_nodes.shape[0]
+
+    def _get_name_bytes(self, name_index: int) -> bytes:
+        """Returns the UTF-8 bytes of the name with the given index.
+
+        Args:
+            name_index (int): The name's index in the sorted name table.
+
+        Returns:
+            bytes: The name's bytes.
+        """
+        return self.name_bytes[
+            self.name_offsets[name_index] : self.name_offsets[name_index + 1]
+        ].tobytes()
+
+
+# PRIVATE FUNCTIONS #
+def _iterate_ncbi_taxdmp_member(
+    ncbi_taxdmp_zipfile_path: str, member_filename: str
+) -> Generator[str, None, None]:
+    """Yields the lines of a file in the NCBI taxdump zip archive one by one.
+
+    The file is decompressed while reading, i.e., it is neither extracted to the disk
+    nor held completely in memory.
 
     Args:
         ncbi_taxdmp_zipfile_path (str): The file path to the NCBI taxdump zip archive.
-        ncbi_parsed_json_path (str): The file path where the parsed JSON data will be saved.
+        member_filename (str): The name of the file in the archive, e.g. "names.dmp".
+
+    Yields:
+        str: The next line of the file.
     """
-    old_wd = os.getcwd()
-    folder = standardize_folder(os.path.dirname(ncbi_taxdmp_zipfile_path))
-    filename = os.path.basename(ncbi_taxdmp_zipfile_path)
-    os.chdir(folder)
+    with (
+        ZipFile(ncbi_taxdmp_zipfile_path, "r") as zipfile,
+        zipfile.open(member_filename, "r") as zip_member,
+    ):
+        yield from io.TextIOWrapper(zip_member, encoding="utf-8")
+
+
+def _write_ncbi_taxonomy_binary(
+    ncbi_binary_folder: str,
+    node_numbers: np.ndarray,
+    parents: np.ndarray,
+    names: list[str],
+    name_nodes: list[int],
+) -> None:
+    """Writes the columns of an NCBI taxonomy as binary taxonomy folder (see write_ncbi_taxonomy_binary).
 
-    with ZipFile(filename, "r") as zipfile:
-        zipfile.extract("names.dmp")
-        zipfile.extract("nodes.dmp")
+    Args:
+        ncbi_binary_folder (str): The binary taxonomy folder, which is created if it does not exist.
+        node_numbers (np.ndarray): NCBI taxonomy number of each node.
+        parents (np.ndarray): Parent node of each node (-1 for the root).
+        names (list[str]): Organism names.
+        name_nodes (list[int]): Node of each organism name.
+    """
+    ncbi_binary_folder = standardize_folder(ncbi_binary_folder)
+    os.makedirs(ncbi_binary_folder, exist_ok=True)
+
+    ncbi_taxonomy_index = NcbiTaxonomyIndex(parents, {})
+    encoded_names = sorted(
+        (name.encode("utf-8"), name_node) for name, name_node in zip(names, name_nodes)
+    )
+    name_lengths = np.array(
+        [len(encoded_name) for encoded_name, _ in encoded_names], dtype=np.int64
+    )
+    name_offsets = np.zeros(len(encoded_names) + 1, dtype=np.int64)
+    np.cumsum(name_lengths, out=name_offsets[1:])
+    arrays = {
+        "node_numbers": np.asarray(node_numbers, dtype=np.int32),
+        "parents": ncbi_taxonomy_index.parents,
+        "depths": ncbi_taxonomy_index.depths,
+        "entries": ncbi_taxonomy_index.entries,
+        "exits": ncbi_taxonomy_index.exits,
+        "name_bytes": np.frombuffer(
+            b"".join(encoded_name for encoded_name, _ in encoded_names), dtype=np.uint8
+        ),
+        "name_offsets": name_offsets,
+        "name_nodes": np.array(
+            [name_node for _, name_node in encoded_names], dtype=np.int32
+        ),
+    }
+    for array_name, array in arrays.items():
+        np.save(f"{ncbi_binary_folder}{array_name}.npy", array)
 
-    with open("names.dmp", encoding="utf-8") as f:
-        name_lines = f.readlines()
-    with open("nodes.dmp", encoding="utf-8") as f:
-        node_lines = f.readlines()
 
-    os.remove("names.dmp")
-    os.remove("nodes.dmp")
-    os.chdir(old_wd)
+# PUBLIC FUNCTIONS #
+@validate_call(validate_return=True)
+def parse_ncbi_taxonomy(
+    ncbi_taxdmp_zipfile_path: str,
+    ncbi_parsed_json_path: str = "",
+    ncbi_binary_folder: str = "",
+) -> None:
+    """Parses NCBI taxonomy data from a taxdump zip file and saves it as a JSON file and/or a binary taxonomy folder.
 
-    parsed_json_data = {}
+    This function streams the necessary files line by line out of the NCBI taxdump zip archive (without
+    extracting them or changing the working directory), parses the taxonomy data, and writes the parsed
+    data to a JSON file. The parsed data includes mappings from taxonomy numbers to names and vice versa,
+    as well as the taxonomy tree structure. Additionally (or instead), the data can be written
+    as compact, memory-mappable binary taxonomy folder (see write_ncbi_taxonomy_binary).
 
-    number_to_names_dict: dict[str, Any] = {}
-    names_to_number_dict = {}
-    for line in name_lines:
+    Args:
+        ncbi_taxdmp_zipfile_path (str): The file path to the NCBI taxdump zip archive.
+        ncbi_parsed_json_path (str, optional): The file path where the parsed JSON data will be saved.
+            If "", no JSON is written. Defaults to "".
+        ncbi_binary_folder (str, optional): The folder where the binary taxonomy will be saved.
+            If "", no binary taxonomy is written. Defaults to "".
+    """
+    number_to_names_dict: dict[str, list[str]] = {}
+    names_to_number_dict: dict[str, str] = {}
+    for line in _iterate_ncbi_taxdmp_member(ncbi_taxdmp_zipfile_path, "names.dmp"):
         if ("scientific name" not in line) and ("synonym" not in line):
             continue
-        number = line.split("|")[0].lstrip().rstrip()
-        name = line.split("|")[1].lstrip().rstrip()
+        line_parts = line.split("|", 2)
+        number = line_parts[0].strip()
+        name = line_parts[1].strip()
         if number not in number_to_names_dict:
             number_to_names_dict[number] = []
         number_to_names_dict[number].append(name)
         names_to_number_dict[name] = number
 
-    parsed_json_data["number_to_names_dict"] = number_to_names_dict
-    parsed_json_data["names_to_number_dict"] = names_to_number_dict
+    nodes_dict: dict[str, str] = {}
+    for line in _iterate_ncbi_taxdmp_member(ncbi_taxdmp_zipfile_path, "nodes.dmp"):
+        line_parts = line.split("|", 2)
+        begin = line_parts[0].strip()
+        end = line_parts[1].strip()
+        nodes_dict[begin] = "END" if begin == end else end
+
+    parsed_json_data: dict[str, Any] = {
+        "number_to_names_dict": number_to_names_dict,
+        "names_to_number_dict": names_to_number_dict,
+        "nodes_dict": nodes_dict,
+    }
+    if ncbi_parsed_json_path:
+        json_zip_write(ncbi_parsed_json_path, parsed_json_data)
+    if ncbi_binary_folder:
+        write_ncbi_taxonomy_binary(parsed_json_data, ncbi_binary_folder)
+
+
+@validate_call
+def get_ncbi_taxonomy_index(parsed_json_data: dict[str, Any]) -> NcbiTaxonomyIndex:
+    """Builds an NcbiTaxonomyIndex from NCBI taxonomy data as created by parse_ncbi_taxonomy.
+
+    Args:
+        parsed_json_data (dict[str, Any]): Parsed JSON data containing "names_to_number_dict" and "nodes_dict".
+
+    Returns:
+        NcbiTaxonomyIndex: The taxonomy index.
+    """
+    nodes_dict: dict[str, str] = parsed_json_data["nodes_dict"]
+    node_of_number = {number: node for node, number in enumerate(nodes_dict)}
+    parents = np.array(
+        [
+            node_of_number.get(parent_number, -1)
+            for parent_number in nodes_dict.values()
+        ],
+        dtype=np.int32,
+    )
+    node_of_name = {
+        name: node_of_number[number]
+        for name, number in parsed_json_data["names_to_number_dict"].items()
+        if number in node_of_number
+    }
+    return NcbiTaxonomyIndex(parents, node_of_name)
+
+
+@validate_call
+def load_ncbi_taxonomy_index(ncbi_parsed_path: str) -> NcbiTaxonomyIndex:
+    """Loads an NcbiTaxonomyIndex from a binary taxonomy folder or from a parsed NCBI taxonomy JSON.
+
+    A binary taxonomy folder (see write_ncbi_taxonomy_binary) is memory-mapped, i.e., nearly nothing is
+    read or computed at loading and only the actually used parts are read from disk later. Otherwise,
+    the zipped JSON of parse_ncbi_taxonomy is loaded fully and the index is computed.
 
-    nodes_dict = {}
-    for line in node_lines:
-        begin = line.split("|")[0].lstrip().rstrip()
-        end = line.split("|")[1].lstrip().rstrip()
-        if begin == end:
-            nodes_dict[begin] = "END"
-        else:
-            nodes_dict[begin] = end
-    parsed_json_data["nodes_dict"] = nodes_dict
-    json_zip_write(ncbi_parsed_json_path, parsed_json_data)
+    Args:
+        ncbi_parsed_path (str): Path to a binary taxonomy folder or (without ".zip") to a parsed NCBI taxonomy JSON.
+
+    Returns:
+        NcbiTaxonomyIndex: The taxonomy index.
+    """
+    if not os.path.isdir(ncbi_parsed_path):
+        return get_ncbi_taxonomy_index(json_zip_load(ncbi_parsed_path))
+
+    ncbi_binary_folder = standardize_folder(ncbi_parsed_path)
+    arrays = {
+        array_name: np.load(f"{ncbi_binary_folder}{array_name}.npy", mmap_mode="r")
+        for array_name in (
+            "parents",
+            "depths",
+            "entries",
+            "exits",
+            "name_bytes",
+            "name_offsets",
+            "name_nodes",
+        )
+    }
+    return NcbiTaxonomyIndex(
+        arrays["parents"],
+        NcbiTaxonomyNames(
+            arrays["name_bytes"], arrays["name_offsets"], arrays["name_nodes"]
+        ),
+        precomputed_arrays=(arrays["depths"], arrays["entries"], arrays["exits"]),
+    )
 
 
 @validate_call(validate_return=True)
@@ -206,3 +597,41 @@ def most_taxonomic_similar(
                 break
 
     return score_dict
+
+
+@validate_call
+def write_ncbi_taxonomy_binary(
+    parsed_json_data: dict[str, Any], ncbi_binary_folder: str
+) -> None:
+    """Writes NCBI taxonomy data (as created by parse_ncbi_taxonomy) as compact binary taxonomy folder.
+
+    The folder contains NumPy .npy arrays which are memory-mapped by load_ncbi_taxonomy_index:
+    The int32 parent array of the taxonomy tree (with the nodes' NCBI taxonomy numbers), the precomputed
+    depths and Euler tour intervals of NcbiTaxonomyIndex, and a name table of all concatenated UTF-8
+    organism names with their offsets and nodes, sorted for binary searches.
+
+    Args:
+        parsed_json_data (dict[str, Any]): Parsed JSON data containing "names_to_number_dict" and "nodes_dict".
+        ncbi_binary_folder (str): The binary taxonomy folder, which is created if it does not exist.
+    """
+    nodes_dict: dict[str, str] = parsed_json_data["nodes_dict"]
+    node_of_number = {number: node for node, number in enumerate(nodes_dict)}
+    names_to_number_dict: dict[str, str] = parsed_json_data["names_to_number_dict"]
+    known_names = [
+        name
+        for name, number in names_to_number_dict.items()
+        if number in node_of_number
+    ]
+    _write_ncbi_taxonomy_binary(
+        ncbi_binary_folder,
+        node_numbers=np.array([int(number) for number in nodes_dict], dtype=np.int32),
+        parents=np.array(
+            [
+                node_of_number.get(parent_number, -1)
+                for parent_number in nodes_dict.values()
+            ],
+            dtype=np.int32,
+        ),
+        names=known_names,
+        name_nodes=[node_of_number[names_to_number_dict[name]] for name in known_names],
+    )
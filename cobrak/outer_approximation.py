@@ -0,0 +1,384 @@
+"""Outer-approximation (LP/NLP decomposition) driver for COBRA-k's MINLP with κ and γ terms.
+
+A persistent master MILP (the ecTFBA of get_lp_from_cobrak_model with enzyme, thermodynamic and loop constraints)
+picks a set of thermodynamically active reactions, which is evaluated with the NLP of
+perform_nlp_irreversible_optimization_with_active_reacs_only. At the NLP solution, linearization cuts of γ and κ are
+added to the master MILP, together with a no-good cut which excludes the evaluated set of active reactions. The master
+MILP is then re-solved (with a warm start if the solver supports it) until its objective value, i.e. the bound of all
+not yet evaluated sets of active reactions, cannot beat the best NLP result anymore.
+
+As γ = 1 - exp(-f/RT) is concave in the driving force f, its tangents overestimate it everywhere. κ is overestimated by
+the sigmoid of its substrate term, whose tangents are valid overestimators where the sigmoid is concave on the term's
+range (see _get_kappa_cut). Hence, each reaction's enzyme constraint v <= k_cat * E * κ * γ yields the valid cuts
+v <= k_cat * E_max * (tangent of γ or κ). Therefore, the master MILP's objective value stays a valid bound.
+"""
+
+from copy import deepcopy
+from math import exp, inf, isfinite
+from time import time
+
+from pyomo.common.errors import ApplicationError
+from pyomo.environ import ConcreteModel, ConstraintList
+
+from .constants import (
+    ALL_OK_KEY,
+    DF_VAR_PREFIX,
+    KAPPA_SUBSTRATES_VAR_PREFIX,
+    OBJECTIVE_BOUND_KEY,
+    OBJECTIVE_VAR_NAME,
+    TIME_BUDGET_EXCEEDED_KEY,
+    Z_VAR_PREFIX,
+)
+from .dataclasses import Model, Solver
+from .evolution import COBRAKProblem
+from .lps import (
+    _get_optimization_lp,
+    add_statuses_to_optimziation_dict,
+    perform_lp_variability_analysis,
+)
+from .pyomo_functionality import get_objective, get_solver
+from .standard_solvers import IPOPT, SCIP
+from .utilities import (
+    get_pyomo_solution_as_dict,
+    get_reaction_enzyme_var_id,
+    is_objsense_maximization,
+)
+
+
+def _sigmoid(value: float) -> float:
+    """Returns the logistic function's value, i.e. 1 / (1 + exp(-value)).
+
+    Args:
+        value (float): The argument.
+
+    Returns:
+        float: The logistic function's value.
+    """
+    if value < -700.0:
+        return 0.0
+    return 1.0 / (1.0 + exp(-value))
+
+
+def _get_kappa_cut(
+    kappa_substrates_value: float, kappa_substrates_lb: float
+) -> tuple[float, float]:
+    """Returns a linear overestimator of κ as (slope, intercept) in the κ substrates term.
+
+    κ = exp(s) / (1 + exp(s) + exp(p)) is at most the sigmoid σ(s) of the substrates term s. On s >= s_min, the concave
+    envelope of σ is the line from (s_min, σ(s_min)) to the tangent point t >= max(0, s_min), and σ itself for s >= t.
+    Hence, the tangent of σ at max(s*, t) overestimates κ for all s >= s_min.
+
+    Args:
+        kappa_substrates_value (float): The substrates term s* at the NLP solution.
+        kappa_substrates_lb (float): The substrates term's lower bound s_min.
+
+    Returns:
+        tuple[float, float]: The slope and intercept of the overestimating line.
+    """
+    sigmoid_lb = _sigmoid(kappa_substrates_lb)
+
+    def envelope_gap(point: float) -> float:
+        sigmoid_value = _sigmoid(point)
+        return (
+            sigmoid_value
+            - sigmoid_lb
+            - sigmoid_value * (1 - sigmoid_value) * (point - kappa_substrates_lb)
+        )
+
+    tangent_point = max(0.0, kappa_substrates_lb)
+    if envelope_gap(tangent_point) < 0.0:
+        low, high = tangent_point, tangent_point + 1.0
+        while envelope_gap(high) < 0.0:
+            low, high = high, 2 * high
+        for _ in range(60):
+            middle = (low + high) / 2
+            if envelope_gap(middle) < 0.0:
+                low = middle
+            else:
+                high = middle
+        tangent_point = high
+
+    tangent_point = max(tangent_point, kappa_substrates_value)
+    sigmoid_value = _sigmoid(tangent_point)
+    slope = sigmoid_value * (1 - sigmoid_value)
+    return slope, sigmoid_value - slope * tangent_point
+
+
+def _add_linearization_cuts(
+    master: ConcreteModel,
+    cobrak_model: Model,
+    nlp_result: dict[str, float],
+    with_kappa: bool,
+    with_gamma: bool,
+    approximation_value: float = 0.0001,
+) -> int:
+    """Adds the γ and κ linearization cuts at an NLP solution to the master MILP's oa_cuts.
+
+    Args:
+        master (ConcreteModel): The master MILP.
+        cobrak_model (Model): The COBRA-k model.
+        nlp_result (dict[str, float]): The NLP solution.
+        with_kappa (bool): Whether or not the NLP contains κ terms.
+        with_gamma (bool): Whether or not the NLP contains γ terms.
+        approximation_value (float, optional): The NLP's minimal κ and γ value (see the nlps module). Defaults to 0.0001.
+
+    Returns:
+        int: The number of added cuts.
+    """
+    rt = cobrak_model.R * cobrak_model.T
+    num_cuts = 0
+    for reac_id, reaction in cobrak_model.reactions.items():
+        if (
+            (reaction.enzyme_reaction_data is None)
+            or (not hasattr(master, reac_id))
+            or (nlp_result.get(reac_id, 0.0) <= 0.0)
+        ):
+            continue
+        enzyme_var_id = get_reaction_enzyme_var_id(reac_id, reaction)
+        if not hasattr(master, enzyme_var_id):
+            continue
+        enzyme_ub = getattr(master, enzyme_var_id).ub
+        if enzyme_ub is None:
+            continue
+        max_v_plus = reaction.enzyme_reaction_data.k_cat * enzyme_ub
+        flux_var = getattr(master, reac_id)
+
+        f_var_id = f"{DF_VAR_PREFIX}{reac_id}"
+        z_var_id = f"{Z_VAR_PREFIX}{reac_id}"
+        if (
+            with_gamma
+            and (reaction.dG0 is not None)
+            and (f_var_id in nlp_result)
+            and hasattr(master, f_var_id)
+            and hasattr(master, z_var_id)
+            and (getattr(master, f_var_id).lb is not None)
+        ):
+            f_value = nlp_result[f_var_id]
+            slope = exp(-f_value / rt) / rt
+            intercept = approximation_value + 1 - exp(-f_value / rt) - slope * f_value
+            # With an inactive reaction (z=0), the cut must not restrict the driving force
+            big_m = max_v_plus * max(
+                0.0, -(intercept + slope * getattr(master, f_var_id).lb)
+            )
+            master.oa_cuts.add(
+                flux_var
+                <= max_v_plus * (intercept + slope * getattr(master, f_var_id))
+                + big_m * (1 - getattr(master, z_var_id))
+            )
+            num_cuts += 1
+
+        kappa_substrates_var_id = f"{KAPPA_SUBSTRATES_VAR_PREFIX}{reac_id}"
+        if (
+            with_kappa
+            and (kappa_substrates_var_id in nlp_result)
+            and hasattr(master, kappa_substrates_var_id)
+            and (getattr(master, kappa_substrates_var_id).lb is not None)
+            and isfinite(getattr(master, kappa_substrates_var_id).lb)
+        ):
+            slope, intercept = _get_kappa_cut(
+                nlp_result[kappa_substrates_var_id],
+                getattr(master, kappa_substrates_var_id).lb,
+            )
+            master.oa_cuts.add(
+                flux_var
+                <= max_v_plus
+                * (
+                    approximation_value
+                    + intercept
+                    + slope * getattr(master, kappa_substrates_var_id)
+                )
+            )
+            num_cuts += 1
+
+    return num_cuts
+
+
+def perform_nlp_outer_approximation(
+    cobrak_model: Model,
+    objective_target: str | dict[str, float],
+    objective_sense: int,
+    variability_dict: dict[str, tuple[float, float]] = {},
+    with_kappa: bool = True,
+    with_gamma: bool = True,
+    lp_solver: Solver = SCIP,
+    nlp_solver: Solver = IPOPT,
+    nlp_strict_mode: bool = False,
+    nlp_single_strict_reacs: list[str] = [],
+    min_abs_objvalue: float = 1e-13,
+    ignore_nonlinear_extra_terms_in_ectfbas: bool = True,
+    rel_gap_tolerance: float = 1e-6,
+    max_iterations: float = float("inf"),
+    time_budget: float = float("inf"),
+    verbose: bool = False,
+) -> dict[float, list[dict[str, float]]]:
+    """Solves COBRA-k's MINLP through outer approximation, i.e. a decomposition into a master MILP and NLPs.
+
+    For the algorithm, see this module's docstring. In contrast to perform_nlp_reversible_optimization with a MINLP
+    solver, only MILPs and NLPs with fixed active reactions are solved. In contrast to perform_nlp_evolutionary_optimization,
+    the result comes with a bound. The gap closes when the bound cannot beat the best NLP result by more than
+    rel_gap_tolerance (then, the result is proven optimal, as far as the NLP solver finds the optimum of each NLP).
+    Parameter corrections (CorrectionConfig) are not supported.
+
+    Args:
+        cobrak_model (Model): The COBRA-k model to optimize.
+        objective_target (str | dict[str, float]): The objective target (reaction ID or dictionary of variable IDs and coefficients).
+        objective_sense (int): The objective sense (positive for maximization, negative for minimization).
+        variability_dict (dict[str, tuple[float, float]], optional): Variability data of the model's reactions. If empty, an
+            ecTFVA is performed. Defaults to {}.
+        with_kappa (bool, optional): Whether to use saturation term constraints in the NLPs (and κ cuts). Defaults to True.
+        with_gamma (bool, optional): Whether to use thermodynamic term constraints in the NLPs (and γ cuts). Defaults to True.
+        lp_solver (Solver, optional): The solver of the master MILP. Defaults to SCIP.
+        nlp_solver (Solver, optional): The NLP solver. Defaults to IPOPT.
+        nlp_strict_mode (bool, optional): Whether or not the <= heuristic (True) or not (False; i.e. setting all equations to ==)
+            shall be used in the NLPs. Defaults to False.
+        nlp_single_strict_reacs (list[str], optional): Single reactions that shall be in strict mode. Defaults to [].
+        min_abs_objvalue (float, optional): Minimal absolute NLP objective value to count as a result. Defaults to 1e-13.
+        ignore_nonlinear_extra_terms_in_ectfbas (bool, optional): Whether or not non-linear watches/constraints shall be ignored
+            in the master MILP. Defaults to True.
+        rel_gap_tolerance (float, optional): Relative gap between bound and best NLP objective value at which the search stops.
+            Defaults to 1e-6.
+        max_iterations (float, optional): Maximal number of master MILP solutions. Defaults to float("inf").
+        time_budget (float, optional): Maximal wall-clock seconds of the search. Defaults to float("inf").
+        verbose (bool, optional): Whether or not the progress shall be printed. Defaults to False.
+
+    Returns:
+        dict[float, list[dict[str, float]]]: The found NLP results, sorted by their objective values. In each result,
+        OBJECTIVE_BOUND_KEY is the final bound (i.e. the best result's objective value if the gap is closed), and
+        TIME_BUDGET_EXCEEDED_KEY shows whether the time budget was used up.
+    """
+    deadline = time() + time_budget
+    if isinstance(objective_target, str):
+        objective_target = {objective_target: 1.0}
+    if variability_dict == {}:
+        variability_dict = perform_lp_variability_analysis(
+            cobrak_model=cobrak_model,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            active_reactions=[],
+            solver=lp_solver,
+            ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
+        )
+    problem = COBRAKProblem(
+        cobrak_model=cobrak_model,
+        objective_target=objective_target,
+        objective_sense=objective_sense,
+        variability_dict=variability_dict,
+        nlp_dict_list=[],
+        best_value=0.0,
+        with_kappa=with_kappa,
+        with_gamma=with_gamma,
+        with_iota=False,
+        with_alpha=False,
+        lp_solver=lp_solver,
+        nlp_solver=nlp_solver,
+        nlp_strict_mode=nlp_strict_mode,
+        nlp_single_strict_reacs=nlp_single_strict_reacs,
+        min_abs_objvalue=min_abs_objvalue,
+        ignore_nonlinear_extra_terms_in_ectfbas=ignore_nonlinear_extra_terms_in_ectfbas,
+    )
+
+    # The persistent master MILP
+    master = _get_optimization_lp(
+        cobrak_model=cobrak_model,
+        with_enzyme_constraints=True,
+        with_thermodynamic_constraints=True,
+        with_loop_constraints=True,
+        variability_dict=deepcopy(variability_dict),
+        ignore_nonlinear_terms=ignore_nonlinear_extra_terms_in_ectfbas,
+    )
+    master.obj = get_objective(master, objective_target, objective_sense)
+    master.oa_cuts = ConstraintList()
+    z_var_ids = [
+        f"{Z_VAR_PREFIX}{reac_id}"
+        for reac_id in cobrak_model.reactions
+        if hasattr(master, f"{Z_VAR_PREFIX}{reac_id}")
+    ]
+    pyomo_lp_solver = get_solver(
+        lp_solver.name, lp_solver.solver_options, lp_solver.solver_attrs
+    )
+    try:
+        warmstart_capable = bool(pyomo_lp_solver.warm_start_capable())
+    except AttributeError:
+        warmstart_capable = False
+    solve_extra_options = deepcopy(lp_solver.solve_extra_options)
+    if warmstart_capable:
+        solve_extra_options["warmstart"] = True
+
+    # Internally, objective values are converted such that lower is better
+    sense_factor = -1.0 if is_objsense_maximization(objective_sense) else 1.0
+    incumbent = inf
+    bound = -inf
+    nlp_results: list[dict[str, float]] = []
+    cut_short = False
+    iteration = 0
+    while iteration < max_iterations:
+        if time() >= deadline:
+            cut_short = True
+            break
+        try:
+            results = pyomo_lp_solver.solve(master, tee=False, **solve_extra_options)
+            master_dict = add_statuses_to_optimziation_dict(
+                get_pyomo_solution_as_dict(master), results
+            )
+        except (ApplicationError, AttributeError, RuntimeError, ValueError):
+            master_dict = {ALL_OK_KEY: False}
+        iteration += 1
+        if not master_dict[ALL_OK_KEY]:
+            # All sets of active reactions are evaluated or excluded
+            bound = incumbent
+            break
+        bound = sense_factor * master_dict[OBJECTIVE_VAR_NAME]
+        if (incumbent != inf) and (
+            bound >= incumbent - rel_gap_tolerance * abs(incumbent)
+        ):
+            bound = incumbent
+            break
+
+        for z_var_id in z_var_ids:
+            master_dict[z_var_id] = round(master_dict[z_var_id])
+        nlp_result = problem._perform_z_branch_nlp(  # noqa: SLF001
+            problem._get_used_z_tfba_dict(master_dict, [])  # noqa: SLF001
+        )
+        num_cuts = 0
+        if nlp_result is not None:
+            nlp_results.append(nlp_result)
+            incumbent = min(incumbent, sense_factor * nlp_result[OBJECTIVE_VAR_NAME])
+            num_cuts = _add_linearization_cuts(
+                master, cobrak_model, nlp_result, with_kappa, with_gamma
+            )
+        if verbose:
+            print(
+                f"Outer approximation iteration {iteration}: bound {sense_factor * bound}, "
+                f"best objective value {sense_factor * incumbent}, {num_cuts} new linearization cuts"
+            )
+        if not z_var_ids:
+            # Without thermodynamic constraints, there is only one set of active reactions
+            bound = incumbent
+            break
+        # No-good cut which excludes the evaluated set of active reactions
+        master.oa_cuts.add(
+            sum(
+                1 - getattr(master, z_var_id)
+                if master_dict[z_var_id] > 0.5
+                else getattr(master, z_var_id)
+                for z_var_id in z_var_ids
+            )
+            >= 1
+        )
+
+    if cut_short:
+        print(
+            f"INFO: Time budget of {time_budget} s used up, returning the best result found so far."
+        )
+
+    result_dict: dict[float, list[dict[str, float]]] = {}
+    for nlp_result in nlp_results:
+        nlp_result[OBJECTIVE_BOUND_KEY] = sense_factor * bound
+        nlp_result[TIME_BUDGET_EXCEEDED_KEY] = cut_short
+        objective_value = nlp_result[OBJECTIVE_VAR_NAME]
+        if objective_value not in result_dict:
+            result_dict[objective_value] = []
+        if nlp_result not in result_dict[objective_value]:
+            result_dict[objective_value].append(nlp_result)
+
+    return {key: result_dict[key] for key in sorted(result_dict.keys(), reverse=True)}
@@ -1,7 +1,7 @@
 """Functions for plotting different types of data or reaction kinetics, all using matplotlib."""
 
 import itertools
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from copy import deepcopy
 from typing import Any, Literal
 
@@ -11,7 +11,35 @@ from matplotlib.cm import get_cmap
 from matplotlib.ticker import FuncFormatter
 from pydantic import ConfigDict, validate_call
 
-from cobrak.io import json_load
+from cobrak.io import json_load, jsonl_stream
+
+
+@validate_call
+def _stream_objvalue_history(
+    json_path: str,
+) -> Generator[tuple[float, list[float]], None, None]:
+    """Yields the (timepoint, objective values) pairs of an objective value log.
+
+    For COBRAKGENETIC's JSON Lines logs, the values are the best objective value followed by the objective values
+    which were newly found at the timepoint. For JSON files of the older format (a dictionary of timepoints
+    and sorted objective values), the whole file is loaded and its items are yielded.
+
+    Args:
+        json_path (str): Path to the objective value log.
+
+    Yields:
+        tuple[float, list[float]]: The timepoint and its objective values.
+    """
+    with open(json_path, encoding="utf-8") as f:
+        first_line = f.readline().strip()
+    if first_line in ("{", "{}"):  # Indented JSON dictionary of the older format
+        for timepoint, values in json_load(json_path, Any).items():
+            yield float(timepoint), values
+        return
+    for entry in jsonl_stream(json_path):
+        if entry.get("finished", False):
+            continue
+        yield entry["time"], [entry["best"], *entry["objvalues"]]
 
 
 @validate_call(validate_return=True)
@@ -453,7 +481,9 @@ def plot_objvalue_evolution(
     """Plots the evolution of the objective value over computational time.
 
     Args:
-        json_path (str): Path to the JSON file containing the data.
+        json_path (str): Path to the objective value log, i.e. either a JSON Lines file as written by COBRAKGENETIC
+            (which is streamed line by line) or a JSON file in the older format (a dictionary of timepoints and
+            sorted objective values).
         output_path (str): Path to save the plot.
         ylabel (str, optional): Label for the Y-axis. Defaults to "Objective value".
         objvalue_multiplicator (float, optional): Multiplier to apply to the objective value. Defaults to -1.0.
@@ -468,32 +498,25 @@ def plot_objvalue_evolution(
     def format_decimal(x, _) -> str:  # noqa: ANN001
         return f"{x:.{precision}f}"  # Use the specified precision
 
-    # Load data from JSON file
-    data = json_load(json_path, Any)
-
-    # Extract timepoints
-    timepoints = tuple(float(key) for key in data)
-
-    # Initialize objvalues list
-    match algorithm:
-        case "pso":
-            objvalues = [[] for _ in range(len(list(data.values())[0]))]
-        case "genetic":
-            objvalues = [[]]
-        case _:
-            raise ValueError
+    if algorithm not in ("pso", "genetic"):
+        raise ValueError
 
-    # Populate objvalues list
-    for values in data.values():
+    # Stream (timepoint, objective values) pairs from the log
+    timepoints: list[float] = []
+    objvalues: list[list[float | None]] = [[]]
+    for timepoint, values in _stream_objvalue_history(json_path):
         match algorithm:
             case "pso":
-                for value_idx, value in enumerate(values):
-                    if value >= 1_000_000.0:
-                        objvalues[value_idx].append(None)
+                while len(objvalues) < len(values):
+                    objvalues.append([None for _ in timepoints])
+                for value_idx, objvalue_list in enumerate(objvalues):
+                    if value_idx >= len(values) or values[value_idx] >= 1_000_000.0:
+                        objvalue_list.append(None)
                     else:
-                        objvalues[value_idx].append(value * objvalue_multiplicator)
+                        objvalue_list.append(values[value_idx] * objvalue_multiplicator)
             case "genetic":
                 objvalues[0].append(objvalue_multiplicator * values[0])
+        timepoints.append(timepoint)
 
     plt.clf()
     plt.cla()
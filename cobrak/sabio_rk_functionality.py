@@ -1,17 +1,22 @@
 """Functions and associated dataclasses for retrieving kinetic data from SABIO-RK"""
 
 # IMPORT SECTION #
+import asyncio
+import hashlib
+import os
 import threading
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from io import StringIO
-from math import sqrt
+from math import isnan, sqrt
 from os.path import exists
 from shutil import rmtree
 from statistics import median
-from time import sleep
+from typing import Any
 from zipfile import ZIP_LZMA, ZipFile
 
 import cobra
+import numpy as np
 import requests
 from dataclasses_json import dataclass_json
 
@@ -25,13 +30,62 @@ from .io import (
     ensure_folder_existence,
     get_files,
     json_load,
-    json_zip_load,
+    pickle_load,
+    pickle_write,
     standardize_folder,
 )
-from .ncbi_taxonomy_functionality import (
-    get_taxonomy_dict_from_nbci_taxonomy,
-    get_taxonomy_scores,
+from .ncbi_taxonomy_functionality import load_ncbi_taxonomy_index
+from .utilities import AsyncTokenBucket, run_coroutine
+
+
+# CONSTANTS SECTION #
+SABIO_RK_TSV_URL = "http://sabiork.h-its.org/sabioRestWebServices/kineticlawsExportTsv"
+"""SABIO-RK's web service for TSV exports of kinetic laws"""
+SABIO_RK_MAX_ENTRY_NUMBER = 80_000
+"""Number of SABIO-RK entry IDs which are queried for a full download"""
+SABIO_RK_ENTRIES_PER_REQUEST = 250
+"""Number of SABIO-RK entry IDs which are queried in one request"""
+SABIO_ENTRY_COLUMN_NAMES: tuple[str, ...] = (
+    "entry_id",
+    "is_recombinant",
+    "kinetics_mechanism_type",
+    "organism",
+    "temperature",
+    "ph",
+    "parameter_value",
+    "parameter_unit",
+    "parameter_associated_species",
+    "substrates",
+    "products",
+    "chebi_ids",
 )
+"""Order of the SabioEntry fields in the rows and columns of SabioEntryColumns"""
+SABIO_ENTRY_NUMERIC_COLUMN_DTYPES: dict[str, type] = {
+    "entry_id": np.int64,
+    "is_recombinant": np.bool_,
+    "temperature": np.float64,
+    "ph": np.float64,
+    "parameter_value": np.float64,
+}
+"""NumPy types of the SabioEntryColumns columns which are stored as arrays"""
+SABIO_PARAMETER_TYPE_FIELDS: dict[str, str] = {
+    "kcat": "kcat_entries",
+    "km": "km_entries",
+    "ki": "ki_entries",
+    "activation constant": "ka_entries",
+    "hill coefficient": "hill_entries",
+}
+"""Lowercase SABIO-RK parameter type -> SabioDict field which contains its entries"""
+SABIO_MISSING_NAME_ADDITIONS_FRONT: tuple[str, ...] = (
+    "",
+    "alpha-",
+    "beta-",
+    "l-",
+    "d-",
+)
+"""Prefixes which are tried if a metabolite name cannot be found as BiGG metabolite name"""
+SABIO_MISSING_NAME_ADDITIONS_END: tuple[str, ...] = ("", "1", "__L", "__D")
+"""Suffixes which are tried if a metabolite name cannot be found as BiGG metabolite name"""
 
 
 # DATACLASSES SECTION #
@@ -73,21 +127,137 @@ class SabioEntry:
 @dataclass_json
 @dataclass
 class SabioDict:
-    """Includes all retrieved SabioEntry instances and shows of which type they are"""
+    """Includes all retrieved SabioEntry instances and shows of which type they are
+
+    The entries are given as mappings from EC codes to SabioEntry lists. get_full_sabio_dict
+    returns SabioEntryColumns mappings, which create the SabioEntry instances of an EC code
+    only when it is accessed.
+    """
 
-    kcat_entries: dict[str, list[SabioEntry]]
+    kcat_entries: Mapping[str, list[SabioEntry]]
     """Turnover number entries"""
-    km_entries: dict[str, list[SabioEntry]]
+    km_entries: Mapping[str, list[SabioEntry]]
     """Michaelis-Menten constant entries"""
-    ki_entries: dict[str, list[SabioEntry]]
+    ki_entries: Mapping[str, list[SabioEntry]]
     """Inhibition constant entries"""
-    ka_entries: dict[str, list[SabioEntry]]
+    ka_entries: Mapping[str, list[SabioEntry]]
     """Activation constant entries"""
-    hill_entries: dict[str, list[SabioEntry]]
+    hill_entries: Mapping[str, list[SabioEntry]]
     """Hill number entries"""
 
 
 # CLASS SECTION #
+class SabioEntryColumns(Mapping[str, list[SabioEntry]]):
+    """A compact, read-only EC code -> SabioEntry list mapping which stores all entries column-wise.
+
+    All entries of one parameter type are stored in one array (or string list) per SabioEntry
+    field, with the entries of each EC code in one consecutive slice. SabioEntry instances are only
+    created (and then kept) for the EC codes which are actually accessed, e.g., the ones of a model.
+
+    Attributes:
+        ec_code_slices (dict[str, tuple[int, int]]): EC code -> (start, stop) of its entries in the columns.
+        columns (dict[str, Any]): SabioEntry field name -> column of all entries (NaN is used for missing
+            temperatures and pH values, and the substrate, product and CHEBI ID lists are ';'-joined).
+    """
+
+    def __init__(self, ec_code_rows: dict[str, list[tuple[Any, ...]]]) -> None:
+        """Initializes the SabioEntryColumns object.
+
+        Args:
+            ec_code_rows (dict[str, list[tuple[Any, ...]]]): EC code -> entry rows, with the
+                values of each row given in the order of SABIO_ENTRY_COLUMN_NAMES.
+        """
+        self.ec_code_slices: dict[str, tuple[int, int]] = {}
+        all_rows: list[tuple[Any, ...]] = []
+        for ec_code, rows in ec_code_rows.items():
+            self.ec_code_slices[ec_code] = (len(all_rows), len(all_rows) + len(rows))
+            all_rows.extend(rows)
+
+        column_values = (
+            list(zip(*all_rows)) if all_rows else [() for _ in SABIO_ENTRY_COLUMN_NAMES]
+        )
+        self.columns: dict[str, Any] = {}
+        for column_name, values in zip(SABIO_ENTRY_COLUMN_NAMES, column_values):
+            if column_name in SABIO_ENTRY_NUMERIC_COLUMN_DTYPES:
+                self.columns[column_name] = np.array(
+                    values, dtype=SABIO_ENTRY_NUMERIC_COLUMN_DTYPES[column_name]
+                )
+            else:
+                self.columns[column_name] = list(values)
+        self._entry_cache: dict[str, list[SabioEntry]] = {}
+
+    def __getitem__(self, ec_code: str) -> list[SabioEntry]:
+        """Returns the SabioEntry instances of the EC code (which are created at the first access).
+
+        Args:
+            ec_code (str): The EC code.
+
+        Raises:
+            KeyError: There are no entries for the EC code.
+
+        Returns:
+            list[SabioEntry]: The EC code's entries in their original order.
+        """
+        if ec_code not in self._entry_cache:
+            start, stop = self.ec_code_slices[ec_code]
+            self._entry_cache[ec_code] = [
+                self._get_entry(row_index) for row_index in range(start, stop)
+            ]
+        return self._entry_cache[ec_code]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over all EC codes.
+
+        Returns:
+            Iterator[str]: The EC code iterator.
+        """
+        return iter(self.ec_code_slices)
+
+    def __len__(self) -> int:
+        """Returns the number of EC codes.
+
+        Returns:
+            int: The number of EC codes.
+        """
+        return len(self.ec_code_slices)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Returns the state for pickling, without already created SabioEntry instances.
+
+        Returns:
+            dict[str, Any]: The pickled state.
+        """
+        return {**self.__dict__, "_entry_cache": {}}
+
+    def _get_entry(self, row_index: int) -> SabioEntry:
+        """Creates the SabioEntry of the given column row.
+
+        Args:
+            row_index (int): The row in the columns.
+
+        Returns:
+            SabioEntry: The entry.
+        """
+        temperature = float(self.columns["temperature"][row_index])
+        ph = float(self.columns["ph"][row_index])
+        return SabioEntry(
+            entry_id=int(self.columns["entry_id"][row_index]),
+            is_recombinant=bool(self.columns["is_recombinant"][row_index]),
+            kinetics_mechanism_type=self.columns["kinetics_mechanism_type"][row_index],
+            organism=self.columns["organism"][row_index],
+            temperature=None if isnan(temperature) else temperature,
+            ph=None if isnan(ph) else ph,
+            parameter_value=float(self.columns["parameter_value"][row_index]),
+            parameter_unit=self.columns["parameter_unit"][row_index],
+            parameter_associated_species=self.columns["parameter_associated_species"][
+                row_index
+            ],
+            substrates=self.columns["substrates"][row_index].split(";"),
+            products=self.columns["products"][row_index].split(";"),
+            chebi_ids=self.columns["chebi_ids"][row_index].split(";"),
+        )
+
+
 class SabioThread(threading.Thread):
     """Represents a single Sabio-RK connection, ready for multi-threading (on one CPU core) using the threading module"""
 
@@ -111,31 +281,9 @@ class SabioThread(threading.Thread):
         Constructs a query string, sends a POST request to the SABIO-RK web service,
         and writes the response to a file in the temporary folder.
         """
-        query_numbers = " OR ".join(
-            [str(i + 1) for i in range(self.start_number, self.end_number + 1)]
-        )
-        query_dict = {"EntryID": f"({query_numbers})"}
-        query_string = " AND ".join([f"{k}:{v}" for k, v in query_dict.items()])
-        query_string += ' AND Parametertype:("activation constant" OR "Ki" OR "kcat" OR "km" OR "Hill coefficient") AND EnzymeType:"wildtype"'
-        query = {
-            "fields[]": [
-                "EntryID",
-                "Organism",
-                "IsRecombinant",
-                "ECNumber",
-                "KineticMechanismType",
-                "SabioCompoundID",
-                "ChebiID",
-                "Parameter",
-                "Substrate",
-                "Product",
-                "Temperature",
-                "pH",
-            ],
-            "q": query_string,
-        }
+        query = _get_sabio_query(self.start_number, self.end_number)
         request = requests.post(
-            "http://sabiork.h-its.org/sabioRestWebServices/kineticlawsExportTsv",
+            SABIO_RK_TSV_URL,
             params=query,
             timeout=1e6,
         )
@@ -147,8 +295,104 @@ class SabioThread(threading.Thread):
 
 
 # "PRIVATE" FUNCTIONS SECTION #
+async def _download_sabio_chunk(
+    temp_folder: str,
+    start_number: int,
+    end_number: int,
+    sabio_url: str,
+    semaphore: asyncio.Semaphore,
+    token_bucket: AsyncTokenBucket,
+    max_retries: int,
+    backoff_seconds: float,
+    request_timeout: float,
+) -> None:
+    """Downloads a single SABIO-RK TSV chunk (if it is not already downloaded) and writes it atomically.
+
+    Args:
+        temp_folder (str): The folder of the chunk files.
+        start_number (int): The chunk's first entry number (0-based).
+        end_number (int): The chunk's last entry number (0-based).
+        sabio_url (str): The SABIO-RK TSV export web service URL.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
+        token_bucket (AsyncTokenBucket): Limits the rate of started requests.
+        max_retries (int): Maximal number of retries of a failed request.
+        backoff_seconds (float): Waiting time before the first retry, which is doubled for each further retry.
+        request_timeout (float): Timeout of a single request in seconds.
+
+    Raises:
+        requests.RequestException: The request still failed after all retries.
+    """
+    chunk_path = f"{temp_folder}zzz{start_number}.txt"
+    if exists(chunk_path):
+        return
+    query = _get_sabio_query(start_number, end_number)
+    for retry in range(max_retries + 1):
+        try:
+            async with semaphore:
+                await token_bucket.acquire()
+                request = await asyncio.to_thread(
+                    requests.post, sabio_url, params=query, timeout=request_timeout
+                )
+            request.raise_for_status()
+            break
+        except requests.RequestException:
+            if retry == max_retries:
+                print(
+                    f"ERROR: SABIO-RK entries {start_number + 1} to {end_number + 1} could not be downloaded!"
+                )
+                raise
+            await asyncio.sleep(backoff_seconds * 2**retry)
+
+    # Write to a temporary file first so that an interrupted write is never taken as downloaded chunk
+    with open(f"{chunk_path}.tmp", "w", encoding="utf-8") as f:  # noqa: FURB103
+        f.write(request.text)
+    os.replace(f"{chunk_path}.tmp", chunk_path)
+
+
+async def _download_sabio_chunks(
+    temp_folder: str,
+    start_and_end_numbers: list[tuple[int, int]],
+    sabio_url: str,
+    max_concurrency: int,
+    requests_per_second: float,
+    max_retries: int,
+    backoff_seconds: float,
+    request_timeout: float,
+) -> None:
+    """Concurrently downloads all given SABIO-RK TSV chunks (see _download_sabio_chunk).
+
+    Args:
+        temp_folder (str): The folder of the chunk files.
+        start_and_end_numbers (list[tuple[int, int]]): The first and last entry numbers of all chunks.
+        sabio_url (str): The SABIO-RK TSV export web service URL.
+        max_concurrency (int): Maximal number of concurrent requests.
+        requests_per_second (float): Maximal average number of started requests per second.
+        max_retries (int): Maximal number of retries of a failed request.
+        backoff_seconds (float): Waiting time before the first retry, which is doubled for each further retry.
+        request_timeout (float): Timeout of a single request in seconds.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    token_bucket = AsyncTokenBucket(requests_per_second)
+    await asyncio.gather(
+        *[
+            _download_sabio_chunk(
+                temp_folder,
+                start_number,
+                end_number,
+                sabio_url,
+                semaphore,
+                token_bucket,
+                max_retries,
+                backoff_seconds,
+                request_timeout,
+            )
+            for start_number, end_number in start_and_end_numbers
+        ]
+    )
+
+
 def _get_ec_code_entries(
-    sabio_entries: dict[str, list[SabioEntry]],
+    sabio_entries: Mapping[str, list[SabioEntry]],
     reac_ec_codes: list[str],
     min_ph: float,
     max_ph: float,
@@ -159,11 +403,12 @@ def _get_ec_code_entries(
     substrate_bigg_ids: list[str],
     product_bigg_ids: list[str],
     name_to_bigg_id_dict: dict[str, str],
+    normalized_name_to_bigg_id_dict: dict[str, str],
 ) -> list[SabioEntry]:
     """Filters SABIO-RK entries based on EC codes, pH, temperature, and substrate/product BIGG IDs.
 
     Args:
-        sabio_entries (dict[str, list[SabioEntry]]): Dictionary of SabioEntry instances keyed by EC code.
+        sabio_entries (Mapping[str, list[SabioEntry]]): Mapping of SabioEntry instances keyed by EC code.
         reac_ec_codes (list[str]): List of reaction EC codes to filter by.
         min_ph (float): Minimum pH value for filtering.
         max_ph (float): Maximum pH value for filtering.
@@ -174,16 +419,15 @@ def _get_ec_code_entries(
         substrate_bigg_ids (list[str]): List of substrate BIGG IDs to filter by.
         product_bigg_ids (list[str]): List of product BIGG IDs to filter by.
         name_to_bigg_id_dict (dict[str, str]): Dictionary mapping compound names to BIGG IDs.
+        normalized_name_to_bigg_id_dict (dict[str, str]): The same mapping with all missing name additions
+            (see _get_normalized_name_to_bigg_id_dict).
 
     Returns:
         list[SabioEntry]: List of filtered SabioEntry instances.
     """
     ec_code_entries = []
-    for ec_code, sabio_entry_list in sabio_entries.items():
-        for sabio_entry in sabio_entry_list:
-            if ec_code not in reac_ec_codes:
-                continue
-
+    for ec_code in dict.fromkeys(reac_ec_codes):
+        for sabio_entry in sabio_entries.get(ec_code, []):
             # Check temperature
             if not accept_nan_temperature:  # noqa: SIM102
                 if (
@@ -210,6 +454,7 @@ def _get_ec_code_entries(
                     bigg_id="",
                     entry=sabio_entry,
                     name_to_bigg_id_dict=name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict=normalized_name_to_bigg_id_dict,
                 )
                 if substrate_bigg_id in substrate_bigg_ids:
                     correct_direction = True
@@ -221,6 +466,7 @@ def _get_ec_code_entries(
                         bigg_id="",
                         entry=sabio_entry,
                         name_to_bigg_id_dict=name_to_bigg_id_dict,
+                        normalized_name_to_bigg_id_dict=normalized_name_to_bigg_id_dict,
                     )
                     if product_bigg_id in product_bigg_ids:
                         correct_direction = True
@@ -233,22 +479,17 @@ def _get_ec_code_entries(
     return ec_code_entries
 
 
-def _get_sabio_tsv_str(target_folder: str) -> str:
-    """Retrieves the SABIO-RK TSV string from the target folder.
+def _ensure_sabio_tsv_zip(target_folder: str) -> str:
+    """Ensures that the zipped SABIO-RK TSV exists in the target folder and returns its path.
 
-    If the a zipped TSV cache does not exist, it downloads the data in threaded SabioThread instances,
+    If the zipped TSV cache does not exist, it downloads the data with download_sabio_rk_tsvs,
     processes it, and stores it in a zip file cache.
 
     Args:
         target_folder (str): The path to the folder where the TSV file or zip file should be stored.
 
     Returns:
-        str: The content of the SABIO-RK TSV file as a string.
-
-    Example:
-        target_folder = "/path/to/target/folder"
-        tsv_str = _get_sabio_tsv_str(target_folder)
-        print(tsv_str)
+        str: The path of the zipped SABIO-RK TSV.
     """
     target_folder = standardize_folder(target_folder)
     ensure_folder_existence(target_folder)
@@ -256,25 +497,11 @@ def _get_sabio_tsv_str(target_folder: str) -> str:
     tsv_zip_filename = f"{target_folder}sabio_full_tsv.zip"
     sabio_tsv_filename = "sabio.tsv"
 
-    starts = [0 + 250 * i for i in range(80_000 // 250)]
-
     if not exists(zip_filename):
         print("READING OUT SABIO-RK ONLINE...")
 
         temp_folder = f"{target_folder}sabiotemp/"
-        ensure_folder_existence(temp_folder)
-
-        start_and_end_numbers = [(start, start + 249) for start in starts]
-
-        threads = [
-            SabioThread(temp_folder, start_number, end_number)
-            for start_number, end_number in start_and_end_numbers
-        ]
-        for thread in threads:
-            thread.start()
-            sleep(2.0)
-        for thread in threads:
-            thread.join()
+        download_sabio_rk_tsvs(temp_folder)
 
         tsv_filenames = get_files(temp_folder)
         with ZipFile(zip_filename, "w", ZIP_LZMA) as zipf:
@@ -305,6 +532,62 @@ def _get_sabio_tsv_str(target_folder: str) -> str:
                 sabio_tsv_filename, StringIO("\n".join(full_tsv_lines)).getvalue()
             )
 
+    return tsv_zip_filename
+
+
+def _get_sabio_query(start_number: int, end_number: int) -> dict[str, Any]:
+    """Returns the SABIO-RK TSV export query parameters for the given (0-based) entry number range.
+
+    Args:
+        start_number (int): The first entry number (0-based).
+        end_number (int): The last entry number (0-based).
+
+    Returns:
+        dict[str, Any]: The query parameters.
+    """
+    query_numbers = " OR ".join(
+        [str(i + 1) for i in range(start_number, end_number + 1)]
+    )
+    query_dict = {"EntryID": f"({query_numbers})"}
+    query_string = " AND ".join([f"{k}:{v}" for k, v in query_dict.items()])
+    query_string += ' AND Parametertype:("activation constant" OR "Ki" OR "kcat" OR "km" OR "Hill coefficient") AND EnzymeType:"wildtype"'
+    return {
+        "fields[]": [
+            "EntryID",
+            "Organism",
+            "IsRecombinant",
+            "ECNumber",
+            "KineticMechanismType",
+            "SabioCompoundID",
+            "ChebiID",
+            "Parameter",
+            "Substrate",
+            "Product",
+            "Temperature",
+            "pH",
+        ],
+        "q": query_string,
+    }
+
+
+def _get_sabio_tsv_str(target_folder: str) -> str:
+    """Retrieves the SABIO-RK TSV string from the target folder.
+
+    If the zipped TSV does not exist, it is created with _ensure_sabio_tsv_zip.
+
+    Args:
+        target_folder (str): The path to the folder where the TSV file or zip file should be stored.
+
+    Returns:
+        str: The content of the SABIO-RK TSV file as a string.
+
+    Example:
+        target_folder = "/path/to/target/folder"
+        tsv_str = _get_sabio_tsv_str(target_folder)
+        print(tsv_str)
+    """
+    tsv_zip_filename = _ensure_sabio_tsv_zip(target_folder)
+    sabio_tsv_filename = "sabio.tsv"
     with ZipFile(tsv_zip_filename, "r") as zipf:  # noqa: SIM117
         with zipf.open(sabio_tsv_filename) as file:
             tsv_content = file.read().decode("utf-8")
@@ -312,19 +595,65 @@ def _get_sabio_tsv_str(target_folder: str) -> str:
     return tsv_content.replace("\r", "")
 
 
+def _get_normalized_name_to_bigg_id_dict(
+    name_to_bigg_id_dict: dict[str, str],
+) -> dict[str, str]:
+    """Returns a metabolite name -> BiGG ID dictionary which already includes all missing name additions.
+
+    For each name, the returned dictionary contains the BiGG ID that _search_metname_in_bigg_ids would
+    find by trying all combinations of SABIO_MISSING_NAME_ADDITIONS_FRONT and SABIO_MISSING_NAME_ADDITIONS_END
+    (names for which nothing is found are not included). Thereby, all these combinations are only
+    computed once, by splitting each known name into all fitting addition combinations.
+
+    Args:
+        name_to_bigg_id_dict (dict[str, str]): The metabolite name -> BiGG ID dictionary.
+
+    Returns:
+        dict[str, str]: The normalized metabolite name -> BiGG ID dictionary.
+    """
+    # As in the loops of _search_metname_in_bigg_ids, later end additions have
+    # a higher priority than earlier ones, and earlier front additions than later ones.
+    best_priorities: dict[str, tuple[int, int]] = {}
+    normalized_name_to_bigg_id_dict: dict[str, str] = {}
+    for name, bigg_id in name_to_bigg_id_dict.items():
+        for end_index, missing_addition_end in enumerate(
+            SABIO_MISSING_NAME_ADDITIONS_END
+        ):
+            if not name.endswith(missing_addition_end):
+                continue
+            name_without_end = name[: len(name) - len(missing_addition_end)]
+            for front_index, missing_addition_front in enumerate(
+                SABIO_MISSING_NAME_ADDITIONS_FRONT
+            ):
+                if not name_without_end.startswith(missing_addition_front):
+                    continue
+                met_id = name_without_end[len(missing_addition_front) :]
+                priority = (end_index, -front_index)
+                if priority > best_priorities.get(met_id, (-1, 0)):
+                    best_priorities[met_id] = priority
+                    normalized_name_to_bigg_id_dict[met_id] = bigg_id
+    return normalized_name_to_bigg_id_dict
+
+
 def _search_metname_in_bigg_ids(
     met_id: str,
     bigg_id: str,
     entry: SabioEntry,
     name_to_bigg_id_dict: dict[str, str],
+    normalized_name_to_bigg_id_dict: dict[str, str] | None = None,
 ) -> str:
     entry_bigg_id: str = ""
-    for missing_addition_end in ["", "1", "__L", "__D"]:
-        for missing_addition_front in ["", "alpha-", "beta-", "l-", "d-"]:
-            addition_name = f"{missing_addition_front}{met_id}{missing_addition_end}"
-            if addition_name in name_to_bigg_id_dict:
-                entry_bigg_id = name_to_bigg_id_dict[addition_name]
-                break
+    if normalized_name_to_bigg_id_dict is not None:
+        entry_bigg_id = normalized_name_to_bigg_id_dict.get(met_id, "")
+    else:
+        for missing_addition_end in SABIO_MISSING_NAME_ADDITIONS_END:
+            for missing_addition_front in SABIO_MISSING_NAME_ADDITIONS_FRONT:
+                addition_name = (
+                    f"{missing_addition_front}{met_id}{missing_addition_end}"
+                )
+                if addition_name in name_to_bigg_id_dict:
+                    entry_bigg_id = name_to_bigg_id_dict[addition_name]
+                    break
     if bigg_id:
         for chebi_id in entry.chebi_ids:
             if chebi_id in name_to_bigg_id_dict:
@@ -335,84 +664,151 @@ def _search_metname_in_bigg_ids(
 
 
 # "PUBLIC" FUNCTIONS SECTION #
+def download_sabio_rk_tsvs(
+    temp_folder: str,
+    max_concurrency: int = 8,
+    requests_per_second: float = 0.5,
+    max_retries: int = 5,
+    backoff_seconds: float = 5.0,
+    request_timeout: float = 600.0,
+    max_entry_number: int = SABIO_RK_MAX_ENTRY_NUMBER,
+    entries_per_request: int = SABIO_RK_ENTRIES_PER_REQUEST,
+    sabio_url: str = SABIO_RK_TSV_URL,
+) -> None:
+    """Downloads all SABIO-RK entries as TSV chunk files ('zzz$START_NUMBER.txt') into the given folder.
+
+    The chunks are downloaded with asyncio, with at most max_concurrency concurrent requests and
+    at most requests_per_second started requests per second (on average). Failed requests are retried
+    with exponential backoff. Each chunk file is written atomically, and chunks which already exist in
+    the folder are not downloaded again, i.e., an interrupted or failed download resumes when this
+    function is called again with the same folder. Within a running event loop (e.g., in a Jupyter
+    notebook), the download runs in a separate thread (see utilities.run_coroutine).
+
+    Args:
+        temp_folder (str): The folder of the chunk files, which is created if it does not exist.
+        max_concurrency (int, optional): Maximal number of concurrent requests. Defaults to 8.
+        requests_per_second (float, optional): Maximal average number of started requests per second. Defaults to 0.5.
+        max_retries (int, optional): Maximal number of retries of a failed request. Defaults to 5.
+        backoff_seconds (float, optional): Waiting time before the first retry, which is doubled for each further retry.
+            Defaults to 5.0.
+        request_timeout (float, optional): Timeout of a single request in seconds. Defaults to 600.0.
+        max_entry_number (int, optional): Number of SABIO-RK entry IDs that are queried. Defaults to SABIO_RK_MAX_ENTRY_NUMBER.
+        entries_per_request (int, optional): Number of entry IDs per request (and chunk). Defaults to SABIO_RK_ENTRIES_PER_REQUEST.
+        sabio_url (str, optional): The SABIO-RK TSV export web service URL. Defaults to SABIO_RK_TSV_URL.
+
+    Raises:
+        requests.RequestException: A chunk still failed after all retries (all other chunks are kept).
+    """
+    temp_folder = standardize_folder(temp_folder)
+    ensure_folder_existence(temp_folder)
+    start_and_end_numbers = [
+        (start_number, min(start_number + entries_per_request, max_entry_number) - 1)
+        for start_number in range(0, max_entry_number, entries_per_request)
+    ]
+    run_coroutine(
+        _download_sabio_chunks(
+            temp_folder,
+            start_and_end_numbers,
+            sabio_url,
+            max_concurrency,
+            requests_per_second,
+            max_retries,
+            backoff_seconds,
+            request_timeout,
+        )
+    )
+
+
 def get_full_sabio_dict(sabio_target_folder: str) -> SabioDict:
     """Parses a SABIO-RK web query TSV file from the target folder to create a SabioDict instance containing SABIO-RK entries.
 
+    The parsed SabioDict is cached as pickle file in the target folder. This cache is bound to the SHA-256 hash of
+    the zipped TSV, i.e., it is only used as long as the TSV does not change. The SabioDict's entries are
+    SabioEntryColumns mappings, which create SabioEntry instances only for the EC codes which are accessed.
+
     Args:
         sabio_target_folder (str): The path to the folder containing the TSV file.
 
     Returns:
         SabioDict: A SabioDict instance whichm in turn, contains SabioEntry instances
     """
-    tsv_str = _get_sabio_tsv_str(sabio_target_folder)
+    sabio_target_folder = standardize_folder(sabio_target_folder)
+    sha256_hash = hashlib.sha256()
+    with open(_ensure_sabio_tsv_zip(sabio_target_folder), "rb") as tsv_zip_file:
+        for chunk in iter(lambda: tsv_zip_file.read(1 << 20), b""):
+            sha256_hash.update(chunk)
+    cache_filename = f"sabio_dict_{sha256_hash.hexdigest()}.pickle"
+    if exists(f"{sabio_target_folder}{cache_filename}"):
+        return pickle_load(f"{sabio_target_folder}{cache_filename}")
 
+    tsv_str = _get_sabio_tsv_str(sabio_target_folder)
     tsv_lines = tsv_str.split("\n")
     titles = tsv_lines[0].split("\t")
-    del tsv_lines[0]
-
-    sabio_dict = SabioDict({}, {}, {}, {}, {})
-    for tsv_line in tsv_lines:
+    column_index: dict[str, int] = {}
+    for title_index, title in enumerate(titles):
+        column_index.setdefault(title, title_index)
+    temperature_index = column_index.get("Temperature", len(titles))
+    ph_index = column_index.get("pH", len(titles))
+
+    field_rows: dict[str, dict[str, list[tuple[Any, ...]]]] = {
+        field_name: {} for field_name in SABIO_PARAMETER_TYPE_FIELDS.values()
+    }
+    for tsv_line in tsv_lines[1:]:
         line = tsv_line.split("\t")
 
-        parameter_value_str = line[titles.index("parameter.startValue")]
+        parameter_value_str = line[column_index["parameter.startValue"]]
         if not parameter_value_str:
             continue
         parameter_value = float(parameter_value_str)
         if parameter_value <= 0.0:
             continue  # There is no kinetic parameter that is just 0 or below
 
-        parameter_type_str = line[titles.index("parameter.type")]
-        match parameter_type_str.lower():
-            case "kcat":
-                sabio_dict_pointer = sabio_dict.kcat_entries
-            case "km":
-                sabio_dict_pointer = sabio_dict.km_entries
-            case "ki":
-                sabio_dict_pointer = sabio_dict.ki_entries
-            case "activation constant":
-                sabio_dict_pointer = sabio_dict.ka_entries
-            case "hill coefficient":
-                sabio_dict_pointer = sabio_dict.hill_entries
-            case _:
-                continue
+        field_name = SABIO_PARAMETER_TYPE_FIELDS.get(
+            line[column_index["parameter.type"]].lower()
+        )
+        if field_name is None:
+            continue
 
-        ec_number = line[titles.index("ECNumber")]
-        entry_id = int(line[titles.index("EntryID")])
-        organism = line[titles.index("Organism")]
-        is_recombinant = line[titles.index("IsRecombinant")].lower() == "true"
-        kinetics_mechanism_type = line[titles.index("KineticMechanismType")]
-        parameter_unit = line[titles.index("parameter.unit")]
-        parameter_associated_species = line[titles.index("parameter.associatedSpecies")]
-        substrates = line[titles.index("Substrate")].split(";")
-        products = line[titles.index("Product")].split(";")
-        chebi_ids = line[titles.index("ChebiID")].split(";")
         try:
-            temperature = float(line[titles.index("Temperature")])
+            temperature = float(line[temperature_index])
         except (ValueError, IndexError):
-            temperature = None
+            temperature = float("nan")
         try:
-            ph = float(line[titles.index("pH")])
+            ph = float(line[ph_index])
         except (ValueError, IndexError):
-            ph = None
-
-        if ec_number not in sabio_dict_pointer:
-            sabio_dict_pointer[ec_number] = []
-        sabio_dict_pointer[ec_number].append(
-            SabioEntry(
-                entry_id=entry_id,
-                is_recombinant=is_recombinant,
-                kinetics_mechanism_type=kinetics_mechanism_type,
-                organism=organism,
-                temperature=temperature,
-                ph=ph,
-                parameter_unit=parameter_unit,
-                parameter_value=parameter_value,
-                parameter_associated_species=parameter_associated_species,
-                substrates=substrates,
-                products=products,
-                chebi_ids=chebi_ids,
+            ph = float("nan")
+
+        ec_number = line[column_index["ECNumber"]]
+        if ec_number not in field_rows[field_name]:
+            field_rows[field_name][ec_number] = []
+        field_rows[field_name][ec_number].append(
+            (
+                int(line[column_index["EntryID"]]),
+                line[column_index["IsRecombinant"]].lower() == "true",
+                line[column_index["KineticMechanismType"]],
+                line[column_index["Organism"]],
+                temperature,
+                ph,
+                parameter_value,
+                line[column_index["parameter.unit"]],
+                line[column_index["parameter.associatedSpecies"]],
+                line[column_index["Substrate"]],
+                line[column_index["Product"]],
+                line[column_index["ChebiID"]],
             )
         )
+
+    sabio_dict = SabioDict(
+        **{
+            field_name: SabioEntryColumns(ec_code_rows)
+            for field_name, ec_code_rows in field_rows.items()
+        }
+    )
+    for filename in get_files(sabio_target_folder):
+        # Remove caches of outdated TSVs
+        if filename.startswith("sabio_dict_") and filename.endswith(".pickle"):
+            os.remove(f"{sabio_target_folder}{filename}")
+    pickle_write(f"{sabio_target_folder}{cache_filename}", sabio_dict)
     return sabio_dict
 
 
@@ -450,7 +846,8 @@ def sabio_select_enzyme_kinetic_data_for_model(
         cobra_model (cobra.Model): The COBRA-k model for which enzyme kinetic data is to be selected.
         sabio_target_folder (str): The path to the folder containing SABIO-RK data.
         base_species (str): The base species for taxonomy comparison.
-        ncbi_parsed_json_path (str): The path to the NCBI parsed JSON file.
+        ncbi_parsed_json_path (str): The path to the NCBI parsed JSON file or to a (faster loading) binary
+            taxonomy folder (see ncbi_taxonomy_functionality.write_ncbi_taxonomy_binary).
         bigg_metabolites_json_path (str): The path to the BIGG metabolites JSON file.
         kinetic_ignored_metabolites (list[str], optional): List of metabolites to ignore. Defaults to [].
         kinetic_ignored_enzyme_ids (list[str], optional): List of enzyme IDs to ignore. Defaults to [].
@@ -485,10 +882,13 @@ def sabio_select_enzyme_kinetic_data_for_model(
     sabio_dict = get_full_sabio_dict(
         sabio_target_folder,
     )
-    ncbi_parsed_json_data = json_zip_load(ncbi_parsed_json_path)
+    ncbi_taxonomy_index = load_ncbi_taxonomy_index(ncbi_parsed_json_path)
     name_to_bigg_id_dict: dict[str, str] = json_load(
         bigg_metabolites_json_path, dict[str, str]
     )
+    normalized_name_to_bigg_id_dict = _get_normalized_name_to_bigg_id_dict(
+        name_to_bigg_id_dict
+    )
 
     # Get reaction<->enzyme reaction data mapping
     enzyme_reaction_data: dict[str, EnzymeReactionData | None] = {}
@@ -547,6 +947,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                     substrate_bigg_ids,
                     product_bigg_ids,
                     name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict,
                 ),
             ),
             (
@@ -563,6 +964,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                     substrate_bigg_ids,
                     product_bigg_ids,
                     name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict,
                 ),
             ),
             (
@@ -579,6 +981,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                     substrate_bigg_ids,
                     product_bigg_ids,
                     name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict,
                 ),
             ),
             (
@@ -595,6 +998,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                     substrate_bigg_ids,
                     product_bigg_ids,
                     name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict,
                 ),
             ),
             (
@@ -611,6 +1015,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                     substrate_bigg_ids,
                     product_bigg_ids,
                     name_to_bigg_id_dict,
+                    normalized_name_to_bigg_id_dict,
                 ),
             ),
         )
@@ -637,12 +1042,9 @@ def sabio_select_enzyme_kinetic_data_for_model(
                         case _:
                             continue
 
-                    taxonomy_dict = get_taxonomy_dict_from_nbci_taxonomy(
-                        [base_species, entry.organism], ncbi_parsed_json_data
-                    )
-                    taxonomy_score = get_taxonomy_scores(base_species, taxonomy_dict)[
-                        entry.organism
-                    ]
+                    taxonomy_score = ncbi_taxonomy_index.get_taxonomic_distances(
+                        base_species, [entry.organism]
+                    )[entry.organism]
                     if taxonomy_score > max_taxonomy_level:
                         continue
                     if taxonomy_score not in k_cat_per_tax_score:
@@ -696,6 +1098,7 @@ def sabio_select_enzyme_kinetic_data_for_model(
                                 bigg_id="",
                                 entry=entry,
                                 name_to_bigg_id_dict=name_to_bigg_id_dict,
+                                normalized_name_to_bigg_id_dict=normalized_name_to_bigg_id_dict,
                             )
                             if not entry_bigg_id:
                                 continue
@@ -713,11 +1116,8 @@ def sabio_select_enzyme_kinetic_data_for_model(
                                 applier = lambda x: x  # noqa: E731
                             case _:  # unknown unit
                                 continue
-                        taxonomy_dict = get_taxonomy_dict_from_nbci_taxonomy(
-                            [base_species, entry.organism], ncbi_parsed_json_data
-                        )
-                        taxonomy_score = get_taxonomy_scores(
-                            base_species, taxonomy_dict
+                        taxonomy_score = ncbi_taxonomy_index.get_taxonomic_distances(
+                            base_species, [entry.organism]
                         )[entry.organism]
                         if taxonomy_score > max_taxonomy_level:
                             continue
@@ -4,7 +4,9 @@ Functions for the generation of a model's mapping of its proteins and their mass
 """
 
 # IMPORTS SECTION #
-import time
+import asyncio
+import os
+import re
 from typing import Any
 
 import cobra
@@ -12,23 +14,281 @@ import requests
 from pydantic import ConfigDict, validate_call
 
 from .io import ensure_folder_existence, json_load, json_write, standardize_folder
+from .utilities import AsyncTokenBucket, run_coroutine
 
+# CONSTANTS SECTION #
+UNIPROT_SEARCH_URL = "https://rest.uniprot.org/uniprotkb/search"
+"""UniProt's REST API endpoint for UniProtKB searches"""
+UNIPROT_MAX_RESULTS_PER_REQUEST = 500
+"""Maximal number of results of a UniProtKB search request (further results are on the following result pages)"""
+UNIPROT_ACCESSION_REGEX = re.compile(
+    r"[OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9]([A-Z][A-Z0-9]{2}[0-9]){1,2}"
+)
+"""UniProt's format of (primary and secondary) accession IDs such as 'P12345'"""
+AVERAGE_AMINO_ACID_RESIDUE_MASSES: dict[str, float] = {
+    "A": 71.0788,
+    "R": 156.1875,
+    "N": 114.1038,
+    "D": 115.0886,
+    "C": 103.1388,
+    "E": 129.1155,
+    "Q": 128.1307,
+    "G": 57.0519,
+    "H": 137.1411,
+    "I": 113.1594,
+    "L": 113.1594,
+    "K": 128.1741,
+    "M": 131.1926,
+    "F": 147.1766,
+    "P": 97.1167,
+    "S": 87.0782,
+    "T": 101.1051,
+    "W": 186.2132,
+    "Y": 163.1760,
+    "V": 99.1326,
+    "U": 150.0388,
+    "O": 237.3018,
+    "B": 114.5962,
+    "Z": 128.6231,
+}
+"""Average amino acid residue masses in Da (unknown one-letter codes such as 'X' are not counted)"""
+WATER_AVERAGE_MASS = 18.01524
+"""Average mass of water in Da, which is added once per protein sequence"""
 
-# FUNCTIONS SECTION #
+
+# "PRIVATE" FUNCTIONS SECTION #
+def _get_uniprot_query_term(uniprot_id: str) -> str:
+    """Returns the UniProtKB search query term which only finds the entry with the given accession or entry ID.
+
+    Args:
+        uniprot_id (str): The UniProt accession ID (e.g. 'P12345') or entry ID (e.g. 'AATM_RABIT').
+
+    Returns:
+        str: The query term, which is a free-text term for IDs of neither format.
+    """
+    if UNIPROT_ACCESSION_REGEX.fullmatch(uniprot_id):
+        return f"accession:{uniprot_id}"
+    if "_" in uniprot_id:
+        return f"id:{uniprot_id}"
+    return uniprot_id
+
+
+async def _get_uniprot_batch_masses(
+    batch: list[str],
+    uniprot_url: str,
+    semaphore: asyncio.Semaphore,
+    token_bucket: AsyncTokenBucket,
+    max_retries: int,
+    backoff_seconds: float,
+    request_timeout: float,
+) -> dict[str, float]:
+    """Searches UniProt for a batch of UniProt IDs and returns all found masses.
+
+    All result pages of the search are read out. UniProt IDs of the batch without a found mass are reported.
+
+    Args:
+        batch (list[str]): The searched UniProt IDs.
+        uniprot_url (str): UniProt's UniProtKB search endpoint.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
+        token_bucket (AsyncTokenBucket): Limits the rate of started requests.
+        max_retries (int): Maximal number of retries of a failed request.
+        backoff_seconds (float): Waiting time before the first retry, which is doubled for each further retry.
+        request_timeout (float): Timeout of a single request in seconds.
+
+    Raises:
+        requests.RequestException: The request still failed after all retries.
+
+    Returns:
+        dict[str, float]: Accession and entry IDs of all found UniProt entries -> mass in Da.
+    """
+    # With 'OR', all given IDs are searched, and subsequently,
+    # the right associated masses are being picked.
+    query = " OR ".join(_get_uniprot_query_term(uniprot_id) for uniprot_id in batch)
+    print(f"UniProt batch search for: {query}")
+    page_url: str | None = uniprot_url
+    params: dict[str, Any] | None = {
+        "query": query,
+        "format": "tsv",
+        "fields": "accession,id,mass",
+        "size": UNIPROT_MAX_RESULTS_PER_REQUEST,
+    }
+    found_masses: dict[str, float] = {}
+    while page_url is not None:
+        for retry in range(max_retries + 1):
+            try:
+                async with semaphore:
+                    await token_bucket.acquire()
+                    response = await asyncio.to_thread(
+                        requests.get, page_url, params=params, timeout=request_timeout
+                    )
+                response.raise_for_status()
+                break
+            except requests.RequestException:
+                if retry == max_retries:
+                    print(f"ERROR: UniProt batch search for {query} failed!")
+                    raise
+                await asyncio.sleep(backoff_seconds * 2**retry)
+
+        # Read out the API-returned lines
+        for line in response.text.split("\n")[1:]:
+            if not line:
+                continue
+            line_parts = line.split("\t")
+            accession_id = line_parts[0].strip()
+            entry_id = line_parts[1].strip()
+            try:
+                # Note that the mass entry from UniProt uses a comma as a thousand separator, so it has to be removed before parsing
+                mass = float(line_parts[2].strip().replace(",", ""))
+            except (ValueError, IndexError):  # We may also risk the entry is missing
+                continue
+            found_masses[accession_id] = mass
+            found_masses[entry_id] = mass
+
+        # The URL of the next result page (which already contains all parameters) is in the 'Link' header
+        page_url = response.links.get("next", {}).get("url")
+        params = None
+
+    missing_uniprot_ids = [
+        uniprot_id for uniprot_id in batch if uniprot_id not in found_masses
+    ]
+    if missing_uniprot_ids:
+        print(f"No UniProt protein masses found for: {missing_uniprot_ids}")
+    return found_masses
+
+
+async def _get_uniprot_masses(
+    batches: list[list[str]],
+    cache_json: dict[str, float],
+    cache_filepath: str,
+    uniprot_url: str,
+    max_concurrency: int,
+    requests_per_second: float,
+    max_retries: int,
+    backoff_seconds: float,
+    request_timeout: float,
+) -> None:
+    """Concurrently searches UniProt for all batches and adds the found masses to the cache.
+
+    The cache file is rewritten after each finished batch, so that the results of finished batches
+    are kept even if later batches fail.
+
+    Args:
+        batches (list[list[str]]): The batches of searched UniProt IDs.
+        cache_json (dict[str, float]): The cache of UniProt ID -> mass in Da, which is updated in-place.
+        cache_filepath (str): The path of the cache JSON.
+        uniprot_url (str): UniProt's UniProtKB search endpoint.
+        max_concurrency (int): Maximal number of concurrent requests.
+        requests_per_second (float): Maximal average number of started requests per second.
+        max_retries (int): Maximal number of retries of a failed request.
+        backoff_seconds (float): Waiting time before the first retry, which is doubled for each further retry.
+        request_timeout (float): Timeout of a single request in seconds.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    token_bucket = AsyncTokenBucket(requests_per_second)
+    batch_tasks = [
+        asyncio.create_task(
+            _get_uniprot_batch_masses(
+                batch,
+                uniprot_url,
+                semaphore,
+                token_bucket,
+                max_retries,
+                backoff_seconds,
+                request_timeout,
+            )
+        )
+        for batch in batches
+    ]
+    try:
+        for batch_task in asyncio.as_completed(batch_tasks):
+            cache_json.update(await batch_task)
+            json_write(f"{cache_filepath}.tmp", cache_json)
+            os.replace(f"{cache_filepath}.tmp", cache_filepath)
+    finally:
+        for batch_task in batch_tasks:
+            batch_task.cancel()
+
+
+def _get_uniprot_fasta_masses(uniprot_fasta_path: str) -> dict[str, float]:
+    """Reads a (local) UniProt FASTA file and returns the average mass of each protein sequence.
+
+    The masses are calculated from the sequences with AVERAGE_AMINO_ACID_RESIDUE_MASSES
+    and rounded to full Da, as UniProt does for its 'mass' field.
+
+    Args:
+        uniprot_fasta_path (str): Path to the FASTA file with UniProt headers such as '>sp|P12345|AATM_RABIT ...'.
+
+    Returns:
+        dict[str, float]: Accession and entry IDs of all proteins in the FASTA -> mass in Da.
+    """
+    fasta_masses: dict[str, float] = {}
+
+    def add_protein(protein_ids: list[str], sequence_mass: float) -> None:
+        for protein_id in protein_ids:
+            fasta_masses[protein_id] = float(round(sequence_mass + WATER_AVERAGE_MASS))
+
+    protein_ids: list[str] = []
+    sequence_mass = 0.0
+    with open(uniprot_fasta_path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(">"):
+                if protein_ids:
+                    add_protein(protein_ids, sequence_mass)
+                header_parts = line[1:].split(maxsplit=1)[0].split("|")
+                protein_ids = (
+                    header_parts[1:3] if len(header_parts) >= 3 else header_parts
+                )
+                sequence_mass = 0.0
+            else:
+                sequence_mass += sum(
+                    AVERAGE_AMINO_ACID_RESIDUE_MASSES.get(amino_acid, 0.0)
+                    for amino_acid in line.strip().upper()
+                )
+    if protein_ids:
+        add_protein(protein_ids, sequence_mass)
+    return fasta_masses
+
+
+# "PUBLIC" FUNCTIONS SECTION #
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
 def uniprot_get_enzyme_molecular_weights(
     model: cobra.Model,
     cache_basepath: str,
     multiplication_factor: float = 1 / 1000,
+    offline: bool = False,
+    uniprot_fasta_path: str = "",
+    batch_size: int = 100,
+    max_concurrency: int = 4,
+    requests_per_second: float = 1.0,
+    max_retries: int = 3,
+    backoff_seconds: float = 2.0,
+    request_timeout: float = 600.0,
+    uniprot_url: str = UNIPROT_SEARCH_URL,
 ) -> dict[str, float]:
     """Returns a JSON with a mapping of protein IDs as keys, and as values the protein mass in kDa.
 
-    The protein masses are taken  from UniProt (retrieved using
-    UniProt's REST API).
+    The protein masses are taken from the cache, from an optional local UniProt FASTA file,
+    and - unless offline is True - from UniProt (retrieved using UniProt's REST API).
+    The UniProt requests are sent concurrently in batches of UniProt IDs (searched by their accession
+    or entry ID, with all result pages being read), and the cache is updated after each finished batch.
+    Within a running event loop (e.g., in a Jupyter notebook), the requests are sent from a separate thread.
 
     Arguments
     ----------
     * model: cobra.Model ~ The model in the cobrapy format
+    * cache_basepath: str ~ Base path of the UniProt mass cache JSON
+    * multiplication_factor: float ~ Factor with which the masses in Da are multiplied. Defaults to 1/1000 (i.e., kDa).
+    * offline: bool ~ If True, no UniProt requests are sent and the masses are only taken from the cache
+      and the FASTA file. Defaults to False.
+    * uniprot_fasta_path: str ~ Optional path to a local UniProt FASTA file from whose sequences masses
+      are calculated. Defaults to "" (no FASTA).
+    * batch_size: int ~ Number of UniProt IDs per request. Defaults to 100.
+    * max_concurrency: int ~ Maximal number of concurrent UniProt requests. Defaults to 4.
+    * requests_per_second: float ~ Maximal average number of started UniProt requests per second. Defaults to 1.0.
+    * max_retries: int ~ Maximal number of retries of a failed request. Defaults to 3.
+    * backoff_seconds: float ~ Waiting time before the first retry, which is doubled for each further retry. Defaults to 2.0.
+    * request_timeout: float ~ Timeout of a single request in seconds. Defaults to 600.0.
+    * uniprot_url: str ~ UniProt's UniProtKB search endpoint. Defaults to UNIPROT_SEARCH_URL.
 
     Output
     ----------
@@ -68,73 +328,49 @@ def uniprot_get_enzyme_molecular_weights(
         cache_json = json_load(cache_filepath, Any)
     except Exception:
         cache_json = {}
+    fasta_masses = (
+        _get_uniprot_fasta_masses(uniprot_fasta_path) if uniprot_fasta_path else {}
+    )
+    # IDs which are present in the cache or in the FASTA (i.e.,
+    # which were searched for already) are not searched again.
+    missing_uniprot_ids: list[str] = []
+    for uniprot_id in uniprot_id_protein_id_mapping:
+        if uniprot_id in cache_json:
+            uniprot_id_protein_mass_mapping[uniprot_id] = cache_json[uniprot_id]
+        elif uniprot_id in fasta_masses:
+            uniprot_id_protein_mass_mapping[uniprot_id] = fasta_masses[uniprot_id]
+        else:
+            missing_uniprot_ids.append(uniprot_id)
+
     # Go through each batch of UniProt IDs (multiple UniProt IDs
     # are searched at once in order to save an amount of UniProt API calls)
-    # and retrieve the amino acid sequences and using these sequences, their
-    # masses.
-    print("Starting UniProt ID<->Protein mass search using UniProt API...")
-    uniprot_ids = list(uniprot_id_protein_id_mapping.keys())
-    batch_size = 15
-    batch_start = 0
-    while batch_start < len(uniprot_ids):
-        # Create the batch with all UniProt IDs
-        prebatch = uniprot_ids[batch_start : batch_start + batch_size]
-        batch = []
-        # Remove all IDs which are present in the cache (i.e.,
-        # which were searched for already).
-        # The cache consists of pickled protein mass floats, each
-        # onein a file with the name of the associated protein.
-        for uniprot_id in prebatch:
-            if uniprot_id not in cache_json:
-                batch.append(uniprot_id)
-            else:
+    # and retrieve their masses.
+    if offline:
+        if missing_uniprot_ids:
+            print(
+                f"Offline mode: No protein masses found for {len(missing_uniprot_ids)} UniProt IDs"
+            )
+    elif missing_uniprot_ids:
+        print("Starting UniProt ID<->Protein mass search using UniProt API...")
+        run_coroutine(
+            _get_uniprot_masses(
+                [
+                    missing_uniprot_ids[batch_start : batch_start + batch_size]
+                    for batch_start in range(0, len(missing_uniprot_ids), batch_size)
+                ],
+                cache_json,
+                cache_filepath,
+                uniprot_url,
+                max_concurrency,
+                requests_per_second,
+                max_retries,
+                backoff_seconds,
+                request_timeout,
+            )
+        )
+        for uniprot_id in missing_uniprot_ids:
+            if uniprot_id in cache_json:
                 uniprot_id_protein_mass_mapping[uniprot_id] = cache_json[uniprot_id]
-                # print(uniprot_id + ":", uniprot_id_protein_mass_mapping[uniprot_id])
-
-        # If all IDs could be found in the cache, continue with the next batch.
-        if len(batch) == 0:
-            batch_start += batch_size
-            continue
-
-        # Create the UniProt query for the batch
-        # With 'OR', all given IDs are searched, and subsequently in this script,
-        # the right associated masses are being picked.
-        query = " OR ".join(batch)
-        uniprot_query_url = f"https://rest.uniprot.org/uniprotkb/search?query={query}&format=tsv&fields=accession,id,mass"
-        print(f"UniProt batch search for: {query}")
-
-        # Call UniProt's API :-)
-        uniprot_data = requests.get(uniprot_query_url, timeout=1e6).text.split("\n")
-        # Wait in order to cool down their server :-)
-        time.sleep(2.0)
-
-        # Read out the API-returned lines
-        found_ids = []
-        for line in uniprot_data[1:]:
-            if not line:
-                continue
-            accession_id = line.split("\t")[0].lstrip().rstrip()
-            entry_id = line.split("\t")[1].lstrip().rstrip()
-            mass_string = line.split("\t")[2].lstrip().rstrip()
-            try:
-                # Note that the mass entry from UniProt uses a comma as a thousand separator, so it has to be removed before parsing
-                mass = float(mass_string.replace(",", ""))
-            except ValueError:  # We may also risk the entry is missing
-                # print(f"No protein mass obtainable for protein ID {uniprot_id}")
-                continue
-            uniprot_id_protein_mass_mapping[accession_id] = float(mass)
-            uniprot_id_protein_mass_mapping[entry_id] = float(mass)
-            found_ids.extend((accession_id, entry_id))
-
-        # Create the pickled cache files for the searched protein masses
-        for uniprot_id in found_ids:
-            if (
-                uniprot_id in uniprot_id_protein_mass_mapping
-            ):  # Takes into account that we may fail to obtain a UniProt ID
-                cache_json[uniprot_id] = uniprot_id_protein_mass_mapping[uniprot_id]
-
-        # Continue with the next batch :D
-        batch_start += batch_size
 
     # Create the final protein ID <-> mass mapping
     protein_id_mass_mapping: dict[str, float] = {}
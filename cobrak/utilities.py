@@ -4,13 +4,21 @@ This module does not include I/O functions which are found in COBRAk's "io" modu
 """
 
 # IMPORT SECTION #
+import asyncio
 import os
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
 from copy import deepcopy
 from random import choice
 from statistics import mean, median
+from time import monotonic, time
 from typing import Any, TypeVar
 
 import numpy as np
+from joblib import Parallel, cpu_count, delayed
+from joblib.executor import get_memmapping_executor
 from numpy import array, exp, percentile
 from numpy.random import uniform
 from pydantic import (
@@ -67,6 +75,56 @@ from .pyomo_functionality import get_model_var_names
 T = TypeVar("T")  # Not neccessary anymore as soon as Python >= 3.12 can be used
 
 
+# CLASSES SECTION #
+class AsyncTokenBucket:
+    """A token bucket rate limiter for asyncio tasks.
+
+    The bucket is refilled with 'rate' tokens per second up to 'capacity' tokens, and each
+    acquire() call takes one token (waiting until one is available). Thereby, on average at
+    most 'rate' actions per second are started, with bursts of up to 'capacity' actions.
+
+    Attributes:
+        rate (float): Refilled tokens per second.
+        capacity (float): Maximal number of stored tokens.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Initializes the AsyncTokenBucket object with a full bucket.
+
+        Args:
+            rate (float): Refilled tokens per second. Must be > 0.
+            capacity (float, optional): Maximal number of stored tokens. Must be >= 1. Defaults to 1.0.
+
+        Raises:
+            ValueError: The rate or the capacity is too low.
+        """
+        if (rate <= 0.0) or (capacity < 1.0):
+            print(
+                f"ERROR: Token bucket rate ({rate}) must be > 0 and capacity ({capacity}) must be >= 1!"
+            )
+            raise ValueError
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill_time = monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Waits until a token is available and takes it."""
+        async with self._lock:
+            while True:
+                current_time = monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (current_time - self._last_refill_time) * self.rate,
+                )
+                self._last_refill_time = current_time
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
 # "PRIVATE" FUNCTIONS SECTION #
 @validate_call(validate_return=True)
 def _compare_two_results_with_statistics(
@@ -2639,6 +2697,22 @@ def is_any_error_term_active(correction_config: CorrectionConfig) -> bool:
     )
 
 
+@validate_call(validate_return=True)
+def is_infeasible_optimization_dict(optimization_dict: dict[str, float]) -> bool:
+    """Checks if the solver proved the optimization problem of the optimization dict to be infeasible.
+
+    In contrast to a False ALL_OK_KEY value, this excludes solver errors, time limits and other problems
+    (see get_termination_condition_from_pyomo_results).
+
+    Args:
+        optimization_dict (dict[str, float]): The optimization dict (with added statuses, see add_statuses_to_optimziation_dict).
+
+    Returns:
+        bool: True if the termination condition is 'infeasible', False otherwise.
+    """
+    return optimization_dict.get(TERMINATION_CONDITION_KEY) == 8
+
+
 @validate_call(validate_return=True)
 def is_objsense_maximization(objsense: int) -> bool:
     """Checks if the objective sense is maximization.
@@ -2714,6 +2788,71 @@ def make_kms_better_by_factor(
         reaction.enzyme_reaction_data.k_ms[product_id] *= factor
 
 
+def parallel_map_until_deadline(
+    function: Callable[..., Any],
+    arguments_list: list[tuple[Any, ...]],
+    deadline: float = float("inf"),
+    verbose: int = 0,
+    stop_condition: Callable[[Any], bool] | None = None,
+) -> tuple[list[Any], bool]:
+    """Calls the function with each of the given argument tuples in parallel processes, but only until the deadline.
+
+    Without a (finite) deadline and stop condition, this is the same as joblib's Parallel(n_jobs=-1). Otherwise, the calls
+    are submitted to joblib's reusable process executor, i.e. a free worker directly starts the next call,
+    and their results are collected until the deadline is reached or the stop condition is met. Then, all calls that did
+    not start yet are dropped and the workers of calls that are still running are terminated (together with their child
+    processes such as solvers) before this function returns. The executor is newly created with its next use.
+
+    Args:
+        function (Callable[..., Any]): The (picklable) function to call.
+        arguments_list (list[tuple[Any, ...]]): The positional arguments of each call.
+        deadline (float, optional): The deadline as time.time() timestamp. Defaults to float("inf").
+        verbose (int, optional): joblib's verbosity level (only used without a finite deadline and stop condition). Defaults to 0.
+        stop_condition (Callable[[Any], bool] | None, optional): If given, it is called (in this process) with each result in
+            the order in which the calls finish. Once it returns True, no further results are collected. Defaults to None.
+
+    Returns:
+        tuple[list[Any], bool]: The results in the order of arguments_list (None for each call that did not finish
+        or that was cancelled), and whether or not any call did not finish because the deadline was reached.
+    """
+    if (deadline == float("inf")) and (stop_condition is None):
+        results = Parallel(n_jobs=-1, verbose=verbose)(
+            delayed(function)(*arguments) for arguments in arguments_list
+        )
+        return list(results), False
+
+    executor = get_memmapping_executor(cpu_count())
+    futures = [executor.submit(function, *arguments) for arguments in arguments_list]
+    stopped = False
+    try:
+        for future in as_completed(
+            futures,
+            timeout=None if deadline == float("inf") else max(0.0, deadline - time()),
+        ):
+            if (stop_condition is not None) and stop_condition(future.result()):
+                stopped = True
+                break
+    except FuturesTimeoutError:
+        pass
+
+    results: list[Any] = []
+    cut_short = False
+    has_unfinished_calls = False
+    for future in futures:
+        if future.done():
+            results.append(future.result())
+        else:
+            results.append(None)
+            has_unfinished_calls = True
+            cut_short = cut_short or not stopped
+    if has_unfinished_calls:
+        # Still running calls would otherwise keep occupying the workers and could still
+        # write (e.g., into temporary folders) after this function returned. The unfinished
+        # futures are not cancelled, as loky resolves them itself when it kills the workers.
+        executor.shutdown(wait=True, kill_workers=True)
+    return results, cut_short
+
+
 @validate_call(validate_return=True)
 def parse_external_resources(path: str, brenda_version: str) -> None:
     """Parse and verify the presence of external resource files required for a COBRAk model.
@@ -2760,8 +2899,14 @@ def parse_external_resources(path: str, brenda_version: str) -> None:
             print(link)
             print("(Accessed on Jun 24 2024, open link at your own risk!)")
             raise FileNotFoundError
-    if "parsed_taxdmp.json.zip" not in filenames:
-        parse_ncbi_taxonomy(f"{path}taxdmp.zip", f"{path}parsed_taxdmp.json")
+    parse_json = "parsed_taxdmp.json.zip" not in filenames
+    parse_binary = not os.path.isdir(f"{path}parsed_taxdmp")
+    if parse_json or parse_binary:
+        parse_ncbi_taxonomy(
+            f"{path}taxdmp.zip",
+            ncbi_parsed_json_path=f"{path}parsed_taxdmp.json" if parse_json else "",
+            ncbi_binary_folder=f"{path}parsed_taxdmp" if parse_binary else "",
+        )
     if "bigg_models_metabolites.json" not in filenames:
         bigg_parse_metabolites_file(
             f"{path}bigg_models_metabolites.txt", f"{path}bigg_models_metabolites.json"
@@ -2836,6 +2981,27 @@ def print_model_parameter_statistics(cobrak_model: Model) -> None:
     print(len(cobrak_model.reactions))
 
 
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Runs the coroutine to completion and returns its result, also if an event loop is already running.
+
+    Without a running event loop, this is the same as asyncio.run(coroutine). Within a running event loop
+    (e.g., in a Jupyter notebook), where asyncio.run cannot be called, the coroutine is run with asyncio.run
+    in a separate thread, which is waited for.
+
+    Args:
+        coroutine (Coroutine[Any, Any, T]): The coroutine.
+
+    Returns:
+        T: The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 @validate_call(config=ConfigDict(arbitrary_types_allowed=True), validate_return=True)
 def sort_dict_keys(dictionary: dict[str, T]) -> dict[str, T]:
     """Sorts all keys in a dictionary alphabetically.
@@ -0,0 +1,105 @@
+"""Compares the number of fitness evaluations which COBRA-k's binary optimizers need to reach a target objective value.
+
+For the toy model and iCH360, each algorithm of BINARY_OPTIMIZERS (genetic algorithm, parallel tempering simulated
+annealing and tabu search) runs with the same seeds, i.e. with the same sampled start solutions. The target is the best
+objective value found by any of the runs. For each algorithm, the share of runs which reached the target and the
+median number of fitness evaluations (i.e. ecTFBA+NLP evaluations of the evolutionary algorithm, without the initial
+sampling) until it was reached are printed and written as JSON.
+"""
+
+import z_add_path  # noqa: F401
+
+from statistics import median
+
+from cobrak.dataclasses import Model
+from cobrak.evolution import perform_nlp_evolutionary_optimization
+from cobrak.example_models import toy_model
+from cobrak.io import ensure_folder_existence, json_load, json_write, jsonl_stream
+from cobrak.lps import perform_lp_variability_analysis
+from cobrak.metaheuristics import BINARY_OPTIMIZERS, get_evaluations_to_target
+from cobrak.standard_solvers import IPOPT, SCIP
+
+SEEDS = [0, 1, 2, 3, 4]
+RESULTS_FOLDER = "examples/benchmark_binary_optimizers/"
+
+toy_variability_dict = perform_lp_variability_analysis(
+    toy_model,
+    with_enzyme_constraints=True,
+    with_thermodynamic_constraints=True,
+    min_flux_cutoff=1e-7,
+)
+toy_variability_dict["EX_S"] = (0.0, 14.0)
+ich360_model: Model = json_load(
+    "examples/iCH360/RESULTS_GLCUPTAKE/used_cobrak_model__1_maxglc1000.json",
+    Model,
+)
+ich360_variability_dict = json_load(
+    "examples/iCH360/RESULTS_GLCUPTAKE/variability_dict__1_maxglc1000.json"
+)
+
+benchmark_cases = {
+    # name: (model, variability dict, objective target, objective sense, generations, population size)
+    "toymodel": (toy_model, toy_variability_dict, "ATP_Consumption", +1, 10, 8),
+    "iCH360": (ich360_model, ich360_variability_dict, "EX_ac_e_fw", +1, 20, 32),
+}
+
+ensure_folder_existence(RESULTS_FOLDER)
+benchmark_results: dict[str, dict[str, dict[str, float]]] = {}
+for case_name, (
+    cobrak_model,
+    variability_dict,
+    objective_target,
+    objective_sense,
+    num_gens,
+    pop_size,
+) in benchmark_cases.items():
+    objvalue_json_paths: dict[str, list[str]] = {}
+    for algorithm in BINARY_OPTIMIZERS:
+        objvalue_json_paths[algorithm] = []
+        for seed in SEEDS:
+            objvalue_json_path = f"{RESULTS_FOLDER}{case_name}_{algorithm}_{seed}.jsonl"
+            perform_nlp_evolutionary_optimization(
+                cobrak_model=cobrak_model,
+                objective_target=objective_target,
+                objective_sense=objective_sense,
+                variability_dict=variability_dict,
+                with_kappa=True,
+                with_gamma=True,
+                evolution_num_gens=num_gens,
+                algorithm=algorithm,
+                lp_solver=SCIP,
+                nlp_solver=IPOPT,
+                objvalue_json_path=objvalue_json_path,
+                pop_size=pop_size,
+                seed=seed,
+            )
+            objvalue_json_paths[algorithm].append(objvalue_json_path)
+
+    # The logs contain fitnesses, i.e. lower is better
+    target_fitness = min(
+        list(jsonl_stream(path))[-1]["best"]
+        for paths in objvalue_json_paths.values()
+        for path in paths
+    )
+    benchmark_results[case_name] = {}
+    for algorithm, paths in objvalue_json_paths.items():
+        evaluations_to_target = [
+            get_evaluations_to_target(path, target_fitness, rel_tolerance=1e-3)
+            for path in paths
+        ]
+        reached = [
+            evaluations
+            for evaluations in evaluations_to_target
+            if evaluations != float("inf")
+        ]
+        benchmark_results[case_name][algorithm] = {
+            "target_fitness": target_fitness,
+            "share_reached": len(reached) / len(paths),
+            "median_evaluations_to_target": median(reached) if reached else -1.0,
+        }
+        print(
+            f"{case_name} | {algorithm}: target reached in {len(reached)}/{len(paths)} runs, "
+            f"median evaluations to target: {median(reached) if reached else '-'}"
+        )
+
+json_write(f"{RESULTS_FOLDER}benchmark_results.json", benchmark_results)
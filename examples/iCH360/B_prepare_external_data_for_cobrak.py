@@ -73,12 +73,13 @@ brenda_enzyme_reaction_data = brenda_select_enzyme_kinetic_data_for_model(
     bigg_metabolites_json_path=f"{common_input_folder}bigg_models_metabolites.json",
     brenda_version="2024_1",
     base_species="Escherichia coli",
-    ncbi_parsed_json_path=f"{common_input_folder}parsed_taxdmp.json",
+    ncbi_parsed_json_path=f"{common_input_folder}parsed_taxdmp",
     kinetic_ignored_metabolites=kinetic_ignored_metabolites,
     kinetic_ignored_enzyme_ids=kinetic_ignored_enzyme_ids,
     kcat_overwrite=kcat_per_h,
     transfered_ec_number_json=f"{common_input_folder}ec_number_transfers.json",
     max_taxonomy_level=6,
+    brenda_store_path=f"{common_input_folder}brenda_2024_1.sqlite",
 )
 
 sabio_enzyme_reaction_data = sabio_select_enzyme_kinetic_data_for_model(
@@ -86,7 +87,7 @@ sabio_enzyme_reaction_data = sabio_select_enzyme_kinetic_data_for_model(
     sabio_target_folder="examples/common_needed_external_resources",
     bigg_metabolites_json_path=f"{common_input_folder}bigg_models_metabolites.json",
     base_species="Escherichia coli",
-    ncbi_parsed_json_path=f"{common_input_folder}parsed_taxdmp.json",
+    ncbi_parsed_json_path=f"{common_input_folder}parsed_taxdmp",
     kinetic_ignored_metabolites=kinetic_ignored_metabolites,
     kinetic_ignored_enzyme_ids=kinetic_ignored_enzyme_ids,
     kcat_overwrite=kcat_per_h,
@@ -3,6 +3,7 @@
 import tempfile
 
 from cobrak.bigg_metabolites_functionality import bigg_parse_metabolites_file
+from cobrak.io import json_load
 
 
 def test_bigg_parse_metabolites_file() -> None:  # noqa: D103
@@ -11,3 +12,26 @@ def test_bigg_parse_metabolites_file() -> None:  # noqa: D103
             "examples/common_needed_external_resources/bigg_models_metabolites.txt",
             temp_json_file.name,
         )
+
+
+def test_bigg_parse_metabolites_file_lines(tmp_path: str) -> None:  # noqa: D103
+    with open(f"{tmp_path}/bigg_models_metabolites.txt", "w", encoding="utf-8") as f:
+        f.write(
+            "bigg_id\tuniversal_bigg_id\tname\tmodel_list\tdatabase_links\told_bigg_ids\n"
+            "atp_c\tatp\tATP C10H12N5O13P3\tiML1515\t"
+            "CHEBI: http://identifiers.org/CHEBI:15422; "
+            "KEGG Compound: http://identifiers.org/kegg.compound/C00002\tatp_c\n"
+            "\n"
+            "x_c\tx\n"
+        )
+    bigg_parse_metabolites_file(
+        f"{tmp_path}/bigg_models_metabolites.txt", f"{tmp_path}/bigg.json"
+    )
+    assert json_load(f"{tmp_path}/bigg.json") == {
+        "universal_bigg_id": "universal_bigg_id",
+        "name": "universal_bigg_id",
+        "atp": "atp",
+        "atp c10h12n5o13p3": "atp",
+        "15422": "atp",
+        "x": "x",
+    }
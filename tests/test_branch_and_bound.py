@@ -0,0 +1,74 @@
+"""pytest tests for COBRA-k's module branch_and_bound"""
+
+from cobrak.branch_and_bound import (
+    _evaluate_branch_and_bound_node,
+    perform_nlp_branch_and_bound,
+)
+from cobrak.constants import OBJECTIVE_BOUND_KEY, OBJECTIVE_VAR_NAME
+from cobrak.evolution import COBRAKProblem
+from cobrak.example_models import toy_model
+from cobrak.lps import perform_lp_optimization, perform_lp_variability_analysis
+from cobrak.standard_solvers import HIGHS
+
+
+def _get_toy_variability_dict() -> dict[str, tuple[float, float]]:
+    variability_dict = perform_lp_variability_analysis(
+        toy_model,
+        with_enzyme_constraints=True,
+        with_thermodynamic_constraints=True,
+        min_flux_cutoff=1e-7,
+        solver=HIGHS,
+    )
+    variability_dict["EX_S"] = (0.0, 14.0)
+    return variability_dict
+
+
+def test_evaluate_branch_and_bound_node() -> None:  # noqa: D103
+    variability_dict = _get_toy_variability_dict()
+    problem = COBRAKProblem(
+        cobrak_model=toy_model,
+        objective_target={"ATP_Consumption": 1.0},
+        objective_sense=+1,
+        variability_dict=variability_dict,
+        nlp_dict_list=[],
+        best_value=0.0,
+        lp_solver=HIGHS,
+    )
+    ectfba_dict = perform_lp_optimization(
+        cobrak_model=toy_model,
+        objective_target={"ATP_Consumption": 1.0},
+        objective_sense=+1,
+        with_enzyme_constraints=True,
+        with_thermodynamic_constraints=True,
+        with_loop_constraints=True,
+        variability_dict=variability_dict,
+        solver=HIGHS,
+    )
+    root_bound, _, used_couple_idxs = _evaluate_branch_and_bound_node(problem, (), ())
+    assert abs(root_bound - ectfba_dict[OBJECTIVE_VAR_NAME]) < 1e-6
+    assert used_couple_idxs
+
+    # Deactivating a used couple can only worsen the bound
+    off_bound, _, _ = _evaluate_branch_and_bound_node(
+        problem, (used_couple_idxs[0],), ()
+    )
+    assert (off_bound is None) or (off_bound <= root_bound + 1e-6)
+    on_bound, _, _ = _evaluate_branch_and_bound_node(
+        problem, (), (used_couple_idxs[0],)
+    )
+    assert abs(on_bound - root_bound) < 1e-6
+
+
+def test_perform_nlp_branch_and_bound() -> None:  # noqa: D103
+    results = perform_nlp_branch_and_bound(
+        cobrak_model=toy_model,
+        objective_target="ATP_Consumption",
+        objective_sense=+1,
+        variability_dict=_get_toy_variability_dict(),
+        lp_solver=HIGHS,
+        num_parallel_nodes=2,
+        max_nodes=4,
+    )
+    for objective_value, nlp_results in results.items():
+        for nlp_result in nlp_results:
+            assert nlp_result[OBJECTIVE_BOUND_KEY] >= objective_value - 1e-6
@@ -1,9 +1,21 @@
 """pytest tests for COBRA-k's module brenda_functionality"""
 
+import io
+import json
+import os
+import tarfile
+
+import cobra
+
 from cobrak.brenda_functionality import (
+    _brenda_get_all_enzyme_kinetic_data_for_model,  # noqa: PLC2701
+    _brenda_get_kinetics_store_version,  # noqa: PLC2701
     _brenda_parse_full_json,  # noqa: PLC2701
+    _brenda_query_kinetics_store,  # noqa: PLC2701
     _is_fitting_ec_numbers,  # noqa: PLC2701
+    brenda_create_kinetics_store,
 )
+from cobrak.io import json_write
 
 
 def test_brenda_parse_full_json() -> None:  # noqa: D103
@@ -23,3 +35,116 @@ def test_brenda_parse_full_json() -> None:  # noqa: D103
 def test_is_fitting_ec_numbers() -> None:  # noqa: D103
     assert not _is_fitting_ec_numbers("1.1.1.1", "1.2.2.2", 2)
     assert _is_fitting_ec_numbers("1.1.1.1", "1.2.2.2", 3)
+
+
+def _write_test_brenda_files(tmp_path: str) -> tuple[str, str]:
+    bigg_metabolites_json_path = os.path.join(tmp_path, "bigg_metabolites.json")
+    json_write(bigg_metabolites_json_path, {"glucose": "glc__D", "atp": "atp"})
+    brenda_json = {
+        "data": {
+            "2.7.1.1": {
+                "protein": {
+                    "1": {"organism": "Escherichia coli", "references": ["1"]},
+                    "2": {"organism": "Homo sapiens", "references": ["1"]},
+                },
+                "reference": {"1": {"pmid": 123}},
+                "turnover_number": [
+                    {
+                        "value": "10 {glucose}",
+                        "proteins": ["1", "2"],
+                        "comment": "pH 7.5, 30°C",
+                        "references": ["1"],
+                    },
+                    {"value": "20 {atp}", "proteins": ["1"]},
+                    {"value": "30 {glucose}", "proteins": ["2"], "comment": "mutant"},
+                ],
+                "km_value": [
+                    {"value": "0.1 {glucose}", "proteins": ["2"], "comment": "pH 9.0"},
+                ],
+            },
+            "1.1.1.1": {"protein": {}, "turnover_number": []},
+            "3.1.1.1": {"protein": {}},
+        }
+    }
+    brenda_json_targz_file_path = os.path.join(tmp_path, "brenda_test.json.tar.gz")
+    brenda_json_bytes = json.dumps(brenda_json).encode("utf-8")
+    with tarfile.open(brenda_json_targz_file_path, "w:gz") as tar:
+        tarinfo = tarfile.TarInfo("brenda_test.json")
+        tarinfo.size = len(brenda_json_bytes)
+        tar.addfile(tarinfo, io.BytesIO(brenda_json_bytes))
+    return brenda_json_targz_file_path, bigg_metabolites_json_path
+
+
+def test_brenda_create_kinetics_store(tmp_path: str) -> None:  # noqa: D103
+    brenda_json_targz_file_path, bigg_metabolites_json_path = _write_test_brenda_files(
+        tmp_path
+    )
+    brenda_store_path = os.path.join(tmp_path, "brenda_test.sqlite")
+    brenda_create_kinetics_store(
+        brenda_json_targz_file_path=brenda_json_targz_file_path,
+        bigg_metabolites_json_path=bigg_metabolites_json_path,
+        brenda_version="test",
+        brenda_store_path=brenda_store_path,
+    )
+    for min_ph, max_ph, accept_nan_ph in ((0.0, 14.0, True), (7.0, 8.0, False)):
+        parsed_json = _brenda_parse_full_json(
+            brenda_json_targz_file_path=brenda_json_targz_file_path,
+            bigg_metabolites_json_path=bigg_metabolites_json_path,
+            brenda_version="test",
+            min_ph=min_ph,
+            max_ph=max_ph,
+            accept_nan_ph=accept_nan_ph,
+        )
+        stored_json = _brenda_query_kinetics_store(
+            brenda_store_path=brenda_store_path,
+            ec_numbers=["1.1.1.1", "2.7.1.1", "9.9.9.9"],
+            min_ph=min_ph,
+            max_ph=max_ph,
+            accept_nan_ph=accept_nan_ph,
+        )
+        assert stored_json == parsed_json
+    assert _brenda_get_kinetics_store_version(brenda_store_path) == "test"
+    # A file which is no BRENDA store has no version
+    assert _brenda_get_kinetics_store_version(bigg_metabolites_json_path) is None
+    assert set(stored_json) == {"1.1.1.1", "2.7.1.1"}
+    assert list(stored_json["2.7.1.1"]) == ["glc__D"]
+    assert set(stored_json["2.7.1.1"]["glc__D"]) == {
+        "Escherichia coli",
+        "Homo sapiens",
+    }
+
+
+def test_brenda_get_all_enzyme_kinetic_data_for_model(tmp_path: str) -> None:  # noqa: D103
+    brenda_json_targz_file_path, bigg_metabolites_json_path = _write_test_brenda_files(
+        tmp_path
+    )
+    brenda_store_path = os.path.join(tmp_path, "brenda_test.sqlite")
+    brenda_create_kinetics_store(
+        brenda_json_targz_file_path=brenda_json_targz_file_path,
+        bigg_metabolites_json_path=bigg_metabolites_json_path,
+        brenda_version="test",
+        brenda_store_path=brenda_store_path,
+    )
+    cobra_model = cobra.Model()
+    for reac_id, ec_code in (("HEX", "2.7.1.1"), ("HEX2", "2.7.1.99")):
+        reaction = cobra.Reaction(reac_id)
+        reaction.annotation["ec-code"] = [ec_code]
+        cobra_model.add_reactions([reaction])
+    model_database = _brenda_get_all_enzyme_kinetic_data_for_model(
+        cobra_model,
+        brenda_json_targz_file_path=brenda_json_targz_file_path,
+        bigg_metabolites_json_path=bigg_metabolites_json_path,
+        brenda_version="test",
+    )
+    assert not model_database["2.7.1.1"]["WILDCARD"]
+    # 2.7.1.99 is not in BRENDA, so that 2.7.1.1 is used as wildcard
+    assert model_database["2.7.1.99"]["WILDCARD"]
+    assert model_database["2.7.1.99"]["glc__D"] == model_database["2.7.1.1"]["glc__D"]
+    store_model_database = _brenda_get_all_enzyme_kinetic_data_for_model(
+        cobra_model,
+        brenda_json_targz_file_path=brenda_json_targz_file_path,
+        bigg_metabolites_json_path=bigg_metabolites_json_path,
+        brenda_version="test",
+        brenda_store_path=brenda_store_path,
+    )
+    assert store_model_database == model_database
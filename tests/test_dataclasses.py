@@ -8,6 +8,7 @@ from cobrak.dataclasses import (
     Model,
     Reaction,
 )
+from cobrak.example_models import toy_model
 
 
 def test_model_creation() -> None:  # noqa: D103
@@ -41,3 +42,20 @@ def test_model_creation() -> None:  # noqa: D103
             )
         ],
     )
+
+
+def test_model_get_enzyme_reaction_index() -> None:  # noqa: D103
+    with toy_model as cobrak_model:
+        enzyme_reaction_index = cobrak_model.get_enzyme_reaction_index()
+        assert enzyme_reaction_index["E_glyc"] == ["Glycolysis"]
+        assert cobrak_model.get_enzyme_reaction_index() is enzyme_reaction_index
+        # Changed reaction IDs lead to a rebuilt index
+        del cobrak_model.reactions["Overflow"]
+        assert "E_over" not in cobrak_model.get_enzyme_reaction_index()
+        cobrak_model.reactions["Respiration"].enzyme_reaction_data.identifiers.append(
+            "E_glyc"
+        )
+        assert cobrak_model.get_enzyme_reaction_index(rebuild=True)["E_glyc"] == [
+            "Glycolysis",
+            "Respiration",
+        ]
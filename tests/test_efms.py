@@ -0,0 +1,41 @@
+"""pytest tests for COBRA-k's module _efms"""
+
+from cobrak._efms import (
+    calculate_efms,
+    iterate_efms_double_description,
+    iterate_efms_milp,
+)
+from cobrak.example_models import toy_model
+from cobrak.standard_solvers import HIGHS
+
+TOY_MODEL_EFMS = {
+    ("Glycolysis", "Overflow", "EX_S", "EX_P", "ATP_Consumption"),
+    ("Glycolysis", "Respiration", "EX_S", "EX_C", "ATP_Consumption"),
+}
+
+
+def test_iterate_efms_double_description() -> None:  # noqa: D103
+    assert set(iterate_efms_double_description(toy_model)) == TOY_MODEL_EFMS
+    assert len(list(iterate_efms_double_description(toy_model, max_num_efms=1))) == 1
+
+
+def test_iterate_efms_milp() -> None:  # noqa: D103
+    for num_workers in (1, 4):
+        assert (
+            set(iterate_efms_milp(toy_model, solver=HIGHS, num_workers=num_workers))
+            == TOY_MODEL_EFMS
+        )
+
+
+def test_calculate_efms() -> None:  # noqa: D103
+    assert calculate_efms(toy_model, solver=HIGHS, num_workers=1) == TOY_MODEL_EFMS
+    assert (
+        calculate_efms(
+            toy_model,
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            solver=HIGHS,
+            num_workers=2,
+        )
+        == TOY_MODEL_EFMS
+    )
@@ -0,0 +1,34 @@
+"""pytest tests for COBRA-k's module evolution"""
+
+from cobrak.evolution import (
+    _get_canonical_deactivation_set,  # noqa: PLC2701
+    _is_deactivation_set_redundant,  # noqa: PLC2701
+)
+
+
+def test_get_canonical_deactivation_set() -> None:  # noqa: D103
+    reac_to_couple_id = {"R1": "R1", "R2": "R1", "R3": "R3"}
+    assert _get_canonical_deactivation_set(["R3", "R2"], reac_to_couple_id) == (
+        "R1",
+        "R3",
+    )
+    assert _get_canonical_deactivation_set(["R1", "R2", "R4"], reac_to_couple_id) == (
+        "R1",
+        "R4",
+    )
+
+
+def test_is_deactivation_set_redundant() -> None:  # noqa: D103
+    sampling_cache = {
+        ("R1",): (None, None),
+        ("R3",): (("R4", "R5"), {"OBJECTIVE_VAR": 1.0}),
+    }
+    # Already sampled
+    assert _is_deactivation_set_redundant(("R3",), sampling_cache)
+    # Superset of an infeasible set
+    assert _is_deactivation_set_redundant(("R1", "R6"), sampling_cache)
+    # Superset of a feasible set whose solution does not use the additional couple
+    assert _is_deactivation_set_redundant(("R3", "R6"), sampling_cache)
+    # Superset of a feasible set whose solution uses the additional couple
+    assert not _is_deactivation_set_redundant(("R3", "R4"), sampling_cache)
+    assert not _is_deactivation_set_redundant(("R6",), sampling_cache)
@@ -0,0 +1,38 @@
+"""pytest tests for COBRA-k's module expasy_functionality"""
+
+from cobrak.brenda_functionality import _is_fitting_ec_numbers  # noqa: PLC2701
+from cobrak.expasy_functionality import EcNumberTrie
+
+
+def test_ec_number_trie() -> None:  # noqa: D103
+    ec_numbers = [
+        "1.1.1.1",
+        "1.1.1.2",
+        "1.1.1.-",
+        "1.1.2.1",
+        "1.2.1.1",
+        "2.7.1.1",
+        "2.7.1",
+        "1.1.1.n2",
+    ]
+    ec_number_trie = EcNumberTrie(ec_numbers)
+    assert ec_number_trie.contains("1.1.1.1")
+    assert not ec_number_trie.contains("1.1.1")
+    assert sorted(ec_number_trie.get_ec_numbers_under("1.1.1.-")) == [
+        "1.1.1.-",
+        "1.1.1.1",
+        "1.1.1.2",
+        "1.1.1.n2",
+    ]
+    assert ec_number_trie.get_ec_numbers_under("3.-.-.-") == []
+    for ec_number in ("1.1.1.3", "1.1.3.1", "2.7.1.5", "2.7.1", "3.1.1.1"):
+        for wildcard_level in range(5):
+            assert sorted(
+                ec_number_trie.get_wildcard_fitting_ec_numbers(
+                    ec_number, wildcard_level
+                )
+            ) == sorted(
+                database_ec_number
+                for database_ec_number in ec_numbers
+                if _is_fitting_ec_numbers(ec_number, database_ec_number, wildcard_level)
+            )
@@ -0,0 +1,115 @@
+"""pytest tests for COBRA-k's module genetic"""
+
+import pytest
+
+from cobrak.genetic import COBRAKGENETIC, HammingKNNSurrogate, tail_objvalue_log
+from cobrak.io import jsonl_stream
+from cobrak.plotting import plot_objvalue_evolution
+
+
+def _onemax_fitness(x: list[int]) -> list[tuple[float, list[int]]]:
+    if x[0] == 0:
+        return [(1_000_000.0, [])]
+    return [(1_000_000.0, []), (-float(sum(x)), list(x))]
+
+
+def test_hamming_knn_surrogate_rank() -> None:  # noqa: D103
+    surrogate = HammingKNNSurrogate(num_neighbors=2)
+    surrogate.fit(
+        {
+            (1, 1, 1, 1): -4.0,
+            (1, 1, 1, 0): -3.0,
+            (0, 0, 0, 0): 1_000_000.0,
+            (0, 0, 0, 1): 1_000_000.0,
+        }
+    )
+    feasibility_probabilities, expected_fitnesses = surrogate.predict(
+        [[0, 0, 0, 1], [1, 1, 0, 1]]
+    )
+    assert feasibility_probabilities[0] == 0.0
+    assert feasibility_probabilities[1] == 1.0
+    assert expected_fitnesses[0] == float("inf")
+    assert -4.0 <= expected_fitnesses[1] <= -3.0
+    assert surrogate.rank([[0, 0, 0, 1], [1, 1, 0, 1]]) == [1, 0]
+
+
+def test_cobrakgenetic_with_surrogate() -> None:  # noqa: D103
+    evolution = COBRAKGENETIC(
+        fitness_function=_onemax_fitness,
+        xs_dim=8,
+        gen=4,
+        extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+        pop_size=8,
+        surrogate_skip_share=0.5,
+    )
+    best_fitness, best_x = evolution.run()
+    assert best_fitness <= -1.0
+    assert best_x[0] == 1
+    assert evolution.num_saved_evaluations > 0
+
+
+def test_cobrakgenetic_seed_and_checkpoint(tmp_path: str) -> None:  # noqa: D103
+    def run_evolution(seed: int, checkpoint_path: str, gen: int) -> COBRAKGENETIC:
+        evolution = COBRAKGENETIC(
+            fitness_function=_onemax_fitness,
+            xs_dim=8,
+            gen=gen,
+            extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+            pop_size=8,
+            seed=seed,
+            checkpoint_path=checkpoint_path,
+        )
+        evolution.run()
+        return evolution
+
+    first_run = run_evolution(42, "", 3)
+    second_run = run_evolution(42, "", 3)
+    assert first_run.tested_xs == second_run.tested_xs
+
+    checkpoint_path = str(tmp_path / "checkpoint.pickle")
+    interrupted_run = run_evolution(42, checkpoint_path, 1)
+    resumed_run = run_evolution(42, checkpoint_path, 3)
+    assert resumed_run.generation == 3
+    assert set(interrupted_run.tested_xs).issubset(set(resumed_run.tested_xs))
+    assert resumed_run.tested_xs == first_run.tested_xs
+
+
+def test_cobrakgenetic_objvalue_log(tmp_path: str, capsys) -> None:  # noqa: ANN001, D103
+    objvalue_json_path = str(tmp_path / "objvalues.jsonl")
+    evolution = COBRAKGENETIC(
+        fitness_function=_onemax_fitness,
+        xs_dim=8,
+        gen=3,
+        extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+        pop_size=8,
+        seed=1,
+        objvalue_json_path=objvalue_json_path,
+    )
+    best_fitness, _ = evolution.run()
+    entries = list(jsonl_stream(objvalue_json_path))
+    assert [entry["generation"] for entry in entries] == [0, 1, 2, 3, 3]
+    assert entries[-1]["finished"]
+    assert entries[-1]["best"] == best_fitness
+
+    tail_objvalue_log(objvalue_json_path, poll_interval=0.01, idle_timeout=1.0)
+    assert "Finished after generation 3" in capsys.readouterr().out
+
+    output_path = str(tmp_path / "objvalues.png")
+    plot_objvalue_evolution(objvalue_json_path, output_path)
+    assert (tmp_path / "objvalues.png").exists()
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnhandledThreadExceptionWarning")
+def test_cobrakgenetic_time_budget() -> None:  # noqa: D103
+    evolution = COBRAKGENETIC(
+        fitness_function=_onemax_fitness,
+        xs_dim=8,
+        gen=1_000,
+        extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+        pop_size=8,
+        time_budget=0.0,
+    )
+    best_fitness, _ = evolution.run()
+    assert evolution.cut_short
+    assert evolution.generation == 0
+    assert best_fitness == 1_000_000.0
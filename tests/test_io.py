@@ -25,6 +25,9 @@ from cobrak.io import (
     json_write,
     json_zip_load,
     json_zip_write,
+    jsonl_append,
+    jsonl_follow,
+    jsonl_stream,
     pickle_load,
     pickle_write,
     save_cobrak_model_as_annotated_sbml_model,
@@ -195,6 +198,19 @@ def test_json_zip_write_and_load(tmp_path: str) -> None:  # noqa: D103
     assert json_data_read == {"key": "value"}
 
 
+def test_jsonl_append_and_stream(tmp_path: str) -> None:  # noqa: D103
+    path = str(tmp_path / "test_jsonl.jsonl")
+    jsonl_append(path, {"key": 1})
+    jsonl_append(path, {"key": 2})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": ')  # Unfinished line
+    assert list(jsonl_stream(path)) == [{"key": 1}, {"key": 2}]
+    assert list(jsonl_follow(path, poll_interval=0.01, idle_timeout=0.05)) == [
+        {"key": 1},
+        {"key": 2},
+    ]
+
+
 def test_pickle_load(tmp_path: str) -> None:  # noqa: D103
     path = str(tmp_path / "test_pickle.pkl")
     pickle_write(path, {"key": "value"})
@@ -0,0 +1,86 @@
+"""pytest tests for COBRA-k's module knockouts"""
+
+import os
+
+from cobrak.example_models import toy_model
+from cobrak.io import jsonl_stream
+from cobrak.knockouts import (
+    iterate_knockout_screen,
+    perform_knockout_batch,
+    perform_knockout_screen,
+)
+from cobrak.standard_solvers import HIGHS
+
+
+def test_iterate_knockout_screen() -> None:  # noqa: D103
+    first_knockout, first_objective_value = next(
+        iterate_knockout_screen(
+            toy_model,
+            "ATP_Consumption",
+            +1,
+            with_enzyme_constraints=True,
+            solver=HIGHS,
+            num_workers=1,
+        )
+    )
+    assert first_knockout == ()
+    assert first_objective_value > 0.0
+
+
+def test_perform_knockout_batch() -> None:  # noqa: D103
+    objective_values = perform_knockout_batch(
+        toy_model,
+        [[], ["E_over"], ["E_over", "E_resp"], ["E_resp", "E_over"]],
+        "ATP_Consumption",
+        +1,
+        with_enzyme_constraints=True,
+        solver=HIGHS,
+        num_workers=2,
+    )
+    assert objective_values[0] > 0.0
+    assert objective_values[1] <= objective_values[0] + 1e-6
+    assert abs(objective_values[2]) < 1e-6
+    assert objective_values[3] == objective_values[2]
+    reaction_objective_values = perform_knockout_batch(
+        toy_model,
+        [["Overflow"]],
+        "ATP_Consumption",
+        +1,
+        knockout_level="reaction",
+        with_enzyme_constraints=True,
+        solver=HIGHS,
+        num_workers=1,
+    )
+    assert abs(reaction_objective_values[0] - objective_values[1]) < 1e-6
+
+
+def test_perform_knockout_screen(tmp_path: str) -> None:  # noqa: D103
+    variability_dict = dict.fromkeys(toy_model.reactions, (0.0, 1_000.0))
+    variability_dict["EX_S"] = (1.0, 1_000.0)
+    result_jsonl_path = os.path.join(tmp_path, "ko_screen.jsonl")
+    screen_results = perform_knockout_screen(
+        toy_model,
+        "ATP_Consumption",
+        +1,
+        with_enzyme_constraints=True,
+        variability_dict=variability_dict,
+        solver=HIGHS,
+        num_workers=2,
+        result_jsonl_path=result_jsonl_path,
+    )
+    # Essential KO without optimization, and no combinations with it
+    assert screen_results[("EX_S",)] is None
+    assert all(
+        "EX_S" not in knockout for knockout in screen_results if len(knockout) > 1
+    )
+    # Symmetric KOs are screened once
+    assert ("Overflow", "Respiration") in screen_results
+    assert ("Respiration", "Overflow") not in screen_results
+    assert screen_results[("Overflow", "Respiration")] is None
+    assert screen_results[("Overflow",)] <= screen_results[()] + 1e-6
+    # Incremental results file
+    written_results = {
+        tuple(line["knockouts"]): line["objective_value"]
+        for line in jsonl_stream(result_jsonl_path)
+    }
+    assert written_results == screen_results
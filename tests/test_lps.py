@@ -0,0 +1,46 @@
+"""pytest tests for COBRA-k's module lps"""
+
+from copy import deepcopy
+
+from cobrak.example_models import toy_model
+from cobrak.lps import (
+    perform_lp_thermodynamic_bottleneck_analysis,
+    perform_lp_thermodynamic_bottleneck_enumeration,
+)
+from cobrak.standard_solvers import HIGHS
+
+
+def test_perform_lp_thermodynamic_bottleneck_enumeration() -> None:  # noqa: D103
+    bottleneck_model = deepcopy(toy_model)
+    bottleneck_model.reactions["ATP_Consumption"].min_flux = 1.0
+    for reac_id in ("Glycolysis", "Respiration", "Overflow"):
+        bottleneck_model.reactions[reac_id].dG0 = 200.0
+
+    bottleneck_sets = perform_lp_thermodynamic_bottleneck_enumeration(
+        bottleneck_model,
+        min_mdf=1.0,
+        solver=HIGHS,
+        seeds=[0, 1],
+    )
+    assert bottleneck_sets == [
+        ["Glycolysis", "Overflow"],
+        ["Glycolysis", "Respiration"],
+    ]
+    single_bottleneck_set = perform_lp_thermodynamic_bottleneck_analysis(
+        bottleneck_model,
+        min_mdf=1.0,
+        solver=HIGHS,
+    )
+    assert sorted(single_bottleneck_set) in bottleneck_sets
+
+    assert (
+        len(
+            perform_lp_thermodynamic_bottleneck_enumeration(
+                bottleneck_model,
+                min_mdf=1.0,
+                max_num_sets=1,
+                solver=HIGHS,
+            )
+        )
+        == 1
+    )
@@ -0,0 +1,64 @@
+"""pytest tests for COBRA-k's module mcs"""
+
+from copy import deepcopy
+
+from cobrak.example_models import toy_model
+from cobrak.mcs import _get_knockout_items, calculate_minimal_cut_sets
+from cobrak.standard_solvers import HIGHS
+
+TOY_MODEL_ATP_MCS = [
+    ["ATP_Consumption"],
+    ["EX_S"],
+    ["Glycolysis"],
+    ["EX_C", "EX_P"],
+    ["EX_C", "Overflow"],
+    ["EX_P", "Respiration"],
+    ["Overflow", "Respiration"],
+]
+
+
+def test_get_knockout_items() -> None:  # noqa: D103
+    reaction_items = _get_knockout_items(toy_model, "reaction", [])
+    assert reaction_items["Glycolysis"] == ["Glycolysis"]
+    split_model = deepcopy(toy_model)
+    split_model.reactions["Overflow_FWD"] = split_model.reactions.pop("Overflow")
+    split_model.reactions["Overflow_REV"] = deepcopy(
+        split_model.reactions["Overflow_FWD"]
+    )
+    reaction_items = _get_knockout_items(split_model, "reaction", ["Overflow_REV"])
+    assert reaction_items == {"Overflow": ["Overflow_FWD", "Overflow_REV"]}
+    enzyme_items = _get_knockout_items(toy_model, "enzyme", ["E_glyc"])
+    assert enzyme_items == {"E_glyc": ["Glycolysis"]}
+
+
+def test_calculate_minimal_cut_sets_dual() -> None:  # noqa: D103
+    assert (
+        calculate_minimal_cut_sets(toy_model, "ATP_Consumption", solver=HIGHS)
+        == TOY_MODEL_ATP_MCS
+    )
+    assert (
+        calculate_minimal_cut_sets(
+            toy_model, "ATP_Consumption", solver=HIGHS, num_workers=2
+        )
+        == TOY_MODEL_ATP_MCS
+    )
+    assert calculate_minimal_cut_sets(
+        toy_model,
+        "ATP_Consumption",
+        with_enzyme_constraints=True,
+        knockout_level="enzyme",
+        solver=HIGHS,
+    ) == [["E_glyc"], ["E_over", "E_resp"]]
+
+
+def test_calculate_minimal_cut_sets_hitting_set() -> None:  # noqa: D103
+    assert (
+        calculate_minimal_cut_sets(
+            toy_model,
+            "ATP_Consumption",
+            with_enzyme_constraints=True,
+            with_thermodynamic_constraints=True,
+            solver=HIGHS,
+        )
+        == TOY_MODEL_ATP_MCS
+    )
@@ -0,0 +1,76 @@
+"""pytest tests for COBRA-k's module metaheuristics"""
+
+from cobrak.genetic import COBRAKGENETIC
+from cobrak.io import jsonl_stream
+from cobrak.metaheuristics import (
+    BINARY_OPTIMIZERS,
+    COBRAKANNEALING,
+    COBRAKTABU,
+    get_evaluations_to_target,
+)
+
+
+def _onemax_fitness(x: list[int]) -> list[tuple[float, list[int]]]:
+    if x[0] == 0:
+        return [(1_000_000.0, [])]
+    return [(1_000_000.0, []), (-float(sum(x)), list(x))]
+
+
+def test_cobrakannealing() -> None:  # noqa: D103
+    evolution = COBRAKANNEALING(
+        fitness_function=_onemax_fitness,
+        xs_dim=8,
+        gen=30,
+        extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+        pop_size=4,
+        seed=1,
+    )
+    best_fitness, best_x = evolution.run()
+    assert best_fitness == -8.0
+    assert best_x == (1, 1, 1, 1, 1, 1, 1, 1)
+    assert evolution.temperatures == sorted(evolution.temperatures)
+    # Already evaluated bit vectors are not evaluated again
+    assert evolution.num_evaluations == len(evolution.evaluated_xs)
+
+
+def test_cobraktabu_aspiration(tmp_path: str) -> None:  # noqa: D103
+    objvalue_json_path = str(tmp_path / "objvalues.jsonl")
+    evolution = COBRAKTABU(
+        fitness_function=_onemax_fitness,
+        xs_dim=8,
+        gen=10,
+        extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+        pop_size=8,
+        seed=1,
+        objvalue_json_path=objvalue_json_path,
+        tabu_tenure=100,
+    )
+    best_fitness, _ = evolution.run()
+    # Every improving move beats the best fitness so far, i.e. the long tabu tenure does not block it
+    assert best_fitness == -8.0
+    assert get_evaluations_to_target(objvalue_json_path, -8.0) <= 8 * 8 + 1
+    assert get_evaluations_to_target(objvalue_json_path, -9.0) == float("inf")
+    entries = list(jsonl_stream(objvalue_json_path))
+    assert entries[-1]["finished"]
+    assert entries[-1]["evaluations"] == evolution.num_evaluations
+
+
+def test_binary_optimizers_share_interface(tmp_path: str) -> None:  # noqa: D103
+    assert BINARY_OPTIMIZERS["genetic"] is COBRAKGENETIC
+    for algorithm, optimizer_class in BINARY_OPTIMIZERS.items():
+        objvalue_json_path = str(tmp_path / f"{algorithm}.jsonl")
+        evolution = optimizer_class(
+            fitness_function=_onemax_fitness,
+            xs_dim=8,
+            gen=2,
+            extra_xs=[[1, 0, 0, 0, 0, 0, 0, 0]],
+            seed=0,
+            objvalue_json_path=objvalue_json_path,
+            max_rounds_same_objvalue=float("inf"),
+            pop_size=4,
+            time_budget=float("inf"),
+        )
+        best_fitness, _ = evolution.run()
+        assert best_fitness <= -1.0
+        assert not evolution.cut_short
+        assert get_evaluations_to_target(objvalue_json_path, -1.0) > 0
@@ -1,9 +1,51 @@
 """pytest tests for COBRA-k's module ncbi_taxonomy"""
 
+import os
+from zipfile import ZipFile
+
+import pytest
+
 from cobrak.ncbi_taxonomy_functionality import (
+    get_ncbi_taxonomy_index,
+    get_taxonomy_dict_from_nbci_taxonomy,
     get_taxonomy_scores,
+    load_ncbi_taxonomy_index,
     most_taxonomic_similar,
+    parse_ncbi_taxonomy,
+    write_ncbi_taxonomy_binary,
 )
+from cobrak.io import json_zip_load
+
+TEST_PARSED_JSON_DATA = {
+    "number_to_names_dict": {
+        "1": ["all", "root"],
+        "2": ["Bacteria"],
+        "3": ["Escherichia"],
+        "4": ["Escherichia coli"],
+        "5": ["Pseudomonas"],
+        "6": ["Animalia"],
+        "7": ["Homo sapiens"],
+    },
+    "names_to_number_dict": {
+        "all": "1",
+        "root": "1",
+        "Bacteria": "2",
+        "Escherichia": "3",
+        "Escherichia coli": "4",
+        "Pseudomonas": "5",
+        "Animalia": "6",
+        "Homo sapiens": "7",
+    },
+    "nodes_dict": {
+        "7": "6",
+        "1": "END",
+        "4": "3",
+        "3": "2",
+        "2": "1",
+        "5": "2",
+        "6": "1",
+    },
+}
 
 
 def test_get_taxonomy_scores() -> None:  # noqa: D103
@@ -30,3 +72,73 @@ def test_most_taxonomic_similar() -> None:  # noqa: D103
     assert most_similar["Escherichia coli"] == 0
     assert most_similar["Pseudomonas"] == 1
     assert most_similar["Homo sapiens"] == 2
+
+
+def test_ncbi_taxonomy_index() -> None:  # noqa: D103
+    parsed_json_data = TEST_PARSED_JSON_DATA
+    ncbi_taxonomy_index = get_ncbi_taxonomy_index(parsed_json_data)
+    organisms = ["Escherichia coli", "Pseudomonas", "Homo sapiens", "Unknown sp."]
+    for base_species in ("Escherichia coli", "Homo sapiens", "Unknown base"):
+        assert ncbi_taxonomy_index.get_taxonomic_distances(
+            base_species, [*organisms, base_species]
+        ) == most_taxonomic_similar(
+            base_species,
+            get_taxonomy_dict_from_nbci_taxonomy(
+                [*organisms, base_species], parsed_json_data
+            ),
+        )
+    assert ncbi_taxonomy_index.get_taxonomic_distances(
+        "Escherichia coli", organisms
+    ) == {"Escherichia coli": 0, "Pseudomonas": 2, "Homo sapiens": 3, "Unknown sp.": 3}
+
+
+def test_write_and_load_ncbi_taxonomy_binary(tmp_path: str) -> None:  # noqa: D103
+    ncbi_binary_folder = f"{tmp_path}/parsed_taxdmp"
+    write_ncbi_taxonomy_binary(TEST_PARSED_JSON_DATA, ncbi_binary_folder)
+    loaded_index = load_ncbi_taxonomy_index(ncbi_binary_folder)
+    json_index = get_ncbi_taxonomy_index(TEST_PARSED_JSON_DATA)
+
+    names = loaded_index.node_of_name
+    assert len(names) == len(TEST_PARSED_JSON_DATA["names_to_number_dict"])
+    assert sorted(names) == sorted(TEST_PARSED_JSON_DATA["names_to_number_dict"])
+    assert names.get("Unknown sp.") is None
+    with pytest.raises(KeyError):
+        names["Escherichia col"]  # noqa: B018
+
+    organisms = ["Escherichia coli", "Pseudomonas", "Homo sapiens", "Unknown sp."]
+    for base_species in ("Escherichia coli", "Homo sapiens", "Unknown base"):
+        assert loaded_index.get_taxonomic_distances(
+            base_species, organisms
+        ) == json_index.get_taxonomic_distances(base_species, organisms)
+
+
+def test_parse_ncbi_taxonomy(tmp_path: str) -> None:  # noqa: D103
+    names_dmp = "".join(
+        f"{number}\t|\t{name}\t|\t\t|\t{name_class}\t|\n"
+        for number, names in TEST_PARSED_JSON_DATA["number_to_names_dict"].items()
+        for name, name_class in zip(names, ("scientific name", "synonym"), strict=False)
+    )
+    names_dmp += "4\t|\tE. coli (common)\t|\t\t|\tcommon name\t|\n"
+    nodes_dmp = "".join(
+        f"{number}\t|\t{number if parent == 'END' else parent}\t|\tno rank\t|\n"
+        for number, parent in TEST_PARSED_JSON_DATA["nodes_dict"].items()
+    )
+    taxdmp_path = f"{tmp_path}/taxdmp.zip"
+    with ZipFile(taxdmp_path, "w") as zipfile:
+        zipfile.writestr("names.dmp", names_dmp)
+        zipfile.writestr("nodes.dmp", nodes_dmp)
+
+    old_wd_files = sorted(os.listdir(os.getcwd()))
+    parse_ncbi_taxonomy(
+        taxdmp_path,
+        ncbi_parsed_json_path=f"{tmp_path}/parsed_taxdmp.json",
+        ncbi_binary_folder=f"{tmp_path}/parsed_taxdmp",
+    )
+    assert sorted(os.listdir(os.getcwd())) == old_wd_files
+    assert json_zip_load(f"{tmp_path}/parsed_taxdmp.json") == TEST_PARSED_JSON_DATA
+    assert load_ncbi_taxonomy_index(
+        f"{tmp_path}/parsed_taxdmp"
+    ).get_taxonomic_distances("Escherichia coli", ["Pseudomonas", "root"]) == {
+        "Pseudomonas": 2,
+        "root": 3,
+    }
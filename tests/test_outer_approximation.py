@@ -0,0 +1,47 @@
+"""pytest tests for COBRA-k's module outer_approximation"""
+
+from cobrak.constants import OBJECTIVE_BOUND_KEY
+from cobrak.example_models import toy_model
+from cobrak.lps import perform_lp_variability_analysis
+from cobrak.outer_approximation import (
+    _get_kappa_cut,
+    _sigmoid,
+    perform_nlp_outer_approximation,
+)
+from cobrak.standard_solvers import HIGHS
+
+
+def test_get_kappa_cut() -> None:  # noqa: D103
+    for kappa_substrates_lb in (-8.0, -1.0, 0.0, 2.0):
+        for kappa_substrates_value in (kappa_substrates_lb, 0.5, 4.0):
+            slope, intercept = _get_kappa_cut(
+                kappa_substrates_value, kappa_substrates_lb
+            )
+            for step in range(1_000):
+                point = kappa_substrates_lb + step * 0.03
+                assert slope * point + intercept >= _sigmoid(point) - 1e-12
+    # In the concave part, the cut is the tangent
+    slope, intercept = _get_kappa_cut(4.0, -1.0)
+    assert abs(slope * 4.0 + intercept - _sigmoid(4.0)) < 1e-12
+
+
+def test_perform_nlp_outer_approximation() -> None:  # noqa: D103
+    variability_dict = perform_lp_variability_analysis(
+        toy_model,
+        with_enzyme_constraints=True,
+        with_thermodynamic_constraints=True,
+        min_flux_cutoff=1e-7,
+        solver=HIGHS,
+    )
+    variability_dict["EX_S"] = (0.0, 14.0)
+    results = perform_nlp_outer_approximation(
+        cobrak_model=toy_model,
+        objective_target="ATP_Consumption",
+        objective_sense=+1,
+        variability_dict=variability_dict,
+        lp_solver=HIGHS,
+        max_iterations=20,
+    )
+    for objective_value, nlp_results in results.items():
+        for nlp_result in nlp_results:
+            assert nlp_result[OBJECTIVE_BOUND_KEY] >= objective_value - 1e-6
@@ -0,0 +1,175 @@
+"""pytest tests for COBRA-k's module sabio_rk_functionality"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+from zipfile import ZipFile
+
+import pytest
+import requests
+
+from cobrak.io import get_files
+from cobrak.sabio_rk_functionality import (
+    SabioEntry,
+    SabioEntryColumns,
+    _get_normalized_name_to_bigg_id_dict,
+    _search_metname_in_bigg_ids,
+    download_sabio_rk_tsvs,
+    get_full_sabio_dict,
+)
+
+TEST_SABIO_TSV_TITLES = (
+    "EntryID\tOrganism\tIsRecombinant\tECNumber\tKineticMechanismType\tSabioCompoundID\t"
+    "ChebiID\tparameter.type\tparameter.associatedSpecies\tparameter.startValue\t"
+    "parameter.unit\tSubstrate\tProduct\tTemperature\tpH"
+)
+
+
+def _write_test_sabio_tsv(sabio_target_folder: str, tsv_lines: list[str]) -> None:
+    with ZipFile(f"{sabio_target_folder}/sabio_single_tsvs.zip", "w"):
+        pass
+    with ZipFile(f"{sabio_target_folder}/sabio_full_tsv.zip", "w") as zipf:
+        zipf.writestr("sabio.tsv", "\n".join([TEST_SABIO_TSV_TITLES, *tsv_lines]))
+
+
+def test_get_full_sabio_dict(tmp_path: str) -> None:  # noqa: D103
+    _write_test_sabio_tsv(
+        tmp_path,
+        [
+            "1\tEscherichia coli\tfalse\t2.7.1.1\tMichaelis-Menten\t1\t15422;17634\t"
+            "kcat\tATP\t10.5\t1/s\tATP;D-Glucose\tADP\t25.0\t7.5",
+            "2\tHomo sapiens\ttrue\t2.7.1.1\t\t1\t15422\tKm\tATP\t0.1\tmM\tATP\tADP\t\t",
+            "3\tHomo sapiens\ttrue\t2.7.1.2\t\t1\t15422\tkcat\tATP\t0\t1/s\tATP\tADP\t\t",
+            "4\tBos taurus\tfalse\t1.1.1.1\t\t1\t\tkcat\tNAD+\t3.0\t1/s\tNAD+\tNADH\tx\t7",
+            "5\tBos taurus\tfalse\t2.7.1.1\t\t1\t\tkcat\tATP\t2.0\t1/s\tATP\tADP\t30\t",
+        ],
+    )
+    sabio_dict = get_full_sabio_dict(str(tmp_path))
+    assert isinstance(sabio_dict.kcat_entries, SabioEntryColumns)
+    assert list(sabio_dict.kcat_entries) == ["2.7.1.1", "1.1.1.1"]
+    assert sabio_dict.kcat_entries["2.7.1.1"][0] == SabioEntry(
+        entry_id=1,
+        is_recombinant=False,
+        kinetics_mechanism_type="Michaelis-Menten",
+        organism="Escherichia coli",
+        temperature=25.0,
+        ph=7.5,
+        parameter_value=10.5,
+        parameter_unit="1/s",
+        parameter_associated_species="ATP",
+        substrates=["ATP", "D-Glucose"],
+        products=["ADP"],
+        chebi_ids=["15422", "17634"],
+    )
+    assert [entry.entry_id for entry in sabio_dict.kcat_entries["2.7.1.1"]] == [1, 5]
+    assert sabio_dict.kcat_entries["1.1.1.1"][0].temperature is None
+    assert sabio_dict.kcat_entries["1.1.1.1"][0].ph == 7.0
+    assert sabio_dict.km_entries["2.7.1.1"][0].is_recombinant
+    assert sabio_dict.kcat_entries.get("2.7.1.2") is None
+    assert not sabio_dict.hill_entries
+
+    # The cached SabioDict is bound to the TSV
+    cache_filenames = [
+        filename
+        for filename in get_files(str(tmp_path))
+        if filename.endswith(".pickle")
+    ]
+    assert len(cache_filenames) == 1
+    assert get_full_sabio_dict(str(tmp_path)).kcat_entries["2.7.1.1"][1].entry_id == 5
+    _write_test_sabio_tsv(
+        tmp_path,
+        ["6\tBos taurus\tfalse\t1.1.1.1\t\t1\t\tkcat\tNAD+\t3.0\t1/s\tNAD+\tNADH\t\t"],
+    )
+    assert list(get_full_sabio_dict(str(tmp_path)).kcat_entries) == ["1.1.1.1"]
+    assert not os.path.exists(f"{tmp_path}/{cache_filenames[0]}")
+
+
+def test_get_normalized_name_to_bigg_id_dict() -> None:  # noqa: D103
+    name_to_bigg_id_dict = {
+        "glc__D": "glc__D",
+        "d-glucose": "glc__D",
+        "alpha-d-glucose": "glc__bD",
+        "l-alanine": "ala__L",
+        "ala__L": "ala__L",
+        "atp": "atp",
+        "atp1": "atp_other",
+    }
+    normalized_name_to_bigg_id_dict = _get_normalized_name_to_bigg_id_dict(
+        name_to_bigg_id_dict
+    )
+    assert normalized_name_to_bigg_id_dict["glucose"] == "glc__D"
+    assert normalized_name_to_bigg_id_dict["d-glucose"] == "glc__D"
+    assert normalized_name_to_bigg_id_dict["alanine"] == "ala__L"
+    assert normalized_name_to_bigg_id_dict["atp"] == "atp_other"
+    for met_id in (*normalized_name_to_bigg_id_dict, "glc", "ala", "unknown"):
+        assert _search_metname_in_bigg_ids(
+            met_id,
+            bigg_id="",
+            entry=None,
+            name_to_bigg_id_dict=name_to_bigg_id_dict,
+            normalized_name_to_bigg_id_dict=normalized_name_to_bigg_id_dict,
+        ) == _search_metname_in_bigg_ids(
+            met_id,
+            bigg_id="",
+            entry=None,
+            name_to_bigg_id_dict=name_to_bigg_id_dict,
+        )
+
+
+class _StubSabioHandler(BaseHTTPRequestHandler):
+    """Answers SABIO-RK TSV export queries, failing the first try of each query"""
+
+    requested_queries: list[str] = []
+
+    def do_POST(self) -> None:  # noqa: D102, N802
+        query = parse_qs(urlparse(self.path).query)["q"][0]
+        first_entry_number = query.split("(")[1].split(" ")[0]
+        failed_before = query in self.requested_queries
+        self.requested_queries.append(query)
+        if (not failed_before) or first_entry_number == "7":
+            self.send_response(503)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(f"{TEST_SABIO_TSV_TITLES}\n{first_entry_number}".encode())
+
+    def log_message(self, *args: object) -> None:  # noqa: D102
+        pass
+
+
+def test_download_sabio_rk_tsvs(tmp_path: str) -> None:  # noqa: D103
+    server = HTTPServer(("127.0.0.1", 0), _StubSabioHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    sabio_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    temp_folder = f"{tmp_path}/sabiotemp"
+    download_settings = {
+        "max_concurrency": 2,
+        "requests_per_second": 1_000.0,
+        "max_retries": 2,
+        "backoff_seconds": 0.01,
+        "max_entry_number": 9,
+        "entries_per_request": 3,
+        "sabio_url": sabio_url,
+    }
+    try:
+        # Entries 7 to 9 always fail, while all others succeed at their retry
+        with pytest.raises(requests.RequestException):
+            download_sabio_rk_tsvs(temp_folder, **download_settings)
+        assert sorted(get_files(temp_folder)) == ["zzz0.txt", "zzz3.txt"]
+        with open(f"{temp_folder}/zzz3.txt", encoding="utf-8") as f:
+            assert f.read().endswith("\n4")
+
+        # A new call only requests the missing chunk
+        _StubSabioHandler.requested_queries.clear()
+        with pytest.raises(requests.RequestException):
+            download_sabio_rk_tsvs(temp_folder, **download_settings)
+        assert len(_StubSabioHandler.requested_queries) == 3
+        assert all(
+            "(7 OR 8 OR 9)" in query for query in _StubSabioHandler.requested_queries
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
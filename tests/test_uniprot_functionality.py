@@ -2,10 +2,14 @@
 
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from shutil import rmtree
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import cobra
 
+from cobrak.io import json_load
 from cobrak.uniprot_functionality import uniprot_get_enzyme_molecular_weights
 
 
@@ -118,3 +122,111 @@ def test_uniprot_get_enzyme_molecular_weights_cleanup() -> None:  # noqa: D103
     # Clean up
     rmtree("./test_cache")
     os.remove("test_cache_cache_uniprot_molecular_weights.json")
+
+
+def _get_test_model(uniprot_ids: list[str]) -> cobra.Model:
+    model = cobra.Model("test_model")
+    for gene_number, uniprot_id in enumerate(uniprot_ids):
+        gene = cobra.Gene(f"gene{gene_number}")
+        gene.annotation = {"uniprot": uniprot_id}
+        model.genes.append(gene)
+    return model
+
+
+class _StubUniProtHandler(BaseHTTPRequestHandler):
+    """Answers UniProtKB TSV searches with one entry per result page, failing the first request"""
+
+    queries: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: D102, N802
+        params = parse_qs(urlparse(self.path).query)
+        self.queries.append(params["query"][0])
+        if len(self.queries) == 1:
+            self.send_response(503)
+            self.end_headers()
+            return
+        found_ids = [
+            term.split(":")[-1]
+            for term in self.queries[-1].split(" OR ")
+            if not term.endswith("P99999")
+        ]
+        page = int(params.get("cursor", ["0"])[0])
+        uniprot_id = found_ids[page]
+        self.send_response(200)
+        if page + 1 < len(found_ids):
+            next_url = f"http://{self.headers['Host']}/?{urlencode({'query': self.queries[-1], 'cursor': page + 1})}"
+            self.send_header("Link", f'<{next_url}>; rel="next"')
+        self.end_headers()
+        self.wfile.write(
+            "\n".join(
+                [
+                    "Entry\tEntry Name\tMass",
+                    f"{uniprot_id}\t{uniprot_id}_ECOLI\t1{len(uniprot_id)},000",
+                ]
+            ).encode()
+        )
+
+    def log_message(self, *args: object) -> None:  # noqa: D102
+        pass
+
+
+def test_uniprot_get_enzyme_molecular_weights_stub_server(tmp_path: str) -> None:  # noqa: D103
+    server = HTTPServer(("127.0.0.1", 0), _StubUniProtHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    cache_basepath = f"{tmp_path}/cache"
+    try:
+        protein_id_mass_mapping = uniprot_get_enzyme_molecular_weights(
+            _get_test_model(["P00001", "P00002", "P00003", "P99999", "Q1"]),
+            cache_basepath,
+            batch_size=2,
+            requests_per_second=1_000.0,
+            backoff_seconds=0.01,
+            uniprot_url=f"http://127.0.0.1:{server.server_address[1]}/",
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert protein_id_mass_mapping == {
+        "gene0": 16.0,
+        "gene1": 16.0,
+        "gene2": 16.0,
+        "gene4": 12.0,
+    }
+    # 3 batches, one of which was retried and one of which has two result pages
+    assert len(_StubUniProtHandler.queries) == 5
+    assert "accession:P00001 OR accession:P00002" in _StubUniProtHandler.queries
+    assert "Q1" in _StubUniProtHandler.queries  # Neither accession nor entry ID
+    assert (
+        json_load(f"{cache_basepath}/_cache_uniprot_molecular_weights.json", dict)[
+            "P00002_ECOLI"
+        ]
+        == 16_000.0
+    )
+
+
+def test_uniprot_get_enzyme_molecular_weights_offline(tmp_path: str) -> None:  # noqa: D103
+    with open(f"{tmp_path}/uniprot.fasta", "w", encoding="utf-8") as f:
+        f.write(
+            ">sp|P00001|TEST1_ECOLI Test protein 1\nGG\nA\n>sp|P00002|TEST2_ECOLI\nW\n"
+        )
+    cache_basepath = f"{tmp_path}/cache"
+    os.makedirs(cache_basepath)
+    with open(
+        f"{cache_basepath}/_cache_uniprot_molecular_weights.json", "w", encoding="utf-8"
+    ) as f:
+        json.dump({"P00003": 5_000.0}, f)
+
+    protein_id_mass_mapping = uniprot_get_enzyme_molecular_weights(
+        _get_test_model(["P00001", "TEST2_ECOLI", "P00003", "P00004"]),
+        cache_basepath,
+        offline=True,
+        uniprot_fasta_path=f"{tmp_path}/uniprot.fasta",
+        multiplication_factor=1.0,
+    )
+    # Gly-Gly-Ala: 2 * 57.0519 + 71.0788 + 18.01524 Da
+    assert protein_id_mass_mapping == {
+        "gene0": 203.0,
+        "gene1": 204.0,
+        "gene2": 5_000.0,
+    }
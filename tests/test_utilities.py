@@ -1,5 +1,7 @@
 """pytest tests for COBRA-k's module utilities"""
 
+import asyncio
+from time import sleep, time
 from typing import Any
 
 import pytest
@@ -44,12 +46,20 @@ from cobrak.utilities import (
     get_substrate_and_product_exchanges,
     get_termination_condition_from_pyomo_results,
     have_all_unignored_km,
+    is_infeasible_optimization_dict,
     is_objsense_maximization,
     last_n_elements_equal,
+    parallel_map_until_deadline,
+    run_coroutine,
     sort_dict_keys,
 )
 
 
+def _sleep_and_return(seconds: float) -> float:
+    sleep(seconds)
+    return seconds
+
+
 # Example fixtures and mock objects
 @pytest.fixture
 def mock_optimization_dict() -> None:  # noqa: D103
@@ -367,6 +377,16 @@ def test_have_all_unignored_km(mock_model: Model) -> None:  # noqa: D103
     assert not result
 
 
+def test_is_infeasible_optimization_dict() -> None:  # noqa: D103
+    assert is_infeasible_optimization_dict(
+        {ALL_OK_KEY: False, TERMINATION_CONDITION_KEY: 8}
+    )
+    assert not is_infeasible_optimization_dict(
+        {ALL_OK_KEY: False, TERMINATION_CONDITION_KEY: 1}
+    )
+    assert not is_infeasible_optimization_dict({ALL_OK_KEY: False})
+
+
 def test_is_objsense_maximization() -> None:  # noqa: D103
     assert is_objsense_maximization(1)
     assert not is_objsense_maximization(-1)
@@ -388,3 +408,32 @@ def test_last_n_elements_equal() -> None:  # noqa: D103
     # Edge case: n = 0 (should always return True)
     assert last_n_elements_equal([1, 2, 3], 0)
     assert last_n_elements_equal([], 0)
+
+
+def test_parallel_map_until_deadline() -> None:  # noqa: D103
+    assert parallel_map_until_deadline(_sleep_and_return, [(0.0,), (0.1,)]) == (
+        [0.0, 0.1],
+        False,
+    )
+    assert parallel_map_until_deadline(
+        _sleep_and_return, [(0.0,), (0.1,)], deadline=time() + 60.0
+    ) == ([0.0, 0.1], False)
+    results, cut_short = parallel_map_until_deadline(
+        _sleep_and_return, [(0.0,), (2.0,), (2.0,)], deadline=time() + 1.0
+    )
+    assert results[0] == 0.0
+    assert results[2] is None
+    assert cut_short
+
+
+def test_run_coroutine() -> None:  # noqa: D103
+    async def add_one(number: int) -> int:
+        await asyncio.sleep(0.0)
+        return number + 1
+
+    async def call_in_running_loop() -> int:
+        return run_coroutine(add_one(2))
+
+    assert run_coroutine(add_one(1)) == 2
+    # asyncio.run would raise a RuntimeError within the running event loop
+    assert asyncio.run(call_in_running_loop()) == 3